@@ -0,0 +1,443 @@
+"""Decoding of raw socket.io payloads into the dataclasses of ``api_types`` and back.
+
+The decoders and encoders are generated once per dataclass when this module is
+imported. Decoders do not validate the payload: missing keys become ``None``
+and values are only converted where the target type is an ``Enum``, a
+dataclass or a list of those, an unknown enum value raises :class:`DecodeError`.
+Encoders skip ``None`` fields and write enums as their ``.value``, ``NaN`` and
+infinite floats raise ``ValueError`` as with ``json.dumps(allow_nan=False)``.
+
+The message types ``api_types`` lacks (``line``, ``start_audio``, ...) are
+decoded into the classes of the generated ``api_models``, known types keep
+their ``api_types`` class. ``api_models`` is imported and compiled on first
+use of one of its classes (:func:`load_models`), not with this module.
+"""
+import dataclasses
+import json
+import math
+import threading
+import typing
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+
+import api_types
+from api_types import (
+    AccMsg,
+    AlertConfirmMsg,
+    AllDataMsg,
+    BorderOverlapMsg,
+    ClearPlaygroundMsg,
+    ColorMsg,
+    ColorPointerMsg,
+    DataType,
+    GridMsg,
+    GridPointerMsg,
+    GridUpdateMsg,
+    GyroMsg,
+    InputPromptMsg,
+    InputResponseMsg,
+    KeyMsg,
+    NotificationMsg,
+    PlaygroundConfigMsg,
+    PointerContext,
+    RemoveSpriteMsg,
+    SpriteClickedMsg,
+    SpriteCollisionMsg,
+    SpriteMsg,
+    SpriteOutMsg,
+    SpritesMsg,
+    UnknownMsg,
+)
+
+T = TypeVar('T')
+
+
+class DecodeError(ValueError):
+    pass
+
+
+def _module_members(module, base) -> List[type]:
+    return [
+        obj
+        for obj in vars(module).values()
+        if isinstance(obj, type) and issubclass(obj, base) and obj.__module__ == module.__name__
+    ]
+
+
+# api_types builds its definitions on first access, the codec covers all of them
+api_types.load_all()
+ENUMS: List[Type[Enum]] = _module_members(api_types, Enum)
+DATACLASSES: List[type] = [cls for cls in _module_members(api_types, object) if dataclasses.is_dataclass(cls)]
+
+
+class EnumTable(dict):
+    """value -> member table of an enum, unknown values raise :class:`DecodeError`"""
+
+    def __init__(self, enum_cls: Type[Enum]):
+        super().__init__((m.value, m) for m in enum_cls)
+        self.enum_cls = enum_cls
+
+    def __missing__(self, value):
+        raise DecodeError(f"unknown {self.enum_cls.__name__} '{value}'")
+
+
+# value -> member tables, used instead of ``Enum.__call__``
+ENUM_LOOKUP: Dict[Type[Enum], Dict[Any, Enum]] = {cls: EnumTable(cls) for cls in ENUMS}
+DATA_TYPES: Dict[str, DataType] = ENUM_LOOKUP[DataType]
+
+
+def enum_member(enum_cls: Type[Enum], value: Any) -> Enum:
+    """``enum_cls(value)`` through a precomputed lookup table."""
+    member = ENUM_LOOKUP[enum_cls].get(value)
+    return enum_cls(value) if member is None else member
+
+
+def data_type(value: str) -> DataType:
+    return DATA_TYPES[value]
+
+
+class DecoderCompiler:
+    """Generates the source of one decoder function per dataclass.
+
+    All decoders share one namespace, so nested and mutually recursive
+    dataclasses (``DataStore`` <-> ``ClientDataMsg``) resolve at call time.
+    """
+
+    PREFIX = '_decode'
+
+    def __init__(self, classes: List[type], targets: Optional[Dict[type, type]] = None):
+        self.classes: List[type] = []
+        # the class instantiated for each ``api_types`` dataclass, e.g. its slotted variant
+        self.targets = targets or {}
+        self.namespace: Dict[str, Any] = {}
+        self.names: Dict[type, str] = {}
+        self._consts: Dict[int, str] = {}
+        self.extend(classes)
+
+    def extend(self, classes: List[type]):
+        """add ``classes``, they may refer to the classes added before"""
+        for idx, cls in enumerate(classes, len(self.classes)):
+            self.names[cls] = f'{self.PREFIX}_{idx}_{cls.__name__}'
+        self.classes.extend(classes)
+
+    def const(self, obj: Any) -> str:
+        name = self._consts.get(id(obj))
+        if name is None:
+            name = f'_c{len(self._consts)}'
+            self._consts[id(obj)] = name
+            self.namespace[name] = obj
+        return name
+
+    def needs_conversion(self, tp) -> bool:
+        if isinstance(tp, type):
+            return issubclass(tp, Enum) or tp in self.names
+        args = getattr(tp, '__args__', None) or ()
+        return any(self.needs_conversion(a) for a in args)
+
+    def expr(self, tp, var: str, depth: int = 0) -> str:
+        """Python expression converting the (non null) json value ``var`` into ``tp``."""
+        if not self.needs_conversion(tp):
+            return var
+        if isinstance(tp, type) and issubclass(tp, Enum):
+            return f'{self.const(ENUM_LOOKUP[tp])}[{var}]'
+        if isinstance(tp, type):
+            return f'{self.names[tp]}({var})'
+        origin = typing.get_origin(tp)
+        args = typing.get_args(tp)
+        if origin in (list, List):
+            item = f'_i{depth}'
+            return f'[{self.expr(args[0], item, depth + 1)} for {item} in {var}]'
+        if origin is Union:
+            non_none = [a for a in args if a is not type(None)]
+            if len(non_none) == 1:
+                return self.expr(non_none[0], var, depth)
+            # mixed unions such as ``Union[List[float], ColorName, None]``:
+            # only strings can be enum values, everything else is kept as is
+            enums = [a for a in non_none if isinstance(a, type) and issubclass(a, Enum)]
+            if enums:
+                table = self.const(ENUM_LOOKUP[enums[0]])
+                return f'({table}.get({var}, {var}) if {var}.__class__ is str else {var})'
+        return var
+
+    def source(self, cls: type) -> str:
+        hints = typing.get_type_hints(cls, vars(api_types))
+        lines = [f'def {self.names[cls]}(d):', '    get = d.get']
+        args = []
+        for idx, field in enumerate(dataclasses.fields(cls)):
+            tp = hints[field.name]
+            if self.needs_conversion(tp):
+                lines.append(f'    f{idx} = get({field.name!r})')
+                lines.append(f'    if f{idx} is not None:')
+                lines.append(f'        f{idx} = {self.expr(tp, f"f{idx}")}')
+                args.append(f'f{idx}')
+            else:
+                args.append(f'get({field.name!r})')
+        target = self.targets.get(cls, cls)
+        lines.append(f'    return {self.const(target)}({", ".join(args)})')
+        return '\n'.join(lines) + '\n'
+
+    def compile(self, classes: Optional[List[type]] = None) -> Dict[type, Callable[[dict], Any]]:
+        """the decoders of ``classes`` (of all classes when ``None``)"""
+        classes = self.classes if classes is None else classes
+        for cls in classes:
+            exec(self.source(cls), self.namespace)
+        return {cls: self.namespace[self.names[cls]] for cls in classes}
+
+
+class _Compiled(dict):
+    """The decoders or encoders per class, the ``api_models`` classes are compiled on first use."""
+
+    def __missing__(self, cls: type):
+        if getattr(cls, '__module__', None) == 'api_models' and _models is None:
+            load_models()
+            return self[cls]
+        raise KeyError(cls)
+
+
+_decoder_compiler = DecoderCompiler(DATACLASSES)
+DECODERS: Dict[type, Callable[[dict], Any]] = _Compiled(_decoder_compiler.compile())
+
+# the message class of every ``type`` discriminator, ``pointer`` messages are
+# further dispatched on their ``context``
+MESSAGE_CLASSES: Dict[DataType, type] = {
+    DataType.ACCELERATION: AccMsg,
+    DataType.ALERT_CONFIRM: AlertConfirmMsg,
+    DataType.ALL_DATA: AllDataMsg,
+    DataType.BORDER_OVERLAP: BorderOverlapMsg,
+    DataType.CLEAR_PLAYGROUND: ClearPlaygroundMsg,
+    DataType.COLOR: ColorMsg,
+    DataType.GRID: GridMsg,
+    DataType.GRID_UPDATE: GridUpdateMsg,
+    DataType.GYRO: GyroMsg,
+    DataType.INPUT_PROMPT: InputPromptMsg,
+    DataType.INPUT_RESPONSE: InputResponseMsg,
+    DataType.KEY: KeyMsg,
+    DataType.NOTIFICATION: NotificationMsg,
+    DataType.PLAYGROUND_CONFIG: PlaygroundConfigMsg,
+    DataType.REMOVE_SPRITE: RemoveSpriteMsg,
+    DataType.SPRITE: SpriteMsg,
+    DataType.SPRITES: SpritesMsg,
+    DataType.SPRITE_CLICKED: SpriteClickedMsg,
+    DataType.SPRITE_COLLISION: SpriteCollisionMsg,
+    DataType.SPRITE_OUT: SpriteOutMsg,
+    DataType.UNKNOWN: UnknownMsg,
+}
+POINTER_CLASSES: Dict[PointerContext, type] = {
+    PointerContext.COLOR: ColorPointerMsg,
+    PointerContext.GRID: GridPointerMsg,
+}
+
+_models: Optional[List[type]] = None
+_models_lock = threading.RLock()
+
+
+def load_models() -> List[type]:
+    """Import ``api_models`` and compile the decoders and encoders of its dataclasses (once),
+    returns the dataclasses. Done on first use of a class or message type only ``api_models`` has."""
+    global _models
+    with _models_lock:
+        if _models is None:
+            import api_models
+
+            models = [cls for cls in _module_members(api_models, object) if dataclasses.is_dataclass(cls)]
+            ENUM_LOOKUP.update((cls, EnumTable(cls)) for cls in _module_members(api_models, Enum))
+            _decoder_compiler.extend(models)
+            DECODERS.update(_decoder_compiler.compile(models))
+            _encoder_compiler.extend(models)
+            ENCODERS.update(_encoder_compiler.compile(models))
+            _models = models
+    return _models
+
+
+def __getattr__(name: str):
+    if name == 'MODELS':
+        # the generated classes of SharedTypings.ts types api_types lacks or has without recent fields
+        return load_models()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def make_decoder(decoders: Dict[type, Callable[[dict], Any]], models: bool = False) -> Callable[[dict], Any]:
+    """Build a ``decode(data)`` function dispatching on ``type`` with the given per class decoders,
+    with ``models`` every message is decoded into its ``api_models`` class (keeping e.g. ``deliver_to``).
+
+    The ``api_models`` types are added on the first type the ``api_types`` classes do not cover
+    (with ``models`` on the first message)."""
+    pointer_decoders: Dict[str, Callable[[dict], Any]] = {}
+    dispatch: Dict[str, Callable[[dict], Any]] = {}
+    complete = False
+
+    def decode_pointer(data: dict):
+        decoder = pointer_decoders.get(data.get('context'))
+        if decoder is None:
+            raise DecodeError(f"unknown pointer context '{data.get('context')}'")
+        return decoder(data)
+
+    def build(with_models: bool):
+        pointer_decoders.update((ctx.value, decoders[cls]) for ctx, cls in POINTER_CLASSES.items())
+        dispatch.update((dt.value, decoders[cls]) for dt, cls in MESSAGE_CLASSES.items())
+        dispatch[DataType.POINTER.value] = decode_pointer
+        if not with_models:
+            return
+        load_models()
+        import api_models
+
+        if models:
+            pointer_decoders.update((ctx, decoders[cls]) for ctx, cls in api_models.POINTER_CLASSES.items())
+        # the types only api_models knows, when the decoders cover its classes
+        for value, cls in api_models.MESSAGE_CLASSES.items():
+            if (models or value not in dispatch) and cls in decoders:
+                dispatch[value] = decoders[cls]
+
+    def decode(data: dict):
+        """Decode a ``new_data`` payload into the message dataclass of its ``type``."""
+        nonlocal complete
+        decoder = dispatch.get(data.get('type'))
+        if decoder is None:
+            if not complete:
+                build(True)
+                complete = True
+                return decode(data)
+            raise DecodeError(f"unknown message type '{data.get('type')}'")
+        return decoder(data)
+
+    if not models:
+        build(False)
+    return decode
+
+
+decode = make_decoder(DECODERS)
+decode_model = make_decoder(DECODERS, models=True)
+
+
+def decode_as(cls: Type[T], data: dict) -> T:
+    """Decode ``data`` into the given ``api_types`` or ``api_models`` dataclass."""
+    return DECODERS[cls](data)
+
+
+def _json_default(obj):
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj):
+        return ENCODERS[obj.__class__].to_dict(obj)
+    raise TypeError(f'Object of type {obj.__class__.__name__} is not JSON serializable')
+
+
+_dumps = json.JSONEncoder(separators=(',', ':'), allow_nan=False, default=_json_default).encode
+_encode_str = json.encoder.encode_basestring_ascii
+_isfinite = math.isfinite
+
+
+def _encode_number(value) -> str:
+    if value.__class__ is float:
+        if not _isfinite(value):
+            raise ValueError(f'Out of range float values are not JSON compliant: {value!r}')
+        return repr(value)
+    if value.__class__ is int:
+        return repr(value)
+    return _dumps(value)
+
+
+class EncoderCompiler(DecoderCompiler):
+    """Generates a json text and a dict encoder per dataclass.
+
+    Both skip ``None`` fields. The text encoders build the json string from
+    the field values directly, untyped values fall back to ``json``.
+    """
+
+    PREFIX = '_encode'
+
+    def __init__(self, classes: List[type]):
+        self.dict_names: Dict[type, str] = {}
+        super().__init__(classes)
+        self.namespace.update(_dumps=_dumps, _str=_encode_str, _number=_encode_number, _Enum=Enum)
+
+    def extend(self, classes: List[type]):
+        for idx, cls in enumerate(classes, len(self.classes)):
+            self.dict_names[cls] = f'_to_dict_{idx}_{cls.__name__}'
+        super().extend(classes)
+
+    def text_expr(self, tp, var: str, depth: int = 0) -> str:
+        """Python expression building the json text of the (non null) value ``var``."""
+        if tp is str:
+            return f'_str({var})'
+        if tp is float or tp is int:
+            return f'_number({var})'
+        if tp is bool:
+            return f"('true' if {var} else 'false')"
+        if isinstance(tp, type) and issubclass(tp, Enum):
+            return f'_str({var}.value)'
+        if isinstance(tp, type) and tp in self.names:
+            return f'{self.names[tp]}({var})'
+        origin = typing.get_origin(tp)
+        args = typing.get_args(tp)
+        if origin in (list, List) and self.needs_conversion(args[0]):
+            item = f'_i{depth}'
+            return f"('[' + ','.join([{self.text_expr(args[0], item, depth + 1)} for {item} in {var}]) + ']')"
+        if origin is Union:
+            non_none = [a for a in args if a is not type(None)]
+            if len(non_none) == 1:
+                return self.text_expr(non_none[0], var, depth)
+            if any(isinstance(a, type) and issubclass(a, Enum) for a in non_none):
+                return f'_dumps({var}.value if isinstance({var}, _Enum) else {var})'
+        return f'_dumps({var})'
+
+    def dict_expr(self, tp, var: str, depth: int = 0) -> str:
+        """Python expression converting the (non null) value ``var`` into json compatible objects."""
+        if not self.needs_conversion(tp):
+            return var
+        if isinstance(tp, type) and issubclass(tp, Enum):
+            return f'{var}.value'
+        if isinstance(tp, type):
+            return f'{self.dict_names[tp]}({var})'
+        origin = typing.get_origin(tp)
+        args = typing.get_args(tp)
+        if origin in (list, List):
+            item = f'_i{depth}'
+            return f'[{self.dict_expr(args[0], item, depth + 1)} for {item} in {var}]'
+        if origin is Union:
+            non_none = [a for a in args if a is not type(None)]
+            if len(non_none) == 1:
+                return self.dict_expr(non_none[0], var, depth)
+            return f'({var}.value if isinstance({var}, _Enum) else {var})'
+        return var
+
+    def source(self, cls: type) -> str:
+        hints = typing.get_type_hints(cls, vars(api_types))
+        text = [f'def {self.names[cls]}(o):', '    items = []', '    append = items.append']
+        to_dict = [f'def {self.dict_names[cls]}(o):', '    d = {}']
+        for field in dataclasses.fields(cls):
+            tp = hints[field.name]
+            text.append(f'    v = o.{field.name}')
+            text.append('    if v is not None:')
+            text.append(f"        append('\"{field.name}\":' + {self.text_expr(tp, 'v')})")
+            to_dict.append(f'    v = o.{field.name}')
+            to_dict.append('    if v is not None:')
+            to_dict.append(f'        d[{field.name!r}] = {self.dict_expr(tp, "v")}')
+        text.append("    return '{' + ','.join(items) + '}'")
+        to_dict.append('    return d')
+        return '\n'.join(text) + '\n\n' + '\n'.join(to_dict) + '\n'
+
+    def compile(self, classes: Optional[List[type]] = None) -> Dict[type, 'Encoder']:
+        classes = self.classes if classes is None else classes
+        for cls in classes:
+            exec(self.source(cls), self.namespace)
+        return {cls: Encoder(self.namespace[self.names[cls]], self.namespace[self.dict_names[cls]]) for cls in classes}
+
+
+class Encoder(typing.NamedTuple):
+    to_json: Callable[[Any], str]
+    to_dict: Callable[[Any], dict]
+
+
+_encoder_compiler = EncoderCompiler(DATACLASSES)
+ENCODERS: Dict[type, Encoder] = _Compiled(_encoder_compiler.compile())
+
+
+def encode(msg) -> bytes:
+    """The compact json representation of an ``api_types`` dataclass, without ``None`` fields."""
+    return ENCODERS[msg.__class__].to_json(msg).encode()
+
+
+def to_dict(msg) -> dict:
+    """``msg`` as json compatible dict without ``None`` fields, e.g. to emit it with a socket.io client."""
+    return ENCODERS[msg.__class__].to_dict(msg)
@@ -0,0 +1,149 @@
+"""Lazy views of the ``api_types`` dataclasses.
+
+A view wraps the raw payload, a parsed dict or its json text, and has the
+attributes of its dataclass. A field is only decoded when it is read: plain
+values come straight from the dict, enums, nested dataclasses and lists of
+those are converted on first access and cached. Nested dataclasses are views
+as well, json text is only parsed when the first field is read::
+
+    from api_lazy import view
+
+    for payload in payloads:
+        msg = view(payload)
+        if msg.device_nr != 3:
+            continue  # nothing but ``device_nr`` was read
+        handle(msg.sprite.pos_x)
+
+    view(raw_json, ClientDataMsg)  # parsed on first access
+
+Views work with ``api_codec.encode`` / ``to_dict`` and ``session_log.Recorder``
+like the dataclasses, :meth:`LazyView.to_dataclass` decodes everything.
+"""
+import dataclasses
+import json
+import sys
+import typing
+from enum import Enum
+from typing import Any, Dict, Optional, Union
+
+import api_codec
+import api_types
+
+
+class LazyView:
+    # the parsed payload or its json text
+    __slots__ = ('_data',)
+
+    # the ``api_types`` dataclass of the view
+    DATACLASS: type = object
+    FIELDS: typing.Tuple[str, ...] = ()
+
+    def __init__(self, data: Union[dict, bytes, str]):
+        self._data = data
+
+    def _load(self) -> dict:
+        self._data = json.loads(self._data)
+        return self._data
+
+    def payload(self) -> dict:
+        """the wrapped (parsed) payload"""
+        return self._data if self._data.__class__ is dict else self._load()
+
+    def to_dataclass(self) -> Any:
+        return api_codec.decode_as(self.DATACLASS, self.payload())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyView):
+            return self.DATACLASS is other.DATACLASS and self.to_dataclass() == other.to_dataclass()
+        if other.__class__ is self.DATACLASS:
+            return self.to_dataclass() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.FIELDS)
+        return f'{self.__class__.__name__}({fields})'
+
+
+class ViewCompiler(api_codec.DecoderCompiler):
+    """Generates a getter per field, nested dataclasses become views (``targets``)."""
+
+    def expr(self, tp, var: str, depth: int = 0) -> str:
+        if isinstance(tp, type) and tp in self.targets:
+            return f'{self.const(self.targets[tp])}({var})'
+        return super().expr(tp, var, depth)
+
+    def cached(self, tp) -> bool:
+        """whether a field is converted once and cached, enum lookups are as cheap as the cache"""
+        if isinstance(tp, type) and issubclass(tp, Enum):
+            return False
+        args = [a for a in typing.get_args(tp) if a is not type(None)]
+        if typing.get_origin(tp) is Union and len(args) == 1:
+            return self.cached(args[0])
+        return self.needs_conversion(tp)
+
+    def getter(self, name: str, tp) -> str:
+        lines = ['def get(self):']
+        if self.cached(tp):
+            lines += ['    try:', f'        return self._v_{name}', '    except AttributeError:', '        pass']
+        lines += ['    data = self._data', '    if data.__class__ is not dict:', '        data = self._load()']
+        if self.cached(tp):
+            lines += [
+                f'    v = data.get({name!r})',
+                '    if v is not None:',
+                f'        v = {self.expr(tp, "v")}',
+                f'    self._v_{name} = v',
+                '    return v',
+            ]
+        elif self.needs_conversion(tp):
+            lines += [f'    v = data.get({name!r})', '    if v is not None:', f'        v = {self.expr(tp, "v")}', '    return v']
+        else:
+            lines += [f'    return data.get({name!r})']
+        return '\n'.join(lines) + '\n'
+
+    def compile(self) -> Dict[type, type]:
+        for cls, view_cls in self.targets.items():
+            hints = typing.get_type_hints(cls, vars(api_types))
+            for name in view_cls.FIELDS:
+                exec(self.getter(name, hints[name]), self.namespace)
+                setattr(view_cls, name, property(self.namespace.pop('get')))
+        return self.targets
+
+
+def _view_class(cls: type) -> type:
+    hints = typing.get_type_hints(cls, vars(api_types))
+    fields = tuple(f.name for f in dataclasses.fields(cls))
+    # cache slots of the fields which are converted
+    compiler = ViewCompiler(api_codec.DATACLASSES)
+    slots = tuple(f'_v_{name}' for name in fields if compiler.cached(hints[name]))
+    namespace = {'__slots__': slots, '__module__': __name__, 'DATACLASS': cls, 'FIELDS': fields}
+    return type(cls.__name__, (LazyView,), namespace)
+
+
+VIEWS: Dict[type, type] = ViewCompiler(
+    api_codec.DATACLASSES, targets={cls: _view_class(cls) for cls in api_codec.DATACLASSES}
+).compile()
+
+_module = sys.modules[__name__]
+for _cls, _view in VIEWS.items():
+    setattr(_module, _cls.__name__, _view)
+    # the generated encoders only access attributes
+    api_codec.ENCODERS[_view] = api_codec.ENCODERS[_cls]
+
+_DISPATCH = {dt.value: VIEWS[cls] for dt, cls in api_codec.MESSAGE_CLASSES.items()}
+_POINTER_DISPATCH = {ctx.value: VIEWS[cls] for ctx, cls in api_codec.POINTER_CLASSES.items()}
+_POINTER = api_types.DataType.POINTER.value
+_CLIENT_DATA_MSG = VIEWS[api_types.ClientDataMsg]
+
+
+def view(data: Union[dict, bytes, str], cls: Optional[type] = None) -> LazyView:
+    """A view of a ``new_data`` payload as the message class of its ``type`` (as ``decode``)
+    or as ``cls`` (an ``api_types`` dataclass), json text is only parsed lazily with ``cls``.
+    Payloads of unknown type are viewed as ``ClientDataMsg``."""
+    if cls is not None:
+        return VIEWS[cls](data)
+    if data.__class__ is not dict:
+        data = json.loads(data)
+    msg_type = data.get('type')
+    if msg_type == _POINTER:
+        return _POINTER_DISPATCH.get(data.get('context'), _CLIENT_DATA_MSG)(data)
+    return _DISPATCH.get(msg_type, _CLIENT_DATA_MSG)(data)
@@ -0,0 +1,489 @@
+# Generated from SharedTypings.ts by gen_api_models.py (yarn to-py-models), do not edit.
+#
+# The message types api_types.py does not know yet. Subclasses of api_types
+# classes add the fields the typings gained since api_types.py was generated.
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Optional, Union
+
+import api_types
+
+
+class SpriteBorderStyle(Enum):
+    DOTTED = "dotted"
+    DASHED = "dashed"
+    SOLID = "solid"
+    DOUBLE = "double"
+    GROOVE = "groove"
+    RIDGE = "ridge"
+    INSET = "inset"
+    OUTSET = "outset"
+    NONE = "none"
+    HIDDEN = "hidden"
+
+
+class AutoMovementMovement(Enum):
+    ABSOLUTE = "absolute"
+    RELATIVE = "relative"
+
+
+class CleanPlaygroundMsgType(Enum):
+    CLEAN_PLAYGROUND = "clean_playground"
+
+
+class SpriteRemovedMsgType(Enum):
+    SPRITE_REMOVED = "sprite_removed"
+
+
+class ImageFormats(Enum):
+    JPG = "jpg"
+    JPEG = "jpeg"
+    PNG = "png"
+    GIF = "gif"
+    SVG = "svg"
+    WEBP = "webp"
+    BMP = "bmp"
+
+
+class AudioFormats(Enum):
+    MP3 = "mp3"
+    OGG = "ogg"
+    WAV = "wav"
+
+
+class LineMsgType(Enum):
+    LINE = "line"
+
+
+class LinesMsgType(Enum):
+    LINES = "lines"
+
+
+class RemoveLineMsgType(Enum):
+    REMOVE_LINE = "remove_line"
+
+
+class CancelUserInputMsgType(Enum):
+    CANCEL_USER_INPUT = "cancel_user_input"
+
+
+class CancelUserInputMsgInputType(Enum):
+    INPUT_PROMPT = "input_prompt"
+    NOTIFICATION = "notification"
+
+
+class StartAudioMsgType(Enum):
+    START_AUDIO = "start_audio"
+
+
+class StopAudioMsgType(Enum):
+    STOP_AUDIO = "stop_audio"
+
+
+class AutoSpritePositionChangedMsgType(Enum):
+    AUTO_MOVEMENT_POS = "auto_movement_pos"
+
+
+@dataclass
+class KeyMsg(api_types.KeyMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class GridMsg(api_types.GridMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    enumerate: Optional[bool] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class GridUpdateMsg(api_types.GridUpdateMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    enumerate: Optional[bool] = None
+    number: Optional[float] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class ColorMsg(api_types.ColorMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class AccMsg(api_types.AccMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class GyroMsg(api_types.GyroMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class NotificationMsg(api_types.NotificationMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class InputPromptMsg(api_types.InputPromptMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class InputResponseMsg(api_types.InputResponseMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class AllDataMsg(api_types.AllDataMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class AlertConfirmMsg(api_types.AlertConfirmMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class AutoMovement:
+    id: str
+    movement: AutoMovementMovement
+    direction: Optional[List[float]] = None
+    distance: Optional[float] = None
+    speed: Optional[float] = None
+    time: Optional[float] = None
+    time_span: Optional[float] = None
+    to: Optional[List[float]] = None
+
+
+@dataclass
+class SpriteAutoMovement:
+    movements: List[AutoMovement]
+    cancel_previous: Optional[bool] = None
+    cycle: Optional[bool] = None
+    exit_on_done: Optional[bool] = None
+    repeat: Optional[float] = None
+
+
+@dataclass
+class Sprite(api_types.Sprite):
+    anchor: Optional[List[float]] = None
+    border_color: Optional[str] = None
+    border_style: Optional[SpriteBorderStyle] = None
+    border_width: Optional[float] = None
+    draggeable: Optional[bool] = None
+    font_color: Optional[str] = None
+    font_size: Optional[float] = None
+    image: Optional[str] = None
+    movements: Optional[SpriteAutoMovement] = None
+    rotate: Optional[float] = None
+    z_index: Optional[float] = None
+
+
+@dataclass
+class SpriteMsg(api_types.SpriteMsg):
+    sprite: Sprite
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class SpritesMsg(api_types.SpritesMsg):
+    sprites: List[Sprite]
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class RemoveSpriteMsg(api_types.RemoveSpriteMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class ClearPlaygroundMsg(api_types.ClearPlaygroundMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class CleanPlaygroundMsg:
+    device_id: str
+    device_nr: float
+    time_stamp: float
+    type: CleanPlaygroundMsgType
+    broadcast: Optional[bool] = None
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+    unicast_to: Optional[float] = None
+
+
+@dataclass
+class SpriteCollisionMsgSprite(api_types.SpriteCollisionMsgSprite):
+    pos_x: Optional[float] = None
+    pos_y: Optional[float] = None
+
+
+@dataclass
+class SpriteCollisionMsg(api_types.SpriteCollisionMsg):
+    sprites: List[SpriteCollisionMsgSprite]
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class SpriteOutMsg(api_types.SpriteOutMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class SpriteRemovedMsg:
+    device_id: str
+    device_nr: float
+    id: str
+    time_stamp: float
+    type: SpriteRemovedMsgType
+    broadcast: Optional[bool] = None
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+    unicast_to: Optional[float] = None
+
+
+@dataclass
+class SocketImage:
+    image: Union[bytes, str]
+    name: str
+    type: ImageFormats
+
+
+@dataclass
+class SocketAudio:
+    audio: bytes
+    name: str
+    type: AudioFormats
+    volume: Optional[float] = None
+
+
+@dataclass
+class PlaygroundConfig(api_types.PlaygroundConfig):
+    audio_tracks: Optional[List[SocketAudio]] = None
+    color: Optional[str] = None
+    image: Optional[str] = None
+    images: Optional[List[SocketImage]] = None
+
+
+@dataclass
+class PlaygroundConfigMsg(api_types.PlaygroundConfigMsg):
+    config: PlaygroundConfig
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class Line:
+    id: str
+    x1: float
+    x2: float
+    y1: float
+    y2: float
+    anchor: Optional[float] = None
+    color: Optional[str] = None
+    line_width: Optional[float] = None
+    rotate: Optional[float] = None
+    z_index: Optional[float] = None
+
+
+@dataclass
+class LineMsg:
+    device_id: str
+    device_nr: float
+    line: Line
+    time_stamp: float
+    type: LineMsgType
+    broadcast: Optional[bool] = None
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+    unicast_to: Optional[float] = None
+
+
+@dataclass
+class LinesMsg:
+    device_id: str
+    device_nr: float
+    lines: List[Line]
+    time_stamp: float
+    type: LinesMsgType
+    broadcast: Optional[bool] = None
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+    unicast_to: Optional[float] = None
+
+
+@dataclass
+class RemoveLineMsg:
+    device_id: str
+    device_nr: float
+    id: str
+    time_stamp: float
+    type: RemoveLineMsgType
+    broadcast: Optional[bool] = None
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+    unicast_to: Optional[float] = None
+
+
+@dataclass
+class UnknownMsg(api_types.UnknownMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class CancelUserInputMsg:
+    device_id: str
+    device_nr: float
+    input_type: CancelUserInputMsgInputType
+    time_stamp: float
+    type: CancelUserInputMsgType
+    broadcast: Optional[bool] = None
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    response_id: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+    unicast_to: Optional[float] = None
+
+
+@dataclass
+class StartAudioMsg:
+    device_id: str
+    device_nr: float
+    name: str
+    time_stamp: float
+    type: StartAudioMsgType
+    broadcast: Optional[bool] = None
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    id: Optional[str] = None
+    repeat: Optional[bool] = None
+    stop_propagation: Optional[bool] = None
+    unicast_to: Optional[float] = None
+    volume: Optional[float] = None
+
+
+@dataclass
+class StopAudioMsg:
+    device_id: str
+    device_nr: float
+    time_stamp: float
+    type: StopAudioMsgType
+    broadcast: Optional[bool] = None
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    id: Optional[str] = None
+    name: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+    unicast_to: Optional[float] = None
+
+
+@dataclass
+class AutoSpritePositionChangedMsg:
+    device_id: str
+    device_nr: float
+    id: str
+    movement_id: str
+    time_stamp: float
+    type: AutoSpritePositionChangedMsgType
+    x: float
+    y: float
+    broadcast: Optional[bool] = None
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+    unicast_to: Optional[float] = None
+
+
+@dataclass
+class ColorPointerMsg(api_types.ColorPointerMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    stop_propagation: Optional[bool] = None
+
+
+@dataclass
+class GridPointerMsg(api_types.GridPointerMsg):
+    cross_origin: Optional[bool] = None
+    deliver_to: Optional[str] = None
+    number: Optional[float] = None
+    stop_propagation: Optional[bool] = None
+
+
+# the message class of every ``type`` discriminator, ``pointer`` messages by their ``context``
+MESSAGE_CLASSES: Dict[str, type] = {
+    'acceleration': AccMsg,
+    'alert_confirm': AlertConfirmMsg,
+    'all_data': AllDataMsg,
+    'auto_movement_pos': AutoSpritePositionChangedMsg,
+    'cancel_user_input': CancelUserInputMsg,
+    'clean_playground': CleanPlaygroundMsg,
+    'clear_playground': ClearPlaygroundMsg,
+    'color': ColorMsg,
+    'grid': GridMsg,
+    'grid_update': GridUpdateMsg,
+    'gyro': GyroMsg,
+    'input_prompt': InputPromptMsg,
+    'input_response': InputResponseMsg,
+    'key': KeyMsg,
+    'line': LineMsg,
+    'lines': LinesMsg,
+    'notification': NotificationMsg,
+    'playground_config': PlaygroundConfigMsg,
+    'remove_line': RemoveLineMsg,
+    'remove_sprite': RemoveSpriteMsg,
+    'sprite': SpriteMsg,
+    'sprite_collision': SpriteCollisionMsg,
+    'sprite_out': SpriteOutMsg,
+    'sprite_removed': SpriteRemovedMsg,
+    'sprites': SpritesMsg,
+    'start_audio': StartAudioMsg,
+    'stop_audio': StopAudioMsg,
+    'unknown': UnknownMsg,
+}
+POINTER_CLASSES: Dict[str, type] = {
+    'color': ColorPointerMsg,
+    'grid': GridPointerMsg,
+}
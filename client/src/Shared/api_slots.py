@@ -0,0 +1,85 @@
+"""Slotted variants of the ``api_types`` dataclasses.
+
+Every dataclass of ``api_types`` is rebuilt here with ``__slots__`` and
+without an instance ``__dict__``, keeping its name, field order and defaults::
+
+    from api_slots import AccMsg, AccMsgType, decode
+
+Nested messages decoded with :func:`decode` are slotted as well. The frozen
+variants of :func:`decode_frozen` are named ``Frozen<name>`` (``FrozenAccMsg``).
+The enums are re-exported unchanged.
+"""
+import dataclasses
+import sys
+from typing import Dict
+
+import api_codec
+
+
+def _getstate(self) -> list:
+    return [getattr(self, name) for name in self.__slots__]
+
+
+def _setstate(self, state: list):
+    # ``object.__setattr__``, frozen instances refuse ``setattr``
+    for name, value in zip(self.__slots__, state):
+        object.__setattr__(self, name, value)
+
+
+def _add_slots(cls: type) -> type:
+    # same approach as ``dataclass(slots=True)`` (python >= 3.10): recreate the
+    # class, since ``__slots__`` can not be added to an existing class
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+    cls_dict['__slots__'] = field_names
+    for name in field_names:
+        # default values are already bound to ``__init__``
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    # pickle and copy, the default state of slotted instances is restored with ``setattr``
+    cls_dict['__getstate__'] = _getstate
+    cls_dict['__setstate__'] = _setstate
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+def slotted(cls: type, frozen: bool = False) -> type:
+    """A slotted copy of the dataclass ``cls`` with the same fields and defaults,
+    the frozen copy is named ``Frozen<name>``."""
+    fields = [
+        (f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory))
+        for f in dataclasses.fields(cls)
+    ]
+    # ``DATACLASS`` as on the lazy views, e.g. for the schema of ``session_log``
+    namespace = {'__module__': __name__, 'DATACLASS': cls}
+    name = f'Frozen{cls.__name__}' if frozen else cls.__name__
+    plain = dataclasses.make_dataclass(name, fields, frozen=frozen, namespace=namespace)
+    return _add_slots(plain)
+
+
+SLOTTED: Dict[type, type] = {cls: slotted(cls) for cls in api_codec.DATACLASSES}
+FROZEN: Dict[type, type] = {cls: slotted(cls, frozen=True) for cls in api_codec.DATACLASSES}
+
+_module = sys.modules[__name__]
+for _cls in api_codec.ENUMS:
+    setattr(_module, _cls.__name__, _cls)
+for _slotted in (*SLOTTED.values(), *FROZEN.values()):
+    setattr(_module, _slotted.__name__, _slotted)
+
+__all__ = (
+    [cls.__name__ for cls in api_codec.ENUMS]
+    + [cls.__name__ for cls in SLOTTED.values()]
+    + [cls.__name__ for cls in FROZEN.values()]
+    + ['decode', 'decode_frozen']
+)
+
+DECODERS = api_codec.DecoderCompiler(api_codec.DATACLASSES, targets=SLOTTED).compile()
+FROZEN_DECODERS = api_codec.DecoderCompiler(api_codec.DATACLASSES, targets=FROZEN).compile()
+
+decode = api_codec.make_decoder(DECODERS)
+decode_frozen = api_codec.make_decoder(FROZEN_DECODERS)
+
+# the generated encoders only access attributes, they work for the slotted variants as well
+for _cls in api_codec.DATACLASSES:
+    api_codec.ENCODERS[SLOTTED[_cls]] = api_codec.ENCODERS[_cls]
+    api_codec.ENCODERS[FROZEN[_cls]] = api_codec.ENCODERS[_cls]
@@ -0,0 +1,1964 @@
+# Generated from the quicktype output by gen_api_types.py (yarn to-py), do not edit.
+"""The dataclasses and enums of SharedTypings.ts, each built on first access.
+
+``from api_types import KeyMsg`` only builds ``KeyMsg`` and the definitions it
+references, :func:`load_all` builds all of them.
+"""
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional, List, Union
+
+__all__ = [
+    'BaseMsg',
+    'DataType',
+    'DataPkg',
+    'SendDataPkg',
+    'DataMsg',
+    'NotificationType',
+    'NotificationMsgType',
+    'NotificationMsg',
+    'SocketEvents',
+    'ErrorMsg',
+    'AlertConfirm',
+    'AlertConfirmMsgType',
+    'AlertConfirmMsg',
+    'ClientDataMsgInputType',
+    'InputPromptMsgType',
+    'InputPromptMsg',
+    'SelectionPromptInputType',
+    'SelectionPrompt',
+    'InputResponse',
+    'InputResponseMsgType',
+    'InputResponseMsg',
+    'PointerContext',
+    'PointerDataMsgType',
+    'PointerDataMsg',
+    'ColorPointer',
+    'ColorPointerMsgContext',
+    'ColorPointerMsg',
+    'ColorPanel',
+    'ColorPanelMsg',
+    'GridPointer',
+    'GridPointerMsgContext',
+    'GridPointerMsg',
+    'ColorName',
+    'Grid',
+    'GridMsg',
+    'GridUpdateMsgType',
+    'GridUpdateMsg',
+    'ColorMsg',
+    'NewDevice',
+    'MessageType',
+    'Device',
+    'RoomLeftPkg',
+    'UnknownMsgType',
+    'UnknownMsg',
+    'PlaygroundConfig',
+    'Key',
+    'Overlap',
+    'SpriteForm',
+    'Sprite',
+    'ClientDataMsgSprite',
+    'ClientDataMsgType',
+    'DataStore',
+    'ClientDataMsg',
+    'PartialDataMsgSprite',
+    'PartialDataMsg',
+    'AllDataMsgType',
+    'AllDataMsg',
+    'DevicesPkg',
+    'KeyMsgType',
+    'KeyMsg',
+    'TimeStampedMsg',
+    'InformationPkg',
+    'SetDeviceNr',
+    'RoomDevice',
+    'DeviceIDPkg',
+    'Playground',
+    'PlaygroundConfigMsgType',
+    'PlaygroundConfigMsg',
+    'SpriteCollisionSprite',
+    'SpriteCollision',
+    'SpriteCollisionMsgSprite',
+    'SpriteCollisionMsgType',
+    'SpriteCollisionMsg',
+    'SpriteClicked',
+    'SpriteClickedMsgType',
+    'SpriteClickedMsg',
+    'SpriteOut',
+    'SpriteOutMsgType',
+    'SpriteOutMsg',
+    'SpriteMsgType',
+    'SpriteMsg',
+    'SpritesMsgType',
+    'SpritesMsg',
+    'RemoveSpriteMsgType',
+    'RemoveSpriteMsg',
+    'ClearPlaygroundMsgType',
+    'ClearPlaygroundMsg',
+    'UpdateSprite',
+    'BorderSide',
+    'BorderOverlap',
+    'BorderOverlapMsgType',
+    'BorderOverlapMsg',
+    'Acc',
+    'Gyro',
+    'AccMsgType',
+    'AccMsg',
+    'GyroMsgType',
+    'GyroMsg',
+    'PartialNotificationMsg',
+    'PartialAlertConfirmMsg',
+    'PartialInputPromptMsg',
+    'PartialInputResponseMsg',
+    'PartialPointerDataMsg',
+    'PartialGridMsg',
+    'PartialGridUpdateMsg',
+    'PartialColorMsg',
+    'PartialUnknownMsg',
+    'PartialKeyMsg',
+    'PartialAccMsg',
+    'PartialGyroMsg',
+    'PartialAllDataMsg',
+    'PartialSpriteMsg',
+    'PartialSpritesMsg',
+    'PartialRemoveSpriteMsg',
+    'PartialClearPlaygroundMsg',
+    'PartialSpriteCollisionMsgSprite',
+    'PartialSpriteCollisionMsg',
+    'PartialSpriteOutMsg',
+    'PartialPlaygroundConfigMsg',
+]
+
+# the definitions referenced by each definition
+_DEPENDENCIES = {
+    'BaseMsg': (),
+    'DataType': (),
+    'DataPkg': ('DataType',),
+    'SendDataPkg': ('DataType',),
+    'DataMsg': ('DataType',),
+    'NotificationType': (),
+    'NotificationMsgType': (),
+    'NotificationMsg': ('NotificationType', 'NotificationMsgType'),
+    'SocketEvents': (),
+    'ErrorMsg': ('SocketEvents',),
+    'AlertConfirm': (),
+    'AlertConfirmMsgType': (),
+    'AlertConfirmMsg': ('AlertConfirmMsgType',),
+    'ClientDataMsgInputType': (),
+    'InputPromptMsgType': (),
+    'InputPromptMsg': ('ClientDataMsgInputType', 'InputPromptMsgType'),
+    'SelectionPromptInputType': (),
+    'SelectionPrompt': ('InputPromptMsgType', 'SelectionPromptInputType'),
+    'InputResponse': (),
+    'InputResponseMsgType': (),
+    'InputResponseMsg': ('InputResponseMsgType',),
+    'PointerContext': (),
+    'PointerDataMsgType': (),
+    'PointerDataMsg': ('PointerContext', 'PointerDataMsgType'),
+    'ColorPointer': (),
+    'ColorPointerMsgContext': (),
+    'ColorPointerMsg': ('PointerDataMsgType', 'ColorPointerMsgContext'),
+    'ColorPanel': (),
+    'ColorPanelMsg': ('ColorPointerMsgContext',),
+    'GridPointer': (),
+    'GridPointerMsgContext': (),
+    'GridPointerMsg': ('PointerDataMsgType', 'GridPointerMsgContext'),
+    'ColorName': (),
+    'Grid': ('ColorName',),
+    'GridMsg': ('GridPointerMsgContext', 'ColorName'),
+    'GridUpdateMsgType': (),
+    'GridUpdateMsg': ('ColorName', 'GridUpdateMsgType'),
+    'ColorMsg': ('ColorPointerMsgContext',),
+    'NewDevice': (),
+    'MessageType': ('DataType',),
+    'Device': (),
+    'RoomLeftPkg': ('Device',),
+    'UnknownMsgType': (),
+    'UnknownMsg': ('UnknownMsgType',),
+    'PlaygroundConfig': (),
+    'Key': (),
+    'Overlap': (),
+    'SpriteForm': (),
+    'Sprite': ('SpriteForm',),
+    'ClientDataMsgSprite': ('SpriteForm',),
+    'ClientDataMsgType': (),
+    'DataStore': (),
+    'ClientDataMsg': ('NotificationType', 'ClientDataMsgInputType', 'PointerContext', 'ColorName', 'PlaygroundConfig', 'Key', 'Overlap', 'Sprite', 'ClientDataMsgSprite', 'ClientDataMsgType', 'DataStore'),
+    'PartialDataMsgSprite': ('SpriteForm',),
+    'PartialDataMsg': ('NotificationType', 'ClientDataMsgInputType', 'PointerContext', 'ColorName', 'PlaygroundConfig', 'Key', 'Overlap', 'Sprite', 'ClientDataMsgType', 'DataStore', 'PartialDataMsgSprite'),
+    'AllDataMsgType': (),
+    'AllDataMsg': ('DataStore', 'AllDataMsgType'),
+    'DevicesPkg': ('Device',),
+    'KeyMsgType': (),
+    'KeyMsg': ('Key', 'KeyMsgType'),
+    'TimeStampedMsg': (),
+    'InformationPkg': ('TimeStampedMsg',),
+    'SetDeviceNr': (),
+    'RoomDevice': ('Device',),
+    'DeviceIDPkg': (),
+    'Playground': (),
+    'PlaygroundConfigMsgType': (),
+    'PlaygroundConfigMsg': ('PlaygroundConfig', 'PlaygroundConfigMsgType'),
+    'SpriteCollisionSprite': (),
+    'SpriteCollision': ('Overlap', 'SpriteCollisionSprite'),
+    'SpriteCollisionMsgSprite': (),
+    'SpriteCollisionMsgType': (),
+    'SpriteCollisionMsg': ('Overlap', 'SpriteCollisionMsgSprite', 'SpriteCollisionMsgType'),
+    'SpriteClicked': (),
+    'SpriteClickedMsgType': (),
+    'SpriteClickedMsg': ('SpriteClickedMsgType',),
+    'SpriteOut': (),
+    'SpriteOutMsgType': (),
+    'SpriteOutMsg': ('SpriteOutMsgType',),
+    'SpriteMsgType': (),
+    'SpriteMsg': ('Sprite', 'SpriteMsgType'),
+    'SpritesMsgType': (),
+    'SpritesMsg': ('Sprite', 'SpritesMsgType'),
+    'RemoveSpriteMsgType': (),
+    'RemoveSpriteMsg': ('RemoveSpriteMsgType',),
+    'ClearPlaygroundMsgType': (),
+    'ClearPlaygroundMsg': ('ClearPlaygroundMsgType',),
+    'UpdateSprite': ('SpriteForm',),
+    'BorderSide': (),
+    'BorderOverlap': ('BorderSide',),
+    'BorderOverlapMsgType': (),
+    'BorderOverlapMsg': ('BorderOverlap', 'BorderOverlapMsgType'),
+    'Acc': (),
+    'Gyro': (),
+    'AccMsgType': (),
+    'AccMsg': ('AccMsgType',),
+    'GyroMsgType': (),
+    'GyroMsg': ('GyroMsgType',),
+    'PartialNotificationMsg': ('NotificationType', 'NotificationMsgType'),
+    'PartialAlertConfirmMsg': ('AlertConfirmMsgType',),
+    'PartialInputPromptMsg': ('ClientDataMsgInputType', 'InputPromptMsgType'),
+    'PartialInputResponseMsg': ('InputResponseMsgType',),
+    'PartialPointerDataMsg': ('PointerContext', 'PointerDataMsgType'),
+    'PartialGridMsg': ('GridPointerMsgContext', 'ColorName'),
+    'PartialGridUpdateMsg': ('ColorName', 'GridUpdateMsgType'),
+    'PartialColorMsg': ('ColorPointerMsgContext',),
+    'PartialUnknownMsg': ('UnknownMsgType',),
+    'PartialKeyMsg': ('Key', 'KeyMsgType'),
+    'PartialAccMsg': ('AccMsgType',),
+    'PartialGyroMsg': ('GyroMsgType',),
+    'PartialAllDataMsg': ('DataStore', 'AllDataMsgType'),
+    'PartialSpriteMsg': ('Sprite', 'SpriteMsgType'),
+    'PartialSpritesMsg': ('Sprite', 'SpritesMsgType'),
+    'PartialRemoveSpriteMsg': ('RemoveSpriteMsgType',),
+    'PartialClearPlaygroundMsg': ('ClearPlaygroundMsgType',),
+    'PartialSpriteCollisionMsgSprite': (),
+    'PartialSpriteCollisionMsg': ('Overlap', 'SpriteCollisionMsgType', 'PartialSpriteCollisionMsgSprite'),
+    'PartialSpriteOutMsg': ('SpriteOutMsgType',),
+    'PartialPlaygroundConfigMsg': ('PlaygroundConfig', 'PlaygroundConfigMsgType'),
+}
+# the definitions referenced by the string annotations of each definition
+_REFERENCES = {
+    'BaseMsg': (),
+    'DataType': (),
+    'DataPkg': (),
+    'SendDataPkg': (),
+    'DataMsg': (),
+    'NotificationType': (),
+    'NotificationMsgType': (),
+    'NotificationMsg': (),
+    'SocketEvents': (),
+    'ErrorMsg': (),
+    'AlertConfirm': (),
+    'AlertConfirmMsgType': (),
+    'AlertConfirmMsg': (),
+    'ClientDataMsgInputType': (),
+    'InputPromptMsgType': (),
+    'InputPromptMsg': (),
+    'SelectionPromptInputType': (),
+    'SelectionPrompt': (),
+    'InputResponse': (),
+    'InputResponseMsgType': (),
+    'InputResponseMsg': (),
+    'PointerContext': (),
+    'PointerDataMsgType': (),
+    'PointerDataMsg': (),
+    'ColorPointer': (),
+    'ColorPointerMsgContext': (),
+    'ColorPointerMsg': (),
+    'ColorPanel': (),
+    'ColorPanelMsg': (),
+    'GridPointer': (),
+    'GridPointerMsgContext': (),
+    'GridPointerMsg': (),
+    'ColorName': (),
+    'Grid': (),
+    'GridMsg': (),
+    'GridUpdateMsgType': (),
+    'GridUpdateMsg': (),
+    'ColorMsg': (),
+    'NewDevice': (),
+    'MessageType': (),
+    'Device': (),
+    'RoomLeftPkg': (),
+    'UnknownMsgType': (),
+    'UnknownMsg': (),
+    'PlaygroundConfig': (),
+    'Key': (),
+    'Overlap': (),
+    'SpriteForm': (),
+    'Sprite': (),
+    'ClientDataMsgSprite': (),
+    'ClientDataMsgType': (),
+    'DataStore': ('ClientDataMsg',),
+    'ClientDataMsg': (),
+    'PartialDataMsgSprite': (),
+    'PartialDataMsg': (),
+    'AllDataMsgType': (),
+    'AllDataMsg': (),
+    'DevicesPkg': (),
+    'KeyMsgType': (),
+    'KeyMsg': (),
+    'TimeStampedMsg': (),
+    'InformationPkg': (),
+    'SetDeviceNr': (),
+    'RoomDevice': (),
+    'DeviceIDPkg': (),
+    'Playground': (),
+    'PlaygroundConfigMsgType': (),
+    'PlaygroundConfigMsg': (),
+    'SpriteCollisionSprite': (),
+    'SpriteCollision': (),
+    'SpriteCollisionMsgSprite': (),
+    'SpriteCollisionMsgType': (),
+    'SpriteCollisionMsg': (),
+    'SpriteClicked': (),
+    'SpriteClickedMsgType': (),
+    'SpriteClickedMsg': (),
+    'SpriteOut': (),
+    'SpriteOutMsgType': (),
+    'SpriteOutMsg': (),
+    'SpriteMsgType': (),
+    'SpriteMsg': (),
+    'SpritesMsgType': (),
+    'SpritesMsg': (),
+    'RemoveSpriteMsgType': (),
+    'RemoveSpriteMsg': (),
+    'ClearPlaygroundMsgType': (),
+    'ClearPlaygroundMsg': (),
+    'UpdateSprite': (),
+    'BorderSide': (),
+    'BorderOverlap': (),
+    'BorderOverlapMsgType': (),
+    'BorderOverlapMsg': (),
+    'Acc': (),
+    'Gyro': (),
+    'AccMsgType': (),
+    'AccMsg': (),
+    'GyroMsgType': (),
+    'GyroMsg': (),
+    'PartialNotificationMsg': (),
+    'PartialAlertConfirmMsg': (),
+    'PartialInputPromptMsg': (),
+    'PartialInputResponseMsg': (),
+    'PartialPointerDataMsg': (),
+    'PartialGridMsg': (),
+    'PartialGridUpdateMsg': (),
+    'PartialColorMsg': (),
+    'PartialUnknownMsg': (),
+    'PartialKeyMsg': (),
+    'PartialAccMsg': (),
+    'PartialGyroMsg': (),
+    'PartialAllDataMsg': (),
+    'PartialSpriteMsg': (),
+    'PartialSpritesMsg': (),
+    'PartialRemoveSpriteMsg': (),
+    'PartialClearPlaygroundMsg': (),
+    'PartialSpriteCollisionMsgSprite': (),
+    'PartialSpriteCollisionMsg': (),
+    'PartialSpriteOutMsg': (),
+    'PartialPlaygroundConfigMsg': (),
+}
+
+_lock = threading.RLock()
+
+
+def __getattr__(name: str):
+    if name not in _DEPENDENCIES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    with _lock:
+        built = globals().get(name)
+        if built is None:
+            for dependency in _DEPENDENCIES[name]:
+                if dependency not in globals():
+                    __getattr__(dependency)
+            built = globals()[f'_build_{name}']()
+            built.__qualname__ = name
+            globals()[name] = built
+            for reference in _REFERENCES[name]:
+                if reference not in globals():
+                    __getattr__(reference)
+    return built
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def load_all():
+    """build every definition"""
+    for name in __all__:
+        if name not in globals():
+            __getattr__(name)
+
+
+def _build_BaseMsg():
+    @dataclass
+    class BaseMsg:
+        device_id: str
+        device_nr: float
+        time_stamp: float
+    return BaseMsg
+
+
+def _build_DataType():
+    class DataType(Enum):
+        ACCELERATION = "acceleration"
+        ALERT_CONFIRM = "alert_confirm"
+        ALL_DATA = "all_data"
+        BORDER_OVERLAP = "border_overlap"
+        CLEAR_PLAYGROUND = "clear_playground"
+        COLOR = "color"
+        GRID = "grid"
+        GRID_UPDATE = "grid_update"
+        GYRO = "gyro"
+        INPUT_PROMPT = "input_prompt"
+        INPUT_RESPONSE = "input_response"
+        KEY = "key"
+        NOTIFICATION = "notification"
+        PLAYGROUND_CONFIG = "playground_config"
+        POINTER = "pointer"
+        REMOVE_SPRITE = "remove_sprite"
+        SPRITE = "sprite"
+        SPRITES = "sprites"
+        SPRITE_CLICKED = "sprite_clicked"
+        SPRITE_COLLISION = "sprite_collision"
+        SPRITE_OUT = "sprite_out"
+        UNKNOWN = "unknown"
+    return DataType
+
+
+def _build_DataPkg():
+    @dataclass
+    class DataPkg:
+        type: DataType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return DataPkg
+
+
+def _build_SendDataPkg():
+    @dataclass
+    class SendDataPkg:
+        type: DataType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return SendDataPkg
+
+
+def _build_DataMsg():
+    @dataclass
+    class DataMsg:
+        device_id: str
+        device_nr: float
+        time_stamp: float
+        type: DataType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return DataMsg
+
+
+def _build_NotificationType():
+    class NotificationType(Enum):
+        ERROR = "error"
+        SUCCESS = "success"
+        WARN = "warn"
+    return NotificationType
+
+
+def _build_NotificationMsgType():
+    class NotificationMsgType(Enum):
+        NOTIFICATION = "notification"
+    return NotificationMsgType
+
+
+def _build_NotificationMsg():
+    @dataclass
+    class NotificationMsg:
+        device_id: str
+        device_nr: float
+        message: str
+        time_stamp: float
+        type: NotificationMsgType
+        alert: Optional[bool] = None
+        broadcast: Optional[bool] = None
+        notification_type: Optional[NotificationType] = None
+        response_id: Optional[str] = None
+        time: Optional[float] = None
+        unicast_to: Optional[float] = None
+    return NotificationMsg
+
+
+def _build_SocketEvents():
+    class SocketEvents(Enum):
+        ALL_DATA = "all_data"
+        CLEAR_DATA = "clear_data"
+        DATA_STORE = "data_store"
+        DEVICE = "device"
+        DEVICES = "devices"
+        ERROR_MSG = "error_msg"
+        GET_ALL_DATA = "get_all_data"
+        GET_DEVICES = "get_devices"
+        INFORMATION_MSG = "information_msg"
+        JOIN_ROOM = "join_room"
+        LEAVE_ROOM = "leave_room"
+        NEW_DATA = "new_data"
+        NEW_DEVICE = "new_device"
+        REMOVE_ALL = "remove_all"
+        ROOM_JOINED = "room_joined"
+        ROOM_LEFT = "room_left"
+        SET_NEW_DEVICE_NR = "set_new_device_nr"
+    return SocketEvents
+
+
+def _build_ErrorMsg():
+    @dataclass
+    class ErrorMsg:
+        err: str
+        msg: str
+        type: SocketEvents
+    return ErrorMsg
+
+
+def _build_AlertConfirm():
+    @dataclass
+    class AlertConfirm:
+        displayed_at: float
+        caller_id: Optional[str] = None
+    return AlertConfirm
+
+
+def _build_AlertConfirmMsgType():
+    class AlertConfirmMsgType(Enum):
+        ALERT_CONFIRM = "alert_confirm"
+    return AlertConfirmMsgType
+
+
+def _build_AlertConfirmMsg():
+    @dataclass
+    class AlertConfirmMsg:
+        device_id: str
+        device_nr: float
+        displayed_at: float
+        time_stamp: float
+        type: AlertConfirmMsgType
+        broadcast: Optional[bool] = None
+        caller_id: Optional[str] = None
+        unicast_to: Optional[float] = None
+    return AlertConfirmMsg
+
+
+def _build_ClientDataMsgInputType():
+    class ClientDataMsgInputType(Enum):
+        DATE = "date"
+        DATETIME_LOCAL = "datetime-local"
+        NUMBER = "number"
+        SELECT = "select"
+        TEXT = "text"
+        TIME = "time"
+    return ClientDataMsgInputType
+
+
+def _build_InputPromptMsgType():
+    class InputPromptMsgType(Enum):
+        INPUT_PROMPT = "input_prompt"
+    return InputPromptMsgType
+
+
+def _build_InputPromptMsg():
+    @dataclass
+    class InputPromptMsg:
+        device_id: str
+        device_nr: float
+        question: str
+        response_id: str
+        time_stamp: float
+        type: InputPromptMsgType
+        broadcast: Optional[bool] = None
+        input_type: Optional[ClientDataMsgInputType] = None
+        options: Optional[List[str]] = None
+        unicast_to: Optional[float] = None
+    return InputPromptMsg
+
+
+def _build_SelectionPromptInputType():
+    class SelectionPromptInputType(Enum):
+        SELECT = "select"
+    return SelectionPromptInputType
+
+
+def _build_SelectionPrompt():
+    @dataclass
+    class SelectionPrompt:
+        device_id: str
+        device_nr: float
+        input_type: SelectionPromptInputType
+        options: List[str]
+        question: str
+        response_id: str
+        time_stamp: float
+        type: InputPromptMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return SelectionPrompt
+
+
+def _build_InputResponse():
+    @dataclass
+    class InputResponse:
+        displayed_at: float
+        response: Union[float, None, str]
+    return InputResponse
+
+
+def _build_InputResponseMsgType():
+    class InputResponseMsgType(Enum):
+        INPUT_RESPONSE = "input_response"
+    return InputResponseMsgType
+
+
+def _build_InputResponseMsg():
+    @dataclass
+    class InputResponseMsg:
+        caller_id: str
+        device_id: str
+        device_nr: float
+        displayed_at: float
+        response: Union[float, None, str]
+        time_stamp: float
+        type: InputResponseMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return InputResponseMsg
+
+
+def _build_PointerContext():
+    class PointerContext(Enum):
+        COLOR = "color"
+        GRID = "grid"
+    return PointerContext
+
+
+def _build_PointerDataMsgType():
+    class PointerDataMsgType(Enum):
+        POINTER = "pointer"
+    return PointerDataMsgType
+
+
+def _build_PointerDataMsg():
+    @dataclass
+    class PointerDataMsg:
+        context: PointerContext
+        device_id: str
+        device_nr: float
+        time_stamp: float
+        type: PointerDataMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return PointerDataMsg
+
+
+def _build_ColorPointer():
+    @dataclass
+    class ColorPointer:
+        color: str
+        displayed_at: float
+        height: float
+        width: float
+        x: float
+        y: float
+    return ColorPointer
+
+
+def _build_ColorPointerMsgContext():
+    class ColorPointerMsgContext(Enum):
+        COLOR = "color"
+    return ColorPointerMsgContext
+
+
+def _build_ColorPointerMsg():
+    @dataclass
+    class ColorPointerMsg:
+        color: str
+        context: ColorPointerMsgContext
+        device_id: str
+        device_nr: float
+        displayed_at: float
+        height: float
+        time_stamp: float
+        type: PointerDataMsgType
+        width: float
+        x: float
+        y: float
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return ColorPointerMsg
+
+
+def _build_ColorPanel():
+    @dataclass
+    class ColorPanel:
+        color: Union[List[float], float, str]
+    return ColorPanel
+
+
+def _build_ColorPanelMsg():
+    @dataclass
+    class ColorPanelMsg:
+        color: Union[List[float], float, str]
+        device_id: str
+        device_nr: float
+        time_stamp: float
+        type: ColorPointerMsgContext
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return ColorPanelMsg
+
+
+def _build_GridPointer():
+    @dataclass
+    class GridPointer:
+        color: Union[List[float], float, None, str]
+        column: float
+        displayed_at: float
+        row: float
+    return GridPointer
+
+
+def _build_GridPointerMsgContext():
+    class GridPointerMsgContext(Enum):
+        GRID = "grid"
+    return GridPointerMsgContext
+
+
+def _build_GridPointerMsg():
+    @dataclass
+    class GridPointerMsg:
+        color: Union[List[float], float, None, str]
+        column: float
+        context: GridPointerMsgContext
+        device_id: str
+        device_nr: float
+        displayed_at: float
+        row: float
+        time_stamp: float
+        type: PointerDataMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return GridPointerMsg
+
+
+def _build_ColorName():
+    class ColorName(Enum):
+        ALICEBLUE = "aliceblue"
+        ANTIQUEWHITE = "antiquewhite"
+        AQUA = "aqua"
+        AQUAMARINE = "aquamarine"
+        AZURE = "azure"
+        BEIGE = "beige"
+        BISQUE = "bisque"
+        BLACK = "black"
+        BLANCHEDALMOND = "blanchedalmond"
+        BLUE = "blue"
+        BLUEVIOLET = "blueviolet"
+        BROWN = "brown"
+        BURLYWOOD = "burlywood"
+        CADETBLUE = "cadetblue"
+        CHARTREUSE = "chartreuse"
+        CHOCOLATE = "chocolate"
+        CORAL = "coral"
+        CORNFLOWERBLUE = "cornflowerblue"
+        CORNSILK = "cornsilk"
+        CRIMSON = "crimson"
+        CYAN = "cyan"
+        DARKBLUE = "darkblue"
+        DARKCYAN = "darkcyan"
+        DARKGOLDENROD = "darkgoldenrod"
+        DARKGRAY = "darkgray"
+        DARKGREEN = "darkgreen"
+        DARKKHAKI = "darkkhaki"
+        DARKMAGENTA = "darkmagenta"
+        DARKOLIVEGREEN = "darkolivegreen"
+        DARKORANGE = "darkorange"
+        DARKORCHID = "darkorchid"
+        DARKRED = "darkred"
+        DARKSALMON = "darksalmon"
+        DARKSEAGREEN = "darkseagreen"
+        DARKSLATEBLUE = "darkslateblue"
+        DARKSLATEGRAY = "darkslategray"
+        DARKTURQUOISE = "darkturquoise"
+        DARKVIOLET = "darkviolet"
+        DEEPPINK = "deeppink"
+        DEEPSKYBLUE = "deepskyblue"
+        DIMGRAY = "dimgray"
+        DODGERBLUE = "dodgerblue"
+        FIREBRICK = "firebrick"
+        FLORALWHITE = "floralwhite"
+        FORESTGREEN = "forestgreen"
+        FUCHSIA = "fuchsia"
+        GAINSBORO = "gainsboro"
+        GHOSTWHITE = "ghostwhite"
+        GOLD = "gold"
+        GOLDENROD = "goldenrod"
+        GRAY = "gray"
+        GREEN = "green"
+        GREENYELLOW = "greenyellow"
+        HONEYDEW = "honeydew"
+        HOTPINK = "hotpink"
+        INDIANRED = "indianred"
+        INDIGO = "indigo"
+        IVORY = "ivory"
+        KHAKI = "khaki"
+        LAVENDER = "lavender"
+        LAVENDERBLUSH = "lavenderblush"
+        LAWNGREEN = "lawngreen"
+        LEMONCHIFFON = "lemonchiffon"
+        LIGHTBLUE = "lightblue"
+        LIGHTCORAL = "lightcoral"
+        LIGHTCYAN = "lightcyan"
+        LIGHTGOLDENRODYELLOW = "lightgoldenrodyellow"
+        LIGHTGREEN = "lightgreen"
+        LIGHTGREY = "lightgrey"
+        LIGHTPINK = "lightpink"
+        LIGHTSALMON = "lightsalmon"
+        LIGHTSEAGREEN = "lightseagreen"
+        LIGHTSKYBLUE = "lightskyblue"
+        LIGHTSLATEGRAY = "lightslategray"
+        LIGHTSTEELBLUE = "lightsteelblue"
+        LIGHTYELLOW = "lightyellow"
+        LIME = "lime"
+        LIMEGREEN = "limegreen"
+        LINEN = "linen"
+        MAGENTA = "magenta"
+        MAROON = "maroon"
+        MEDIUMAQUAMARINE = "mediumaquamarine"
+        MEDIUMBLUE = "mediumblue"
+        MEDIUMORCHID = "mediumorchid"
+        MEDIUMPURPLE = "mediumpurple"
+        MEDIUMSEAGREEN = "mediumseagreen"
+        MEDIUMSLATEBLUE = "mediumslateblue"
+        MEDIUMSPRINGGREEN = "mediumspringgreen"
+        MEDIUMTURQUOISE = "mediumturquoise"
+        MEDIUMVIOLETRED = "mediumvioletred"
+        MIDNIGHTBLUE = "midnightblue"
+        MINTCREAM = "mintcream"
+        MISTYROSE = "mistyrose"
+        MOCCASIN = "moccasin"
+        NAVAJOWHITE = "navajowhite"
+        NAVY = "navy"
+        OLDLACE = "oldlace"
+        OLIVE = "olive"
+        OLIVEDRAB = "olivedrab"
+        ORANGE = "orange"
+        ORANGERED = "orangered"
+        ORCHID = "orchid"
+        PALEGOLDENROD = "palegoldenrod"
+        PALEGREEN = "palegreen"
+        PALETURQUOISE = "paleturquoise"
+        PALEVIOLETRED = "palevioletred"
+        PAPAYAWHIP = "papayawhip"
+        PEACHPUFF = "peachpuff"
+        PERU = "peru"
+        PINK = "pink"
+        PLUM = "plum"
+        POWDERBLUE = "powderblue"
+        PURPLE = "purple"
+        REBECCAPURPLE = "rebeccapurple"
+        RED = "red"
+        ROSYBROWN = "rosybrown"
+        ROYALBLUE = "royalblue"
+        SADDLEBROWN = "saddlebrown"
+        SALMON = "salmon"
+        SANDYBROWN = "sandybrown"
+        SEAGREEN = "seagreen"
+        SEASHELL = "seashell"
+        SIENNA = "sienna"
+        SILVER = "silver"
+        SKYBLUE = "skyblue"
+        SLATEBLUE = "slateblue"
+        SLATEGRAY = "slategray"
+        SNOW = "snow"
+        SPRINGGREEN = "springgreen"
+        STEELBLUE = "steelblue"
+        TAN = "tan"
+        TEAL = "teal"
+        THISTLE = "thistle"
+        TOMATO = "tomato"
+        TURQUOISE = "turquoise"
+        VIOLET = "violet"
+        WHEAT = "wheat"
+        WHITE = "white"
+        WHITESMOKE = "whitesmoke"
+        YELLOW = "yellow"
+        YELLOWGREEN = "yellowgreen"
+    return ColorName
+
+
+def _build_Grid():
+    @dataclass
+    class Grid:
+        base_color: Union[List[float], ColorName, None]
+        grid: Union[List[Union[List[Union[List[float], float, str]], str]], str]
+    return Grid
+
+
+def _build_GridMsg():
+    @dataclass
+    class GridMsg:
+        base_color: Union[List[float], ColorName, None]
+        device_id: str
+        device_nr: float
+        grid: Union[List[Union[List[Union[List[float], float, str]], str]], str]
+        time_stamp: float
+        type: GridPointerMsgContext
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return GridMsg
+
+
+def _build_GridUpdateMsgType():
+    class GridUpdateMsgType(Enum):
+        GRID_UPDATE = "grid_update"
+    return GridUpdateMsgType
+
+
+def _build_GridUpdateMsg():
+    @dataclass
+    class GridUpdateMsg:
+        base_color: Union[List[float], ColorName, None]
+        color: Union[List[float], float, str]
+        column: float
+        device_id: str
+        device_nr: float
+        row: float
+        time_stamp: float
+        type: GridUpdateMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return GridUpdateMsg
+
+
+def _build_ColorMsg():
+    @dataclass
+    class ColorMsg:
+        color: str
+        device_id: str
+        device_nr: float
+        time_stamp: float
+        type: ColorPointerMsgContext
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return ColorMsg
+
+
+def _build_NewDevice():
+    @dataclass
+    class NewDevice:
+        device_id: str
+        is_client: bool
+        old_device_id: Optional[str] = None
+    return NewDevice
+
+
+def _build_MessageType():
+    @dataclass
+    class MessageType:
+        broadcast: Optional[bool] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        is_client: Optional[bool] = None
+        old_device_id: Optional[str] = None
+        time_stamp: Optional[float] = None
+        type: Optional[DataType] = None
+        unicast_to: Optional[float] = None
+    return MessageType
+
+
+def _build_Device():
+    @dataclass
+    class Device:
+        device_id: str
+        device_nr: float
+        is_client: bool
+        socket_id: str
+    return Device
+
+
+def _build_RoomLeftPkg():
+    @dataclass
+    class RoomLeftPkg:
+        device: Device
+        room: str
+    return RoomLeftPkg
+
+
+def _build_UnknownMsgType():
+    class UnknownMsgType(Enum):
+        UNKNOWN = "unknown"
+    return UnknownMsgType
+
+
+def _build_UnknownMsg():
+    @dataclass
+    class UnknownMsg:
+        device_id: str
+        device_nr: float
+        time_stamp: float
+        type: UnknownMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return UnknownMsg
+
+
+def _build_PlaygroundConfig():
+    @dataclass
+    class PlaygroundConfig:
+        height: Optional[float] = None
+        shift_x: Optional[float] = None
+        shift_y: Optional[float] = None
+        width: Optional[float] = None
+    return PlaygroundConfig
+
+
+def _build_Key():
+    class Key(Enum):
+        DOWN = "down"
+        F1 = "F1"
+        F2 = "F2"
+        F3 = "F3"
+        F4 = "F4"
+        HOME = "home"
+        LEFT = "left"
+        RIGHT = "right"
+        UP = "up"
+    return Key
+
+
+def _build_Overlap():
+    class Overlap(Enum):
+        IN = "in"
+        OUT = "out"
+    return Overlap
+
+
+def _build_SpriteForm():
+    class SpriteForm(Enum):
+        RECTANGLE = "rectangle"
+        ROUND = "round"
+    return SpriteForm
+
+
+def _build_Sprite():
+    @dataclass
+    class Sprite:
+        id: str
+        clickable: Optional[bool] = None
+        collision_detection: Optional[bool] = None
+        color: Optional[str] = None
+        direction: Optional[List[float]] = None
+        distance: Optional[float] = None
+        form: Optional[SpriteForm] = None
+        height: Optional[float] = None
+        pos_x: Optional[float] = None
+        pos_y: Optional[float] = None
+        reset_time: Optional[bool] = None
+        speed: Optional[float] = None
+        text: Optional[str] = None
+        time_span: Optional[float] = None
+        width: Optional[float] = None
+    return Sprite
+
+
+def _build_ClientDataMsgSprite():
+    @dataclass
+    class ClientDataMsgSprite:
+        id: str
+        clickable: Optional[bool] = None
+        collision_detection: Optional[bool] = None
+        color: Optional[str] = None
+        direction: Optional[List[float]] = None
+        distance: Optional[float] = None
+        form: Optional[SpriteForm] = None
+        height: Optional[float] = None
+        pos_x: Optional[float] = None
+        pos_y: Optional[float] = None
+        reset_time: Optional[bool] = None
+        speed: Optional[float] = None
+        text: Optional[str] = None
+        time_span: Optional[float] = None
+        width: Optional[float] = None
+    return ClientDataMsgSprite
+
+
+def _build_ClientDataMsgType():
+    class ClientDataMsgType(Enum):
+        ACCELERATION = "acceleration"
+        ALERT_CONFIRM = "alert_confirm"
+        ALL_DATA = "all_data"
+        CLEAR_PLAYGROUND = "clear_playground"
+        COLOR = "color"
+        GRID = "grid"
+        GRID_UPDATE = "grid_update"
+        GYRO = "gyro"
+        INPUT_PROMPT = "input_prompt"
+        INPUT_RESPONSE = "input_response"
+        KEY = "key"
+        NOTIFICATION = "notification"
+        PLAYGROUND_CONFIG = "playground_config"
+        POINTER = "pointer"
+        REMOVE_SPRITE = "remove_sprite"
+        SPRITE = "sprite"
+        SPRITES = "sprites"
+        SPRITE_COLLISION = "sprite_collision"
+        SPRITE_OUT = "sprite_out"
+        UNKNOWN = "unknown"
+    return ClientDataMsgType
+
+
+def _build_DataStore():
+    @dataclass
+    class DataStore:
+        acceleration: Optional[List['ClientDataMsg']] = None
+        alert_confirm: Optional[List['ClientDataMsg']] = None
+        all_data: Optional[List['ClientDataMsg']] = None
+        border_overlap: Optional[List['ClientDataMsg']] = None
+        clear_playground: Optional[List['ClientDataMsg']] = None
+        color: Optional[List['ClientDataMsg']] = None
+        grid: Optional[List['ClientDataMsg']] = None
+        grid_update: Optional[List['ClientDataMsg']] = None
+        gyro: Optional[List['ClientDataMsg']] = None
+        input_prompt: Optional[List['ClientDataMsg']] = None
+        input_response: Optional[List['ClientDataMsg']] = None
+        key: Optional[List['ClientDataMsg']] = None
+        notification: Optional[List['ClientDataMsg']] = None
+        playground_config: Optional[List['ClientDataMsg']] = None
+        pointer: Optional[List['ClientDataMsg']] = None
+        remove_sprite: Optional[List['ClientDataMsg']] = None
+        sprite: Optional[List['ClientDataMsg']] = None
+        sprite_clicked: Optional[List['ClientDataMsg']] = None
+        sprite_collision: Optional[List['ClientDataMsg']] = None
+        sprite_out: Optional[List['ClientDataMsg']] = None
+        sprites: Optional[List['ClientDataMsg']] = None
+        unknown: Optional[List['ClientDataMsg']] = None
+    return DataStore
+
+
+def _build_ClientDataMsg():
+    @dataclass
+    class ClientDataMsg:
+        base_color: Union[List[float], ColorName, None]
+        color: Union[List[float], float, None, str]
+        device_id: str
+        device_nr: float
+        grid: Union[List[Union[List[Union[List[float], float, str]], str]], None, str]
+        response: Union[float, None, str]
+        time_stamp: float
+        type: ClientDataMsgType
+        absolute: Optional[bool] = None
+        alert: Optional[bool] = None
+        all_data: Optional[DataStore] = None
+        alpha: Optional[float] = None
+        beta: Optional[float] = None
+        broadcast: Optional[bool] = None
+        caller_id: Optional[str] = None
+        column: Optional[float] = None
+        config: Optional[PlaygroundConfig] = None
+        context: Optional[PointerContext] = None
+        displayed_at: Optional[float] = None
+        gamma: Optional[float] = None
+        id: Optional[str] = None
+        input_type: Optional[ClientDataMsgInputType] = None
+        interval: Optional[float] = None
+        key: Optional[Key] = None
+        message: Optional[str] = None
+        notification_type: Optional[NotificationType] = None
+        options: Optional[List[str]] = None
+        overlap: Optional[Overlap] = None
+        question: Optional[str] = None
+        response_id: Optional[str] = None
+        row: Optional[float] = None
+        sprite: Optional[Sprite] = None
+        sprites: Optional[List[ClientDataMsgSprite]] = None
+        time: Optional[float] = None
+        unicast_to: Optional[float] = None
+        x: Optional[float] = None
+        y: Optional[float] = None
+        z: Optional[float] = None
+    return ClientDataMsg
+
+
+def _build_PartialDataMsgSprite():
+    @dataclass
+    class PartialDataMsgSprite:
+        id: str
+        clickable: Optional[bool] = None
+        collision_detection: Optional[bool] = None
+        color: Optional[str] = None
+        direction: Optional[List[float]] = None
+        distance: Optional[float] = None
+        form: Optional[SpriteForm] = None
+        height: Optional[float] = None
+        pos_x: Optional[float] = None
+        pos_y: Optional[float] = None
+        reset_time: Optional[bool] = None
+        speed: Optional[float] = None
+        text: Optional[str] = None
+        time_span: Optional[float] = None
+        width: Optional[float] = None
+    return PartialDataMsgSprite
+
+
+def _build_PartialDataMsg():
+    @dataclass
+    class PartialDataMsg:
+        base_color: Union[List[float], ColorName, None]
+        color: Union[List[float], float, None, str]
+        grid: Union[List[Union[List[Union[List[float], float, str]], str]], None, str]
+        response: Union[float, None, str]
+        absolute: Optional[bool] = None
+        alert: Optional[bool] = None
+        all_data: Optional[DataStore] = None
+        alpha: Optional[float] = None
+        beta: Optional[float] = None
+        broadcast: Optional[bool] = None
+        caller_id: Optional[str] = None
+        column: Optional[float] = None
+        config: Optional[PlaygroundConfig] = None
+        context: Optional[PointerContext] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        displayed_at: Optional[float] = None
+        gamma: Optional[float] = None
+        id: Optional[str] = None
+        input_type: Optional[ClientDataMsgInputType] = None
+        interval: Optional[float] = None
+        key: Optional[Key] = None
+        message: Optional[str] = None
+        notification_type: Optional[NotificationType] = None
+        options: Optional[List[str]] = None
+        overlap: Optional[Overlap] = None
+        question: Optional[str] = None
+        response_id: Optional[str] = None
+        row: Optional[float] = None
+        sprite: Optional[Sprite] = None
+        sprites: Optional[List[PartialDataMsgSprite]] = None
+        time: Optional[float] = None
+        time_stamp: Optional[float] = None
+        type: Optional[ClientDataMsgType] = None
+        unicast_to: Optional[float] = None
+        x: Optional[float] = None
+        y: Optional[float] = None
+        z: Optional[float] = None
+    return PartialDataMsg
+
+
+def _build_AllDataMsgType():
+    class AllDataMsgType(Enum):
+        ALL_DATA = "all_data"
+    return AllDataMsgType
+
+
+def _build_AllDataMsg():
+    @dataclass
+    class AllDataMsg:
+        all_data: DataStore
+        device_id: str
+        device_nr: float
+        time_stamp: float
+        type: AllDataMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return AllDataMsg
+
+
+def _build_DevicesPkg():
+    @dataclass
+    class DevicesPkg:
+        devices: List[Device]
+        time_stamp: float
+    return DevicesPkg
+
+
+def _build_KeyMsgType():
+    class KeyMsgType(Enum):
+        KEY = "key"
+    return KeyMsgType
+
+
+def _build_KeyMsg():
+    @dataclass
+    class KeyMsg:
+        device_id: str
+        device_nr: float
+        key: Key
+        time_stamp: float
+        type: KeyMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return KeyMsg
+
+
+def _build_TimeStampedMsg():
+    @dataclass
+    class TimeStampedMsg:
+        time_stamp: float
+    return TimeStampedMsg
+
+
+def _build_InformationPkg():
+    @dataclass
+    class InformationPkg:
+        action: TimeStampedMsg
+        message: str
+        time_stamp: float
+    return InformationPkg
+
+
+def _build_SetDeviceNr():
+    @dataclass
+    class SetDeviceNr:
+        device_id: str
+        new_device_nr: float
+        time_stamp: float
+        current_device_nr: Optional[float] = None
+    return SetDeviceNr
+
+
+def _build_RoomDevice():
+    @dataclass
+    class RoomDevice:
+        device: Device
+        room: str
+    return RoomDevice
+
+
+def _build_DeviceIDPkg():
+    @dataclass
+    class DeviceIDPkg:
+        device_id: str
+    return DeviceIDPkg
+
+
+def _build_Playground():
+    @dataclass
+    class Playground:
+        height: float
+        width: float
+        shift_x: Optional[float] = None
+        shift_y: Optional[float] = None
+    return Playground
+
+
+def _build_PlaygroundConfigMsgType():
+    class PlaygroundConfigMsgType(Enum):
+        PLAYGROUND_CONFIG = "playground_config"
+    return PlaygroundConfigMsgType
+
+
+def _build_PlaygroundConfigMsg():
+    @dataclass
+    class PlaygroundConfigMsg:
+        config: PlaygroundConfig
+        device_id: str
+        device_nr: float
+        time_stamp: float
+        type: PlaygroundConfigMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return PlaygroundConfigMsg
+
+
+def _build_SpriteCollisionSprite():
+    @dataclass
+    class SpriteCollisionSprite:
+        collision_detection: bool
+        id: str
+    return SpriteCollisionSprite
+
+
+def _build_SpriteCollision():
+    @dataclass
+    class SpriteCollision:
+        overlap: Overlap
+        sprites: List[SpriteCollisionSprite]
+    return SpriteCollision
+
+
+def _build_SpriteCollisionMsgSprite():
+    @dataclass
+    class SpriteCollisionMsgSprite:
+        collision_detection: bool
+        id: str
+    return SpriteCollisionMsgSprite
+
+
+def _build_SpriteCollisionMsgType():
+    class SpriteCollisionMsgType(Enum):
+        SPRITE_COLLISION = "sprite_collision"
+    return SpriteCollisionMsgType
+
+
+def _build_SpriteCollisionMsg():
+    @dataclass
+    class SpriteCollisionMsg:
+        device_id: str
+        device_nr: float
+        overlap: Overlap
+        sprites: List[SpriteCollisionMsgSprite]
+        time_stamp: float
+        type: SpriteCollisionMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return SpriteCollisionMsg
+
+
+def _build_SpriteClicked():
+    @dataclass
+    class SpriteClicked:
+        id: str
+        x: float
+        y: float
+        text: Optional[str] = None
+    return SpriteClicked
+
+
+def _build_SpriteClickedMsgType():
+    class SpriteClickedMsgType(Enum):
+        SPRITE_CLICKED = "sprite_clicked"
+    return SpriteClickedMsgType
+
+
+def _build_SpriteClickedMsg():
+    @dataclass
+    class SpriteClickedMsg:
+        device_id: str
+        device_nr: float
+        id: str
+        time_stamp: float
+        type: SpriteClickedMsgType
+        x: float
+        y: float
+        broadcast: Optional[bool] = None
+        text: Optional[str] = None
+        unicast_to: Optional[float] = None
+    return SpriteClickedMsg
+
+
+def _build_SpriteOut():
+    @dataclass
+    class SpriteOut:
+        id: str
+    return SpriteOut
+
+
+def _build_SpriteOutMsgType():
+    class SpriteOutMsgType(Enum):
+        SPRITE_OUT = "sprite_out"
+    return SpriteOutMsgType
+
+
+def _build_SpriteOutMsg():
+    @dataclass
+    class SpriteOutMsg:
+        device_id: str
+        device_nr: float
+        id: str
+        time_stamp: float
+        type: SpriteOutMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return SpriteOutMsg
+
+
+def _build_SpriteMsgType():
+    class SpriteMsgType(Enum):
+        SPRITE = "sprite"
+    return SpriteMsgType
+
+
+def _build_SpriteMsg():
+    @dataclass
+    class SpriteMsg:
+        device_id: str
+        device_nr: float
+        sprite: Sprite
+        time_stamp: float
+        type: SpriteMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return SpriteMsg
+
+
+def _build_SpritesMsgType():
+    class SpritesMsgType(Enum):
+        SPRITES = "sprites"
+    return SpritesMsgType
+
+
+def _build_SpritesMsg():
+    @dataclass
+    class SpritesMsg:
+        device_id: str
+        device_nr: float
+        sprites: List[Sprite]
+        time_stamp: float
+        type: SpritesMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return SpritesMsg
+
+
+def _build_RemoveSpriteMsgType():
+    class RemoveSpriteMsgType(Enum):
+        REMOVE_SPRITE = "remove_sprite"
+    return RemoveSpriteMsgType
+
+
+def _build_RemoveSpriteMsg():
+    @dataclass
+    class RemoveSpriteMsg:
+        device_id: str
+        device_nr: float
+        id: str
+        time_stamp: float
+        type: RemoveSpriteMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return RemoveSpriteMsg
+
+
+def _build_ClearPlaygroundMsgType():
+    class ClearPlaygroundMsgType(Enum):
+        CLEAR_PLAYGROUND = "clear_playground"
+    return ClearPlaygroundMsgType
+
+
+def _build_ClearPlaygroundMsg():
+    @dataclass
+    class ClearPlaygroundMsg:
+        device_id: str
+        device_nr: float
+        time_stamp: float
+        type: ClearPlaygroundMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return ClearPlaygroundMsg
+
+
+def _build_UpdateSprite():
+    @dataclass
+    class UpdateSprite:
+        id: str
+        color: Optional[str] = None
+        form: Optional[SpriteForm] = None
+        height: Optional[float] = None
+        pos_x: Optional[float] = None
+        pos_y: Optional[float] = None
+        width: Optional[float] = None
+    return UpdateSprite
+
+
+def _build_BorderSide():
+    class BorderSide(Enum):
+        BOTTOM = "bottom"
+        LEFT = "left"
+        RIGHT = "right"
+        TOP = "top"
+    return BorderSide
+
+
+def _build_BorderOverlap():
+    @dataclass
+    class BorderOverlap:
+        border: BorderSide
+        collision_detection: bool
+        id: str
+        x: float
+        y: float
+    return BorderOverlap
+
+
+def _build_BorderOverlapMsgType():
+    class BorderOverlapMsgType(Enum):
+        BORDER_OVERLAP = "border_overlap"
+    return BorderOverlapMsgType
+
+
+def _build_BorderOverlapMsg():
+    @dataclass
+    class BorderOverlapMsg:
+        border_overlap: BorderOverlap
+        device_id: str
+        device_nr: float
+        time_stamp: float
+        type: BorderOverlapMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return BorderOverlapMsg
+
+
+def _build_Acc():
+    @dataclass
+    class Acc:
+        interval: float
+        x: float
+        y: float
+        z: float
+    return Acc
+
+
+def _build_Gyro():
+    @dataclass
+    class Gyro:
+        absolute: bool
+        alpha: float
+        beta: float
+        gamma: float
+    return Gyro
+
+
+def _build_AccMsgType():
+    class AccMsgType(Enum):
+        ACCELERATION = "acceleration"
+    return AccMsgType
+
+
+def _build_AccMsg():
+    @dataclass
+    class AccMsg:
+        device_id: str
+        device_nr: float
+        interval: float
+        time_stamp: float
+        type: AccMsgType
+        x: float
+        y: float
+        z: float
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return AccMsg
+
+
+def _build_GyroMsgType():
+    class GyroMsgType(Enum):
+        GYRO = "gyro"
+    return GyroMsgType
+
+
+def _build_GyroMsg():
+    @dataclass
+    class GyroMsg:
+        absolute: bool
+        alpha: float
+        beta: float
+        device_id: str
+        device_nr: float
+        gamma: float
+        time_stamp: float
+        type: GyroMsgType
+        broadcast: Optional[bool] = None
+        unicast_to: Optional[float] = None
+    return GyroMsg
+
+
+def _build_PartialNotificationMsg():
+    @dataclass
+    class PartialNotificationMsg:
+        alert: Optional[bool] = None
+        broadcast: Optional[bool] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        message: Optional[str] = None
+        notification_type: Optional[NotificationType] = None
+        response_id: Optional[str] = None
+        time: Optional[float] = None
+        time_stamp: Optional[float] = None
+        type: Optional[NotificationMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialNotificationMsg
+
+
+def _build_PartialAlertConfirmMsg():
+    @dataclass
+    class PartialAlertConfirmMsg:
+        broadcast: Optional[bool] = None
+        caller_id: Optional[str] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        displayed_at: Optional[float] = None
+        time_stamp: Optional[float] = None
+        type: Optional[AlertConfirmMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialAlertConfirmMsg
+
+
+def _build_PartialInputPromptMsg():
+    @dataclass
+    class PartialInputPromptMsg:
+        broadcast: Optional[bool] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        input_type: Optional[ClientDataMsgInputType] = None
+        options: Optional[List[str]] = None
+        question: Optional[str] = None
+        response_id: Optional[str] = None
+        time_stamp: Optional[float] = None
+        type: Optional[InputPromptMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialInputPromptMsg
+
+
+def _build_PartialInputResponseMsg():
+    @dataclass
+    class PartialInputResponseMsg:
+        response: Union[float, None, str]
+        broadcast: Optional[bool] = None
+        caller_id: Optional[str] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        displayed_at: Optional[float] = None
+        time_stamp: Optional[float] = None
+        type: Optional[InputResponseMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialInputResponseMsg
+
+
+def _build_PartialPointerDataMsg():
+    @dataclass
+    class PartialPointerDataMsg:
+        broadcast: Optional[bool] = None
+        context: Optional[PointerContext] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        time_stamp: Optional[float] = None
+        type: Optional[PointerDataMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialPointerDataMsg
+
+
+def _build_PartialGridMsg():
+    @dataclass
+    class PartialGridMsg:
+        base_color: Union[List[float], ColorName, None]
+        grid: Union[List[Union[List[Union[List[float], float, str]], str]], None, str]
+        broadcast: Optional[bool] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        time_stamp: Optional[float] = None
+        type: Optional[GridPointerMsgContext] = None
+        unicast_to: Optional[float] = None
+    return PartialGridMsg
+
+
+def _build_PartialGridUpdateMsg():
+    @dataclass
+    class PartialGridUpdateMsg:
+        base_color: Union[List[float], ColorName, None]
+        color: Union[List[float], float, None, str]
+        broadcast: Optional[bool] = None
+        column: Optional[float] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        row: Optional[float] = None
+        time_stamp: Optional[float] = None
+        type: Optional[GridUpdateMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialGridUpdateMsg
+
+
+def _build_PartialColorMsg():
+    @dataclass
+    class PartialColorMsg:
+        broadcast: Optional[bool] = None
+        color: Optional[str] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        time_stamp: Optional[float] = None
+        type: Optional[ColorPointerMsgContext] = None
+        unicast_to: Optional[float] = None
+    return PartialColorMsg
+
+
+def _build_PartialUnknownMsg():
+    @dataclass
+    class PartialUnknownMsg:
+        broadcast: Optional[bool] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        time_stamp: Optional[float] = None
+        type: Optional[UnknownMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialUnknownMsg
+
+
+def _build_PartialKeyMsg():
+    @dataclass
+    class PartialKeyMsg:
+        broadcast: Optional[bool] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        key: Optional[Key] = None
+        time_stamp: Optional[float] = None
+        type: Optional[KeyMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialKeyMsg
+
+
+def _build_PartialAccMsg():
+    @dataclass
+    class PartialAccMsg:
+        broadcast: Optional[bool] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        interval: Optional[float] = None
+        time_stamp: Optional[float] = None
+        type: Optional[AccMsgType] = None
+        unicast_to: Optional[float] = None
+        x: Optional[float] = None
+        y: Optional[float] = None
+        z: Optional[float] = None
+    return PartialAccMsg
+
+
+def _build_PartialGyroMsg():
+    @dataclass
+    class PartialGyroMsg:
+        absolute: Optional[bool] = None
+        alpha: Optional[float] = None
+        beta: Optional[float] = None
+        broadcast: Optional[bool] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        gamma: Optional[float] = None
+        time_stamp: Optional[float] = None
+        type: Optional[GyroMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialGyroMsg
+
+
+def _build_PartialAllDataMsg():
+    @dataclass
+    class PartialAllDataMsg:
+        all_data: Optional[DataStore] = None
+        broadcast: Optional[bool] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        time_stamp: Optional[float] = None
+        type: Optional[AllDataMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialAllDataMsg
+
+
+def _build_PartialSpriteMsg():
+    @dataclass
+    class PartialSpriteMsg:
+        broadcast: Optional[bool] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        sprite: Optional[Sprite] = None
+        time_stamp: Optional[float] = None
+        type: Optional[SpriteMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialSpriteMsg
+
+
+def _build_PartialSpritesMsg():
+    @dataclass
+    class PartialSpritesMsg:
+        broadcast: Optional[bool] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        sprites: Optional[List[Sprite]] = None
+        time_stamp: Optional[float] = None
+        type: Optional[SpritesMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialSpritesMsg
+
+
+def _build_PartialRemoveSpriteMsg():
+    @dataclass
+    class PartialRemoveSpriteMsg:
+        broadcast: Optional[bool] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        id: Optional[str] = None
+        time_stamp: Optional[float] = None
+        type: Optional[RemoveSpriteMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialRemoveSpriteMsg
+
+
+def _build_PartialClearPlaygroundMsg():
+    @dataclass
+    class PartialClearPlaygroundMsg:
+        broadcast: Optional[bool] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        time_stamp: Optional[float] = None
+        type: Optional[ClearPlaygroundMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialClearPlaygroundMsg
+
+
+def _build_PartialSpriteCollisionMsgSprite():
+    @dataclass
+    class PartialSpriteCollisionMsgSprite:
+        collision_detection: bool
+        id: str
+    return PartialSpriteCollisionMsgSprite
+
+
+def _build_PartialSpriteCollisionMsg():
+    @dataclass
+    class PartialSpriteCollisionMsg:
+        broadcast: Optional[bool] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        overlap: Optional[Overlap] = None
+        sprites: Optional[List[PartialSpriteCollisionMsgSprite]] = None
+        time_stamp: Optional[float] = None
+        type: Optional[SpriteCollisionMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialSpriteCollisionMsg
+
+
+def _build_PartialSpriteOutMsg():
+    @dataclass
+    class PartialSpriteOutMsg:
+        broadcast: Optional[bool] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        id: Optional[str] = None
+        time_stamp: Optional[float] = None
+        type: Optional[SpriteOutMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialSpriteOutMsg
+
+
+def _build_PartialPlaygroundConfigMsg():
+    @dataclass
+    class PartialPlaygroundConfigMsg:
+        broadcast: Optional[bool] = None
+        config: Optional[PlaygroundConfig] = None
+        device_id: Optional[str] = None
+        device_nr: Optional[float] = None
+        time_stamp: Optional[float] = None
+        type: Optional[PlaygroundConfigMsgType] = None
+        unicast_to: Optional[float] = None
+    return PartialPlaygroundConfigMsg
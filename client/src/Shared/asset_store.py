@@ -0,0 +1,205 @@
+"""Content addressed storage of the image and audio assets of playground configs.
+
+A ``playground_config`` message embeds its ``images`` and ``audio_tracks``
+(``SocketImage`` / ``SocketAudio`` of SharedTypings.ts, the generated
+``api_types.PlaygroundConfig`` has no such fields). :class:`AssetStore` hashes
+every body once, keeps it once no matter how many configs use it and replaces
+it by its digest in the stored config::
+
+    assets = AssetStore(max_bytes=64 << 20)
+    stored = assets.intern(config_msg)  # bodies are None, entries carry a ``digest``
+    assets.resolve(stored)  # the bodies again
+
+    # a reconnecting client only asks for what is not in its own store
+    wanted = client_assets.missing(stored)
+
+Assets referenced by an interned config are kept, the unreferenced ones are
+evicted least recently used first once the store holds more than
+``max_bytes``.
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+MAX_BYTES = 64 << 20
+
+# the asset lists of a ``PlaygroundConfig`` and the body field of their entries
+ASSET_FIELDS = (('images', 'image'), ('audio_tracks', 'audio'))
+
+# not (yet) part of api_types.SocketEvents
+GET_ASSETS = 'get_assets'
+ASSETS = 'assets'
+
+Body = Union[bytes, str]
+
+
+class MissingAssets(KeyError):
+    """raised by ``resolve`` with the digests that are not in the store"""
+
+    def __init__(self, digests: List[str]):
+        super().__init__(digests)
+        self.digests = digests
+
+
+def digest(body: Body) -> str:
+    """the hex sha256 of an asset body, svg text is hashed as utf-8"""
+    return hashlib.sha256(body.encode() if body.__class__ is str else body).hexdigest()
+
+
+def body_size(body: Body) -> int:
+    """the size of an asset body in bytes, svg text as utf-8"""
+    return len(body.encode()) if body.__class__ is str else len(body)
+
+
+def entries(msg: dict) -> Iterator[Tuple[dict, str]]:
+    """``(entry, body field)`` of all assets of a ``playground_config`` message"""
+    config = msg.get('config') or {}
+    for list_field, body_field in ASSET_FIELDS:
+        for entry in config.get(list_field) or ():
+            yield entry, body_field
+
+
+class AssetStore:
+    def __init__(self, max_bytes: int = MAX_BYTES):
+        """
+        :param max_bytes: size above which unreferenced assets are evicted
+        """
+        self.max_bytes = max_bytes
+        # bytes of all stored bodies
+        self.size = 0
+        # bodies by digest, least recently used first
+        self.bodies: 'OrderedDict[str, Body]' = OrderedDict()
+        # number of interned configs using each digest
+        self.refs: Dict[str, int] = {}
+        # digests of the stored body objects, so bodies handed out by ``resolve`` are not hashed again
+        self._digests: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.bodies)
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self.bodies
+
+    # bodies
+
+    def put(self, body: Body) -> str:
+        """store ``body`` (once), returns its digest"""
+        key = self._store(body)
+        self.evict()
+        return key
+
+    def _store(self, body: Body) -> str:
+        key = self._digests.get(id(body))
+        if key is None or self.bodies.get(key) is not body:
+            key = digest(body)
+        if key in self.bodies:
+            self.bodies.move_to_end(key)
+            return key
+        self.bodies[key] = body
+        self._digests[id(body)] = key
+        self.size += body_size(body)
+        return key
+
+    def get(self, digest: str) -> Optional[Body]:
+        body = self.bodies.get(digest)
+        if body is not None:
+            self.bodies.move_to_end(digest)
+        return body
+
+    def update(self, bodies: Dict[str, Body]):
+        """add the bodies of an ``assets`` response, bodies not matching their digest are ignored"""
+        for key, body in bodies.items():
+            if key not in self.bodies and digest(body) == key:
+                self.put(body)
+
+    def select(self, digests: Iterable[str]) -> Dict[str, Body]:
+        """the stored bodies of ``digests``, unknown digests are left out"""
+        bodies = {}
+        for key in digests:
+            body = self.get(key)
+            if body is not None:
+                bodies[key] = body
+        return bodies
+
+    def evict(self):
+        """drop unreferenced assets, least recently used first, until the size is below ``max_bytes``"""
+        if self.size <= self.max_bytes:
+            return
+        for key in [key for key in self.bodies if not self.refs.get(key)]:
+            body = self.bodies.pop(key)
+            self._digests.pop(id(body), None)
+            self.size -= body_size(body)
+            if self.size <= self.max_bytes:
+                return
+
+    # messages
+
+    def intern(self, msg: dict) -> dict:
+        """A copy of a ``playground_config`` message with its asset bodies stored and
+        replaced by ``None`` and a ``digest`` field, the digests are referenced until
+        :meth:`release`. Entries of an interned message are kept as they are."""
+        if not any(True for _ in entries(msg)):
+            return msg
+        config = dict(msg['config'])
+        for list_field, body_field in ASSET_FIELDS:
+            items = config.get(list_field)
+            if not items:
+                continue
+            interned = []
+            for entry in items:
+                body = entry.get(body_field)
+                if body is not None:
+                    entry = {**entry, body_field: None, 'digest': self._store(body)}
+                if entry.get('digest') is not None:
+                    self.refs[entry['digest']] = self.refs.get(entry['digest'], 0) + 1
+                interned.append(entry)
+            config[list_field] = interned
+        # the new assets are referenced before anything is evicted
+        self.evict()
+        return {**msg, 'config': config}
+
+    def release(self, msg: Optional[dict]):
+        """drop the references of an interned message"""
+        if msg is None:
+            return
+        for entry, _ in entries(msg):
+            key = entry.get('digest')
+            count = self.refs.get(key)
+            if count is None:
+                continue
+            if count > 1:
+                self.refs[key] = count - 1
+            else:
+                del self.refs[key]
+        self.evict()
+
+    def digests(self, msg: dict) -> List[str]:
+        """the digests referenced by an interned message, in order and without duplicates"""
+        return list(dict.fromkeys(entry['digest'] for entry, _ in entries(msg) if entry.get('digest') is not None))
+
+    def missing(self, msg: dict) -> List[str]:
+        """the digests of an interned message that are not in the store"""
+        return [key for key in self.digests(msg) if key not in self.bodies]
+
+    def resolve(self, msg: dict) -> dict:
+        """A copy of an interned message with the bodies put back (and without ``digest``),
+        raises :class:`MissingAssets` when bodies are not in the store."""
+        missing = self.missing(msg)
+        if missing:
+            raise MissingAssets(missing)
+        if not any(entry.get('digest') is not None for entry, _ in entries(msg)):
+            return msg
+        config = dict(msg['config'])
+        for list_field, body_field in ASSET_FIELDS:
+            items = config.get(list_field)
+            if not items:
+                continue
+            resolved = []
+            for entry in items:
+                key = entry.get('digest')
+                if key is not None:
+                    entry = {name: value for name, value in entry.items() if name != 'digest'}
+                    entry[body_field] = self.get(key)
+                resolved.append(entry)
+            config[list_field] = resolved
+        return {**msg, 'config': config}
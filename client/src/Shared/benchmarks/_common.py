@@ -0,0 +1,93 @@
+"""Helpers shared by the benchmark scripts.
+
+Run the benchmarks from anywhere, e.g. ``python client/src/Shared/benchmarks/bench_decode.py``.
+"""
+import os
+import random
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def acc_msg(device_nr: int = 0, time_stamp: float = 1596731613.793) -> dict:
+    return {
+        'device_id': 'FooBar',
+        'device_nr': device_nr,
+        'time_stamp': time_stamp,
+        'type': 'acceleration',
+        'x': random.uniform(-1, 1),
+        'y': random.uniform(-1, 1),
+        'z': random.uniform(-10, -9),
+        'interval': 16,
+    }
+
+
+def gyro_msg(device_nr: int = 0, time_stamp: float = 1596731613.793) -> dict:
+    return {
+        'device_id': 'FooBar',
+        'device_nr': device_nr,
+        'time_stamp': time_stamp,
+        'type': 'gyro',
+        'alpha': random.uniform(0, 360),
+        'beta': random.uniform(-180, 180),
+        'gamma': random.uniform(-90, 90),
+        'absolute': False,
+    }
+
+
+def key_msg(device_nr: int = 0, time_stamp: float = 1596731613.793) -> dict:
+    return {
+        'device_id': 'FooBar',
+        'device_nr': device_nr,
+        'time_stamp': time_stamp,
+        'type': 'key',
+        'key': random.choice(['up', 'right', 'down', 'left', 'home']),
+    }
+
+
+def sprite_msg(sprite_id: str = 's1', device_nr: int = -1, time_stamp: float = 1596731613.793) -> dict:
+    return {
+        'device_id': 'FooBar',
+        'device_nr': device_nr,
+        'time_stamp': time_stamp,
+        'type': 'sprite',
+        'sprite': {
+            'id': sprite_id,
+            'pos_x': random.uniform(-50, 50),
+            'pos_y': random.uniform(-50, 50),
+            'width': 5,
+            'height': 5,
+            'form': 'round',
+            'color': 'red',
+            'collision_detection': random.random() < 0.2,
+        },
+    }
+
+
+def mixed_stream(count: int, devices: int = 40) -> List[dict]:
+    """Sensor heavy ``new_data`` stream as sent by a class full of phones."""
+    factories = [acc_msg, acc_msg, gyro_msg, gyro_msg, key_msg]
+    stream = []
+    for i in range(count):
+        nr = i % devices
+        if i % 10 == 9:
+            stream.append(sprite_msg(f's{nr}', time_stamp=i / 60))
+        else:
+            stream.append(random.choice(factories)(nr, i / 60))
+    return stream
+
+
+def measure(fn: Callable[[], object], repeat: int = 5) -> float:
+    """best wall time in seconds of ``repeat`` runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label: str, count: int, seconds: float, unit: str = 'msg'):
+    print(f'{label:<40} {count / seconds:>14,.0f} {unit}/s')
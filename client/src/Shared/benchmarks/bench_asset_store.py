@@ -0,0 +1,78 @@
+"""Stores the playground configs of a class (every script sends the same sprite sheet
+and sounds) with and without an ``AssetStore`` and reconnects a client that
+already has most assets.
+
+The store without assets keeps (and sends in every ``all_data``) one body per
+config, the asset store one per distinct asset.
+"""
+import os
+
+from _common import measure, report
+
+from asset_store import AssetStore
+from data_store import DataStoreEngine
+
+DEVICES = 40
+CONFIGS = 10
+IMAGES = [os.urandom(64 << 10) for _ in range(12)]
+AUDIO = [os.urandom(512 << 10) for _ in range(3)]
+
+
+def config_msg(device: int, version: int) -> dict:
+    """device specific picks of the shared assets, fresh bytes objects like received from a socket"""
+    images = [IMAGES[(device + version + i) % len(IMAGES)] for i in range(6)]
+    return {
+        'device_id': f'class-{device}',
+        'device_nr': -1,
+        'time_stamp': version,
+        'type': 'playground_config',
+        'config': {
+            'width': 100,
+            'height': 100,
+            'images': [{'name': f'img{i}', 'type': 'png', 'image': bytes(bytearray(body))} for i, body in enumerate(images)],
+            'audio_tracks': [{'name': f'track{i}', 'type': 'mp3', 'audio': bytes(bytearray(body))} for i, body in enumerate(AUDIO[:2])],
+        },
+    }
+
+
+def stored_bytes(engine: DataStoreEngine) -> int:
+    bodies = {}
+    for store in engine.devices.values():
+        for field, key in (('images', 'image'), ('audio_tracks', 'audio')):
+            for entry in store.config['config'][field]:
+                if entry[key] is not None:
+                    bodies[id(entry[key])] = len(entry[key])
+    return sum(bodies.values()) + (engine.assets.size if engine.assets is not None else 0)
+
+
+def main():
+    messages = [config_msg(device, version) for version in range(CONFIGS) for device in range(DEVICES)]
+
+    def apply(engine: DataStoreEngine):
+        for msg in messages:
+            engine.apply(msg['device_id'], msg)
+
+    plain = DataStoreEngine()
+    interned = DataStoreEngine(AssetStore())
+    report('apply configs', len(messages), measure(lambda: apply(plain), 1), 'config')
+    report('apply configs (assets)', len(messages), measure(lambda: apply(interned), 1), 'config')
+    print(f'{"stored bytes":<40} {stored_bytes(plain):>14,}')
+    print(f'{"stored bytes (assets)":<40} {stored_bytes(interned):>14,}')
+
+    # a client that saw the previous config of its device reconnects
+    client = AssetStore()
+    previous = interned.assets.intern(config_msg(0, CONFIGS - 2))
+    client.update(interned.assets.select(interned.assets.digests(previous)))
+    current = interned['class-0'].config
+    wanted = client.missing(current)
+    client.update(interned.assets.select(wanted))
+    full = client.resolve(current)
+    assert full['config']['images'] == config_msg(0, CONFIGS - 1)['config']['images']
+    sent = sum(len(interned.assets.get(key)) for key in wanted)
+    total = sum(len(entry.get('image') or entry.get('audio')) for entry in full['config']['images'] + full['config']['audio_tracks'])
+    print(f'{"reconnect bytes":<40} {total:>14,}')
+    print(f'{"reconnect bytes (assets)":<40} {sent:>14,}')
+
+
+if __name__ == '__main__':
+    main()
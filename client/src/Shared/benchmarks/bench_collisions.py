@@ -0,0 +1,112 @@
+"""Collision detection of 2,000 sprites (10% moving per tick) with ``CollisionGrid`` and the O(n²) scan of ``Playground.update``.
+
+Both report the same ``sprite_collision`` messages for every tick.
+"""
+import random
+
+from _common import measure, report
+
+from sprite_collisions import CollisionGrid
+
+SPRITES = 2_000
+TICKS = 20
+MOVING = 0.1
+SIZE = 500
+
+
+def boxes_overlap(a: dict, b: dict) -> bool:
+    return (
+        a['pos_x'] + a['width'] > b['pos_x']
+        and a['pos_x'] < b['pos_x'] + b['width']
+        and a['pos_y'] + a['height'] > b['pos_y']
+        and a['pos_y'] < b['pos_y'] + b['height']
+    )
+
+
+def position(sprite: dict) -> dict:
+    return {k: sprite[k] for k in ('id', 'collision_detection', 'pos_x', 'pos_y')}
+
+
+def scan(sprites: list, overlaps: dict, time_stamp: float) -> list:
+    """``Sprite.reportCollisions`` for every collision detected sprite"""
+    events = []
+    for sprite in sprites:
+        if not sprite['collision_detection']:
+            continue
+        found = [s for s in sprites if s is not sprite and boxes_overlap(sprite, s)]
+        known = overlaps.setdefault(sprite['id'], {})
+        for other in found:
+            if other['id'] not in known:
+                if other['collision_detection']:
+                    overlaps.setdefault(other['id'], {})[sprite['id']] = sprite
+                known[other['id']] = other
+                events.append(
+                    {'type': 'sprite_collision', 'sprites': [position(sprite), position(other)], 'time_stamp': time_stamp, 'overlap': 'in'}
+                )
+        found_ids = {s['id'] for s in found}
+        for other_id, other in list(known.items()):
+            if other_id not in found_ids:
+                del known[other_id]
+                if other['collision_detection']:
+                    overlaps[other_id].pop(sprite['id'], None)
+                events.append(
+                    {'type': 'sprite_collision', 'sprites': [position(sprite), position(other)], 'time_stamp': time_stamp, 'overlap': 'out'}
+                )
+    return events
+
+
+def trace():
+    sprites = [
+        {
+            'id': f's{i}',
+            'pos_x': random.uniform(0, SIZE),
+            'pos_y': random.uniform(0, SIZE),
+            'width': 5,
+            'height': 5,
+            'collision_detection': random.random() < 0.3,
+        }
+        for i in range(SPRITES)
+    ]
+    moves = []
+    for _ in range(TICKS):
+        moved = random.sample(range(SPRITES), int(SPRITES * MOVING))
+        moves.append([(i, random.uniform(-3, 3), random.uniform(-3, 3)) for i in moved])
+    return sprites, moves
+
+
+def main():
+    initial, moves = trace()
+
+    def run_scan():
+        sprites = [dict(s) for s in initial]
+        overlaps = {}
+        result = []
+        for tick, moved in enumerate(moves):
+            for i, dx, dy in moved:
+                sprites[i]['pos_x'] += dx
+                sprites[i]['pos_y'] += dy
+            result.append(scan(sprites, overlaps, tick))
+        return result
+
+    def run_grid():
+        sprites = [dict(s) for s in initial]
+        grid = CollisionGrid()
+        for sprite in sprites:
+            grid.upsert(sprite)
+        result = []
+        for tick, moved in enumerate(moves):
+            for i, dx, dy in moved:
+                sprite = sprites[i]
+                sprite['pos_x'] += dx
+                sprite['pos_y'] += dy
+                grid.move(sprite['id'], sprite['pos_x'], sprite['pos_y'])
+            result.append(grid.detect(tick))
+        return result
+
+    assert run_scan() == run_grid(), 'events differ'
+    report('O(n²) scan (Playground.update)', SPRITES * TICKS, measure(run_scan, repeat=1), 'sprite checks')
+    report('CollisionGrid', SPRITES * TICKS, measure(run_grid, repeat=3), 'sprite checks')
+
+
+if __name__ == '__main__':
+    main()
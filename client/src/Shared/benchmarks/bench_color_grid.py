@@ -0,0 +1,63 @@
+"""64x64 LED grid at 20 fps: parsing frames and diffing them per cell and with ``ColorGrid``."""
+import random
+
+from _common import measure, report
+
+from color_grid import ColorGrid, cell_rgba
+
+SIZE = 64
+FRAMES = 100
+# share of the cells changing per frame
+CHANGE = 0.05
+COLORS = ['red', 'blue', 'white', 'black', [255, 128, 0], 3, 9]
+
+
+def frames(kind: str):
+    if kind == 'digits':
+        frame = [[random.choice('0123456789') for _ in range(SIZE)] for _ in range(SIZE)]
+        cell = lambda: random.choice('0123456789')  # noqa: E731
+    else:
+        frame = [[random.choice(COLORS) for _ in range(SIZE)] for _ in range(SIZE)]
+        cell = lambda: random.choice(COLORS)  # noqa: E731
+    result = []
+    for _ in range(FRAMES):
+        frame = [list(row) for row in frame]
+        for _ in range(int(SIZE * SIZE * CHANGE)):
+            frame[random.randrange(SIZE)][random.randrange(SIZE)] = cell()
+        result.append([''.join(row) for row in frame] if kind == 'digits' else frame)
+    return result
+
+
+def per_cell(stream):
+    prev = None
+    for grid in stream:
+        cells = [[cell_rgba(color) for color in row] for row in grid]
+        if prev is not None:
+            updates = [
+                {'type': 'grid_update', 'row': r, 'column': c, 'color': grid[r][c]}
+                for r, row in enumerate(cells)
+                for c, color in enumerate(row)
+                if prev[r][c] != color
+            ]
+        prev = cells
+    return updates
+
+
+def vectorized(stream):
+    prev = None
+    for grid in stream:
+        frame = ColorGrid.from_wire(grid)
+        messages = frame.diff(prev)
+        prev = frame
+    return messages
+
+
+def main():
+    for kind in ('digits', 'mixed'):
+        stream = frames(kind)
+        report(f'per cell ({kind})', FRAMES, measure(lambda: per_cell(stream), repeat=3), 'frames')
+        report(f'ColorGrid ({kind})', FRAMES, measure(lambda: vectorized(stream), repeat=3), 'frames')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Resolving the cells of 64x64 grids of css colors (uncached, through the LRU cache and with ``resolve_many``) and of alpha level grids."""
+import random
+
+import numpy as np
+
+from _common import measure, report
+
+from colors import parse_css, resolve, resolve_many
+
+SIZE = 64
+FRAMES = 20
+# a palette as a script would use it: names, hex and functional forms
+PALETTE = (
+    ['red', 'green', 'blue', 'white', 'black', 'orange', 'Purple ']
+    + [f'#{random.randrange(1 << 24):06x}' for _ in range(8)]
+    + [f'rgb({random.randrange(256)}, {random.randrange(256)}, {random.randrange(256)})' for _ in range(8)]
+    + [f'hsl({random.randrange(360)}, 80%, 50%)' for _ in range(4)]
+)
+
+
+def main():
+    frames = [[random.choice(PALETTE) for _ in range(SIZE * SIZE)] for _ in range(FRAMES)]
+    cells = SIZE * SIZE * FRAMES
+    uncached = parse_css.__wrapped__
+
+    def run_uncached():
+        for frame in frames:
+            [uncached(color) for color in frame]
+
+    def run_cached():
+        for frame in frames:
+            [parse_css(color) for color in frame]
+
+    def run_many():
+        for frame in frames:
+            resolve_many(frame)
+
+    report('parse per cell (uncached)', cells, measure(run_uncached, repeat=3), 'cells')
+    report('parse per cell (LRU cache)', cells, measure(run_cached, repeat=3), 'cells')
+    report('resolve_many', cells, measure(run_many, repeat=3), 'cells')
+
+    levels = [np.random.randint(0, 10, (SIZE, SIZE)) for _ in range(FRAMES)]
+
+    def run_levels_per_cell():
+        for frame in levels:
+            [resolve(level) for level in frame.ravel().tolist()]
+
+    def run_levels_many():
+        for frame in levels:
+            resolve_many(frame)
+
+    report('levels per cell', cells, measure(run_levels_per_cell, repeat=3), 'cells')
+    report('levels resolve_many', cells, measure(run_levels_many, repeat=3), 'cells')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Replays 100k sprite updates through ``DataStoreEngine`` and a list based port of ``addDataToStore``."""
+import random
+
+from _common import measure, report, sprite_msg
+
+from data_store import THRESHOLD, DataStoreEngine
+
+COUNT = 100_000
+SPRITE_IDS = 200
+
+
+def naive_apply(store: dict, msg: dict):
+    """the list based ``findIndex`` + ``splice`` logic of index.ts"""
+    if msg['type'] == 'remove_sprite':
+        sprites = store.get('sprite', [])
+        idx = next((i for i, s in enumerate(sprites) if s['sprite']['id'] == msg['id']), -1)
+        if idx >= 0:
+            sprites.pop(idx)
+        return
+    sprites = store.setdefault('sprite', [])
+    idx = next((i for i, s in enumerate(sprites) if s['sprite']['id'] == msg['sprite']['id']), -1)
+    if idx >= 0:
+        prev = sprites.pop(idx)
+        prev['time_stamp'] = msg['time_stamp']
+        prev['sprite'] = {**prev['sprite'], **msg['sprite']}
+        sprites.append(prev)
+        return
+    if len(sprites) >= THRESHOLD:
+        idx = next((i for i, s in enumerate(sprites) if not s['sprite'].get('collision_detection')), -1)
+        sprites.pop(idx if idx >= 0 else 0)
+    sprites.append(msg)
+
+
+def recorded_stream():
+    stream = []
+    for i in range(COUNT):
+        # most updates hit the sprites on screen, some spawn new ones
+        sprite_id = f's{random.randrange(THRESHOLD) if random.random() < 0.9 else random.randrange(SPRITE_IDS)}'
+        if i % 50 == 49:
+            stream.append({'type': 'remove_sprite', 'id': sprite_id, 'device_id': 'FooBar', 'device_nr': -1, 'time_stamp': i})
+        else:
+            stream.append(sprite_msg(sprite_id, time_stamp=i))
+    return stream
+
+
+def main():
+    stream = recorded_stream()
+
+    def replay_naive():
+        store = {}
+        for msg in stream:
+            naive_apply(store, dict(msg))
+
+    def replay_engine():
+        engine = DataStoreEngine()
+        for msg in stream:
+            engine.apply('FooBar', dict(msg))
+
+    report('list based (index.ts)', COUNT, measure(replay_naive, repeat=3))
+    report('DataStoreEngine', COUNT, measure(replay_engine, repeat=3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Throughput of ``api_codec.decode`` compared to naive ``Cls(**d)`` decoding."""
+from _common import measure, mixed_stream, report
+
+import api_types
+from api_codec import decode
+
+COUNT = 100_000
+
+NAIVE_CLASSES = {
+    'acceleration': (api_types.AccMsg, api_types.AccMsgType),
+    'gyro': (api_types.GyroMsg, api_types.GyroMsgType),
+    'key': (api_types.KeyMsg, api_types.KeyMsgType),
+    'sprite': (api_types.SpriteMsg, api_types.SpriteMsgType),
+}
+
+
+def naive(data: dict):
+    """``Cls(**d)``, leaves enums as strings and nested objects as dicts"""
+    return NAIVE_CLASSES[data['type']][0](**data)
+
+
+def naive_enums(data: dict):
+    """``Cls(**d)`` with enums and nested sprites converted by hand"""
+    cls, type_enum = NAIVE_CLASSES[data['type']]
+    data = dict(data, type=type_enum(data['type']))
+    if 'key' in data:
+        data['key'] = api_types.Key(data['key'])
+    if 'sprite' in data:
+        sprite = dict(data['sprite'])
+        sprite['form'] = api_types.SpriteForm(sprite['form'])
+        data['sprite'] = api_types.Sprite(**sprite)
+    return cls(**data)
+
+
+def main():
+    stream = mixed_stream(COUNT)
+    for label, fn in [('naive Cls(**d)', naive), ('naive Cls(**d) + Enum(value)', naive_enums), ('api_codec.decode', decode)]:
+        report(label, COUNT, measure(lambda: [fn(d) for d in stream]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Connects 1,000 devices, routes ``unicast_to`` messages and churns connections with ``DeviceRegistry``
+and with the list scans of index.ts (``unorderedDevices().find``, ``nextDeviceNr``).
+
+Both assign the same numbers and send the same ``devices`` packages.
+"""
+import random
+
+from _common import measure, report
+
+from device_registry import DeviceRegistry
+
+DEVICES = 1_000
+MESSAGES = 100_000
+CHURN = 2_000
+
+
+class ListDevices:
+    """the device handling of index.ts"""
+
+    def __init__(self):
+        self.devices = {}
+        self.time_stamp = 0
+
+    def next_device_nr(self, is_client: bool) -> int:
+        numbers = [d['device_nr'] for d in self.devices.values()]
+        nr = 0 if is_client else -1
+        while nr in numbers:
+            nr += 1 if is_client else -1
+        return nr
+
+    def add(self, sid: str, device_id: str, is_client: bool) -> dict:
+        device = {'device_id': device_id, 'is_client': is_client, 'device_nr': self.next_device_nr(is_client), 'socket_id': sid, 'is_silent': None}
+        self.devices[sid] = device
+        self.time_stamp += 1
+        return device
+
+    def remove(self, sid: str):
+        self.devices.pop(sid, None)
+        self.time_stamp += 1
+
+    def by_nr(self, device_nr):
+        return next((d for d in self.devices.values() if d['device_nr'] == device_nr), None)
+
+    def devices_pkg(self) -> dict:
+        clients = sorted((d for d in self.devices.values() if d['is_client']), key=lambda d: d['device_nr'])
+        scripts = sorted((d for d in self.devices.values() if not d['is_client']), key=lambda d: -d['device_nr'])
+        return {'time_stamp': self.time_stamp, 'devices': clients + scripts}
+
+
+def trace():
+    connects = [(f'sid{i}', f'room{i % 50}', random.random() < 0.8) for i in range(DEVICES)]
+    targets = [random.randrange(-DEVICES // 5, DEVICES) for _ in range(MESSAGES)]
+    churn = [random.randrange(DEVICES) for _ in range(CHURN)]
+    return connects, targets, churn
+
+
+def main():
+    connects, targets, churn = trace()
+
+    def run(devices):
+        pkgs = []
+        for sid, device_id, is_client in connects:
+            devices.add(sid, device_id, is_client)
+            pkgs.append(devices.devices_pkg()['devices'])
+        routed = [devices.by_nr(nr) for nr in targets]
+        for i in churn:
+            sid, device_id, is_client = connects[i]
+            devices.remove(sid)
+            devices.add(sid, device_id, is_client)
+            pkgs.append(devices.devices_pkg()['devices'])
+        return pkgs, [d and d['socket_id'] for d in routed]
+
+    assert run(ListDevices()) == run(DeviceRegistry()), 'devices differ'
+    operations = DEVICES + MESSAGES + CHURN
+    report('list scans (index.ts)', operations, measure(lambda: run(ListDevices()), repeat=1), 'ops')
+    report('DeviceRegistry', operations, measure(lambda: run(DeviceRegistry()), repeat=3), 'ops')
+
+    def lookups(devices):
+        for nr in targets:
+            devices.by_nr(nr)
+
+    scan, registry = ListDevices(), DeviceRegistry()
+    for sid, device_id, is_client in connects:
+        scan.add(sid, device_id, is_client)
+        registry.add(sid, device_id, is_client)
+    report('unicast_to lookup, list scan', MESSAGES, measure(lambda: lookups(scan), repeat=1), 'lookups')
+    report('unicast_to lookup, DeviceRegistry', MESSAGES, measure(lambda: lookups(registry), repeat=3), 'lookups')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Downsamples a class of phones sending ``acceleration`` and ``gyro`` at 60 Hz to
+10 Hz and compares a subscriber decoding and buffering every message with one
+doing so for the aggregates only.
+"""
+from _common import acc_msg, gyro_msg, measure, report
+
+import api_codec
+from api_types import DataType
+from downsampler import AGGREGATIONS, Downsampler
+from sensor_buffer import AccelerationBuffer, GyroBuffer
+
+DEVICES = 40
+SECONDS = 10
+RATE = 60
+TARGET = 10
+
+
+def sensor_stream() -> list:
+    stream = []
+    for k in range(SECONDS * RATE):
+        for nr in range(DEVICES):
+            for factory in (acc_msg, gyro_msg):
+                msg = factory(nr, 1596731613.793 + k / RATE)
+                msg['device_id'] = f'phone-{nr}'
+                if 'interval' in msg:
+                    msg['interval'] = 1000 / RATE
+                stream.append(msg)
+    return stream
+
+
+def main():
+    stream = sensor_stream()
+    rates = {DataType.ACCELERATION: TARGET, DataType.GYRO: TARGET}
+    for aggregation in AGGREGATIONS:
+        emitted = []
+        seconds = measure(lambda: emitted.append(len(Downsampler(rates, aggregation).push_many(stream))), 3)
+        report(f'push ({aggregation})', len(stream), seconds)
+    print(f'{"messages":<40} {len(stream):>14,}')
+    print(f'{"aggregates":<40} {emitted[-1]:>14,}')
+
+    def consume(msg, buffers):
+        msg = api_codec.decode(msg)
+        for buffer in buffers:
+            buffer.ingest(msg)
+
+    def decode_all():
+        buffers = (AccelerationBuffer(), GyroBuffer())
+        for msg in stream:
+            consume(msg, buffers)
+
+    def decode_aggregates():
+        buffers = (AccelerationBuffer(), GyroBuffer())
+        downsampler = Downsampler(rates)
+        for msg in stream:
+            for aggregate in downsampler.push(msg):
+                consume(aggregate, buffers)
+
+    report('subscriber (every message)', len(stream), measure(decode_all, 3))
+    report('subscriber (downsampled)', len(stream), measure(decode_aggregates, 3))
+
+
+if __name__ == '__main__':
+    main()
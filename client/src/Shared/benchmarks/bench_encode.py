@@ -0,0 +1,66 @@
+"""Throughput and payload size of ``api_codec.encode`` compared to ``asdict`` + ``json.dumps``."""
+import dataclasses
+import json
+from enum import Enum
+
+from _common import measure, report, sprite_msg
+
+import api_types
+from api_codec import decode, encode
+
+COUNT = 20_000
+
+
+def _enum_value(obj):
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(obj)
+
+
+def asdict_dumps(msg) -> bytes:
+    return json.dumps(dataclasses.asdict(msg), default=_enum_value).encode()
+
+
+def samples():
+    sprite = decode(sprite_msg())
+    sprites = api_types.SpritesMsg(
+        device_id='FooBar',
+        device_nr=-1,
+        sprites=[decode(sprite_msg(f's{i}')).sprite for i in range(10)],
+        time_stamp=1596731613.793,
+        type=api_types.SpritesMsgType.SPRITES,
+    )
+    notification = api_types.NotificationMsg(
+        device_id='FooBar',
+        device_nr=-1,
+        message='Game over',
+        time_stamp=1596731613.793,
+        type=api_types.NotificationMsgType.NOTIFICATION,
+        notification_type=api_types.NotificationType.SUCCESS,
+    )
+    client_data = api_types.ClientDataMsg(
+        base_color=None,
+        color=None,
+        device_id='FooBar',
+        device_nr=0,
+        grid=None,
+        response=None,
+        time_stamp=1596731613.793,
+        type=api_types.ClientDataMsgType.ACCELERATION,
+        x=0.1,
+        y=0.2,
+        z=-9.81,
+        interval=16,
+    )
+    return [('SpriteMsg', sprite), ('SpritesMsg (10)', sprites), ('NotificationMsg', notification), ('ClientDataMsg', client_data)]
+
+
+def main():
+    for label, msg in samples():
+        print(f'{label}: {len(asdict_dumps(msg))} B with asdict, {len(encode(msg))} B with api_codec')
+        report('  asdict + json.dumps', COUNT, measure(lambda: [asdict_dumps(msg) for _ in range(COUNT)]))
+        report('  api_codec.encode', COUNT, measure(lambda: [encode(msg) for _ in range(COUNT)]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Startup cost of the generated types and the codec, each measured in a fresh
+interpreter (best of ``REPEAT``), and the decode rate with the generated
+``api_models`` dispatch table.
+
+``importtime`` is the cumulative ``python -X importtime`` figure of the
+module, ``total`` the whole statement including the definitions ``api_types``
+builds on first access (after its import). ``load_all`` builds what the eager
+module built at import.
+"""
+import os
+import re
+import subprocess
+import sys
+from typing import Tuple
+
+from _common import measure, mixed_stream, report
+
+import api_codec
+
+SHARED = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STARTUP = [
+    ('api_types', 'from api_types import KeyMsg'),
+    ('api_types', 'import api_types; api_types.load_all()'),
+    ('api_models', 'import api_models'),
+    ('api_codec', 'import api_codec'),
+]
+REPEAT = 7
+COUNT = 100_000
+
+_TIMER = 'import time, sys; t = time.perf_counter(); {statement}; sys.stderr.write(f"total {{time.perf_counter() - t}}")'
+
+
+def startup(module: str, statement: str) -> Tuple[float, float]:
+    """the best ``-X importtime`` cumulative seconds of ``module`` and the best total of ``statement``"""
+    importtimes = []
+    totals = []
+    for _ in range(REPEAT):
+        out = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', _TIMER.format(statement=statement)],
+            cwd=SHARED,
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        cumulative = re.search(rf'\|\s*(\d+)\s*\|\s*{module}$', out.stderr, re.MULTILINE)
+        importtimes.append(int(cumulative.group(1)) / 1e6)
+        totals.append(float(re.search(r'^total (\S+)', out.stderr, re.MULTILINE).group(1)))
+    return min(importtimes), min(totals)
+
+
+def line_msg(i: int) -> dict:
+    return {
+        'device_id': 'FooBar',
+        'device_nr': -1,
+        'time_stamp': i / 60,
+        'type': 'line',
+        'line': {'id': f'l{i % 20}', 'x1': 0, 'y1': 0, 'x2': i % 100, 'y2': 50, 'color': 'red'},
+        'deliver_to': 'SCRIPT',
+    }
+
+
+def main():
+    print(f'{"statement":<40} {"importtime ms":>14} {"total ms":>14}')
+    for module, statement in STARTUP:
+        importtime, total = startup(module, statement)
+        print(f'{statement:<40} {importtime * 1e3:>14.2f} {total * 1e3:>14.2f}')
+
+    stream = mixed_stream(COUNT)
+    lines = [line_msg(i) for i in range(COUNT)]
+    report('decode', COUNT, measure(lambda: [api_codec.decode(m) for m in stream], 3))
+    report('decode_model', COUNT, measure(lambda: [api_codec.decode_model(m) for m in stream], 3))
+    report('decode line', COUNT, measure(lambda: [api_codec.decode(m) for m in lines], 3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Records latencies into a ``Histogram`` and into a list summarized with ``np.percentile``,
+then passes a sensor heavy stream of 40 devices through ``LatencyMonitor.observe``.
+
+The histogram answers the same quantiles within its bucket precision in constant memory.
+"""
+import sys
+
+import numpy as np
+from _common import measure, mixed_stream, report
+
+from latency_monitor import BUCKETS, Histogram, LatencyMonitor
+
+COUNT = 500_000
+QUANTILES = [0.5, 0.9, 0.99, 0.999]
+
+
+def main():
+    values = np.random.default_rng(0).lognormal(-5, 1.5, COUNT)
+    items = values.tolist()
+
+    def histogram():
+        hist = Histogram()
+        for value in items:
+            hist.record(value)
+        return hist
+
+    def collected():
+        latencies = []
+        for value in items:
+            latencies.append(value)
+        return np.percentile(latencies, [q * 100 for q in QUANTILES])
+
+    report('list + np.percentile', COUNT, measure(collected, 3), 'value')
+    report('Histogram.record', COUNT, measure(histogram, 3), 'value')
+    report('Histogram.record_many', COUNT, measure(lambda: Histogram().record_many(values), 3), 'value')
+    hist = histogram()
+    exact = np.quantile(values, QUANTILES)
+    error = np.max(np.abs(np.array(hist.quantiles(QUANTILES)) / exact - 1))
+    print(f'{"max relative quantile error":<40} {error:>14.2%}')
+    print(f'{"bytes per histogram":<40} {BUCKETS * 8:>14,}')
+    print(f'{"bytes of the list":<40} {sys.getsizeof(items) + COUNT * sys.getsizeof(1.0):>14,}')
+
+    stream = mixed_stream(200_000)
+    received = (np.arange(len(stream)) / 60 + 0.02).tolist()
+
+    def observe():
+        monitor = LatencyMonitor()
+        for msg, at in zip(stream, received):
+            monitor.observe(msg, at, observer=-1)
+        return monitor
+
+    report('LatencyMonitor.observe', len(stream), measure(observe, 3))
+    monitor = observe()
+    report('LatencyMonitor.prometheus', len(monitor.by_type) + len(monitor.by_device), measure(monitor.prometheus, 3), 'series')
+
+
+if __name__ == '__main__':
+    main()
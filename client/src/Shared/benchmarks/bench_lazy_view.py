@@ -0,0 +1,48 @@
+"""Filters 100k mixed ``new_data`` payloads on ``type`` and ``device_nr`` (keeping about 10%)
+with fully decoded dataclasses and with the lazy views of ``api_lazy``.
+
+Both keep the same messages.
+"""
+import json
+
+from _common import measure, mixed_stream, report
+
+import api_codec
+from api_lazy import view
+from api_types import ClientDataMsg
+
+COUNT = 100_000
+DEVICES = 40
+
+
+def keep(msg) -> bool:
+    return msg.device_nr < DEVICES // 4 and msg.type.value == 'gyro'
+
+
+def main():
+    payloads = mixed_stream(COUNT, DEVICES)
+    texts = [json.dumps(msg) for msg in payloads]
+
+    def decoded():
+        return [msg for msg in map(api_codec.decode, payloads) if keep(msg)]
+
+    def lazy():
+        return [msg for msg in map(view, payloads) if keep(msg)]
+
+    def decoded_text():
+        return [msg for msg in (api_codec.decode_as(ClientDataMsg, json.loads(text)) for text in texts) if keep(msg)]
+
+    def lazy_text():
+        return [msg for msg in (view(text, ClientDataMsg) for text in texts) if keep(msg)]
+
+    kept = decoded()
+    assert kept == lazy() and len(kept) == len(decoded_text()) == len(lazy_text()), 'kept messages differ'
+    print(f'kept {len(kept) / COUNT:.0%}')
+    report('dicts, api_codec.decode', COUNT, measure(decoded, repeat=3))
+    report('dicts, view', COUNT, measure(lazy, repeat=3))
+    report('json text, loads + decode ClientDataMsg', COUNT, measure(decoded_text, repeat=3))
+    report('json text, view ClientDataMsg', COUNT, measure(lazy_text, repeat=3))
+
+
+if __name__ == '__main__':
+    main()
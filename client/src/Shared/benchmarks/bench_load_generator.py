@@ -0,0 +1,63 @@
+"""Builds load generator payloads from numpy blocks and one by one from the ``api_types``
+dataclasses, then runs 100 and 300 simulated phones against a ``LocalServer`` and
+prints the send to receive latency per type.
+"""
+import asyncio
+import math
+import random
+
+from _common import measure, report
+
+import api_codec
+from api_types import AccMsg, AccMsgType, DataType, GyroMsg, GyroMsgType
+from load_generator import INTERVAL, LoadGenerator, format_stats
+from local_server import LocalServer
+
+DEVICES = 1_000
+SAMPLES = 64
+RUNS = ((100, 3.0), (300, 3.0))
+
+
+def naive(generator: LoadGenerator, k0: int, count: int) -> list:
+    """one dataclass per message, encoded with ``api_codec``"""
+    payloads = []
+    for k in range(k0, k0 + count):
+        for i, (device_id, nr) in enumerate(zip(generator.device_ids, generator.device_nrs)):
+            phase = generator.waveforms.phase[i]
+            msg = AccMsg(device_id, nr, INTERVAL, 0.0, AccMsgType.ACCELERATION, random.random() / 10, random.random() / 10 + 9.81, math.sin(k / (50 / INTERVAL) + phase))
+            payloads.append(api_codec.to_dict(msg))
+            angle = k / (2000 / INTERVAL) + phase
+            msg = GyroMsg(False, math.sin(angle) * 180 + 180, math.cos(angle) * 180, device_id, nr, 0.0, 0.0, GyroMsgType.GYRO)
+            payloads.append(api_codec.to_dict(msg))
+    return payloads
+
+
+def vectorized(generator: LoadGenerator, k0: int, count: int) -> list:
+    return generator.build(DataType.ACCELERATION, k0, count) + generator.build(DataType.GYRO, k0, count)
+
+
+async def run(devices: int, duration: float):
+    server = LocalServer()
+    generator = LoadGenerator(
+        devices,
+        rates={DataType.ACCELERATION: 2, DataType.GYRO: 2, DataType.KEY: 0.5, DataType.POINTER: 0.5},
+        transport=server.transport,
+        seed=1,
+    )
+    stats = await generator.run(duration)
+    print(f'{devices} devices, {duration:.0f} s, schedule lag {generator.lag * 1e3:.1f} ms')
+    print(format_stats(stats))
+
+
+def main():
+    generator = LoadGenerator(DEVICES, seed=1)
+    generator.device_nrs = list(range(DEVICES))
+    count = DEVICES * SAMPLES * 2
+    report('payloads one by one', count, measure(lambda: naive(generator, 0, SAMPLES), 3))
+    report('payloads from numpy blocks', count, measure(lambda: vectorized(generator, 0, SAMPLES), 3))
+    for devices, duration in RUNS:
+        asyncio.run(run(devices, duration))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Bytes per instance of the ``api_types`` dataclasses and their ``api_slots`` variants."""
+import tracemalloc
+
+from _common import acc_msg, gyro_msg, sprite_msg
+
+import api_codec
+import api_slots
+import api_types
+
+COUNT = 20_000
+
+
+def client_data_msg(device_nr: int = 0, time_stamp: float = 0) -> dict:
+    # a ClientDataMsg as stored in the ``DataStore``, i.e. a decoded ``AccMsg``
+    return acc_msg(device_nr, time_stamp)
+
+
+def bytes_per_instance(decoder, payloads) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [decoder(p) for p in payloads]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    # the list holding the instances is not part of the instance size
+    size -= instances.__sizeof__()
+    return size / len(instances)
+
+
+def main():
+    cases = [
+        ('AccMsg', api_types.AccMsg, acc_msg),
+        ('GyroMsg', api_types.GyroMsg, gyro_msg),
+        ('SpriteMsg', api_types.SpriteMsg, lambda nr, ts: sprite_msg(f's{nr}', nr, ts)),
+        ('ClientDataMsg', api_types.ClientDataMsg, client_data_msg),
+    ]
+    print(f'{"class":<16} {"dataclass":>12} {"slotted":>12} {"frozen":>12}')
+    for label, cls, factory in cases:
+        payloads = [factory(i % 40, i / 60) for i in range(COUNT)]
+        sizes = [
+            bytes_per_instance(decoders[cls], payloads)
+            for decoders in (api_codec.DECODERS, api_slots.DECODERS, api_slots.FROZEN_DECODERS)
+        ]
+        print(f'{label:<16}' + ''.join(f' {size:>10.0f} B' for size in sizes))
+
+
+if __name__ == '__main__':
+    main()
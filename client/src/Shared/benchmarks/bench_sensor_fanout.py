@@ -0,0 +1,62 @@
+"""Decodes ``acceleration`` and ``gyro`` json payloads of 10 to 500 devices in one process and with ``SensorFanOut``.
+
+Throughput per core divides by the worker processes plus the partitioning main process.
+"""
+import json
+import os
+
+import numpy as np
+from _common import acc_msg, gyro_msg, measure, report
+
+from sensor_fanout import COLUMNS, SensorFanOut, _Worker
+
+SAMPLES = 200
+DEVICE_COUNTS = (10, 50, 100, 500)
+
+
+def payloads(devices: int) -> list:
+    stream = []
+    for i in range(SAMPLES):
+        for nr in range(devices):
+            msg = (acc_msg if i % 2 else gyro_msg)(nr, i / 60)
+            msg['device_id'] = f'phone-{nr}'
+            stream.append(json.dumps(msg).encode())
+    return stream
+
+
+def main():
+    workers = os.cpu_count() or 1
+    print(f'{workers} worker processes')
+    for devices in DEVICE_COUNTS:
+        stream = payloads(devices)
+
+        def single():
+            state = _Worker(1024)
+            row = np.empty(len(COLUMNS))
+            devices_of = {}
+            for payload in stream:
+                device_id = json.loads(payload)['device_id']
+                state.ingest(devices_of.setdefault(device_id, len(devices_of)), payload, row)
+
+        def fan_out():
+            rows = 0
+
+            def count(block):
+                nonlocal rows
+                rows += len(block)
+
+            with SensorFanOut(workers) as fanout:
+                for payload in stream:
+                    fanout.put(payload)
+                    fanout.drain(count)
+                fanout.close(count)
+            assert rows == len(stream), 'samples lost'
+
+        report(f'{devices} devices, one process', len(stream), measure(single, repeat=3))
+        seconds = measure(fan_out, repeat=3)
+        report(f'{devices} devices, SensorFanOut', len(stream), seconds)
+        report(f'{devices} devices, SensorFanOut per core', len(stream), seconds * (workers + 1))
+
+
+if __name__ == '__main__':
+    main()
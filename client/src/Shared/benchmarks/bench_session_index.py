@@ -0,0 +1,58 @@
+"""Queries a 200k message session log with ``SessionIndex`` and with a full scan of the log.
+
+Both return the same messages, the gyro columns of ``block`` match the decoded messages.
+"""
+import os
+import tempfile
+
+import numpy as np
+from _common import measure, mixed_stream, report
+
+from session_index import SessionIndex
+from session_log import Recorder, SessionLog
+
+COUNT = 200_000
+DEVICES = 40
+
+
+def main():
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, 'session.log')
+    with Recorder(path) as recorder:
+        for msg in mixed_stream(COUNT, DEVICES):
+            msg['device_id'] = f'phone-{msg["device_nr"]}'
+            recorder.write(msg)
+    start, end = COUNT / 60 * 0.25, COUNT / 60 * 0.75
+    query = {'start': start, 'end': end, 'device_nr': 3, 'type': 'gyro'}
+
+    with SessionLog(path) as log:
+        index = SessionIndex.build(log)
+
+        def scan():
+            return [
+                msg
+                for msg in log.messages(decode=False)
+                if msg.get('type') == 'gyro' and msg.get('device_nr') == 3 and start <= msg['time_stamp'] <= end
+            ]
+
+        def select():
+            return list(index.messages(decode=False, **query))
+
+        def block():
+            return index.block(('time_stamp', 'alpha', 'beta', 'gamma'), **query)
+
+        expected = scan()
+        assert select() == expected, 'messages differ'
+        columns = block()
+        for name in columns:
+            assert np.array_equal(columns[name], [msg[name] for msg in expected]), f'{name} differs'
+
+        matches = len(expected)
+        report('build index', COUNT, measure(lambda: SessionIndex.build(log), repeat=1))
+        report('full scan', matches, measure(scan, repeat=1), 'matches')
+        report('SessionIndex.messages', matches, measure(select, repeat=3), 'matches')
+        report('SessionIndex.block', matches, measure(block, repeat=3), 'matches')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Records 100k mixed ``new_data`` messages as session log and as json lines, reports size and throughput."""
+import json
+import os
+import tempfile
+
+from _common import measure, mixed_stream, report
+
+import api_codec
+from session_log import Recorder, SessionLog
+
+COUNT = 100_000
+
+
+def main():
+    messages = [api_codec.decode(msg) for msg in mixed_stream(COUNT)]
+    tmp = tempfile.mkdtemp()
+    log_path = os.path.join(tmp, 'session.log')
+    json_path = os.path.join(tmp, 'session.jsonl')
+
+    def write_log():
+        if os.path.exists(log_path):
+            os.remove(log_path)
+        with Recorder(log_path) as recorder:
+            for msg in messages:
+                recorder.write(msg)
+
+    def write_json():
+        with open(json_path, 'wb') as f:
+            for msg in messages:
+                f.write(api_codec.encode(msg) + b'\n')
+
+    def read_log():
+        with SessionLog(log_path) as log:
+            for _ in log:
+                pass
+
+    def read_json():
+        with open(json_path, 'rb') as f:
+            for line in f:
+                api_codec.decode(json.loads(line))
+
+    report('write json lines', COUNT, measure(write_json, repeat=3))
+    report('write session log', COUNT, measure(write_log, repeat=3))
+    report('read json lines', COUNT, measure(read_json, repeat=3))
+    report('read session log', COUNT, measure(read_log, repeat=3))
+    for label, path in (('json lines', json_path), ('session log', log_path)):
+        print(f'{label:<40} {os.path.getsize(path) / COUNT:>14.1f} bytes/msg')
+
+
+if __name__ == '__main__':
+    main()
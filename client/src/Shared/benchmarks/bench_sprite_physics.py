@@ -0,0 +1,165 @@
+"""Steps 5,000 moving sprites with ``SpritePhysics`` and with a per sprite port of ``Playground.update``.
+
+Both engines are fed the same trace, the events of every tick have to match.
+"""
+import math
+import random
+
+from _common import measure, report
+
+from sprite_physics import OUT_TIMEOUT, SPEED_SCALE, SpritePhysics
+
+SPRITES = 5_000
+TICKS = 200
+TICK = 0.005
+
+
+class BoundingBox:
+    """``BoundingBox`` of the browser client"""
+
+    def __init__(self, x: float, y: float, width: float, height: float, anchor=(0, 0)):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.anchor = anchor
+
+    @property
+    def left(self) -> float:
+        return self.x - self.anchor[0] * self.width
+
+    @property
+    def right(self) -> float:
+        return self.x + (1 - self.anchor[0]) * self.width
+
+    @property
+    def bottom(self) -> float:
+        return self.y - self.anchor[1] * self.height
+
+    @property
+    def top(self) -> float:
+        return self.y + (1 - self.anchor[1]) * self.height
+
+    def has_overlap(self, other: 'BoundingBox') -> bool:
+        x_overlap = self.right > other.left and self.left < other.right
+        y_overlap = self.top > other.bottom and self.bottom < other.top
+        return x_overlap and y_overlap
+
+
+class Playground(BoundingBox):
+    """the default 100 x 100 playground centered at the origin"""
+
+    def __init__(self):
+        super().__init__(-50, -50, 100, 100)
+
+    def border_overlap(self, other: BoundingBox):
+        if other.left < self.left:
+            return 'left'
+        if self.right < other.right:
+            return 'right'
+        if self.top < other.top:
+            return 'top'
+        if other.bottom < self.bottom:
+            return 'bottom'
+        return None
+
+
+PLAYGROUND = Playground()
+
+
+class ScalarSprite(BoundingBox):
+    """``Sprite`` + ``AutoMovementSequencer`` of the browser client, init movement only"""
+
+    def __init__(self, sprite: dict, time_stamp: float):
+        super().__init__(sprite['pos_x'], sprite['pos_y'], sprite['width'], sprite['height'])
+        self.id = sprite['id']
+        self.init_x = self.x
+        self.init_y = self.y
+        self.direction = sprite['direction']
+        self.speed = sprite['speed']
+        self.distance = sprite.get('distance')
+        self.time_span = sprite.get('time_span')
+        self.start = time_stamp
+        self.border = None
+        self.inactive_since = None
+
+    def update_position(self, time_stamp: float) -> bool:
+        """returns ``True`` when the movement is done"""
+        moving = (self.direction != [0, 0] and self.speed != 0) or (self.time_span or 0) > 0
+        if not moving:
+            return False
+        dt = time_stamp - self.start
+        self.x = self.init_x + self.direction[0] * self.speed * dt * SPEED_SCALE
+        self.y = self.init_y + self.direction[1] * self.speed * dt * SPEED_SCALE
+        if self.distance:
+            return math.sqrt((self.init_x - self.x) ** 2 + (self.init_y - self.y) ** 2) >= self.distance
+        return bool(self.time_span) and dt > self.time_span
+
+
+def scalar_step(sprites: list, time_stamp: float) -> list:
+    """``Playground.update``"""
+    events = []
+    for sprite in list(sprites):
+        if sprite.update_position(time_stamp):
+            events.append({'type': 'sprite_removed', 'id': sprite.id})
+            sprites.remove(sprite)
+            continue
+        if sprite.has_overlap(PLAYGROUND):
+            sprite.inactive_since = None
+            side = PLAYGROUND.border_overlap(sprite)
+            if side is not None and side != sprite.border:
+                events.append(
+                    {'type': 'border_overlap', 'id': sprite.id, 'collision_detection': False, 'border': side, 'x': sprite.x, 'y': sprite.y}
+                )
+            sprite.border = side
+        elif sprite.inactive_since is not None and time_stamp - sprite.inactive_since > OUT_TIMEOUT:
+            events.append({'type': 'sprite_removed', 'id': sprite.id})
+            sprites.remove(sprite)
+        elif sprite.inactive_since is None:
+            sprite.inactive_since = time_stamp
+            events.append({'type': 'sprite_out', 'id': sprite.id})
+    return events
+
+
+def trace():
+    sprites = []
+    for i in range(SPRITES):
+        angle = random.uniform(0, 2 * math.pi)
+        sprite = {
+            'id': f's{i}',
+            'pos_x': random.uniform(-50, 45),
+            'pos_y': random.uniform(-50, 45),
+            'width': 5,
+            'height': 5,
+            'direction': [math.cos(angle), math.sin(angle)],
+            'speed': random.uniform(0, 20),
+        }
+        if i % 3 == 0:
+            sprite['distance'] = random.uniform(5, 50)
+        elif i % 3 == 1:
+            sprite['time_span'] = random.uniform(0.1, 1)
+        sprites.append(sprite)
+    return sprites
+
+
+def main():
+    sprites = trace()
+    ticks = [TICK * (i + 1) for i in range(TICKS)]
+
+    def run_scalar():
+        scalar = [ScalarSprite(s, 0) for s in sprites]
+        return [scalar_step(scalar, ts) for ts in ticks]
+
+    def run_physics():
+        physics = SpritePhysics()
+        for sprite in sprites:
+            physics.upsert(sprite, 0)
+        return [physics.step(ts) for ts in ticks]
+
+    assert run_scalar() == run_physics(), 'events differ'
+    report('per sprite (Playground.update)', SPRITES * TICKS, measure(run_scalar, repeat=3), 'sprite steps')
+    report('SpritePhysics', SPRITES * TICKS, measure(run_physics, repeat=3), 'sprite steps')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Reads a ``data_store`` payload of 30 devices (100k messages, a 2 MB base64 image per device)
+with ``json.loads`` + ``DataStore`` decoding and with ``iter_store``, reports throughput and peak memory.
+
+Both yield the same messages, ``iter_store`` without the image bodies.
+"""
+import base64
+import io
+import json
+import os
+import tracemalloc
+
+from _common import measure, mixed_stream, report
+
+import api_codec
+from api_types import DataStore
+from store_stream import iter_store
+
+DEVICES = 30
+COUNT = 100_000
+IMAGE_BYTES = 1_500_000
+
+
+def payload() -> bytes:
+    store = {}
+    for msg in mixed_stream(COUNT, DEVICES):
+        store.setdefault(f'device-{msg["device_nr"]}', {}).setdefault(msg['type'], []).append(msg)
+    image = base64.b64encode(os.urandom(IMAGE_BYTES)).decode()
+    for device_id, data in store.items():
+        config = {'width': 100, 'height': 100, 'images': [{'name': 'background', 'image': image}]}
+        data['playground_config'] = [{'type': 'playground_config', 'device_id': device_id, 'device_nr': 0, 'time_stamp': 0, 'config': config}]
+    return json.dumps(store).encode()
+
+
+def peak(fn) -> float:
+    tracemalloc.start()
+    fn()
+    _, peak_size = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_size / 1e6
+
+
+def main():
+    text = payload()
+    print(f'payload {len(text) / 1e6:.0f} MB')
+
+    def loads():
+        stores = {device_id: api_codec.decode_as(DataStore, data) for device_id, data in json.loads(text).items()}
+        return sum(len(msgs or ()) for store in stores.values() for msgs in vars(store).values())
+
+    def streamed():
+        return sum(1 for _ in iter_store(io.BytesIO(text)))
+
+    count = loads()
+    assert count == streamed(), 'message counts differ'
+    report('json.loads + DataStore', count, measure(loads, repeat=1))
+    report('iter_store, images skipped', count, measure(streamed, repeat=1))
+    print(f'{"peak memory json.loads + DataStore":<40} {peak(loads):>14.1f} MB')
+    print(f'{"peak memory iter_store":<40} {peak(streamed):>14.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,284 @@
+"""Dense RGBA representation of the ``grid`` of the color grid view.
+
+A grid is stored as one ``(rows, columns, 4)`` uint8 array. All wire forms of
+``Grid.grid`` (a string with one line per row, a list of strings, a single
+row or nested lists of ``CssColor`` cells) are parsed like ``ColorGrid.ts``
+renders them, the frequent forms (digit lines, numeric and RGB lists) without
+a python loop per cell::
+
+    prev = ColorGrid.from_wire(['0' * 64] * 64, base_color='blue')
+    frame = prev.copy()
+    frame.update({'row': 1, 'column': 3, 'color': 9})
+    frame.diff(prev)
+    # -> [{'type': 'grid_update', 'row': 1, 'column': 3, 'color': 9}]
+
+:meth:`ColorGrid.diff` sends the changed cells as ``grid_update`` messages or
+the whole frame as one ``grid`` message, whichever is smaller on the wire.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+import api_codec
+import colors
+from api_types import DataType
+from colors import MAX_LEVEL, NAMED_COLORS, RGB, RGBA, CssColor, level_color, pack, resolve, to_rgba_array, unpack
+
+WHITE: RGBA = unpack(colors.WHITE)
+# the base color of alpha levels when none is given
+BASE_COLOR: RGB = unpack(colors.BASE_COLOR)[:3]
+# alpha byte of the levels 0..9 (``rgba(base, level / 9)``)
+LEVEL_ALPHA = np.array([level_color(level, 0) for level in range(MAX_LEVEL + 1)], dtype=np.uint8)
+
+# approximate encoded size of a ``grid_update`` message (with device_id,
+# device_nr and time_stamp) and of a cell in a ``grid`` message
+UPDATE_BYTES = 110
+CELL_BYTES = 8
+
+GRID = DataType.GRID.value
+GRID_UPDATE = DataType.GRID_UPDATE.value
+
+WireGrid = Union[List[List[CssColor]], List[CssColor], List[str], str]
+
+# alpha byte -> level, -1 for alphas which are no level
+_ALPHA_LEVEL = np.full(256, -1, dtype=np.int8)
+_ALPHA_LEVEL[LEVEL_ALPHA] = np.arange(MAX_LEVEL + 1)
+# packed opaque color -> shortest name
+_NAME_OF: Dict[int, str] = {}
+for _name, _packed in sorted(NAMED_COLORS.items(), key=lambda item: -len(item[0])):
+    _NAME_OF[_packed] = _name
+
+
+def base_rgb(base_color: Union[Sequence[float], str, None]) -> RGB:
+    """the rgb of a ``base_color`` (``colors.base_color``)"""
+    return unpack(colors.base_color(base_color))[:3]
+
+
+def cell_rgba(color: CssColor, base: RGB = BASE_COLOR) -> RGBA:
+    """The color of one cell (``colors.resolve``), empty cells and invalid css
+    colors are not rendered and stay white."""
+    packed = resolve(color, pack(*base))
+    return WHITE if packed is None else unpack(packed)
+
+
+def parse_grid(grid: WireGrid, base: RGB = BASE_COLOR) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse a wire grid, returns the ``(rows, columns, 4)`` colors and the mask
+    of the cells colored by ``base`` (alpha levels)."""
+    if isinstance(grid, str):
+        grid = [line.strip() for line in grid.split('\n')]
+        grid = [line for line in grid if line]
+    if len(grid) == 0:
+        return np.array([[WHITE]], dtype=np.uint8), np.zeros((1, 1), dtype=bool)
+    if isinstance(grid[0], str):
+        return _parse_lines(grid, base)
+    if not isinstance(grid[0], (list, tuple)):
+        grid = [grid]
+    columns = max(len(row) for row in grid)
+    if columns == 0:
+        return np.array([[WHITE]], dtype=np.uint8), np.zeros((1, 1), dtype=bool)
+    if all(len(row) == columns for row in grid) and not isinstance(grid[0][0], str):
+        try:
+            values = np.array(grid, dtype=np.float64)
+        except (TypeError, ValueError):
+            values = None
+        if values is not None and values.ndim == 2:
+            return _levels_to_rgba(values, base)
+        if values is not None and values.ndim == 3 and values.shape[2] in (3, 4):
+            rgba = to_rgba_array(colors.resolve_many(values, rgb=True))
+            return rgba, np.zeros(values.shape[:2], dtype=bool)
+    return _parse_cells(grid, columns, base)
+
+
+def _parse_lines(lines: List[str], base: RGB) -> Tuple[np.ndarray, np.ndarray]:
+    """rows of characters, digits are alpha levels, other characters level 0"""
+    columns = max(len(line) for line in lines)
+    # -1 pads the short rows, these cells are empty (white)
+    codes = np.full((len(lines), columns), -1, dtype=np.int64)
+    for idx, line in enumerate(lines):
+        codes[idx, : len(line)] = np.frombuffer(line.encode('utf-32-le'), dtype=np.uint32)
+    digits = codes - ord('0')
+    levels = np.where((digits >= 0) & (digits <= MAX_LEVEL), digits, 0).astype(np.float64)
+    levels[codes < 0] = np.nan
+    return _levels_to_rgba(levels, base, empty_is_white=False)
+
+
+def _levels_to_rgba(levels: np.ndarray, base: RGB, empty_is_white: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """numeric cells, ``0`` and ``NaN`` are empty (white) unless ``empty_is_white`` is unset"""
+    packed_base = pack(*base)
+    packed = colors.resolve_many(levels, packed_base)
+    mask = ~np.isnan(levels)
+    if empty_is_white:
+        mask &= levels != 0
+    else:
+        packed[levels == 0] = level_color(0, packed_base)
+    return to_rgba_array(packed), mask
+
+
+def _parse_cells(grid: List[List[CssColor]], columns: int, base: RGB) -> Tuple[np.ndarray, np.ndarray]:
+    """mixed cells, every distinct cell value is resolved once"""
+    # index 0 is the padding of short rows
+    index: Dict[Any, int] = {}
+    table: List[RGBA] = [WHITE]
+    based: List[bool] = [False]
+    cells: List[int] = []
+    for row in grid:
+        for color in row:
+            key = tuple(color) if isinstance(color, list) else color
+            idx = index.get(key)
+            if idx is None:
+                idx = index[key] = len(table)
+                table.append(cell_rgba(color, base))
+                based.append(_is_level(color))
+            cells.append(idx)
+        cells.extend([0] * (columns - len(row)))
+    cells = np.array(cells, dtype=np.intp).reshape(len(grid), columns)
+    return np.array(table, dtype=np.uint8)[cells], np.array(based)[cells]
+
+
+def _is_level(color: CssColor) -> bool:
+    if isinstance(color, str):
+        return len(color) == 1
+    return bool(color) and isinstance(color, (int, float))
+
+
+class ColorGrid:
+    def __init__(self, rgba: np.ndarray, base_color: RGB = BASE_COLOR, based: Optional[np.ndarray] = None):
+        """
+        :param rgba: ``(rows, columns, 4)`` uint8 colors
+        :param base_color: rgb of the alpha levels
+        :param based: mask of the cells colored by ``base_color``, they change with it
+        """
+        self.rgba = np.ascontiguousarray(rgba, dtype=np.uint8)
+        self.base_color = tuple(base_color)
+        self.based = based if based is not None else np.zeros(self.rgba.shape[:2], dtype=bool)
+
+    @classmethod
+    def from_wire(cls, grid: WireGrid, base_color: Union[Sequence[float], str, None] = None) -> 'ColorGrid':
+        base = base_rgb(base_color)
+        rgba, based = parse_grid(grid, base)
+        return cls(rgba, base, based)
+
+    @classmethod
+    def from_msg(cls, msg: Union[dict, object]) -> 'ColorGrid':
+        """the grid of a ``grid`` message"""
+        if msg.__class__ is not dict:
+            msg = api_codec.to_dict(msg)
+        return cls.from_wire(msg['grid'], msg.get('base_color'))
+
+    def copy(self) -> 'ColorGrid':
+        return ColorGrid(self.rgba.copy(), self.base_color, self.based.copy())
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.rgba.shape[:2]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ColorGrid) and self.shape == other.shape and bool(np.all(self.rgba == other.rgba))
+
+    # updates
+
+    def set_base_color(self, base_color: Union[Sequence[float], str, None]):
+        self.base_color = base_rgb(base_color)
+        self.rgba[self.based, :3] = self.base_color
+
+    def update(self, msg: Union[dict, object]):
+        """apply a ``grid_update`` message, the grid grows when the cell is outside"""
+        if msg.__class__ is not dict:
+            msg = api_codec.to_dict(msg)
+        if msg.get('base_color') is not None:
+            self.set_base_color(msg['base_color'])
+        row, column = msg.get('row'), msg.get('column')
+        if msg.get('number') is not None:
+            number = int(msg['number']) - 1
+            row, column = divmod(number, self.shape[1])
+        elif row is None:
+            return
+        row, column = int(row), int(column or 0)
+        rows, columns = self.shape
+        if row >= rows or column >= columns:
+            self._resize(max(rows, row + 1), max(columns, column + 1))
+        self.rgba[row, column] = cell_rgba(msg.get('color'), self.base_color)
+        self.based[row, column] = _is_level(msg.get('color'))
+
+    def _resize(self, rows: int, columns: int):
+        rgba = np.empty((rows, columns, 4), dtype=np.uint8)
+        rgba[...] = WHITE
+        based = np.zeros((rows, columns), dtype=bool)
+        old_rows, old_columns = self.shape
+        rgba[:old_rows, :old_columns] = self.rgba
+        based[:old_rows, :old_columns] = self.based
+        self.rgba = rgba
+        self.based = based
+
+    def apply(self, msg: Union[dict, object]):
+        """apply a ``grid`` or ``grid_update`` message"""
+        if msg.__class__ is not dict:
+            msg = api_codec.to_dict(msg)
+        if msg.get('type') == GRID:
+            other = ColorGrid.from_msg(msg)
+            self.rgba, self.base_color, self.based = other.rgba, other.base_color, other.based
+        elif msg.get('type') == GRID_UPDATE:
+            self.update(msg)
+
+    # encoding
+
+    def _levels(self) -> np.ndarray:
+        """the alpha level of every cell, -1 for cells not in ``base_color``"""
+        levels = _ALPHA_LEVEL[self.rgba[..., 3]]
+        levels[np.any(self.rgba[..., :3] != self.base_color, axis=2)] = -1
+        return levels
+
+    def _packed(self) -> np.ndarray:
+        """the cells packed as ``0xRRGGBBAA`` like ``colors.pack``"""
+        return self.rgba.view('>u4')[..., 0]
+
+    def _encode_cells(self, packed: np.ndarray, levels: np.ndarray) -> List[CssColor]:
+        """wire colors of the given cells: levels as numbers (``'0'`` for level 0),
+        opaque named colors by name and all others as rgb(a) lists"""
+        encoded = []
+        for value, level in zip(packed.tolist(), levels.tolist()):
+            if level > 0:
+                encoded.append(level)
+            elif level == 0:
+                encoded.append('0')
+            elif value in _NAME_OF:
+                encoded.append(_NAME_OF[value])
+            else:
+                r, g, b, a = unpack(value)
+                encoded.append([r, g, b] if a == 255 else [r, g, b, round(a / 255, 3)])
+        return encoded
+
+    def to_wire(self) -> WireGrid:
+        """the grid in its shortest wire form: digit lines when all cells are alpha levels"""
+        levels = self._levels()
+        rows, columns = self.shape
+        if np.all(levels >= 0):
+            return [''.join(map(str, row)) for row in levels.tolist()]
+        packed = self._packed()
+        unique, inverse = np.unique(packed, return_inverse=True)
+        unique_levels = np.full(len(unique), -1, dtype=np.int8)
+        unique_levels[inverse.reshape(-1)] = levels.reshape(-1)
+        cells = self._encode_cells(unique, unique_levels)
+        return [[cells[idx] for idx in row] for row in inverse.reshape(rows, columns).tolist()]
+
+    def to_msg(self) -> Dict[str, Any]:
+        return {'type': GRID, 'grid': self.to_wire(), 'base_color': list(self.base_color)}
+
+    def diff(self, previous: Optional['ColorGrid']) -> List[Dict[str, Any]]:
+        """The messages turning ``previous`` into this grid: ``grid_update``
+        messages of the changed cells or one ``grid`` message when that is
+        smaller (or the shape or base color changed)."""
+        if previous is None or previous.shape != self.shape or previous.base_color != self.base_color:
+            return [self.to_msg()]
+        packed = self._packed()
+        changed = np.flatnonzero(packed != previous._packed())
+        if len(changed) == 0:
+            return []
+        if len(changed) * UPDATE_BYTES >= packed.size * CELL_BYTES:
+            return [self.to_msg()]
+        rows, columns = np.divmod(changed, self.shape[1])
+        cells = self._encode_cells(packed.reshape(-1)[changed], self._levels().reshape(-1)[changed])
+        return [
+            {'type': GRID_UPDATE, 'row': row, 'column': column, 'color': color}
+            for row, column, color in zip(rows.tolist(), columns.tolist(), cells)
+        ]
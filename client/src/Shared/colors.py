@@ -0,0 +1,329 @@
+"""Resolution of the color forms used in the api to packed RGBA ints.
+
+Colors are packed as ``0xRRGGBBAA``. ``NAMED_COLORS`` maps every ``ColorName``
+to its packed color, :func:`parse_css` parses css strings (names, ``#rgb``,
+``#rrggbbaa``, ``rgb()``, ``rgba()``, ``hsl()``, ``hsla()``) through a
+bounded LRU cache and :func:`resolve` applies ``toCssColor`` of Color.ts to
+any ``CssColor`` (numbers and single digits are alpha levels of a base
+color). :func:`resolve_many` resolves a whole array of colors, numeric arrays
+are alpha levels unless ``rgb`` is set::
+
+    parse_css('#ff8000')          # -> 0xff8000ff
+    resolve(3, base='blue')       # -> 0x0000ff55
+    resolve_many(['red', '#00f', [0, 255, 0]])
+    resolve_many(np.array([[255, 128, 0], [0, 0, 255]]), rgb=True)
+"""
+import colorsys
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from api_types import ColorName
+
+RGB = Tuple[int, int, int]
+RGBA = Tuple[int, int, int, int]
+CssColor = Union[List[float], float, str, None]
+
+CACHE_SIZE = 1024
+MAX_LEVEL = 9
+
+# ``COLOR_MAP`` of Color.ts
+COLOR_NAMES: Mapping[str, RGB] = MappingProxyType(
+    {
+        'aliceblue': (240, 248, 255),
+        'antiquewhite': (250, 235, 215),
+        'aqua': (0, 255, 255),
+        'aquamarine': (127, 255, 212),
+        'azure': (240, 255, 255),
+        'beige': (245, 245, 220),
+        'bisque': (255, 228, 196),
+        'black': (0, 0, 0),
+        'blanchedalmond': (255, 235, 205),
+        'blue': (0, 0, 255),
+        'blueviolet': (138, 43, 226),
+        'brown': (165, 42, 42),
+        'burlywood': (222, 184, 135),
+        'cadetblue': (95, 158, 160),
+        'chartreuse': (127, 255, 0),
+        'chocolate': (210, 105, 30),
+        'coral': (255, 127, 80),
+        'cornflowerblue': (100, 149, 237),
+        'cornsilk': (255, 248, 220),
+        'crimson': (220, 20, 60),
+        'cyan': (0, 255, 255),
+        'darkblue': (0, 0, 139),
+        'darkcyan': (0, 139, 139),
+        'darkgoldenrod': (184, 134, 11),
+        'darkgray': (169, 169, 169),
+        'darkgreen': (0, 100, 0),
+        'darkkhaki': (189, 183, 107),
+        'darkmagenta': (139, 0, 139),
+        'darkolivegreen': (85, 107, 47),
+        'darkorange': (255, 140, 0),
+        'darkorchid': (153, 50, 204),
+        'darkred': (139, 0, 0),
+        'darksalmon': (233, 150, 122),
+        'darkseagreen': (143, 188, 143),
+        'darkslateblue': (72, 61, 139),
+        'darkslategray': (47, 79, 79),
+        'darkturquoise': (0, 206, 209),
+        'darkviolet': (148, 0, 211),
+        'deeppink': (255, 20, 147),
+        'deepskyblue': (0, 191, 255),
+        'dimgray': (105, 105, 105),
+        'dodgerblue': (30, 144, 255),
+        'firebrick': (178, 34, 34),
+        'floralwhite': (255, 250, 240),
+        'forestgreen': (34, 139, 34),
+        'fuchsia': (255, 0, 255),
+        'gainsboro': (220, 220, 220),
+        'ghostwhite': (248, 248, 255),
+        'gold': (255, 215, 0),
+        'goldenrod': (218, 165, 32),
+        'gray': (128, 128, 128),
+        'green': (0, 128, 0),
+        'greenyellow': (173, 255, 47),
+        'honeydew': (240, 255, 240),
+        'hotpink': (255, 105, 180),
+        'indianred': (205, 92, 92),
+        'indigo': (75, 0, 130),
+        'ivory': (255, 255, 240),
+        'khaki': (240, 230, 140),
+        'lavender': (230, 230, 250),
+        'lavenderblush': (255, 240, 245),
+        'lawngreen': (124, 252, 0),
+        'lemonchiffon': (255, 250, 205),
+        'lightblue': (173, 216, 230),
+        'lightcoral': (240, 128, 128),
+        'lightcyan': (224, 255, 255),
+        'lightgoldenrodyellow': (250, 250, 210),
+        'lightgrey': (211, 211, 211),
+        'lightgreen': (144, 238, 144),
+        'lightpink': (255, 182, 193),
+        'lightsalmon': (255, 160, 122),
+        'lightseagreen': (32, 178, 170),
+        'lightskyblue': (135, 206, 250),
+        'lightslategray': (119, 136, 153),
+        'lightsteelblue': (176, 196, 222),
+        'lightyellow': (255, 255, 224),
+        'lime': (0, 255, 0),
+        'limegreen': (50, 205, 50),
+        'linen': (250, 240, 230),
+        'magenta': (255, 0, 255),
+        'maroon': (128, 0, 0),
+        'mediumaquamarine': (102, 205, 170),
+        'mediumblue': (0, 0, 205),
+        'mediumorchid': (186, 85, 211),
+        'mediumpurple': (147, 112, 216),
+        'mediumseagreen': (60, 179, 113),
+        'mediumslateblue': (123, 104, 238),
+        'mediumspringgreen': (0, 250, 154),
+        'mediumturquoise': (72, 209, 204),
+        'mediumvioletred': (199, 21, 133),
+        'midnightblue': (25, 25, 112),
+        'mintcream': (245, 255, 250),
+        'mistyrose': (255, 228, 225),
+        'moccasin': (255, 228, 181),
+        'navajowhite': (255, 222, 173),
+        'navy': (0, 0, 128),
+        'oldlace': (253, 245, 230),
+        'olive': (128, 128, 0),
+        'olivedrab': (107, 142, 35),
+        'orange': (255, 165, 0),
+        'orangered': (255, 69, 0),
+        'orchid': (218, 112, 214),
+        'palegoldenrod': (238, 232, 170),
+        'palegreen': (152, 251, 152),
+        'paleturquoise': (175, 238, 238),
+        'palevioletred': (216, 112, 147),
+        'papayawhip': (255, 239, 213),
+        'peachpuff': (255, 218, 185),
+        'peru': (205, 133, 63),
+        'pink': (255, 192, 203),
+        'plum': (221, 160, 221),
+        'powderblue': (176, 224, 230),
+        'purple': (128, 0, 128),
+        'rebeccapurple': (102, 51, 153),
+        'red': (255, 0, 0),
+        'rosybrown': (188, 143, 143),
+        'royalblue': (65, 105, 225),
+        'saddlebrown': (139, 69, 19),
+        'salmon': (250, 128, 114),
+        'sandybrown': (244, 164, 96),
+        'seagreen': (46, 139, 87),
+        'seashell': (255, 245, 238),
+        'sienna': (160, 82, 45),
+        'silver': (192, 192, 192),
+        'skyblue': (135, 206, 235),
+        'slateblue': (106, 90, 205),
+        'slategray': (112, 128, 144),
+        'snow': (255, 250, 250),
+        'springgreen': (0, 255, 127),
+        'steelblue': (70, 130, 180),
+        'tan': (210, 180, 140),
+        'teal': (0, 128, 128),
+        'thistle': (216, 191, 216),
+        'tomato': (255, 99, 71),
+        'turquoise': (64, 224, 208),
+        'violet': (238, 130, 238),
+        'wheat': (245, 222, 179),
+        'white': (255, 255, 255),
+        'whitesmoke': (245, 245, 245),
+        'yellow': (255, 255, 0),
+        'yellowgreen': (154, 205, 50),
+    }
+)
+
+
+def pack(r: int, g: int, b: int, a: int = 255) -> int:
+    return r << 24 | g << 16 | b << 8 | a
+
+
+def unpack(color: int) -> RGBA:
+    return color >> 24 & 255, color >> 16 & 255, color >> 8 & 255, color & 255
+
+
+NAMED_COLORS: Mapping[str, int] = MappingProxyType(
+    {member.value: pack(*COLOR_NAMES[member.value]) for member in ColorName}
+)
+WHITE = NAMED_COLORS[ColorName.WHITE.value]
+TRANSPARENT = 0
+# the base color of alpha levels when none is given
+BASE_COLOR = NAMED_COLORS[ColorName.RED.value]
+
+_FUNCTION = re.compile(r'^(rgba?|hsla?)\((.*)\)$')
+_SEPARATOR = re.compile(r'\s*,\s*|\s*/\s*|\s+')
+_HUE_UNITS = {'deg': 1 / 360, 'turn': 1, 'rad': 1 / (2 * 3.141592653589793), 'grad': 1 / 400}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_css(text: str) -> Optional[int]:
+    """the packed color of a css color string, ``None`` when it is no valid color"""
+    text = text.strip().lower()
+    color = NAMED_COLORS.get(text)
+    if color is not None:
+        return color
+    if text == 'transparent':
+        return TRANSPARENT
+    try:
+        if text.startswith('#'):
+            return _parse_hex(text[1:])
+        match = _FUNCTION.match(text)
+        if match is None:
+            return None
+        args = [arg for arg in _SEPARATOR.split(match.group(2).strip()) if arg]
+        if len(args) not in (3, 4):
+            return None
+        alpha = _channel(args[3], 1) if len(args) == 4 else 255
+        if match.group(1).startswith('rgb'):
+            return pack(_channel(args[0], 255), _channel(args[1], 255), _channel(args[2], 255), alpha)
+        return _parse_hsl(args, alpha)
+    except ValueError:
+        return None
+
+
+def _parse_hex(digits: str) -> Optional[int]:
+    if len(digits) in (3, 4):
+        digits = ''.join(digit * 2 for digit in digits)
+    if len(digits) == 6:
+        return int(digits, 16) << 8 | 255
+    if len(digits) == 8:
+        return int(digits, 16)
+    return None
+
+
+def _channel(arg: str, scale: float) -> int:
+    """a color channel of ``0..scale`` or a percentage as byte"""
+    if arg.endswith('%'):
+        value = float(arg[:-1]) / 100 * 255
+    else:
+        value = float(arg) * 255 / scale
+    return int(min(max(round(value), 0), 255))
+
+
+def _parse_hsl(args: List[str], alpha: int) -> int:
+    hue = args[0]
+    unit = next((unit for unit in _HUE_UNITS if hue.endswith(unit)), None)
+    hue = float(hue[: -len(unit)]) * _HUE_UNITS[unit] if unit else float(hue) / 360
+    saturation = min(max(float(args[1].rstrip('%')) / 100, 0), 1)
+    lightness = min(max(float(args[2].rstrip('%')) / 100, 0), 1)
+    r, g, b = colorsys.hls_to_rgb(hue % 1, lightness, saturation)
+    return pack(round(r * 255), round(g * 255), round(b * 255), alpha)
+
+
+def base_color(color: Union[Sequence[float], str, None]) -> int:
+    """the packed ``base_color`` of a grid, unknown names fall back to red like in the browser"""
+    if color is None:
+        return BASE_COLOR
+    if isinstance(color, str):
+        return NAMED_COLORS.get(color.strip().lower(), BASE_COLOR)
+    return pack(*(int(min(max(round(c), 0), 255)) for c in color[:3]))
+
+
+def level_color(level: float, base: int = BASE_COLOR) -> int:
+    """alpha level 0..9 of ``base``"""
+    level = min(max(level, 0), MAX_LEVEL) if level == level else 0
+    return base & ~255 | int(round(level * 255 / MAX_LEVEL))
+
+
+def resolve(color: CssColor, base: int = BASE_COLOR) -> Optional[int]:
+    """The packed color of a ``CssColor`` as rendered by ``toCssColor``: ``None``
+    for empty colors (``None``, ``0``, ``''``) and invalid css strings, numbers
+    and single characters are alpha levels of ``base``."""
+    if not color:
+        return None
+    if isinstance(color, str):
+        if len(color) == 1:
+            # ``parseInt`` only reads ascii digits, other characters (``'x'``, ``'²'``) are level 0
+            return level_color(ord(color) - 48 if '0' <= color <= '9' else 0, base)
+        return parse_css(color)
+    if isinstance(color, (int, float)):
+        return level_color(color, base)
+    r, g, b = (int(min(max(round(c), 0), 255)) for c in color[:3])
+    alpha = 255 if len(color) < 4 else int(min(max(round(color[3] * 255), 0), 255))
+    return pack(r, g, b, alpha)
+
+
+def resolve_many(
+    colors: Union[Sequence[CssColor], np.ndarray], base: int = BASE_COLOR, default: int = WHITE, rgb: bool = False
+) -> np.ndarray:
+    """Resolve an array of colors to packed uint32 colors, empty and invalid
+    colors are ``default``. Numeric arrays are converted without a python loop,
+    as alpha levels or, with ``rgb``, as rgb(a) rows along the last axis (of
+    length 3 or 4). Otherwise every distinct color is resolved once."""
+    if rgb:
+        colors = np.asarray(colors)
+        if colors.dtype.kind not in 'iuf' or colors.ndim == 0 or colors.shape[-1] not in (3, 4):
+            raise ValueError(f'rgb colors need a numeric last axis of length 3 or 4, got {colors.shape}')
+    if isinstance(colors, np.ndarray) and colors.dtype.kind in 'iuf':
+        if rgb:
+            channels = np.clip(np.round(colors.astype(np.float64)), 0, 255).astype(np.uint32)
+            alpha = np.full(colors.shape[:-1], 255, dtype=np.uint32)
+            if colors.shape[-1] == 4:
+                alpha = np.clip(np.round(colors[..., 3] * 255), 0, 255).astype(np.uint32)
+            return channels[..., 0] << 24 | channels[..., 1] << 16 | channels[..., 2] << 8 | alpha
+        levels = colors.astype(np.float64)
+        empty = np.isnan(levels) | (levels == 0)
+        alpha = np.round(np.clip(np.nan_to_num(levels), 0, MAX_LEVEL) * 255 / MAX_LEVEL).astype(np.uint32)
+        return np.where(empty, np.uint32(default), np.uint32(base & ~255) | alpha).astype(np.uint32)
+    index: Dict[object, int] = {}
+    table: List[int] = []
+    cells: List[int] = []
+    for color in colors:
+        key = tuple(color) if color.__class__ is list or color.__class__ is np.ndarray else color
+        pos = index.get(key)
+        if pos is None:
+            pos = index[key] = len(table)
+            packed = resolve(color, base)
+            table.append(default if packed is None else packed)
+        cells.append(pos)
+    return np.array(table, dtype=np.uint32)[np.array(cells, dtype=np.intp)]
+
+
+def to_rgba_array(packed: np.ndarray) -> np.ndarray:
+    """packed colors as a ``(..., 4)`` uint8 array"""
+    packed = np.asarray(packed, dtype=np.uint32)
+    return packed.astype('>u4').view(np.uint8).reshape(packed.shape + (4,))
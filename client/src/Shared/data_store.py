@@ -0,0 +1,322 @@
+"""Python replica of the server side data store (``addDataToStore`` in index.ts).
+
+Messages are applied in their wire format (dicts as received on ``new_data``)
+with the same semantics as the server:
+
+- ``sprite`` and ``line`` messages are upserted by id, an update merges the
+  fields into the stored message and moves it to the end
+- at most ``THRESHOLD`` messages are kept per type, for sprites the oldest
+  sprite without ``collision_detection`` is evicted first
+- ``remove_sprite``, ``remove_line``, ``clear_playground``, ``clean_playground``,
+  ``input_response`` and ``alert_confirm`` remove the affected messages
+
+Sprites and lines are kept in id indexed ordered maps, input prompts and
+notifications in time stamp indexed ordered maps and all other types in
+bounded deques, so applying a message is O(1).
+"""
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Hashable, List, Optional, Set, Tuple, Union
+
+import api_codec
+from api_types import DataStore, DataType
+from asset_store import AssetStore
+
+THRESHOLD = 25
+
+SPRITE = DataType.SPRITE.value
+SPRITES = DataType.SPRITES.value
+REMOVE_SPRITE = DataType.REMOVE_SPRITE.value
+PLAYGROUND_CONFIG = DataType.PLAYGROUND_CONFIG.value
+NOTIFICATION = DataType.NOTIFICATION.value
+INPUT_PROMPT = DataType.INPUT_PROMPT.value
+# not (yet) part of api_types.DataType
+LINE = 'line'
+LINES = 'lines'
+REMOVE_LINE = 'remove_line'
+CLEAN_PLAYGROUND = 'clean_playground'
+AUTO_MOVEMENT_POS = 'auto_movement_pos'
+
+
+class _CappedMap:
+    """Ordered map holding at most ``THRESHOLD`` messages, the oldest is dropped first."""
+
+    __slots__ = ('items',)
+
+    def __init__(self):
+        self.items: 'OrderedDict[Hashable, dict]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items.values())
+
+    def add(self, key: Hashable, msg: dict) -> Optional[Hashable]:
+        """add ``msg``, returns the key of the evicted message if any"""
+        evicted = None
+        if key in self.items:
+            del self.items[key]
+        elif len(self.items) >= THRESHOLD:
+            evicted, _ = self.items.popitem(last=False)
+        self.items[key] = msg
+        return evicted
+
+    def discard(self, key: Hashable) -> bool:
+        return self.items.pop(key, None) is not None
+
+    def clear(self):
+        self.items.clear()
+
+
+class DeviceStore:
+    """The stored messages of one ``device_id``.
+
+    Every change of a stored entry is reported to :meth:`changed`, entries are
+    identified by their kind (the message type) and key (the sprite or line
+    id, the time stamp of prompts and notifications or a sequence number for
+    all other types).
+    """
+
+    def __init__(self):
+        self.sprites: 'OrderedDict[str, dict]' = OrderedDict()
+        # sprites without collision detection, in the same order as ``sprites``
+        self.plain_sprites: 'OrderedDict[str, None]' = OrderedDict()
+        self.lines: 'OrderedDict[str, dict]' = OrderedDict()
+        self.config: Optional[dict] = None
+        self.keyed: Dict[str, _CappedMap] = {NOTIFICATION: _CappedMap(), INPUT_PROMPT: _CappedMap()}
+        # (sequence number, message) per type
+        self.messages: Dict[str, Deque[Tuple[int, dict]]] = {}
+        self.auto_movements: Dict[str, Set[str]] = {}
+        self._seq = 0
+
+    def changed(self, kind: str, key: Hashable, msg: Optional[dict]):
+        """hook called after an entry was upserted (``msg``) or removed (``None``)"""
+
+    def dropped(self, kind: str, key: Hashable):
+        """hook called before the oldest message of a bounded deque is evicted by the cap"""
+
+    def upsert_sprite(self, msg: dict):
+        sprite = msg['sprite']
+        sprite_id = sprite['id']
+        prev = self.sprites.pop(sprite_id, None)
+        if prev is not None:
+            prev['time_stamp'] = msg.get('time_stamp')
+            prev['sprite'] = {**prev['sprite'], **sprite}
+            msg = prev
+        elif len(self.sprites) >= THRESHOLD:
+            if self.plain_sprites:
+                evicted, _ = self.plain_sprites.popitem(last=False)
+                del self.sprites[evicted]
+            else:
+                evicted, _ = self.sprites.popitem(last=False)
+            self.changed(SPRITE, evicted, None)
+        self.sprites[sprite_id] = msg
+        self.plain_sprites.pop(sprite_id, None)
+        if not msg['sprite'].get('collision_detection'):
+            self.plain_sprites[sprite_id] = None
+        self.changed(SPRITE, sprite_id, msg)
+
+    def remove_sprite(self, sprite_id: str):
+        if self.sprites.pop(sprite_id, None) is not None:
+            self.changed(SPRITE, sprite_id, None)
+        self.plain_sprites.pop(sprite_id, None)
+        self.auto_movements.pop(sprite_id, None)
+
+    def upsert_line(self, msg: dict):
+        line = msg['line']
+        prev = self.lines.pop(line['id'], None)
+        if prev is not None:
+            prev['time_stamp'] = msg.get('time_stamp')
+            prev['line'] = {**prev['line'], **line}
+            msg = prev
+        elif len(self.lines) >= THRESHOLD:
+            evicted, _ = self.lines.popitem(last=False)
+            self.changed(LINE, evicted, None)
+        self.lines[line['id']] = msg
+        self.changed(LINE, line['id'], msg)
+
+    def remove_line(self, line_id: str):
+        if self.lines.pop(line_id, None) is not None:
+            self.changed(LINE, line_id, None)
+
+    def set_config(self, msg: Optional[dict]):
+        if msg is None and self.config is None:
+            return
+        self.config = msg
+        self.changed(PLAYGROUND_CONFIG, PLAYGROUND_CONFIG, msg)
+
+    def add_keyed(self, kind: str, msg: dict):
+        key = msg.get('time_stamp')
+        evicted = self.keyed[kind].add(key, msg)
+        if evicted is not None:
+            self.changed(kind, evicted, None)
+        self.changed(kind, key, msg)
+
+    def discard_keyed(self, kind: str, key: Hashable):
+        if self.keyed[kind].discard(key):
+            self.changed(kind, key, None)
+
+    def clean_playground(self):
+        for sprite_id in self.sprites:
+            self.changed(SPRITE, sprite_id, None)
+        for line_id in self.lines:
+            self.changed(LINE, line_id, None)
+        self.sprites.clear()
+        self.plain_sprites.clear()
+        self.lines.clear()
+        self.auto_movements.clear()
+
+    def auto_movement_pos(self, msg: dict):
+        if msg.get('movement_id') == 'init':
+            msg['stop_propagation'] = True
+            return
+        seen = self.auto_movements.setdefault(msg['id'], set())
+        if msg.get('movement_id') in seen:
+            msg['stop_propagation'] = True
+            return
+        seen.add(msg.get('movement_id'))
+        prev = self.sprites.pop(msg['id'], None)
+        if prev is None:
+            return
+        prev['time_stamp'] = msg.get('time_stamp')
+        sprite = {**prev['sprite'], 'pos_x': msg.get('x'), 'pos_y': msg.get('y')}
+        movements = sprite.get('movements')
+        if movements is not None:
+            if movements.get('repeat') is not None:
+                movements['repeat'] -= 1
+                if movements['repeat'] < 0:
+                    sprite['movements'] = None
+            elif not movements.get('cycle'):
+                sprite['movements'] = None
+        prev['sprite'] = sprite
+        self.sprites[msg['id']] = prev
+        if msg['id'] in self.plain_sprites:
+            self.plain_sprites.move_to_end(msg['id'])
+        self.changed(SPRITE, msg['id'], prev)
+
+    def append(self, msg: dict):
+        store = self.messages.get(msg['type'])
+        if store is None:
+            store = deque(maxlen=THRESHOLD)
+            self.messages[msg['type']] = store
+        if len(store) == store.maxlen:
+            self.dropped(msg['type'], store[0][0])
+        self._seq += 1
+        store.append((self._seq, msg))
+        self.changed(msg['type'], self._seq, msg)
+
+    def to_dict(self) -> Dict[str, List[dict]]:
+        """the stored messages per type, as ``ClientsData`` on the server"""
+        data: Dict[str, List[dict]] = {key: [msg for _, msg in store] for key, store in self.messages.items()}
+        data.update((key, list(store)) for key, store in self.keyed.items() if store)
+        if self.sprites:
+            data[SPRITE] = list(self.sprites.values())
+        if self.lines:
+            data[LINE] = list(self.lines.values())
+        if self.config is not None:
+            data[PLAYGROUND_CONFIG] = [self.config]
+        return data
+
+
+class DataStoreEngine:
+    """Applies ``new_data`` messages to per device stores like the server does."""
+
+    DEVICE_STORE = DeviceStore
+
+    def __init__(self, assets: Optional[AssetStore] = None):
+        """
+        :param assets: stores the image and audio bodies of the playground configs,
+            the stored configs reference them by digest
+        """
+        self.devices: Dict[str, DeviceStore] = {}
+        self.assets = assets
+
+    def __getitem__(self, device_id: str) -> DeviceStore:
+        return self.devices[device_id]
+
+    def __contains__(self, device_id: str) -> bool:
+        return device_id in self.devices
+
+    def device(self, device_id: str) -> DeviceStore:
+        store = self.devices.get(device_id)
+        if store is None:
+            store = self.DEVICE_STORE()
+            self.devices[device_id] = store
+        return store
+
+    def clear(self, device_id: str):
+        """``clear_data`` of a device"""
+        self.release_assets(self.devices.get(device_id))
+        self.devices[device_id] = self.DEVICE_STORE()
+
+    def release_assets(self, store: Optional[DeviceStore]):
+        """drop the asset references of the config of a replaced or cleared store"""
+        if self.assets is not None and store is not None:
+            self.assets.release(store.config)
+
+    def apply(self, device_id: str, msg: Union[dict, object]):
+        """Apply a message to the store of ``device_id``.
+
+        Dicts are stored as they are and may be updated in place by later
+        messages, dataclasses are converted with ``api_codec.to_dict``.
+        """
+        if msg.__class__ is not dict:
+            msg = api_codec.to_dict(msg)
+        store = self.device(device_id)
+        msg_type = msg.get('type')
+        if msg_type == SPRITE:
+            store.upsert_sprite(msg)
+        elif msg_type == SPRITES:
+            for sprite in msg['sprites']:
+                store.upsert_sprite(_expand(msg, SPRITE, 'sprite', sprite))
+        elif msg_type == LINE:
+            store.upsert_line(msg)
+        elif msg_type == LINES:
+            for line in msg['lines']:
+                store.upsert_line(_expand(msg, LINE, 'line', line))
+        elif msg_type == REMOVE_SPRITE:
+            store.remove_sprite(msg['id'])
+        elif msg_type == REMOVE_LINE:
+            store.remove_line(msg['id'])
+        elif msg_type == DataType.CLEAR_PLAYGROUND.value:
+            store.clean_playground()
+            self.release_assets(store)
+            store.set_config(None)
+        elif msg_type == CLEAN_PLAYGROUND:
+            store.clean_playground()
+        elif msg_type == AUTO_MOVEMENT_POS:
+            store.auto_movement_pos(msg)
+        elif msg_type == PLAYGROUND_CONFIG:
+            if self.assets is not None:
+                # intern first, assets of both configs stay referenced
+                msg = self.assets.intern(msg)
+                self.release_assets(store)
+            store.set_config(msg)
+        elif msg_type == DataType.INPUT_PROMPT.value:
+            store.add_keyed(INPUT_PROMPT, msg)
+        elif msg_type == DataType.INPUT_RESPONSE.value:
+            store.discard_keyed(INPUT_PROMPT, msg.get('time_stamp'))
+        elif msg_type in (DataType.ALERT_CONFIRM.value, NOTIFICATION):
+            # the server never stores notifications, alerts are only removed
+            store.discard_keyed(NOTIFICATION, msg.get('time_stamp'))
+        elif msg_type in (DataType.ALL_DATA.value, DataType.UNKNOWN.value, None):
+            return
+        else:
+            store.append(msg)
+
+    def to_dict(self) -> Dict[str, Dict[str, List[dict]]]:
+        return {device_id: store.to_dict() for device_id, store in self.devices.items()}
+
+    def data_store(self, device_id: str) -> DataStore:
+        """the store of ``device_id`` decoded as ``api_types.DataStore``"""
+        return api_codec.decode_as(DataStore, self.device(device_id).to_dict())
+
+
+def _expand(msg: dict, msg_type: str, key: str, value: dict) -> dict:
+    return {
+        'type': msg_type,
+        key: value,
+        'time_stamp': msg.get('time_stamp'),
+        'device_id': msg.get('device_id'),
+        'device_nr': msg.get('device_nr'),
+    }
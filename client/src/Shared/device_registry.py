@@ -0,0 +1,210 @@
+"""Registry of the connected devices of a server.
+
+index.ts finds devices by scanning the device list (``unorderedDevices().find``)
+and assigns numbers with ``numbers.includes`` in a loop. :class:`DeviceRegistry`
+keeps maps from ``socket_id``, ``device_nr`` and ``device_id`` to the devices
+and free lists of numbers, clients get the lowest free number ``>= 0``,
+scripts the highest free number ``< 0``::
+
+    registry = DeviceRegistry()
+    device = registry.add(sid, 'FooBar', is_client=True)
+    registry.by_nr(device['device_nr'])
+    pkg = registry.changed_pkg()  # ``DevicesPkg``, None when sent already
+
+Devices are wire dicts (``api_types.Device`` plus ``is_silent``) as sent with
+the ``device`` and ``devices`` events.
+"""
+import bisect
+import heapq
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+
+def time_stamp() -> float:
+    return time.time()
+
+
+class _NumberPool:
+    """The lowest free number ``k >= 0``, device numbers map to ``k`` or ``-k - 1``.
+
+    Every free number below ``high`` is on the heap, numbers taken by
+    ``DeviceRegistry.reassign`` stay on it and are skipped when popped.
+    """
+
+    def __init__(self, registry: 'DeviceRegistry', is_client: bool):
+        self.registry = registry
+        self.is_client = is_client
+        self.free: List[int] = []
+        self.high = 0
+
+    def device_nr(self, k: int) -> int:
+        return k if self.is_client else -k - 1
+
+    def taken(self, k: int) -> bool:
+        return self.device_nr(k) in self.registry.numbers
+
+    def take(self) -> int:
+        while self.free:
+            k = heapq.heappop(self.free)
+            if not self.taken(k):
+                return self.device_nr(k)
+        while self.taken(self.high):
+            self.high += 1
+        self.high += 1
+        return self.device_nr(self.high - 1)
+
+    def release(self, device_nr: float):
+        if device_nr != int(device_nr):
+            return
+        k = int(device_nr) if self.is_client else -int(device_nr) - 1
+        if 0 <= k < self.high:
+            heapq.heappush(self.free, k)
+
+
+class DeviceRegistry:
+    def __init__(self):
+        self.sockets: Dict[str, Dict[str, Any]] = {}
+        self.numbers: Dict[float, Dict[str, Any]] = {}
+        # the devices of each device_id by socket_id, in connection order
+        self.ids: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.time_stamp = time_stamp()
+        # sorted numbers of the clients and (descending) negated numbers of the scripts
+        self._clients: List[float] = []
+        self._scripts: List[float] = []
+        self._pools = {True: _NumberPool(self, True), False: _NumberPool(self, False)}
+        self._pkg: Optional[Dict[str, Any]] = None
+        self._sent: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self.sockets)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.ordered())
+
+    def __contains__(self, socket_id: str) -> bool:
+        return socket_id in self.sockets
+
+    # lookups
+
+    def by_socket(self, socket_id: str) -> Optional[Dict[str, Any]]:
+        return self.sockets.get(socket_id)
+
+    def by_nr(self, device_nr: Any) -> Optional[Dict[str, Any]]:
+        """the device with ``device_nr``, ``None`` for unknown numbers and non numbers"""
+        if device_nr.__class__ is bool:
+            return None
+        try:
+            return self.numbers.get(device_nr)
+        except TypeError:
+            return None
+
+    def by_id(self, device_id: str) -> List[Dict[str, Any]]:
+        """the devices of ``device_id``, ordered like ``devices(device_id)`` of index.ts"""
+        devices = self.ids.get(device_id)
+        if not devices:
+            return []
+        return sorted(devices.values(), key=_order)
+
+    def ordered(self) -> List[Dict[str, Any]]:
+        """clients ascending by ``device_nr``, followed by scripts descending by ``device_nr``"""
+        numbers = self.numbers
+        return [numbers[nr] for nr in self._clients] + [numbers[-nr] for nr in self._scripts]
+
+    # changes
+
+    def touch(self):
+        # strictly increasing, so every change is a new ``time_stamp``
+        self.time_stamp = max(time_stamp(), self.time_stamp + 1e-6)
+        self._pkg = None
+
+    def next_device_nr(self, is_client: bool) -> int:
+        return self._pools[is_client].take()
+
+    def add(self, socket_id: str, device_id: str, is_client: bool, is_silent: Optional[bool] = None) -> Dict[str, Any]:
+        """register the device of a socket (replacing its previous device) with the next free number"""
+        # like index.ts, the previous device of the socket still holds its number
+        device_nr = self.next_device_nr(is_client)
+        self.remove(socket_id)
+        device = {
+            'device_id': device_id,
+            'is_client': is_client,
+            'device_nr': device_nr,
+            'socket_id': socket_id,
+            'is_silent': is_silent,
+        }
+        self.sockets[socket_id] = device
+        self.ids.setdefault(device_id, {})[socket_id] = device
+        self._index(device)
+        self.touch()
+        return device
+
+    def remove(self, socket_id: str) -> Optional[Dict[str, Any]]:
+        device = self.sockets.pop(socket_id, None)
+        if device is None:
+            return None
+        devices = self.ids[device['device_id']]
+        del devices[socket_id]
+        if not devices:
+            del self.ids[device['device_id']]
+        self._unindex(device)
+        self._release(device['device_nr'])
+        self.touch()
+        return device
+
+    def reassign(self, device: Dict[str, Any], new_device_nr: float) -> Optional[Dict[str, Any]]:
+        """Give ``device`` the number ``new_device_nr`` like ``set_new_device_nr`` of index.ts,
+        the device holding that number gets the next free one and is returned."""
+        other = self.by_nr(new_device_nr)
+        self._unindex(device)
+        self._release(device['device_nr'])
+        if other is not None and other is not device:
+            self._unindex(other)
+        else:
+            other = None
+        device['device_nr'] = new_device_nr
+        self._index(device)
+        if other is not None:
+            other['device_nr'] = self.next_device_nr(other['is_client'])
+            self._index(other)
+        self.touch()
+        return other
+
+    def _release(self, device_nr: float):
+        # the pool of the number range, a reassigned client may hold a negative number
+        self._pools[device_nr >= 0].release(device_nr)
+
+    def _index(self, device: Dict[str, Any]):
+        nr = device['device_nr']
+        self.numbers[nr] = device
+        if device['is_client']:
+            bisect.insort(self._clients, nr)
+        else:
+            bisect.insort(self._scripts, -nr)
+
+    def _unindex(self, device: Dict[str, Any]):
+        nr = device['device_nr']
+        if self.numbers.get(nr) is device:
+            del self.numbers[nr]
+        numbers, key = (self._clients, nr) if device['is_client'] else (self._scripts, -nr)
+        idx = bisect.bisect_left(numbers, key)
+        if idx < len(numbers) and numbers[idx] == key:
+            del numbers[idx]
+
+    # packages
+
+    def devices_pkg(self) -> Dict[str, Any]:
+        """the ``DevicesPkg``, built once per change"""
+        if self._pkg is None:
+            self._pkg = {'time_stamp': self.time_stamp, 'devices': self.ordered()}
+        return self._pkg
+
+    def changed_pkg(self) -> Optional[Dict[str, Any]]:
+        """the ``DevicesPkg`` when its ``time_stamp`` changed since the last call, else ``None``"""
+        if self._sent == self.time_stamp:
+            return None
+        self._sent = self.time_stamp
+        return self.devices_pkg()
+
+
+def _order(device: Dict[str, Any]):
+    return (not device['is_client'], device['device_nr'] if device['is_client'] else -device['device_nr'])
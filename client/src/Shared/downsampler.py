@@ -0,0 +1,188 @@
+"""Downsampling of ``acceleration`` and ``gyro`` streams for consumers wanting a lower rate.
+
+Phones send their devicemotion samples at 60-100 Hz, many consumers only want
+10 Hz. :class:`Downsampler` collects the samples of every device into windows
+of ``1 / rate`` seconds (by their ``time_stamp``) and emits one synthetic
+message per window, a wire dict of the ``AccMsg`` / ``GyroMsg`` shape::
+
+    downsampler = Downsampler({DataType.ACCELERATION: 10, DataType.GYRO: 10}, aggregation=MEAN)
+    for msg in stream:
+        for aggregate in downsampler.push(msg):
+            process(aggregate)
+
+    # per subscriber of an ``AsyncSocketClient``
+    async for msg in client.stream(DataType.ACCELERATION, downsampler=Downsampler({DataType.ACCELERATION: 10})):
+        print(msg.x)
+
+The values of a window are aggregated with ``LAST`` (the last sample),
+``MEAN`` or ``MAX_MAGNITUDE`` (the sample with the largest norm). An aggregate
+carries the ``device_id``, ``device_nr`` and ``time_stamp`` of the last sample
+of its window, the ``interval`` of acceleration aggregates is the window
+length in ms. Messages of other types pass unchanged.
+
+The ``interval`` of the acceleration samples is used as a hint of when the
+next acceleration sample of a device arrives: a window is emitted as soon as the next
+sample would fall into the next window instead of when that sample arrives.
+"""
+from operator import itemgetter
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+import api_codec
+from api_types import AccMsg, DataType, GyroMsg
+
+LAST = 'last'
+MEAN = 'mean'
+MAX_MAGNITUDE = 'max_magnitude'
+AGGREGATIONS = (LAST, MEAN, MAX_MAGNITUDE)
+
+# the aggregated fields of each sensor type
+SENSOR_FIELDS = {
+    DataType.ACCELERATION.value: ('x', 'y', 'z'),
+    DataType.GYRO.value: ('alpha', 'beta', 'gamma'),
+}
+# windows of at least this many samples are aggregated with numpy, smaller ones in python
+NUMPY_MIN = 32
+
+Message = Union[dict, AccMsg, GyroMsg]
+Values = Tuple[float, float, float]
+
+
+def _square(values: Values) -> float:
+    return values[0] * values[0] + values[1] * values[1] + values[2] * values[2]
+
+
+def aggregate(values: List[Values], aggregation: str) -> List[float]:
+    """the aggregate of the ``(x, y, z)`` samples of a window"""
+    if aggregation == LAST:
+        return list(values[-1])
+    if len(values) >= NUMPY_MIN:
+        rows = np.array(values, dtype=np.float64)
+        if aggregation == MEAN:
+            return (np.add.reduce(rows, 0) / len(rows)).tolist()
+        return rows[np.argmax(np.einsum('ij,ij->i', rows, rows))].tolist()
+    if aggregation == MEAN:
+        count = len(values)
+        return [sum(column) / count for column in zip(*values)]
+    return list(max(values, key=_square))
+
+
+class _Window:
+    """The samples of one device and sensor type since the window started."""
+
+    def __init__(self):
+        self.values: List[Values] = []
+        self.start = 0.0
+        self.emitted = False
+        # the last message and its time stamp
+        self.last: Optional[dict] = None
+        self.last_ts = 0.0
+        # the sample interval in seconds the device announced last
+        self.interval: Optional[float] = None
+
+
+class _Sensor:
+    """The configuration and the windows of one sensor type."""
+
+    def __init__(self, data_type: str, rate: float, aggregation: str):
+        self.type = data_type
+        self.period = 1.0 / rate
+        self.aggregation = aggregation
+        self.fields = SENSOR_FIELDS[data_type]
+        self.values = itemgetter(*self.fields)
+        self.windows: Dict[Hashable, _Window] = {}
+
+
+class Downsampler:
+    def __init__(
+        self,
+        rates: Dict[Union[DataType, str], float],
+        aggregation: Union[str, Dict[Union[DataType, str], str]] = MEAN,
+        key: str = 'device_id',
+    ):
+        """
+        :param rates: the aggregates per second and device of each sensor type
+        :param aggregation: ``LAST``, ``MEAN`` or ``MAX_MAGNITUDE``, for all or per sensor type
+        :param key: the windows are kept per ``device_id`` or ``device_nr``
+        """
+        if key not in ('device_id', 'device_nr'):
+            raise ValueError(f"key must be 'device_id' or 'device_nr', got '{key}'")
+        self.key = key
+        if aggregation.__class__ is not str:
+            aggregation = {getattr(data_type, 'value', data_type): agg for data_type, agg in aggregation.items()}
+        self.sensors: Dict[str, _Sensor] = {}
+        for data_type, rate in rates.items():
+            data_type = getattr(data_type, 'value', data_type)
+            agg = aggregation if aggregation.__class__ is str else aggregation.get(data_type, MEAN)
+            if data_type not in SENSOR_FIELDS:
+                raise ValueError(f"can not downsample '{data_type}'")
+            if agg not in AGGREGATIONS:
+                raise ValueError(f"unknown aggregation '{agg}'")
+            self.sensors[data_type] = _Sensor(data_type, rate, agg)
+        self.received = 0
+        self.emitted = 0
+
+    def push(self, msg: Message) -> List[dict]:
+        """Add one message, returns the aggregates of the windows it completes
+        (or the message itself when its type is not downsampled)."""
+        if msg.__class__ is not dict:
+            msg = api_codec.to_dict(msg)
+        sensor = self.sensors.get(msg.get('type'))
+        if sensor is None:
+            return [msg]
+        self.received += 1
+        device = msg.get(self.key)
+        window = sensor.windows.get(device)
+        if window is None:
+            window = sensor.windows[device] = _Window()
+        interval = msg.get('interval')
+        if interval:
+            window.interval = interval / 1000
+        ts = msg['time_stamp']
+        period = sensor.period
+        out = []
+        if window.values and ts >= window.start + period:
+            out.append(self._emit(sensor, window))
+        if not window.values:
+            # consecutive windows follow each other without drift, a gap starts a new grid
+            follows = window.start + period
+            window.start = follows if window.emitted and ts < follows + period else ts
+        window.values.append(sensor.values(msg))
+        step = window.interval
+        if step is not None and window.last is not None and ts - window.last_ts < step:
+            # a jittery or wrong hint never delays an aggregate past the observed rate
+            step = max(ts - window.last_ts, 0)
+        window.last = msg
+        window.last_ts = ts
+        if step and ts + step >= window.start + period:
+            out.append(self._emit(sensor, window))
+        return out
+
+    def push_many(self, messages: Iterable[Message]) -> List[dict]:
+        out = []
+        for msg in messages:
+            out.extend(self.push(msg))
+        return out
+
+    def _emit(self, sensor: _Sensor, window: _Window) -> dict:
+        values = aggregate(window.values, sensor.aggregation)
+        fields = sensor.fields
+        msg = {**window.last, fields[0]: values[0], fields[1]: values[1], fields[2]: values[2]}
+        if sensor.type == DataType.ACCELERATION.value:
+            msg['interval'] = sensor.period * 1000
+        window.values = []
+        window.emitted = True
+        window.last = None
+        self.emitted += 1
+        return msg
+
+    def flush(self, time_stamp: Optional[float] = None) -> List[dict]:
+        """the aggregates of the windows ended before ``time_stamp`` (of all windows when ``None``),
+        e.g. of devices that stopped sending"""
+        out = []
+        for sensor in self.sensors.values():
+            for window in sensor.windows.values():
+                if window.values and (time_stamp is None or window.start + sensor.period <= time_stamp):
+                    out.append(self._emit(sensor, window))
+        return out
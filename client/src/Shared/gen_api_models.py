@@ -0,0 +1,440 @@
+"""Generates ``api_models.py`` from ``SharedTypings.ts`` (``yarn to-py-models``).
+
+``api_types.py`` is generated by quicktype and lags behind the typings. This
+generator reads the message types of the ``ClientDataMsg`` union (and the
+pointer messages) with everything they reference and writes
+
+- a dataclass for every type ``api_types`` does not have, fields ordered like
+  quicktype does (required fields first, both alphabetically)
+- a subclass of the ``api_types`` class for every type which gained fields
+  (e.g. ``deliver_to``) or references a generated class, the added fields are
+  optional
+- ``MESSAGE_CLASSES`` and ``POINTER_CLASSES``, the class of every ``type``
+  (and pointer ``context``) discriminator
+
+Only the subset of TypeScript used by the typings is understood::
+
+    python3 gen_api_models.py [SharedTypings.ts] [api_models.py]
+"""
+import dataclasses
+import keyword
+import os
+import re
+import sys
+import typing
+from enum import Enum
+from typing import Dict, List, Optional, Set, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+import api_types  # noqa: E402
+
+PRIMITIVES = {
+    'number': 'float',
+    'string': 'str',
+    'boolean': 'bool',
+    'ArrayBuffer': 'bytes',
+    'Date': 'str',
+    'any': 'Any',
+}
+NULLS = ('undefined', 'null')
+# typings whose python class has another name
+RENAMES = {'ClientsData': 'DataStore'}
+# the discriminated unions of the messages
+UNION = 'ClientDataMsg'
+POINTER_BASE = 'PointerDataMsg'
+
+HEADER = '''\
+# Generated from SharedTypings.ts by gen_api_models.py (yarn to-py-models), do not edit.
+#
+# The message types api_types.py does not know yet. Subclasses of api_types
+# classes add the fields the typings gained since api_types.py was generated.
+'''
+
+_COMMENTS = re.compile(r'/\*.*?\*/|//[^\n]*', re.DOTALL)
+_DECLARATION = re.compile(r'(?:export\s+)?(enum|interface|type)\s+(\w+)\s*(?:extends\s+([\w\s,]+?))?\s*(=|\{)')
+_FIELD = re.compile(r'^\s*(\w+)(\?)?\s*:\s*(.+)$', re.DOTALL)
+_ENUM_MEMBER = re.compile(r'^\s*(\w+)\s*=\s*[\'"](.*)[\'"]\s*$')
+
+# parsed types: ('prim', name), ('list', type), ('member', enum, member), ('lit', value),
+# ('ref', name), ('obj', fields), ('union', types), ('null',)
+Type = tuple
+Field = Tuple[str, Type, bool]
+
+
+def split_top(text: str, sep: str) -> List[str]:
+    """split ``text`` at ``sep`` outside of brackets and strings"""
+    parts = []
+    depth = 0
+    quote = None
+    start = 0
+    for idx, c in enumerate(text):
+        if quote:
+            if c == quote:
+                quote = None
+        elif c in '\'"':
+            quote = c
+        elif c in '([{<':
+            depth += 1
+        elif c in ')]}>':
+            depth -= 1
+        elif c == sep and depth == 0:
+            parts.append(text[start:idx])
+            start = idx + 1
+    parts.append(text[start:])
+    return parts
+
+
+def matching(text: str, start: int) -> int:
+    """the position after the bracket closing the one at ``start``"""
+    depth = 0
+    for idx in range(start, len(text)):
+        if text[idx] in '([{':
+            depth += 1
+        elif text[idx] in ')]}':
+            depth -= 1
+            if depth == 0:
+                return idx + 1
+    raise ValueError(f'unbalanced brackets at {start}')
+
+
+def parse_type(text: str) -> Type:
+    text = text.strip()
+    parts = [part for part in split_top(text, '|') if part.strip()]
+    if len(parts) > 1:
+        return ('union', tuple(parse_type(part) for part in parts))
+    text = parts[0].strip()
+    if text.endswith('[]'):
+        return ('list', parse_type(text[:-2]))
+    if text.startswith('(') and matching(text, 0) == len(text):
+        return parse_type(text[1:-1])
+    if text.startswith('['):
+        # tuples are lists of the union of their (labeled) elements
+        items = [split_top(item, ':')[-1] for item in split_top(text[1:-1], ',') if item.strip()]
+        elements = [parse_type(item) for item in items]
+        unique = list(dict.fromkeys(elements))
+        return ('list', unique[0] if len(unique) == 1 else ('union', tuple(unique)))
+    if text.startswith('{'):
+        return ('obj', tuple(parse_fields(text[1:-1])))
+    if text[0] in '\'"':
+        return ('lit', text[1:-1])
+    if text in NULLS:
+        return ('null',)
+    if text in PRIMITIVES:
+        return ('prim', PRIMITIVES[text])
+    if '.' in text:
+        enum, member = text.split('.')
+        return ('member', enum, member)
+    return ('ref', text)
+
+
+def parse_fields(body: str) -> List[Field]:
+    fields = []
+    for chunk in split_top(body, ';'):
+        for item in split_top(chunk, ',') if chunk.strip().startswith('{') else [chunk]:
+            match = _FIELD.match(item.strip())
+            if match is None:
+                continue  # index signatures and empty chunks
+            name, optional, tp = match.groups()
+            fields.append((name, parse_type(tp), bool(optional)))
+    return fields
+
+
+class Typings:
+    """the enums, interfaces and type aliases of a typings file"""
+
+    def __init__(self, source: str):
+        source = _COMMENTS.sub('', source)
+        self.enums: Dict[str, List[Tuple[str, str]]] = {}
+        self.interfaces: Dict[str, Tuple[List[str], List[Field]]] = {}
+        self.aliases: Dict[str, Type] = {}
+        pos = 0
+        while True:
+            match = _DECLARATION.search(source, pos)
+            if match is None:
+                break
+            kind, name, bases, opening = match.groups()
+            if opening == '{':
+                end = matching(source, match.end() - 1)
+                body = source[match.end() : end - 1]
+                if kind == 'enum':
+                    members = [_ENUM_MEMBER.match(item) for item in body.split(',')]
+                    self.enums[name] = [m.groups() for m in members if m]
+                else:
+                    bases = [base.strip() for base in (bases or '').split(',') if base.strip()]
+                    self.interfaces[name] = (bases, parse_fields(body))
+            else:
+                end = match.end()
+                depth = 0
+                while end < len(source) and not (source[end] == ';' and depth == 0):
+                    depth += source[end] in '([{'
+                    depth -= source[end] in ')]}'
+                    end += 1
+                text = source[match.end() : end].strip()
+                if not text.startswith('{'):  # mapped types
+                    self.aliases[name] = parse_type(text)
+            pos = end
+
+    def fields(self, name: str) -> Dict[str, Tuple[Type, bool]]:
+        """the fields of an interface including the inherited ones, later declarations win"""
+        bases, own = self.interfaces[name]
+        fields: Dict[str, Tuple[Type, bool]] = {}
+        for base in bases:
+            fields.update(self.fields(base))
+        for field, tp, optional in own:
+            fields[field] = (tp, optional)
+        return fields
+
+    def member_value(self, enum: str, member: str) -> str:
+        return dict(self.enums[enum])[member]
+
+
+def _enum_member_name(value: str) -> str:
+    name = re.sub(r'\W', '_', re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '_', value)).upper()
+    if not name or name[0].isdigit() or keyword.iskeyword(name):
+        name = f'_{name}'
+    return name
+
+
+def _camel(name: str) -> str:
+    return ''.join(part[:1].upper() + part[1:] for part in name.split('_'))
+
+
+def _singular(name: str) -> str:
+    return name[:-1] if name.endswith('s') and not name.endswith('ss') else name
+
+
+@dataclasses.dataclass
+class Model:
+    name: str
+    # (name, annotation, optional) of the declared fields
+    fields: List[Tuple[str, str, bool]]
+    # the extended ``api_types`` class
+    base: Optional[str] = None
+
+
+class Generator:
+    def __init__(self, typings: Typings):
+        self.typings = typings
+        api_types.load_all()
+        self.api_classes = {
+            name: obj
+            for name, obj in vars(api_types).items()
+            if isinstance(obj, type) and obj.__module__ == api_types.__name__ and dataclasses.is_dataclass(obj)
+        }
+        self.api_enums = {
+            name: obj
+            for name, obj in vars(api_types).items()
+            if isinstance(obj, type) and obj.__module__ == api_types.__name__ and issubclass(obj, Enum)
+        }
+        # generated enums (name -> values) and classes in dependency order
+        self.enums: Dict[str, List[str]] = {}
+        self.models: Dict[str, Optional[Model]] = {}
+        # names taken from api_types
+        self.imports: Set[str] = set()
+        self.typing_names: Set[str] = set()
+
+    # types
+
+    def enum(self, name: str, values: List[str]) -> str:
+        """the enum ``name`` with ``values``, an equal ``api_types`` enum is reused"""
+        existing = self.api_enums.get(name)
+        if existing is not None and [m.value for m in existing] == values:
+            self.imports.add(name)
+            return name
+        if name in self.enums and self.enums[name] != values:
+            raise ValueError(f'conflicting enum {name}')
+        self.enums[name] = values
+        return name
+
+    def literals(self, parts: List[Type], owner: str, field: str) -> str:
+        """the enum of a union of string literals and enum members"""
+        enums = {part[1] for part in parts if part[0] == 'member'}
+        values = [self.typings.member_value(p[1], p[2]) if p[0] == 'member' else p[1] for p in parts]
+        if len(enums) == 1 and all(part[0] == 'member' for part in parts):
+            (enum,) = enums
+            # subsets of the ``DataType`` discriminators get an enum per class like quicktype does
+            if enum != 'DataType':
+                return self.ts_enum(enum)
+        return self.enum(owner + _camel(field), list(dict.fromkeys(values)))
+
+    def ts_enum(self, name: str) -> str:
+        return self.enum(name, [value for _, value in self.typings.enums[name]])
+
+    def annotation(self, tp: Type, owner: str, field: str) -> Tuple[str, bool]:
+        """the python annotation of ``tp`` and whether it may be null"""
+        kind = tp[0]
+        if kind == 'prim':
+            if tp[1] == 'Any':
+                self.typing_names.add('Any')
+            return tp[1], False
+        if kind == 'null':
+            return 'None', True
+        if kind == 'list':
+            item, _ = self.annotation(tp[1], owner, _singular(field))
+            self.typing_names.add('List')
+            return f'List[{item}]', False
+        if kind in ('lit', 'member'):
+            return self.literals([tp], owner, field), False
+        if kind == 'obj':
+            name = owner + _camel(_singular(field))
+            return self.model(name, {f: (t, o) for f, t, o in tp[1]}), False
+        if kind == 'ref':
+            return self.reference(tp[1], owner, field), False
+        # unions
+        parts = []
+        for part in tp[1]:
+            parts.extend(part[1] if part[0] == 'union' else [part])
+        nullable = any(part[0] == 'null' for part in parts)
+        literals = [part for part in parts if part[0] in ('lit', 'member')]
+        rendered = [self.literals(literals, owner, field)] if literals else []
+        for part in parts:
+            if part[0] not in ('null', 'lit', 'member'):
+                text, null = self.annotation(part, owner, field)
+                nullable = nullable or null
+                if text not in rendered:
+                    rendered.append(text)
+        if len(rendered) == 1:
+            return rendered[0], nullable
+        self.typing_names.add('Union')
+        return f'Union[{", ".join(rendered)}]', nullable
+
+    def reference(self, name: str, owner: str, field: str) -> str:
+        typings = self.typings
+        if name in RENAMES:
+            self.imports.add(RENAMES[name])
+            return RENAMES[name]
+        if name in typings.enums:
+            return self.ts_enum(name)
+        if name in typings.interfaces:
+            return self.model(name, typings.fields(name))
+        alias = typings.aliases[name]
+        members = alias[1] if alias[0] == 'union' else []
+        if members and all(m[0] == 'ref' and m[1] in typings.interfaces for m in members):
+            return self.model(name, self.merged([typings.fields(m[1]) for m in members]))
+        return self.annotation(alias, owner, field)[0]
+
+    def merged(self, variants: List[Dict[str, Tuple[Type, bool]]]) -> Dict[str, Tuple[Type, bool]]:
+        """the fields of a union of interfaces, fields not in every variant are optional"""
+        fields: Dict[str, Tuple[Type, bool]] = {}
+        for variant in variants:
+            for name, (tp, optional) in variant.items():
+                if name in fields:
+                    prev, prev_optional = fields[name]
+                    if prev != tp:
+                        tp = ('union', (prev, tp))
+                    optional = optional or prev_optional
+                fields[name] = (tp, optional)
+        for name in fields:
+            if not all(name in variant for variant in variants):
+                fields[name] = (fields[name][0], True)
+        return fields
+
+    # classes
+
+    def model(self, name: str, fields: Dict[str, Tuple[Type, bool]]) -> str:
+        """the class of an interface, generated unless the ``api_types`` class is complete"""
+        if name in self.models:
+            if self.models[name] is None:
+                raise ValueError(f'recursive type {name}')
+            return name
+        self.models[name] = None
+        rendered = {field: (*self.annotation(tp, name, field), optional) for field, (tp, optional) in fields.items()}
+        base = self.api_classes.get(name)
+        if base is None:
+            required = sorted(f for f, (_, null, optional) in rendered.items() if not (null or optional))
+            rest = sorted(f for f in rendered if f not in required)
+            declared = [(f, rendered[f][0], f in rest) for f in required + rest]
+            # after the classes it references
+            del self.models[name]
+            self.models[name] = Model(name, declared)
+            return name
+        inherited = {f.name: f for f in dataclasses.fields(base)}
+        generated = [model for model, m in self.models.items() if m is not None]
+        redeclared = []
+        added = []
+        for field, (text, null, optional) in sorted(rendered.items()):
+            if field not in inherited:
+                added.append((field, text, True))
+            elif any(re.search(rf'\b{model}\b', text) for model in generated):
+                # references a generated class
+                redeclared.append((field, text, inherited[field].default is None))
+        del self.models[name]
+        if not (redeclared or added):
+            self.imports.add(name)
+            return name
+        self.models[name] = Model(name, redeclared + added, base=name)
+        return name
+
+    def discriminators(self, name: str) -> Dict[str, Type]:
+        return {field: tp for field, (tp, _) in self.typings.fields(name).items() if field in ('type', 'context')}
+
+    def value(self, tp: Type) -> str:
+        return self.typings.member_value(tp[1], tp[2]) if tp[0] == 'member' else tp[1]
+
+    def generate(self) -> str:
+        typings = self.typings
+        messages: Dict[str, str] = {}
+        pointers: Dict[str, str] = {}
+        for member in typings.aliases[UNION][1]:
+            name = member[1]
+            if name == POINTER_BASE:
+                continue
+            cls = self.model(name, typings.fields(name))
+            messages[self.value(self.discriminators(name)['type'])] = cls
+        for name, (bases, _) in typings.interfaces.items():
+            if POINTER_BASE in bases:
+                cls = self.model(name, typings.fields(name))
+                pointers[self.value(self.discriminators(name)['context'])] = cls
+        return self.render(messages, pointers)
+
+    def render(self, messages: Dict[str, str], pointers: Dict[str, str]) -> str:
+        models = list(self.models.values())
+        # the enums and names of the fields not declared again are left out
+        used = ' '.join([text for m in models for _, text, _ in m.fields] + list(messages.values()) + list(pointers.values()))
+
+        def is_used(name: str) -> bool:
+            return re.search(rf'\b{name}\b', used) is not None
+
+        typing_names = {'Dict'} | ({'Optional'} if any(o for m in models for _, _, o in m.fields) else set())
+        typing_names |= {name for name in self.typing_names if is_used(name)}
+        lines = [HEADER, 'from dataclasses import dataclass', 'from enum import Enum', f'from typing import {", ".join(sorted(typing_names))}', '']
+        lines.append('import api_types')
+        generated = {m.name for m in models} | set(self.enums)
+        imports = sorted(name for name in self.imports if name not in generated and is_used(name))
+        if imports:
+            lines.append('from api_types import ' + ', '.join(imports))
+        for name, values in self.enums.items():
+            if not is_used(name):
+                continue
+            lines += ['', '', f'class {name}(Enum):']
+            lines += [f'    {_enum_member_name(value)} = "{value}"' for value in values]
+        for model in models:
+            base = f'(api_types.{model.base})' if model.base else ''
+            lines += ['', '', '@dataclass', f'class {model.name}{base}:']
+            for field, text, optional in model.fields:
+                if optional:
+                    lines.append(f'    {field}: {text if text.startswith("Optional[") else f"Optional[{text}]"} = None')
+                else:
+                    lines.append(f'    {field}: {text}')
+        lines += ['', '', '# the message class of every ``type`` discriminator, ``pointer`` messages by their ``context``']
+        lines.append('MESSAGE_CLASSES: Dict[str, type] = {')
+        lines += [f'    {value!r}: {cls},' for value, cls in sorted(messages.items())]
+        lines.append('}')
+        lines.append('POINTER_CLASSES: Dict[str, type] = {')
+        lines += [f'    {value!r}: {cls},' for value, cls in sorted(pointers.items())]
+        lines.append('}')
+        return '\n'.join(lines) + '\n'
+
+
+def main(source: str = os.path.join(HERE, 'SharedTypings.ts'), target: str = os.path.join(HERE, 'api_models.py')):
+    with open(source) as f:
+        typings = Typings(f.read())
+    code = Generator(typings).generate()
+    with open(target, 'w') as f:
+        f.write(code)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,140 @@
+"""Turns the quicktype output into the lazy ``api_types`` package (``yarn to-py``).
+
+Building ~120 dataclasses and enums is most of the cost of importing the
+types, while a script typically uses a handful of them. Every definition of
+the quicktype module becomes a function building it, ``api_types.__getattr__``
+calls it (after the builders of the definitions it references) on first
+access. Definitions referenced by string annotations (``'ClientDataMsg'``) are
+built right after, so ``typing.get_type_hints`` resolves them::
+
+    python3 gen_api_types.py .api_types.py [api_types/__init__.py]
+
+``from api_types import KeyMsg`` builds ``KeyMsg``, ``KeyMsgType`` and ``Key``,
+``api_types.load_all()`` everything.
+"""
+import ast
+import os
+import sys
+import textwrap
+from typing import Dict, List
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+HEADER = '''\
+# Generated from the quicktype output by gen_api_types.py (yarn to-py), do not edit.
+"""The dataclasses and enums of SharedTypings.ts, each built on first access.
+
+``from api_types import KeyMsg`` only builds ``KeyMsg`` and the definitions it
+references, :func:`load_all` builds all of them.
+"""
+import threading
+'''
+
+LOADER = '''
+__all__ = [
+{names}
+]
+
+# the definitions referenced by each definition
+_DEPENDENCIES = {{
+{dependencies}
+}}
+# the definitions referenced by the string annotations of each definition
+_REFERENCES = {{
+{references}
+}}
+
+_lock = threading.RLock()
+
+
+def __getattr__(name: str):
+    if name not in _DEPENDENCIES:
+        raise AttributeError(f'module {{__name__!r}} has no attribute {{name!r}}')
+    with _lock:
+        built = globals().get(name)
+        if built is None:
+            for dependency in _DEPENDENCIES[name]:
+                if dependency not in globals():
+                    __getattr__(dependency)
+            built = globals()[f'_build_{{name}}']()
+            built.__qualname__ = name
+            globals()[name] = built
+            for reference in _REFERENCES[name]:
+                if reference not in globals():
+                    __getattr__(reference)
+    return built
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def load_all():
+    """build every definition"""
+    for name in __all__:
+        if name not in globals():
+            __getattr__(name)
+'''
+
+
+def dependencies(node: ast.ClassDef, defined: List[str]) -> List[str]:
+    """the earlier definitions a class references"""
+    names = {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+    return [name for name in defined if name in names and name != node.name]
+
+
+def references(node: ast.ClassDef, defined: List[str]) -> List[str]:
+    """the definitions the string annotations of a class reference, e.g. ``Optional[List['ClientDataMsg']]``"""
+    names = set()
+    for ann in ast.walk(node):
+        if not isinstance(ann, ast.AnnAssign):
+            continue
+        for n in ast.walk(ann.annotation):
+            if isinstance(n, ast.Constant) and isinstance(n.value, str):
+                names.update(m.id for m in ast.walk(ast.parse(n.value, mode='eval')) if isinstance(m, ast.Name))
+    return [name for name in defined if name in names and name != node.name]
+
+
+def generate(source: str) -> str:
+    tree = ast.parse(source)
+    lines = source.splitlines()
+    imports: List[str] = []
+    builders: List[str] = []
+    defined: List[str] = []
+    deps: Dict[str, List[str]] = {}
+    classes: List[ast.ClassDef] = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            imports.append(ast.get_source_segment(source, node))
+            continue
+        if not isinstance(node, ast.ClassDef):
+            raise ValueError(f'unexpected statement at line {node.lineno}')
+        first = min([node.lineno] + [d.lineno for d in node.decorator_list])
+        body = '\n'.join(lines[first - 1 : node.end_lineno])
+        builders.append(f'def _build_{node.name}():\n{textwrap.indent(body, "    ")}\n    return {node.name}')
+        deps[node.name] = dependencies(node, defined)
+        defined.append(node.name)
+        classes.append(node)
+    refs = {node.name: references(node, defined) for node in classes}
+    if 'from typing import' not in '\n'.join(imports):
+        imports.append('from typing import List')
+    elif not any('List' in line for line in imports if line.startswith('from typing')):
+        imports = [line + ', List' if line.startswith('from typing') else line for line in imports]
+    loader = LOADER.format(
+        names='\n'.join(f"    '{name}'," for name in defined),
+        dependencies='\n'.join(f'    {name!r}: {tuple(deps[name])!r},' for name in defined),
+        references='\n'.join(f'    {name!r}: {tuple(refs[name])!r},' for name in defined),
+    )
+    return HEADER + '\n'.join(imports) + '\n' + loader + '\n\n' + '\n\n\n'.join(builders) + '\n'
+
+
+def main(source: str, target: str = os.path.join(HERE, 'api_types', '__init__.py')):
+    with open(source) as f:
+        code = generate(f.read())
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(target, 'w') as f:
+        f.write(code)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
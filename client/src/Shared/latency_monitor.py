@@ -0,0 +1,310 @@
+"""Latency of the messages seen by a Python client, per hop, ``DataType`` and ``device_nr``.
+
+Every message carries the ``time_stamp`` of its sender, responses to prompts
+and alerts and the grid and color pointers also carry ``displayed_at`` of
+the device that showed the prompt, grid or color. The hops are
+
+- ``send``: ``time_stamp`` of the sender to the receive by the observer
+  (through the server, which does not stamp messages itself)
+- ``display``: ``time_stamp`` of a prompt or alert (the response carries it)
+  to ``displayed_at`` on the responding device
+- ``response``: ``displayed_at`` to the receive of the response, for pointers
+  ``displayed_at`` to the ``time_stamp`` of the pointer input
+- ``round_trip``: ``time_stamp`` of a prompt or alert to the receive of its
+  response, on the clock of the observer
+
+Times of different devices are compared on the server clock, the offset of
+every device is estimated from the 1 Hz ``timer`` event of the server::
+
+    monitor = LatencyMonitor()
+    monitor.attach(client)  # an ``AsyncSocketClient``
+    ...
+    monitor.lagging('send', top=5)  # the devices with the highest p99
+    monitor.write_prometheus('/var/lib/node_exporter/sockets.prom')
+
+The latencies are counted in fixed size histograms with log linear buckets
+(about 3% relative error) like HdrHistogram, see :class:`Histogram`.
+"""
+import math
+import os
+import time
+from array import array
+from collections import deque
+from typing import Any, Deque, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from api_types import DataType, SocketEvents
+
+HOPS = ('send', 'display', 'response', 'round_trip')
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+# timer events an offset estimate is taken from
+OFFSET_WINDOW = 30
+METRIC_PREFIX = 'sockets'
+
+# not (yet) part of api_types.SocketEvents
+TIMER = 'timer'
+
+# histograms count microseconds, ``HALF`` buckets per power of two above ``SUB_BUCKETS``
+UNIT = 1e-6
+SUB_BITS = 6
+SUB_BUCKETS = 1 << SUB_BITS
+HALF = SUB_BUCKETS // 2
+MAX_BITS = 27  # about 134 s
+MAX_VALUE = (1 << MAX_BITS) - 1
+BUCKETS = SUB_BUCKETS + (MAX_BITS - SUB_BITS) * HALF
+
+RESPONSES = frozenset([DataType.INPUT_RESPONSE.value, DataType.ALERT_CONFIRM.value])
+POINTER = DataType.POINTER.value
+
+
+def time_stamp() -> float:
+    return time.time()
+
+
+def _bucket_bounds() -> np.ndarray:
+    """the lowest value of every bucket and the end of the last one"""
+    lows = list(range(SUB_BUCKETS))
+    for idx in range(SUB_BUCKETS, BUCKETS):
+        e, m = divmod(idx - SUB_BUCKETS, HALF)
+        lows.append((m + HALF) << (e + 1))
+    lows.append(MAX_VALUE + 1)
+    return np.array(lows, dtype=np.float64)
+
+
+_BOUNDS = _bucket_bounds()
+# the value reported for a bucket
+_MIDS = (_BOUNDS[:-1] + _BOUNDS[1:] - 1) / 2 * UNIT
+
+
+class Histogram:
+    """Counts of latencies (seconds) in ``BUCKETS`` log linear buckets."""
+
+    __slots__ = ('counts', 'count', 'sum', 'max', 'negative', 'overflow')
+
+    def __init__(self):
+        self.counts = array('q', bytes(8 * BUCKETS))
+        self.count = 0
+        self.sum = 0.0
+        self.max = -math.inf
+        # values below 0 (clock offsets) and above ``MAX_VALUE``, counted in the first and last bucket
+        self.negative = 0
+        self.overflow = 0
+
+    def record(self, value: float):
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+        if value < 0:
+            self.negative += 1
+            self.counts[0] += 1
+            return
+        v = int(value * 1e6)
+        if v < SUB_BUCKETS:
+            self.counts[v] += 1
+            return
+        if v > MAX_VALUE:
+            self.overflow += 1
+            v = MAX_VALUE
+        e = v.bit_length() - SUB_BITS
+        self.counts[SUB_BUCKETS + (e - 1) * HALF + (v >> e) - HALF] += 1
+
+    def record_many(self, values: Iterable[float]):
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return
+        self.count += len(values)
+        self.sum += float(values.sum())
+        self.max = max(self.max, float(values.max()))
+        v = (values * 1e6).astype(np.int64)
+        self.negative += int((values < 0).sum())
+        self.overflow += int((v > MAX_VALUE).sum())
+        v = np.clip(v, 0, MAX_VALUE)
+        e = np.maximum(np.frexp(v.astype(np.float64))[1] - SUB_BITS, 1)
+        idx = np.where(v < SUB_BUCKETS, v, SUB_BUCKETS + (e - 1) * HALF + (v >> e) - HALF)
+        counts = np.frombuffer(self.counts, dtype=np.int64)
+        counts += np.bincount(idx, minlength=BUCKETS)
+
+    def merge(self, other: 'Histogram'):
+        counts = np.frombuffer(self.counts, dtype=np.int64)
+        counts += np.frombuffer(other.counts, dtype=np.int64)
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+        self.negative += other.negative
+        self.overflow += other.overflow
+
+    def quantiles(self, quantiles: Iterable[float] = QUANTILES) -> List[float]:
+        """the values at ``quantiles`` (midpoints of their buckets), ``NaN`` when empty"""
+        quantiles = list(quantiles)
+        if not self.count:
+            return [math.nan] * len(quantiles)
+        cumulative = np.cumsum(np.frombuffer(self.counts, dtype=np.int64))
+        ranks = np.ceil(np.array(quantiles) * self.count).clip(1, self.count)
+        return _MIDS[np.searchsorted(cumulative, ranks)].tolist()
+
+    def quantile(self, q: float) -> float:
+        return self.quantiles((q,))[0]
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else math.nan
+
+
+class ClockOffsets:
+    """Offset of the clock of every device to the server clock (``local - server``).
+
+    The minimum over the last ``window`` timer events is taken, it is the offset
+    plus the smallest delay of the timer event.
+    """
+
+    def __init__(self, window: int = OFFSET_WINDOW):
+        self.window = window
+        self.samples: Dict[Hashable, Deque[float]] = {}
+        self.offsets: Dict[Hashable, float] = {}
+
+    def observe(self, device_nr: Hashable, server_time: float, local_time: float):
+        samples = self.samples.get(device_nr)
+        if samples is None:
+            samples = self.samples[device_nr] = deque(maxlen=self.window)
+        sample = local_time - server_time
+        offset = self.offsets.get(device_nr)
+        dropped = samples[0] if len(samples) == samples.maxlen else None
+        samples.append(sample)
+        if offset is None or sample <= offset:
+            self.offsets[device_nr] = sample
+        elif dropped is not None and dropped <= offset:
+            # the minimum left the window
+            self.offsets[device_nr] = min(samples)
+
+    def get(self, device_nr: Hashable) -> float:
+        """the offset of ``device_nr``, 0 (synchronized clocks) when unknown"""
+        return self.offsets.get(device_nr, 0.0)
+
+
+class LatencyMonitor:
+    def __init__(self, window: int = OFFSET_WINDOW):
+        """
+        :param window: timer events a clock offset is estimated from
+        """
+        self.offsets = ClockOffsets(window)
+        # by (hop, data type) and by (hop, device_nr)
+        self.by_type: Dict[Tuple[str, str], Histogram] = {}
+        self.by_device: Dict[Tuple[str, Any], Histogram] = {}
+
+    # input
+
+    def attach(self, client) -> 'LatencyMonitor':
+        """observe the ``new_data`` and ``timer`` events of an ``AsyncSocketClient``"""
+        client.on(TIMER, lambda data: self.observe_timer(client.device_nr, data))
+        client.on(SocketEvents.NEW_DATA, lambda data: self.observe(data, observer=client.device_nr))
+        return self
+
+    def observe_timer(self, device_nr: Any, data: dict, received_at: Optional[float] = None):
+        """a ``timer`` event (``{'time': server time}``) received by ``device_nr``"""
+        if device_nr is None or data.get('time') is None:
+            return
+        self.offsets.observe(device_nr, data['time'], time_stamp() if received_at is None else received_at)
+
+    def observe(self, msg: dict, received_at: Optional[float] = None, observer: Any = None):
+        """Record the hops of a received wire message, ``observer`` is the ``device_nr`` of the receiver."""
+        ts = msg.get('time_stamp')
+        if ts is None:
+            return
+        if received_at is None:
+            received_at = time_stamp()
+        msg_type = msg.get('type')
+        if msg_type is None:
+            return
+        device_nr = msg.get('device_nr')
+        offsets = self.offsets
+        local = received_at - offsets.get(observer)
+        if msg_type in RESPONSES:
+            # the time stamp of the prompt or alert, sent by the observer
+            sent = ts - offsets.get(observer)
+            displayed_at = msg.get('displayed_at')
+            if displayed_at is not None:
+                displayed = displayed_at - offsets.get(device_nr)
+                self.record('display', msg_type, device_nr, displayed - sent)
+                self.record('response', msg_type, device_nr, local - displayed)
+            self.record('round_trip', msg_type, device_nr, received_at - ts)
+            return
+        self.record('send', msg_type, device_nr, local - (ts - offsets.get(device_nr)))
+        if msg_type == POINTER and msg.get('displayed_at') is not None:
+            self.record('response', msg_type, device_nr, ts - msg['displayed_at'])
+
+    def record(self, hop: str, msg_type: str, device_nr: Any, value: float):
+        hist = self.by_type.get((hop, msg_type))
+        if hist is None:
+            hist = self.by_type[(hop, msg_type)] = Histogram()
+        hist.record(value)
+        hist = self.by_device.get((hop, device_nr))
+        if hist is None:
+            hist = self.by_device[(hop, device_nr)] = Histogram()
+        hist.record(value)
+
+    # output
+
+    def lagging(self, hop: str = 'send', quantile: float = 0.99, top: int = 10) -> List[Tuple[Any, float]]:
+        """``(device_nr, latency)`` of the ``top`` devices with the highest ``quantile`` of ``hop``"""
+        values = [(nr, hist.quantile(quantile)) for (h, nr), hist in self.by_device.items() if h == hop and hist.count]
+        values.sort(key=lambda item: item[1], reverse=True)
+        return values[:top]
+
+    def snapshot(self, quantiles: Iterable[float] = QUANTILES) -> Dict[str, Any]:
+        """the quantiles, counts and sums of all histograms and the clock offsets"""
+        quantiles = tuple(quantiles)
+
+        def summary(hist: Histogram) -> Dict[str, Any]:
+            return {'count': hist.count, 'sum': hist.sum, 'max': hist.max, 'quantiles': dict(zip(quantiles, hist.quantiles(quantiles)))}
+
+        return {
+            'type': {key: summary(hist) for key, hist in self.by_type.items()},
+            'device': {key: summary(hist) for key, hist in self.by_device.items()},
+            'offsets': dict(self.offsets.offsets),
+        }
+
+    def prometheus(self, quantiles: Iterable[float] = QUANTILES, prefix: str = METRIC_PREFIX) -> str:
+        """the histograms as prometheus summaries and the clock offsets as gauges, in the text format"""
+        quantiles = tuple(quantiles)
+        lines: List[str] = []
+        for name, series, label in (
+            (f'{prefix}_latency_seconds', self.by_type, 'type'),
+            (f'{prefix}_device_latency_seconds', self.by_device, 'device_nr'),
+        ):
+            lines.append(f'# HELP {name} message latency per hop and {label}')
+            lines.append(f'# TYPE {name} summary')
+            for (hop, key), hist in sorted(series.items(), key=lambda item: (item[0][0], str(item[0][1]))):
+                labels = f'hop="{hop}",{label}="{_label(key)}"'
+                for q, value in zip(quantiles, hist.quantiles(quantiles)):
+                    lines.append(f'{name}{{{labels},quantile="{q}"}} {_number(value)}')
+                lines.append(f'{name}_sum{{{labels}}} {_number(hist.sum)}')
+                lines.append(f'{name}_count{{{labels}}} {hist.count}')
+        name = f'{prefix}_clock_offset_seconds'
+        lines.append(f'# HELP {name} clock offset of the device to the server')
+        lines.append(f'# TYPE {name} gauge')
+        for device_nr, offset in sorted(self.offsets.offsets.items(), key=lambda item: str(item[0])):
+            lines.append(f'{name}{{device_nr="{_label(device_nr)}"}} {_number(offset)}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str, quantiles: Iterable[float] = QUANTILES, prefix: str = METRIC_PREFIX):
+        """write :meth:`prometheus` to ``path`` atomically (for the textfile collector of node_exporter)"""
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'w') as f:
+            f.write(self.prometheus(quantiles, prefix))
+        os.replace(tmp, path)
+
+
+def _label(value: Any) -> str:
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value: float) -> str:
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(value)
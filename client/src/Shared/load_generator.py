@@ -0,0 +1,285 @@
+"""Load generator for the ``new_data`` path of a server.
+
+:class:`LoadGenerator` connects ``devices`` virtual phones (one socket each,
+device ids ``<prefix>-<n>``) and sends ``acceleration``, ``gyro``, ``key`` and
+grid ``pointer`` messages at the configured rates per device, the sends of a
+type are spread evenly over the devices. A listener in the ``GLOBAL_LISTENER``
+room receives the messages back and records the send to receive latency::
+
+    generator = LoadGenerator(1000, rates={DataType.ACCELERATION: 60, DataType.GYRO: 60})
+    stats = await generator.run(duration=30, url='http://localhost:5000')
+    for data_type, latency in stats.items():
+        print(data_type, latency.p50, latency.p99)
+
+The sensor values follow the waveforms of ``MotionSimulator.ts`` and are
+computed with numpy for all devices and ``BLOCK`` samples at once. The wire
+dicts are built from these blocks ahead of time, sending only stamps the
+``time_stamp`` of a payload.
+"""
+import asyncio
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from api_types import DataType, Key, SocketEvents
+from socket_client import GLOBAL_LISTENER_ROOM, AsyncSocketClient
+
+# interval in ms of the simulated devicemotion events, as ``MotionSimulator.ts``
+INTERVAL = 64
+RATES = {DataType.ACCELERATION: 1000 / INTERVAL, DataType.GYRO: 1000 / INTERVAL, DataType.KEY: 1, DataType.POINTER: 2}
+# samples per device computed and built at once
+BLOCK = 64
+TICK = 0.005
+CONNECT_BATCH = 50
+
+KEYS = [key.value for key in Key]
+COLORS = ['red', 'green', 'blue', 'yellow', 'white', 'black']
+
+NEW_DATA = SocketEvents.NEW_DATA.value
+
+
+def time_stamp() -> float:
+    return time.time()
+
+
+@dataclass
+class LatencyStats:
+    """send to receive latencies of one data type in seconds"""
+
+    sent: int
+    received: int
+    p50: float
+    p99: float
+    max: float
+
+    @classmethod
+    def of(cls, sent: int, latencies: array) -> 'LatencyStats':
+        if not latencies:
+            return cls(sent, 0, np.nan, np.nan, np.nan)
+        values = np.frombuffer(latencies, dtype=np.float64)
+        p50, p99 = np.percentile(values, [50, 99]).tolist()
+        return cls(sent, len(values), p50, p99, float(values.max()))
+
+
+class Waveforms:
+    """The sensor values of all devices, sample ``k`` of device ``i`` is ``[k, i]``."""
+
+    def __init__(self, devices: int, seed: Optional[int] = None):
+        self.devices = devices
+        self.rng = np.random.default_rng(seed)
+        # the devices do not move in step
+        self.phase = self.rng.uniform(0, 2 * np.pi, devices)
+
+    def acceleration(self, k0: int, count: int) -> Dict[str, np.ndarray]:
+        """``accelerationIncludingGravity`` of ``MotionSimulator.nextValues``"""
+        k = np.arange(k0, k0 + count, dtype=np.float64)[:, None]
+        shape = (count, self.devices)
+        return {
+            'x': self.rng.random(shape) / 10,
+            'y': self.rng.random(shape) / 10 + 9.81,
+            'z': np.sin(k / (50 / INTERVAL) + self.phase),
+        }
+
+    def gyro(self, k0: int, count: int) -> Dict[str, np.ndarray]:
+        """the orientation of ``MotionSimulator.nextOrientationValues``"""
+        angle = np.arange(k0, k0 + count, dtype=np.float64)[:, None] / (2000 / INTERVAL) + self.phase
+        return {
+            'alpha': np.sin(angle) * 180 + 180,
+            'beta': np.cos(angle) * 180,
+            'gamma': np.zeros((count, self.devices)),
+        }
+
+    def keys(self, count: int) -> np.ndarray:
+        return self.rng.integers(0, len(KEYS), (count, self.devices))
+
+    def grid(self, count: int, rows: int, columns: int) -> Dict[str, np.ndarray]:
+        shape = (count, self.devices)
+        return {
+            'row': self.rng.integers(0, rows, shape),
+            'column': self.rng.integers(0, columns, shape),
+            'color': self.rng.integers(0, len(COLORS), shape),
+        }
+
+
+class _Stream:
+    """The messages of one data type, message ``j`` is sent by device ``j % devices``."""
+
+    def __init__(self, generator: 'LoadGenerator', data_type: DataType, rate: float):
+        self.generator = generator
+        self.data_type = data_type
+        self.rate = rate
+        self.sent = 0
+        # samples per device built so far and the built payloads not yet sent
+        self.built = 0
+        self.payloads: Deque[dict] = deque()
+
+    def due(self, elapsed: float) -> int:
+        """the number of messages due after ``elapsed`` seconds"""
+        return int(elapsed * self.rate * self.generator.devices)
+
+    def next(self) -> dict:
+        if not self.payloads:
+            self.payloads.extend(self.generator.build(self.data_type, self.built, BLOCK))
+            self.built += BLOCK
+        self.sent += 1
+        return self.payloads.popleft()
+
+
+class LoadGenerator:
+    def __init__(
+        self,
+        devices: int,
+        rates: Optional[Dict[DataType, float]] = None,
+        transport: Optional[Callable[[], object]] = None,
+        prefix: str = 'load',
+        grid: Tuple[int, int] = (10, 10),
+        seed: Optional[int] = None,
+    ):
+        """
+        :param devices: number of simulated devices
+        :param rates: messages per second and device of each type, ``DataType.POINTER`` are grid pointers
+        :param transport: creates the transport of a connection, the ``SocketIoTransport`` when ``None``
+        :param prefix: the device ids are ``<prefix>-<n>``
+        :param grid: rows and columns of the grid pointers
+        """
+        self.devices = devices
+        self.rates = dict(RATES if rates is None else rates)
+        self.transport = transport
+        self.prefix = prefix
+        self.grid = grid
+        self.waveforms = Waveforms(devices, seed)
+        self.clients: List[AsyncSocketClient] = []
+        self.listener: Optional[AsyncSocketClient] = None
+        self._id_prefix = f'{prefix}-'
+        self.device_ids: List[str] = [f'{prefix}-{i}' for i in range(devices)]
+        self.device_nrs: List[Optional[float]] = []
+        self.streams: Dict[DataType, _Stream] = {dt: _Stream(self, dt, rate) for dt, rate in self.rates.items() if rate > 0}
+        # latencies by the ``type`` of the received messages
+        self.latencies: Dict[str, array] = {dt.value: array('d') for dt in self.streams}
+        # the schedule delay of the sends, how far the generator fell behind
+        self.lag = 0.0
+
+    def _client(self, device_id: str, is_client: bool = True) -> AsyncSocketClient:
+        transport = self.transport() if self.transport is not None else None
+        return AsyncSocketClient(device_id, transport=transport, is_client=is_client)
+
+    # connections
+
+    async def connect(self, url: Optional[str] = None, timeout: Optional[float] = 30):
+        self.listener = self._client(f'{self.prefix}-listener', is_client=False)
+        self.listener.on(SocketEvents.NEW_DATA, self._received)
+        await self.listener.connect(url, timeout)
+        await self.listener.transport.emit(SocketEvents.JOIN_ROOM.value, {'room': GLOBAL_LISTENER_ROOM})
+        self.clients = [self._client(device_id) for device_id in self.device_ids]
+        for start in range(0, len(self.clients), CONNECT_BATCH):
+            batch = self.clients[start : start + CONNECT_BATCH]
+            await asyncio.gather(*(client.connect(url, timeout) for client in batch))
+        self.device_nrs = [client.device_nr for client in self.clients]
+
+    async def close(self):
+        for start in range(0, len(self.clients), CONNECT_BATCH):
+            await asyncio.gather(*(client.close() for client in self.clients[start : start + CONNECT_BATCH]))
+        if self.listener is not None:
+            await self.listener.close()
+
+    # payloads
+
+    def build(self, data_type: DataType, k0: int, count: int) -> List[dict]:
+        """the wire dicts of ``count`` samples of all devices from sample ``k0`` on, sample major"""
+        ids = self.device_ids * count
+        nrs = self.device_nrs * count
+        waves = self.waveforms
+        if data_type == DataType.ACCELERATION:
+            cols = waves.acceleration(k0, count)
+            return [
+                {'device_id': i, 'device_nr': nr, 'time_stamp': 0.0, 'type': 'acceleration', 'x': x, 'y': y, 'z': z, 'interval': INTERVAL}
+                for i, nr, x, y, z in zip(ids, nrs, cols['x'].ravel().tolist(), cols['y'].ravel().tolist(), cols['z'].ravel().tolist())
+            ]
+        if data_type == DataType.GYRO:
+            cols = waves.gyro(k0, count)
+            return [
+                {'device_id': i, 'device_nr': nr, 'time_stamp': 0.0, 'type': 'gyro', 'alpha': a, 'beta': b, 'gamma': g, 'absolute': False}
+                for i, nr, a, b, g in zip(
+                    ids, nrs, cols['alpha'].ravel().tolist(), cols['beta'].ravel().tolist(), cols['gamma'].ravel().tolist()
+                )
+            ]
+        if data_type == DataType.KEY:
+            return [
+                {'device_id': i, 'device_nr': nr, 'time_stamp': 0.0, 'type': 'key', 'key': KEYS[key]}
+                for i, nr, key in zip(ids, nrs, waves.keys(count).ravel().tolist())
+            ]
+        if data_type == DataType.POINTER:
+            cols = waves.grid(count, *self.grid)
+            return [
+                {
+                    'device_id': i,
+                    'device_nr': nr,
+                    'time_stamp': 0.0,
+                    'type': 'pointer',
+                    'context': 'grid',
+                    'row': row,
+                    'column': column,
+                    'color': COLORS[color],
+                    'displayed_at': 0.0,
+                }
+                for i, nr, row, column, color in zip(
+                    ids, nrs, cols['row'].ravel().tolist(), cols['column'].ravel().tolist(), cols['color'].ravel().tolist()
+                )
+            ]
+        raise ValueError(f'no load for {data_type}')
+
+    # sending and receiving
+
+    def _received(self, data: dict):
+        ts = data.get('time_stamp')
+        latencies = self.latencies.get(data.get('type'))
+        if latencies is None or ts is None or not str(data.get('device_id', '')).startswith(self._id_prefix):
+            return
+        latencies.append(time_stamp() - ts)
+
+    async def send(self, duration: float, tick: float = TICK):
+        """send the messages due within ``duration`` seconds on schedule (or as fast as possible when behind)"""
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        clients = self.clients
+        devices = self.devices
+        while True:
+            elapsed = min(loop.time() - start, duration)
+            for stream in self.streams.values():
+                due = stream.due(elapsed)
+                while stream.sent < due:
+                    client = clients[stream.sent % devices]
+                    payload = stream.next()
+                    payload['time_stamp'] = time_stamp()
+                    if stream.data_type == DataType.POINTER:
+                        payload['displayed_at'] = payload['time_stamp']
+                    await client.transport.emit(NEW_DATA, payload)
+            self.lag = max(self.lag, loop.time() - start - elapsed)
+            if elapsed >= duration:
+                return
+            await asyncio.sleep(tick)
+
+    async def run(self, duration: float, url: Optional[str] = None, drain: float = 1.0) -> Dict[str, LatencyStats]:
+        """connect, send for ``duration`` seconds, wait ``drain`` seconds for the last messages and disconnect"""
+        await self.connect(url)
+        try:
+            await self.send(duration)
+            await asyncio.sleep(drain)
+        finally:
+            await self.close()
+        return self.stats()
+
+    def stats(self) -> Dict[str, LatencyStats]:
+        """the latency distribution per ``type``"""
+        return {stream.data_type.value: LatencyStats.of(stream.sent, self.latencies[stream.data_type.value]) for stream in self.streams.values()}
+
+
+def format_stats(stats: Dict[str, LatencyStats]) -> str:
+    lines = [f'{"type":<14} {"sent":>9} {"received":>9} {"p50 ms":>9} {"p99 ms":>9} {"max ms":>9}']
+    for data_type, s in stats.items():
+        lines.append(f'{data_type:<14} {s.sent:>9} {s.received:>9} {s.p50 * 1e3:>9.2f} {s.p99 * 1e3:>9.2f} {s.max * 1e3:>9.2f}')
+    return '\n'.join(lines)
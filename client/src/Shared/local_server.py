@@ -0,0 +1,271 @@
+"""In-process stand-in for the socket.io server of index.ts.
+
+Routes the events of ``SocketEvents`` between :class:`LocalTransport`
+connections the same way the node server does (device rooms, ``broadcast``,
+``unicast_to``, ``caller_id`` responses, ``all_data``), so clients can be
+exercised without a running server::
+
+    server = LocalServer()
+    client = AsyncSocketClient('FooBar', transport=server.transport())
+"""
+import asyncio
+import inspect
+import itertools
+import json
+import time
+from typing import Any, Callable, Dict, Optional, Set
+
+from api_types import DataType, SocketEvents
+from asset_store import ASSETS, AssetStore
+from data_store import DataStoreEngine
+from device_registry import DeviceRegistry
+from socket_client import GLOBAL_LISTENER_ROOM
+
+_sids = itertools.count(1)
+
+
+def time_stamp() -> float:
+    return time.time()
+
+
+class LocalTransport:
+    """A client connection to a :class:`LocalServer`, payloads are json round tripped like on the wire."""
+
+    def __init__(self, server: 'LocalServer'):
+        self.server = server
+        self.sid: Optional[str] = None
+        self.handlers: Dict[str, Callable[[Any], Any]] = {}
+        self._inbox: 'asyncio.Queue[tuple]' = asyncio.Queue()
+        self._reader: Optional[asyncio.Task] = None
+
+    @property
+    def connected(self) -> bool:
+        return self.sid is not None
+
+    def on(self, event: str, handler: Callable[[Any], Any]):
+        self.handlers[event] = handler
+
+    async def connect(self, url: Optional[str] = None):
+        self.sid = f'local-{next(_sids)}'
+        self._reader = asyncio.ensure_future(self._read())
+        self._deliver('connect', None)
+        self.server.connect(self)
+
+    async def disconnect(self):
+        if self.sid is None:
+            return
+        self.server.disconnect(self)
+        self.sid = None
+        self._deliver('disconnect', None)
+        await self._inbox.join()
+        self._reader.cancel()
+
+    async def emit(self, event: str, data: Any = None):
+        if self.sid is None:
+            raise ConnectionError('not connected')
+        self.server.handle(self, event, json.loads(json.dumps(data)))
+
+    def _deliver(self, event: str, data: Any):
+        self._inbox.put_nowait((event, None if data is None else json.dumps(data)))
+
+    async def _read(self):
+        while True:
+            event, payload = await self._inbox.get()
+            try:
+                handler = self.handlers.get(event)
+                if handler is not None:
+                    result = handler(None if payload is None else json.loads(payload))
+                    if inspect.isawaitable(result):
+                        await result
+            finally:
+                self._inbox.task_done()
+
+
+class LocalServer:
+    def __init__(self, assets: Optional[AssetStore] = None):
+        """
+        :param assets: store the playground config assets once, ``all_data`` then
+            references them by digest and clients fetch them with ``get_assets``
+        """
+        self.sockets: Dict[str, LocalTransport] = {}
+        self.rooms: Dict[str, Set[str]] = {}
+        self.devices = DeviceRegistry()
+        self.store = DataStoreEngine(assets)
+
+    def transport(self) -> LocalTransport:
+        return LocalTransport(self)
+
+    # emitting
+
+    def emit_to(self, sids, event: str, data: Any):
+        for sid in sids:
+            socket = self.sockets.get(sid)
+            if socket is not None:
+                socket._deliver(event, data)
+
+    def emit_room(self, room: str, event: str, data: Any):
+        self.emit_to(list(self.rooms.get(room, ())), event, data)
+
+    def emit_all(self, event: str, data: Any):
+        self.emit_to(list(self.sockets), event, data)
+
+    def join(self, sid: str, room: str):
+        self.rooms.setdefault(room, set()).add(sid)
+
+    def leave(self, sid: str, room: str):
+        members = self.rooms.get(room)
+        if members is not None:
+            members.discard(sid)
+            if not members:
+                del self.rooms[room]
+
+    # devices
+
+    def devices_pkg(self) -> dict:
+        return self.devices.devices_pkg()
+
+    def emit_devices(self):
+        """send the ``devices`` package to all sockets when it changed"""
+        pkg = self.devices.changed_pkg()
+        if pkg is not None:
+            self.emit_all(SocketEvents.DEVICES.value, pkg)
+
+    def all_data_pkg(self, device_id: str) -> dict:
+        return {
+            'device_id': device_id,
+            'type': DataType.ALL_DATA.value,
+            'all_data': self.store.device(device_id).to_dict(),
+            'time_stamp': time_stamp(),
+            'device_nr': -999,
+        }
+
+    # events
+
+    def connect(self, socket: LocalTransport):
+        self.sockets[socket.sid] = socket
+        self.join(socket.sid, socket.sid)
+        socket._deliver(SocketEvents.DEVICES.value, self.devices_pkg())
+
+    def disconnect(self, socket: LocalTransport):
+        sid = socket.sid
+        device = self.devices.by_socket(sid)
+        # the 'disconnecting' handler of index.ts: the other members of each room the socket was in get room_left
+        for room, members in list(self.rooms.items()):
+            if sid in members:
+                self.leave(sid, room)
+                if room != sid and device is not None:
+                    self.emit_room(room, SocketEvents.ROOM_LEFT.value, {'room': room, 'device': device})
+        self.sockets.pop(sid, None)
+        self.devices.remove(sid)
+        self.emit_devices()
+
+    def handle(self, socket: LocalTransport, event: str, data: Any):
+        handler = getattr(self, f'on_{event}', None)
+        if handler is not None:
+            handler(socket.sid, data or {})
+
+    def on_new_device(self, sid: str, data: dict):
+        if data.get('old_device_id'):
+            self.leave(sid, data['old_device_id'])
+            old_device = self.devices.remove(sid)
+            if old_device is not None:
+                self.emit_room(
+                    data['old_device_id'],
+                    SocketEvents.ROOM_LEFT.value,
+                    {'room': data['old_device_id'], 'device': old_device},
+                )
+        if data.get('device_id'):
+            device = self.devices.add(sid, data['device_id'], bool(data.get('is_client')), data.get('is_silent'))
+            self.store.device(data['device_id'])
+            self.join(sid, data['device_id'])
+            self.emit_room(data['device_id'], SocketEvents.ROOM_JOINED.value, {'room': data['device_id'], 'device': device})
+            self.emit_to([sid], SocketEvents.DEVICE.value, device)
+        self.emit_devices()
+
+    def on_get_devices(self, sid: str, data: dict):
+        self.emit_to([sid], SocketEvents.DEVICES.value, self.devices_pkg())
+
+    def on_join_room(self, sid: str, data: dict):
+        room = data.get('room')
+        if room and sid not in self.rooms.get(room, ()):
+            self.join(sid, room)
+            self.emit_room(room, SocketEvents.ROOM_JOINED.value, {'room': room, 'device': self.devices.by_socket(sid)})
+
+    def on_leave_room(self, sid: str, data: dict):
+        room = data.get('room')
+        if room and sid in self.rooms.get(room, ()):
+            pkg = {'room': room, 'device': self.devices.by_socket(sid)}
+            # index.ts emits to the room once the socket left it, then to the socket
+            self.leave(sid, room)
+            self.emit_room(room, SocketEvents.ROOM_LEFT.value, pkg)
+            self.emit_to([sid], SocketEvents.ROOM_LEFT.value, pkg)
+
+    def device_by_nr(self, device_nr) -> Optional[dict]:
+        return self.devices.by_nr(device_nr)
+
+    def on_new_data(self, sid: str, data: dict):
+        if not data.get('device_id') and data.get('device_nr') is None:
+            return
+        device_id = data.get('device_id')
+        if not device_id:
+            device = self.device_by_nr(data['device_nr'])
+            device_id = device and device['device_id']
+        if not device_id:
+            return
+        if isinstance(data.get('deliver_to'), str) and device_id != data['deliver_to']:
+            device_id = data['deliver_to']
+            data['cross_origin'] = True
+        unicast_to = None
+        if isinstance(data.get('unicast_to'), (int, float)) and not isinstance(data.get('unicast_to'), bool):
+            unicast_to = self.device_by_nr(data['unicast_to'])
+            if unicast_to is not None:
+                device_id = unicast_to['device_id']
+                data['deliver_to'] = device_id
+                data['broadcast'] = False
+                data['cross_origin'] = True
+        if data.get('type') is None:
+            data['type'] = DataType.UNKNOWN.value
+        if data['type'] == DataType.INPUT_PROMPT.value or (data['type'] == DataType.NOTIFICATION.value and data.get('alert')):
+            data['response_id'] = sid
+        self.store.apply(device_id, data)
+        if data.get('stop_propagation'):
+            return
+        caller_id = data.get('caller_id')
+        if caller_id:
+            self.emit_room(caller_id, SocketEvents.NEW_DATA.value, data)
+            input_type = {
+                DataType.INPUT_RESPONSE.value: DataType.INPUT_PROMPT.value,
+                DataType.ALERT_CONFIRM.value: DataType.NOTIFICATION.value,
+            }.get(data['type'])
+            if input_type is not None:
+                cancel_request = {
+                    'device_id': device_id,
+                    'time_stamp': data.get('time_stamp'),
+                    'device_nr': data.get('device_nr'),
+                    'response_id': caller_id,
+                    'input_type': input_type,
+                    'type': 'cancel_user_input',
+                }
+                self.emit_room(device_id, SocketEvents.NEW_DATA.value, cancel_request)
+        elif data.get('broadcast'):
+            self.emit_all(SocketEvents.NEW_DATA.value, data)
+        elif unicast_to is not None:
+            self.emit_to([unicast_to['socket_id']], SocketEvents.NEW_DATA.value, data)
+            self.emit_room(GLOBAL_LISTENER_ROOM, SocketEvents.NEW_DATA.value, data)
+        else:
+            self.emit_room(device_id, SocketEvents.NEW_DATA.value, data)
+            self.emit_room(GLOBAL_LISTENER_ROOM, SocketEvents.NEW_DATA.value, data)
+
+    def on_get_all_data(self, sid: str, data: dict):
+        if data.get('device_id') in self.store:
+            self.emit_to([sid], SocketEvents.ALL_DATA.value, self.all_data_pkg(data['device_id']))
+
+    def on_clear_data(self, sid: str, data: dict):
+        if data.get('device_id') in self.store:
+            self.store.clear(data['device_id'])
+            self.emit_all(SocketEvents.ALL_DATA.value, self.all_data_pkg(data['device_id']))
+
+    def on_get_assets(self, sid: str, data: dict):
+        if self.store.assets is not None:
+            bodies = self.store.assets.select(data.get('digests') or ())
+            self.emit_to([sid], ASSETS, {'assets': bodies, 'time_stamp': data.get('time_stamp')})
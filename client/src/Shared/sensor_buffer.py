@@ -0,0 +1,164 @@
+"""Columnar ring buffers for ``acceleration`` and ``gyro`` streams.
+
+Samples are written into preallocated float64 columns per device, no object
+is created per sample. Every sample is stored twice (at ``i`` and
+``i + capacity``), so the last ``n`` samples are always one contiguous slice
+and can be handed out as numpy views without copying::
+
+    acc = AccelerationBuffer(capacity=600)
+    for msg in stream:
+        acc.ingest(msg)
+    acc['FooBar'].magnitude(60)
+"""
+from operator import attrgetter, itemgetter
+from typing import Dict, Hashable, Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+from api_types import AccMsg, DataType, GyroMsg
+
+ACC_FIELDS = ('time_stamp', 'x', 'y', 'z', 'interval')
+GYRO_FIELDS = ('time_stamp', 'alpha', 'beta', 'gamma', 'absolute')
+
+
+class SensorRing:
+    """Fixed capacity ring of samples for one device, one float64 column per field."""
+
+    def __init__(self, fields: Tuple[str, ...], capacity: int):
+        self.fields = fields
+        self.columns = {name: idx for idx, name in enumerate(fields)}
+        self.capacity = capacity
+        self.count = 0
+        self._data = np.zeros((len(fields), 2 * capacity), dtype=np.float64)
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, values: Tuple[float, ...]):
+        pos = self.count % self.capacity
+        self._data[:, pos] = values
+        self._data[:, pos + self.capacity] = values
+        self.count += 1
+
+    def extend(self, rows: np.ndarray):
+        """Append a ``(samples, fields)`` block of samples."""
+        rows = np.asarray(rows, dtype=np.float64)
+        if len(rows) > self.capacity:
+            self.count += len(rows) - self.capacity
+            rows = rows[-self.capacity:]
+        pos = self.count % self.capacity
+        first = min(len(rows), self.capacity - pos)
+        for offset in (0, self.capacity):
+            self._data[:, offset + pos: offset + pos + first] = rows[:first].T
+            self._data[:, offset: offset + len(rows) - first] = rows[first:].T
+        self.count += len(rows)
+
+    def _window(self, n: Optional[int]) -> slice:
+        size = len(self) if n is None else min(n, len(self))
+        end = self.count % self.capacity + self.capacity
+        return slice(end - size, end)
+
+    def last(self, n: Optional[int] = None) -> np.ndarray:
+        """``(fields, n)`` view of the last ``n`` samples, oldest first."""
+        return self._data[:, self._window(n)]
+
+    def column(self, field: str, n: Optional[int] = None) -> np.ndarray:
+        """view of the last ``n`` values of ``field``, oldest first"""
+        return self._data[self.columns[field], self._window(n)]
+
+    def rolling_mean(self, field: str, window: int, n: Optional[int] = None) -> np.ndarray:
+        """mean over the trailing ``window`` samples for each of the last ``n`` samples"""
+        values = self.column(field, n)
+        if len(values) < window:
+            return np.empty(0)
+        cumsum = np.cumsum(values)
+        cumsum[window:] = cumsum[window:] - cumsum[:-window]
+        return cumsum[window - 1:] / window
+
+    def resample(self, field: str, rate: float, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """linearly interpolate ``field`` to a fixed ``rate`` in Hz, returns ``(time_stamps, values)``"""
+        time_stamps = self.column('time_stamp', n)
+        if len(time_stamps) == 0:
+            return np.empty(0), np.empty(0)
+        grid = np.arange(time_stamps[0], time_stamps[-1] + 0.5 / rate, 1.0 / rate)
+        return grid, np.interp(grid, time_stamps, self.column(field, n))
+
+
+class AccelerationRing(SensorRing):
+    def __init__(self, capacity: int):
+        super().__init__(ACC_FIELDS, capacity)
+
+    def magnitude(self, n: Optional[int] = None) -> np.ndarray:
+        """euclidean norm of ``(x, y, z)`` for the last ``n`` samples"""
+        xyz = self._data[1:4, self._window(n)]
+        return np.sqrt(np.einsum('ij,ij->j', xyz, xyz))
+
+
+class GyroRing(SensorRing):
+    def __init__(self, capacity: int):
+        super().__init__(GYRO_FIELDS, capacity)
+
+
+class SensorBuffer:
+    """Ring buffers of one sensor type, keyed by ``device_id`` or ``device_nr``.
+
+    ``ingest`` accepts decoded messages as well as raw ``new_data`` dicts,
+    messages of other types are ignored.
+    """
+
+    FIELDS: Tuple[str, ...] = ()
+    DATA_TYPE: DataType = DataType.UNKNOWN
+    RING = SensorRing
+
+    def __init__(self, capacity: int = 1024, key: str = 'device_id'):
+        if key not in ('device_id', 'device_nr'):
+            raise ValueError(f"key must be 'device_id' or 'device_nr', got '{key}'")
+        self.capacity = capacity
+        self.key = key
+        self.rings: Dict[Hashable, SensorRing] = {}
+        self._from_dict = itemgetter(key, *self.FIELDS)
+        self._from_msg = attrgetter(key, *self.FIELDS)
+
+    def __getitem__(self, device: Hashable) -> SensorRing:
+        return self.rings[device]
+
+    def __contains__(self, device: Hashable) -> bool:
+        return device in self.rings
+
+    def __iter__(self):
+        return iter(self.rings)
+
+    def ring(self, device: Hashable) -> SensorRing:
+        ring = self.rings.get(device)
+        if ring is None:
+            ring = self.RING(self.capacity)
+            self.rings[device] = ring
+        return ring
+
+    def ingest(self, msg: Union[dict, AccMsg, GyroMsg]) -> bool:
+        """Append one sample, returns ``False`` when ``msg`` is of another type."""
+        if msg.__class__ is dict:
+            if msg.get('type') != self.DATA_TYPE.value:
+                return False
+            device, *values = self._from_dict(msg)
+        else:
+            if getattr(msg.type, 'value', msg.type) != self.DATA_TYPE.value:
+                return False
+            device, *values = self._from_msg(msg)
+        self.ring(device).append(values)
+        return True
+
+    def ingest_many(self, messages: Iterable[Union[dict, AccMsg, GyroMsg]]) -> int:
+        return sum(self.ingest(msg) for msg in messages)
+
+
+class AccelerationBuffer(SensorBuffer):
+    FIELDS = ACC_FIELDS
+    DATA_TYPE = DataType.ACCELERATION
+    RING = AccelerationRing
+
+
+class GyroBuffer(SensorBuffer):
+    FIELDS = GYRO_FIELDS
+    DATA_TYPE = DataType.GYRO
+    RING = GyroRing
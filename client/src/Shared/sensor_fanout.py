@@ -0,0 +1,288 @@
+"""Decoding of ``acceleration`` and ``gyro`` streams in a pool of worker processes.
+
+:class:`SensorFanOut` assigns every device (by ``device_id``) to one worker
+process. A worker decodes the payloads of its devices in order and keeps their
+:class:`sensor_buffer.SensorBuffer` rings, so no state is shared between
+workers. Samples come back as rows of shared memory blocks (see ``COLUMNS``),
+only block numbers pass the result queue::
+
+    with SensorFanOut(workers=4) as fanout:
+        for payload in stream:  # json text or dicts of ``new_data``
+            fanout.put(payload)
+            fanout.drain(lambda block: process(block.sensor(DataType.GYRO)))
+
+A block handed to the callback is a view of the shared memory and only valid
+until the callback returns, use :meth:`SampleBlock.copy` to keep it.
+
+Payloads a worker can not decode (broken json, missing fields) are skipped and
+counted in ``skipped``. A worker which fails otherwise passes its traceback to
+:meth:`SensorFanOut.drain`, which raises it as :class:`WorkerError`.
+"""
+import json
+import multiprocessing
+import os
+import queue
+import re
+import traceback
+from multiprocessing import shared_memory
+from operator import itemgetter
+from typing import Any, Callable, Dict, Hashable, List, Optional, Union
+
+import numpy as np
+
+from api_types import DataType
+from sensor_buffer import ACC_FIELDS, GYRO_FIELDS, AccelerationBuffer, GyroBuffer, SensorBuffer
+
+# the columns of a sample row, gyro samples store alpha, beta, gamma and absolute in x, y, z and interval
+COLUMNS = ('device', 'type', 'device_nr', 'time_stamp', 'x', 'y', 'z', 'interval')
+# the ``type`` column
+SENSOR_TYPES = (DataType.ACCELERATION, DataType.GYRO)
+SENSOR_FIELDS = {DataType.ACCELERATION: ACC_FIELDS, DataType.GYRO: GYRO_FIELDS}
+
+BLOCK_ROWS = 4096
+SLOTS = 4
+BATCH = 256
+
+_DEVICE_ID = re.compile(rb'"device_id"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+Payload = Union[bytes, str, Dict[str, Any]]
+
+
+class WorkerError(RuntimeError):
+    pass
+
+
+class SampleBlock:
+    """The sample rows of one block, ``device`` holds the index into ``device_ids``."""
+
+    def __init__(self, worker: int, rows: np.ndarray, device_ids: List[Hashable]):
+        self.worker = worker
+        self.rows = rows
+        self.device_ids = device_ids
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def copy(self) -> 'SampleBlock':
+        return SampleBlock(self.worker, self.rows.copy(), self.device_ids)
+
+    def column(self, name: str) -> np.ndarray:
+        return self.rows[:, COLUMNS.index(name)]
+
+    def sensor(self, data_type: DataType) -> Dict[str, np.ndarray]:
+        """the rows of one sensor type as columns named like its ``SensorBuffer`` fields"""
+        rows = self.rows[self.rows[:, 1] == SENSOR_TYPES.index(data_type)]
+        columns = {'device': rows[:, 0].astype(np.int64), 'device_nr': rows[:, 2]}
+        for idx, name in enumerate(SENSOR_FIELDS[data_type]):
+            columns[name] = rows[:, 3 + idx]
+        return columns
+
+
+class _Worker:
+    """The state of the devices of one worker process."""
+
+    def __init__(self, capacity: int):
+        self.buffers: List[SensorBuffer] = [AccelerationBuffer(capacity), GyroBuffer(capacity)]
+        self.types = {buffer.DATA_TYPE.value: idx for idx, buffer in enumerate(self.buffers)}
+        self.getters = [itemgetter(*buffer.FIELDS) for buffer in self.buffers]
+
+    def ingest(self, device: int, payload: Payload, row: np.ndarray) -> bool:
+        """decode ``payload`` into the rings of ``device`` and ``row``, ``False`` for other types"""
+        data = payload if payload.__class__ is dict else json.loads(payload)
+        sensor = self.types.get(data.get('type'))
+        if sensor is None:
+            return False
+        values = self.getters[sensor](data)
+        device_nr = data.get('device_nr')
+        row[0] = device
+        row[1] = sensor
+        row[2] = np.nan if device_nr is None else device_nr
+        row[3:] = values
+        # after the row, a payload with invalid values leaves the rings unchanged
+        self.buffers[sensor].ring(device).append(values)
+        return True
+
+
+def _work(worker: int, shm_name: str, inbox, free, results, capacity: int, block_rows: int):
+    """puts ``(worker, slot, rows, skipped payloads, None)`` per block and
+    ``(worker, None, 0, skipped payloads, traceback or None)`` when it stops"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    skipped = 0
+    failure: Optional[str] = None
+    try:
+        blocks = np.ndarray((SLOTS, block_rows, len(COLUMNS)), dtype=np.float64, buffer=shm.buf)
+        state = _Worker(capacity)
+        slot: Optional[int] = None
+        count = 0
+        while True:
+            batch = inbox.get()
+            if batch is None:
+                break
+            for device, payload in batch:
+                if slot is None:
+                    slot = free.get()
+                    count = 0
+                try:
+                    ingested = state.ingest(device, payload, blocks[slot, count])
+                except Exception:
+                    skipped += 1
+                    continue
+                if ingested:
+                    count += 1
+                    if count == block_rows:
+                        results.put((worker, slot, count, skipped, None))
+                        slot = None
+                        skipped = 0
+            # hand out a partial block when there is nothing to do
+            if slot is not None and count and inbox.empty():
+                results.put((worker, slot, count, skipped, None))
+                slot = None
+                skipped = 0
+        if slot is not None and count:
+            results.put((worker, slot, count, skipped, None))
+            skipped = 0
+    except Exception:
+        failure = traceback.format_exc()
+    finally:
+        blocks = state = None
+        shm.close()
+        results.put((worker, None, 0, skipped, failure))
+
+
+class SensorFanOut:
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        capacity: int = 1024,
+        block_rows: int = BLOCK_ROWS,
+        batch: int = BATCH,
+    ):
+        """
+        :param workers: number of worker processes, defaults to the number of cores
+        :param capacity: ring capacity per device and sensor in the workers
+        :param block_rows: sample rows per shared memory block, each worker has ``SLOTS`` blocks
+        :param batch: payloads sent to a worker at once
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.block_rows = block_rows
+        self.batch = batch
+        # device index of every device key, devices are assigned round robin
+        self.devices: Dict[Hashable, int] = {}
+        self.device_ids: List[Hashable] = []
+        self.count = 0
+        # payloads the workers could not decode
+        self.skipped = 0
+        self._batches: List[List[Any]] = [[] for _ in range(self.workers)]
+        self._results = multiprocessing.Queue()
+        self._inboxes = []
+        self._free = []
+        self._shms = []
+        self._blocks = []
+        self._processes = []
+        self._running = self.workers
+        size = SLOTS * block_rows * len(COLUMNS) * 8
+        for worker in range(self.workers):
+            shm = shared_memory.SharedMemory(create=True, size=size)
+            inbox = multiprocessing.Queue()
+            free = multiprocessing.Queue()
+            for slot in range(SLOTS):
+                free.put(slot)
+            process = multiprocessing.Process(
+                target=_work,
+                args=(worker, shm.name, inbox, free, self._results, capacity, block_rows),
+                daemon=True,
+            )
+            process.start()
+            self._shms.append(shm)
+            self._blocks.append(np.ndarray((SLOTS, block_rows, len(COLUMNS)), dtype=np.float64, buffer=shm.buf))
+            self._inboxes.append(inbox)
+            self._free.append(free)
+            self._processes.append(process)
+
+    def __enter__(self) -> 'SensorFanOut':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def device(self, payload: Payload) -> int:
+        """the device index of a payload, its ``device_id`` is read without decoding json text"""
+        if payload.__class__ is dict:
+            key = payload.get('device_id')
+        else:
+            match = _DEVICE_ID.search(payload if payload.__class__ is bytes else payload.encode())
+            key = None
+            if match:
+                raw = match.group(1)
+                key = json.loads(b'"' + raw + b'"') if b'\\' in raw else raw.decode()
+        device = self.devices.get(key)
+        if device is None:
+            device = self.devices[key] = len(self.device_ids)
+            self.device_ids.append(key)
+        return device
+
+    def put(self, payload: Payload):
+        device = self.device(payload)
+        worker = device % self.workers
+        batch = self._batches[worker]
+        batch.append((device, payload))
+        self.count += 1
+        if len(batch) >= self.batch:
+            self._inboxes[worker].put(batch)
+            self._batches[worker] = []
+
+    def flush(self):
+        """send the pending payloads to the workers"""
+        for worker, batch in enumerate(self._batches):
+            if batch:
+                self._inboxes[worker].put(batch)
+                self._batches[worker] = []
+
+    def drain(self, callback: Callable[[SampleBlock], Any], timeout: Optional[float] = 0) -> int:
+        """Pass the finished blocks to ``callback``, waits up to ``timeout``
+        seconds (forever when ``None``) for the first one. Returns the number of blocks,
+        raises :class:`WorkerError` when a worker failed."""
+        drained = 0
+        while self._running:
+            try:
+                result = self._results.get(timeout=timeout) if timeout != 0 else self._results.get_nowait()
+            except queue.Empty:
+                break
+            worker, slot, count, skipped, failure = result
+            self.skipped += skipped
+            if slot is None:
+                self._running -= 1
+                if failure is not None:
+                    raise WorkerError(f'sensor worker {worker} failed\n{failure}')
+                continue
+            try:
+                callback(SampleBlock(worker, self._blocks[worker][slot, :count], self.device_ids))
+            finally:
+                self._free[worker].put(slot)
+            drained += 1
+            timeout = 0
+        return drained
+
+    def close(self, callback: Optional[Callable[[SampleBlock], Any]] = None):
+        """Process all pending payloads (their blocks are passed to ``callback``) and stop the workers."""
+        if not self._processes:
+            return
+        self.flush()
+        for inbox in self._inboxes:
+            inbox.put(None)
+        error: Optional[WorkerError] = None
+        while self._running:
+            try:
+                self.drain(callback or (lambda block: None), timeout=None)
+            except WorkerError as e:
+                # stop the other workers first
+                error = error or e
+        for process in self._processes:
+            process.join()
+        self._blocks = []
+        for shm in self._shms:
+            shm.close()
+            shm.unlink()
+        self._processes = []
+        if error is not None:
+            raise error
@@ -0,0 +1,203 @@
+"""Queries over a recorded :class:`session_log.SessionLog`.
+
+:class:`SessionIndex` scans a log once and keeps the records sorted by
+``time_stamp`` with secondary indexes on ``device_id``, ``device_nr``,
+``type`` and the sprite ``id``. A query only touches the matching records::
+
+    index = SessionIndex.build(log)
+    gyro = index.block(('time_stamp', 'alpha', 'beta', 'gamma'), type=DataType.GYRO, device_nr=3, start=t1, end=t2)
+    clicks = index.messages(type=DataType.SPRITE_CLICKED, sprite_id='ball')
+
+:meth:`SessionIndex.block` reads numeric fields as numpy columns straight from
+the fixed part of the records, without decoding the messages. An index can be
+saved next to its log and loaded again.
+"""
+import json
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from api_types import DataType
+from session_log import BOOL, ENUM, FLOAT, RECORD, SessionLog
+
+# ``time_stamp`` of records without one, sorted after all others
+NO_TIME = np.inf
+
+_DTYPES = {FLOAT: np.dtype('<f8'), BOOL: np.dtype('?'), ENUM: np.dtype('<u2')}
+_MASK_DTYPES = {'B': np.dtype('u1'), 'I': np.dtype('<u4'), 'Q': np.dtype('<u8')}
+
+
+class _Secondary:
+    """positions (in time order) of every key"""
+
+    def __init__(self, keys: List[Hashable], codes: np.ndarray):
+        """
+        :param codes: the key index of every record, -1 for records without key
+        """
+        self.keys = keys
+        self.lookup = {key: code for code, key in enumerate(keys)}
+        self.order = np.argsort(codes, kind='stable')
+        self.starts = np.searchsorted(codes[self.order], np.arange(len(keys) + 1))
+        self.codes = codes
+
+    @classmethod
+    def of(cls, values: Sequence[Optional[Hashable]]) -> '_Secondary':
+        lookup: Dict[Hashable, int] = {}
+        codes = np.fromiter(
+            (-1 if value is None else lookup.setdefault(value, len(lookup)) for value in values),
+            dtype=np.int64,
+            count=len(values),
+        )
+        return cls(list(lookup), codes)
+
+    def positions(self, key: Hashable) -> np.ndarray:
+        code = self.lookup.get(key)
+        if code is None:
+            return np.empty(0, dtype=np.int64)
+        return self.order[self.starts[code] : self.starts[code + 1]]
+
+
+class SessionIndex:
+    SECONDARY = ('device_id', 'device_nr', 'type', 'sprite_id')
+    # the fields read by ``build``, ``sprite`` and ``id`` for the ``sprite_id``
+    FIELDS = ('time_stamp', 'device_id', 'device_nr', 'type', 'sprite', 'id')
+
+    def __init__(self, log: SessionLog, time_stamps: np.ndarray, offsets: np.ndarray, secondary: Dict[str, _Secondary]):
+        """
+        :param time_stamps: sorted time stamps of all message records
+        :param offsets: offset of the record of each time stamp
+        """
+        self.log = log
+        self.time_stamps = time_stamps
+        self.offsets = offsets
+        self.secondary = secondary
+
+    @classmethod
+    def build(cls, log: SessionLog) -> 'SessionIndex':
+        """scan all records of ``log``"""
+        offsets = []
+        time_stamps = []
+        keys: Dict[str, List[Any]] = {name: [] for name in cls.SECONDARY}
+        for offset, schema, start, end in log.records():
+            data = schema.reader(cls.FIELDS)(log.buffer, start, end)
+            offsets.append(offset)
+            ts = data.get('time_stamp')
+            time_stamps.append(NO_TIME if ts is None else ts)
+            keys['device_id'].append(data.get('device_id'))
+            keys['device_nr'].append(data.get('device_nr'))
+            keys['type'].append(data.get('type'))
+            keys['sprite_id'].append(_sprite_id(data))
+        order = np.argsort(np.array(time_stamps, dtype=np.float64), kind='stable')
+        secondary = {name: _Secondary.of([values[idx] for idx in order.tolist()]) for name, values in keys.items()}
+        return cls(
+            log,
+            np.array(time_stamps, dtype=np.float64)[order],
+            np.array(offsets, dtype=np.int64)[order],
+            secondary,
+        )
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    # persistence
+
+    def save(self, path: str):
+        keys = {name: index.keys for name, index in self.secondary.items()}
+        arrays = {f'{name}_codes': index.codes for name, index in self.secondary.items()}
+        np.savez(
+            path,
+            time_stamps=self.time_stamps,
+            offsets=self.offsets,
+            keys=np.array(json.dumps(keys)),
+            log_end=np.array(self.log.end),
+            **arrays,
+        )
+
+    @classmethod
+    def load(cls, log: SessionLog, path: str) -> 'SessionIndex':
+        """an index saved for ``log``, rebuilt when the log has grown since"""
+        for _ in log.records():
+            pass
+        with np.load(path) as data:
+            if int(data['log_end']) != log.end:
+                return cls.build(log)
+            keys = json.loads(str(data['keys']))
+            secondary = {name: _Secondary(keys[name], data[f'{name}_codes']) for name in cls.SECONDARY}
+            return cls(log, data['time_stamps'], data['offsets'], secondary)
+
+    # queries
+
+    def select(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        device_id: Optional[str] = None,
+        device_nr: Optional[float] = None,
+        type: Union[DataType, str, None] = None,
+        sprite_id: Optional[str] = None,
+    ) -> np.ndarray:
+        """Positions (in time order) of the records matching all given filters,
+        ``start`` and ``end`` are inclusive."""
+        lo = 0 if start is None else int(np.searchsorted(self.time_stamps, start, 'left'))
+        hi = len(self.offsets) if end is None else int(np.searchsorted(self.time_stamps, end, 'right'))
+        filters = {'device_id': device_id, 'device_nr': device_nr, 'type': getattr(type, 'value', type), 'sprite_id': sprite_id}
+        selected: Optional[np.ndarray] = None
+        for name, key in filters.items():
+            if key is None:
+                continue
+            positions = self.secondary[name].positions(key)
+            # restrict to the time range before intersecting
+            positions = positions[np.searchsorted(positions, lo) : np.searchsorted(positions, hi)]
+            selected = positions if selected is None else np.intersect1d(selected, positions, assume_unique=True)
+        if selected is None:
+            return np.arange(lo, hi)
+        return selected
+
+    def messages(self, positions: Optional[np.ndarray] = None, decode: bool = True, **filters) -> Iterator[Any]:
+        """lazy iterator over the messages at ``positions`` or matching ``filters`` (see ``select``)"""
+        if positions is None:
+            positions = self.select(**filters)
+        for offset in self.offsets[positions].tolist():
+            yield self.log.read(offset, decode)
+
+    def block(self, fields: Iterable[str], positions: Optional[np.ndarray] = None, **filters) -> Dict[str, np.ndarray]:
+        """Numeric fields of the selected records as float64 columns, ``NaN`` where a
+        record has no such field (or it is ``None``). Only fields stored in the fixed
+        part of the records (numbers, bools, enums as value index) can be read."""
+        if positions is None:
+            positions = self.select(**filters)
+        fields = list(fields)
+        offsets = self.offsets[positions]
+        columns = {name: np.full(len(offsets), np.nan) for name in fields}
+        if len(offsets) == 0:
+            return columns
+        buffer = np.frombuffer(self.log.buffer, dtype=np.uint8)
+        schema_ids = buffer[offsets[:, None] + np.arange(4, 6)].copy().view('<u2')[:, 0]
+        for schema_id in np.unique(schema_ids).tolist():
+            rows = np.flatnonzero(schema_ids == schema_id)
+            starts = offsets[rows] + RECORD.size
+            schema = self.log.schemas[schema_id]
+            mask = _gather(buffer, starts, 0, _MASK_DTYPES[schema.mask_code]).astype(np.uint64)
+            for name in fields:
+                field = schema.layout.get(name)
+                if field is None:
+                    continue
+                pos, bit, code = field
+                values = _gather(buffer, starts, pos, _DTYPES[code]).astype(np.float64)
+                values[(mask >> np.uint64(bit)) & np.uint64(1) == 0] = np.nan
+                columns[name][rows] = values
+        del buffer
+        return columns
+
+
+def _sprite_id(data: Dict[str, Any]) -> Optional[str]:
+    sprite = data.get('sprite')
+    if isinstance(sprite, dict):
+        return sprite.get('id')
+    return data.get('id')
+
+
+def _gather(buffer: np.ndarray, starts: np.ndarray, pos: int, dtype: np.dtype) -> np.ndarray:
+    """the values of ``dtype`` at ``starts + pos``"""
+    raw = buffer[(starts + pos)[:, None] + np.arange(dtype.itemsize)]
+    return raw.copy().view(dtype)[:, 0]
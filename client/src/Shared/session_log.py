@@ -0,0 +1,396 @@
+"""Append-only binary log of ``new_data`` messages, to record and replay sessions.
+
+A log starts with ``MAGIC`` followed by records of a ``RECORD`` header
+(payload length, schema id) and the payload. The first message of each
+dataclass writes a schema record (schema id 0) listing its fields; numeric,
+bool and enum fields of a message are stored in a fixed ``struct`` layout
+(floats as float64), only strings, lists and nested dataclasses are stored as
+json::
+
+    with Recorder('session.log') as recorder:
+        async for msg in client.stream(DataType.ACCELERATION):
+            recorder.write(msg)
+
+    with SessionLog('session.log') as log:
+        await log.replay(client.send, speed=2)
+
+Writing appends only, so a log of a crashed recorder is readable up to its
+last complete record and can be continued by a new :class:`Recorder`.
+"""
+import asyncio
+import dataclasses
+import importlib
+import inspect
+import json
+import mmap
+import os
+import struct
+import typing
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
+
+import api_codec
+import api_types
+
+MAGIC = b'NEWDATA-LOG\x00\x01'
+# payload length, schema id
+RECORD = struct.Struct('<IH')
+SCHEMA_RECORD = 0
+
+FLOAT = 'd'
+BOOL = '?'
+ENUM = 'H'
+JSON = 'j'
+
+# the modules of the recorded dataclasses, a schema names its class as ``module.name``
+MODULES = ('api_types', 'api_models')
+
+_dumps = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+_scan_once = json.JSONDecoder().scan_once
+
+
+def _field_code(tp) -> Tuple[str, Optional[type]]:
+    """storage code of a field type and its enum class"""
+    args = [a for a in typing.get_args(tp) if a is not type(None)]
+    if typing.get_origin(tp) is Union and len(args) == 1:
+        tp = args[0]
+    if tp in (float, int):
+        return FLOAT, None
+    if tp is bool:
+        return BOOL, None
+    if isinstance(tp, type) and issubclass(tp, Enum):
+        return ENUM, tp
+    return JSON, None
+
+
+def _to_json(value):
+    if isinstance(value, Enum):
+        return value.value
+    if value.__class__ in api_codec.ENCODERS:
+        # dataclasses and their slotted or lazy variants
+        return api_codec.to_dict(value)
+    if isinstance(value, list):
+        return [_to_json(v) for v in value]
+    return value
+
+
+def dataclass_of(cls: type) -> type:
+    """the ``api_types`` or ``api_models`` dataclass recorded for instances of ``cls``,
+    the slotted, frozen and lazy variants have the schema of their dataclass"""
+    data_cls = getattr(cls, 'DATACLASS', cls)
+    if data_cls.__module__ not in MODULES or not dataclasses.is_dataclass(data_cls):
+        raise TypeError(f'can not record {cls.__name__} messages')
+    if data_cls.__module__ == 'api_models':
+        # the encoders of nested api_models values
+        api_codec.load_models()
+    return data_cls
+
+
+def _json_prefix(text: str, count: int) -> List[Any]:
+    """the first ``count`` values of a json list written by ``_dumps``, the rest is not parsed"""
+    values = []
+    pos = 1
+    for _ in range(count):
+        value, pos = _scan_once(text, pos)
+        values.append(value)
+        # the separator (no whitespace in ``_dumps`` output)
+        pos += 1
+    return values
+
+
+def _class(name: str) -> type:
+    # logs of earlier versions name the api_types classes without module
+    module, _, cls_name = name.rpartition('.')
+    if module and module not in MODULES:
+        raise ValueError(f'unknown schema class {name}')
+    if module == 'api_models':
+        api_codec.load_models()
+    return getattr(importlib.import_module(module or 'api_types'), cls_name)
+
+
+class Schema:
+    """The record layout of one dataclass.
+
+    Fixed fields are packed behind a bitmask of the fields which are set,
+    the json fields follow as one json list (left out when all are ``None``).
+    ``pack`` and ``unpack`` are generated per schema, :meth:`reader` unpacks
+    only some of the fields.
+    """
+
+    def __init__(self, schema_id: int, cls: type, fields: List[Tuple[str, str, Optional[List[Any]]]]):
+        """
+        :param fields: ``(name, code, enum values)`` of each field
+        """
+        self.id = schema_id
+        self.cls = cls
+        self.fields = fields
+        self.fixed = [(name, code, values) for name, code, values in fields if code != JSON]
+        self.json = [name for name, code, _ in fields if code == JSON]
+        self.mask_code = 'B' if len(self.fixed) <= 8 else 'I' if len(self.fixed) <= 32 else 'Q'
+        self.struct = struct.Struct('<' + self.mask_code + ''.join(code for _, code, _ in self.fixed))
+        # payload position, mask bit and code of each fixed field
+        self.layout: Dict[str, Tuple[int, int, str]] = {}
+        for idx, (name, code, _) in enumerate(self.fixed):
+            codes = ''.join(c for _, c, _ in self.fixed[:idx])
+            self.layout[name] = (struct.calcsize('<' + self.mask_code + codes), idx, code)
+        self.pack, self.unpack = self._compile()
+        self._readers: Dict[Tuple[str, ...], Callable[[Any, int, int], Dict[str, Any]]] = {}
+
+    @classmethod
+    def of(cls, schema_id: int, data_cls: type) -> 'Schema':
+        hints = typing.get_type_hints(data_cls, vars(api_types))
+        fields = []
+        for field in dataclasses.fields(data_cls):
+            code, enum_cls = _field_code(hints[field.name])
+            fields.append((field.name, code, [m.value for m in enum_cls] if enum_cls is not None else None))
+        return cls(schema_id, data_cls, fields)
+
+    def to_json(self) -> bytes:
+        name = f'{self.cls.__module__}.{self.cls.__name__}'
+        return _dumps({'id': self.id, 'class': name, 'fields': self.fields}).encode()
+
+    @classmethod
+    def from_json(cls, data: bytes) -> 'Schema':
+        schema = json.loads(data)
+        return cls(schema['id'], _class(schema['class']), [tuple(f) for f in schema['fields']])
+
+    def reader(self, names: Iterable[str]) -> Callable[[Any, int, int], Dict[str, Any]]:
+        """``unpack`` of the fields ``names`` only, the json list is parsed up to the last of them"""
+        names = tuple(names)
+        read = self._readers.get(names)
+        if read is None:
+            read = self._readers[names] = self._reader(frozenset(names))
+        return read
+
+    def _reader(self, names: FrozenSet[str]) -> Callable[[Any, int, int], Dict[str, Any]]:
+        # (name, position in the unpacked tuple, mask bit, enum values) of the fixed fields
+        fixed = [(name, idx + 1, 1 << idx, values) for idx, (name, _, values) in enumerate(self.fixed) if name in names]
+        count = max((idx + 1 for idx, name in enumerate(self.json) if name in names), default=0)
+        json_names = self.json[:count]
+        unpack_from = self.struct.unpack_from
+        size = self.struct.size
+
+        def read(buffer, start: int, end: int) -> Dict[str, Any]:
+            row = unpack_from(buffer, start)
+            data = {}
+            for name, pos, bit, values in fixed:
+                if row[0] & bit:
+                    data[name] = row[pos] if values is None else values[row[pos]]
+            if count and start + size < end:
+                for name, value in zip(json_names, _json_prefix(bytes(buffer[start + size : end]).decode(), count)):
+                    if value is not None and name in names:
+                        data[name] = value
+            return data
+
+        return read
+
+    def _compile(self):
+        namespace: Dict[str, Any] = {
+            '_pack': self.struct.pack,
+            '_unpack_from': self.struct.unpack_from,
+            '_dumps': _dumps,
+            '_loads': json.loads,
+            '_to_json': _to_json,
+            '_json_names': self.json,
+        }
+        fixed_vars = [f'v{idx}' for idx in range(len(self.fixed))]
+        pack = ['def pack(msg):', '    mask = 0']
+        unpack = [
+            'def unpack(buffer, start, end):',
+            f'    mask, {"".join(v + ", " for v in fixed_vars)}= _unpack_from(buffer, start)',
+            '    data = {}',
+        ]
+        for idx, (name, code, values) in enumerate(self.fixed):
+            var = fixed_vars[idx]
+            pack += [f'    {var} = msg.{name}', f'    if {var} is None:', f'        {var} = {code == BOOL}']
+            pack += ['    else:', f'        mask |= {1 << idx}']
+            unpack += [f'    if mask & {1 << idx}:']
+            if code == ENUM:
+                # enum members and plain values map to the index of the value
+                index = {value: i for i, value in enumerate(values)}
+                for member in self._enum_members(name):
+                    if member.value in index:
+                        index[member] = index[member.value]
+                namespace[f'_index{idx}'] = index
+                namespace[f'_values{idx}'] = values
+                pack += [f'        {var} = _index{idx}[{var}]']
+                unpack += [f'        data[{name!r}] = _values{idx}[{var}]']
+            else:
+                unpack += [f'        data[{name!r}] = {var}']
+        pack += [f'    fixed = _pack(mask, {", ".join(fixed_vars)})']
+        if self.json:
+            json_vars = ', '.join(f'msg.{name}' for name in self.json)
+            pack += [f'    variable = ({json_vars},)', '    if variable.count(None) == len(variable):', '        return fixed']
+            pack += ['    return fixed + _dumps([_to_json(v) for v in variable]).encode()']
+            unpack += [
+                f'    start += {self.struct.size}',
+                '    if start < end:',
+                '        for name, value in zip(_json_names, _loads(bytes(buffer[start:end]))):',
+                '            if value is not None:',
+                '                data[name] = value',
+            ]
+        else:
+            pack += ['    return fixed']
+        unpack += ['    return data']
+        exec('\n'.join(pack + unpack), namespace)
+        return namespace['pack'], namespace['unpack']
+
+    def _enum_members(self, name: str) -> List[Enum]:
+        hint = typing.get_type_hints(self.cls, vars(api_types))[name]
+        enum_cls = next(a for a in (hint, *typing.get_args(hint)) if isinstance(a, type) and issubclass(a, Enum))
+        return list(enum_cls)
+
+
+class Recorder:
+    def __init__(self, path: Union[str, os.PathLike], buffering: int = 1 << 16):
+        """
+        :param path: the log, an existing log is continued
+        """
+        self.path = path
+        self.schemas: Dict[type, Schema] = {}
+        # the schema of each message class, variants included
+        self._class_schemas: Dict[type, Schema] = {}
+        self.count = 0
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with SessionLog(path) as log:
+                for _ in log.records():
+                    pass
+                self.schemas = {schema.cls: schema for schema in log.schemas.values()}
+                valid_size = log.end
+            self.file = open(path, 'r+b', buffering)
+            # drop a truncated last record
+            self.file.truncate(valid_size)
+            self.file.seek(valid_size)
+        else:
+            self.file = open(path, 'wb', buffering)
+            self.file.write(MAGIC)
+
+    def __enter__(self) -> 'Recorder':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _schema(self, cls: type) -> Schema:
+        schema = self.schemas.get(cls)
+        if schema is None:
+            schema = Schema.of(len(self.schemas) + 1, cls)
+            self._write(SCHEMA_RECORD, schema.to_json())
+            self.schemas[cls] = schema
+        return schema
+
+    def _write(self, schema_id: int, payload: bytes):
+        self.file.write(RECORD.pack(len(payload), schema_id))
+        self.file.write(payload)
+
+    def write(self, msg: Any):
+        """Append a message, dicts (raw payloads) are decoded with ``api_codec.decode``."""
+        if msg.__class__ is dict:
+            msg = api_codec.decode(msg)
+        schema = self._class_schemas.get(msg.__class__)
+        if schema is None:
+            schema = self._class_schemas[msg.__class__] = self._schema(dataclass_of(msg.__class__))
+        self._write(schema.id, schema.pack(msg))
+        self.count += 1
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+class SessionLog:
+    """Read access to a log, the file is memory mapped and decoded lazily."""
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = path
+        self.schemas: Dict[int, Schema] = {}
+        # end of the last complete record
+        self.end = len(MAGIC)
+        self._file = open(path, 'rb')
+        size = os.path.getsize(path)
+        self.buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        if self.buffer[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f'{path} is no session log')
+
+    def __enter__(self) -> 'SessionLog':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        self._file.close()
+
+    def records(self) -> Iterator[Tuple[int, Schema, int, int]]:
+        """``(offset, schema, payload start, payload end)`` of all message records"""
+        buffer = self.buffer
+        size = len(buffer)
+        offset = len(MAGIC)
+        while offset + RECORD.size <= size:
+            length, schema_id = RECORD.unpack_from(buffer, offset)
+            start = offset + RECORD.size
+            end = start + length
+            if end > size:
+                break
+            if schema_id == SCHEMA_RECORD:
+                schema = Schema.from_json(buffer[start:end])
+                self.schemas[schema.id] = schema
+            else:
+                yield offset, self.schemas[schema_id], start, end
+            offset = end
+            self.end = end
+
+    def read(self, offset: int, decode: bool = True) -> Any:
+        """the message of the record at ``offset`` (as returned by ``records``)"""
+        length, schema_id = RECORD.unpack_from(self.buffer, offset)
+        start = offset + RECORD.size
+        if schema_id not in self.schemas:
+            for _ in self.records():
+                pass
+        return self._message(self.schemas[schema_id], start, start + length, decode)
+
+    def _message(self, schema: Schema, start: int, end: int, decode: bool) -> Any:
+        data = schema.unpack(self.buffer, start, end)
+        return api_codec.decode_as(schema.cls, data) if decode else data
+
+    def messages(self, decode: bool = True) -> Iterator[Any]:
+        """all messages in order, as ``api_types`` dataclasses or as wire dicts"""
+        for _, schema, start, end in self.records():
+            yield self._message(schema, start, end, decode)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.messages()
+
+    async def replay(
+        self,
+        send: Callable[[Any], Optional[Awaitable[Any]]],
+        speed: Optional[float] = 1,
+        decode: bool = False,
+    ) -> int:
+        """Pass all messages to ``send`` (e.g. ``AsyncSocketClient.send``) with
+        the spacing of their ``time_stamp`` divided by ``speed``, as fast as
+        possible when ``speed`` is ``None``. Returns the number of messages."""
+        loop = asyncio.get_event_loop()
+        started = loop.time()
+        first: Optional[float] = None
+        count = 0
+        for msg in self.messages(decode):
+            ts = getattr(msg, 'time_stamp', None) if decode else msg.get('time_stamp')
+            if speed and ts is not None:
+                if first is None:
+                    first = ts
+                delay = started + (ts - first) / speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            result = send(msg)
+            if inspect.isawaitable(result):
+                await result
+            count += 1
+        return count
+
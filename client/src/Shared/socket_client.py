@@ -0,0 +1,358 @@
+"""Asyncio client for the socket.io protocol of ``SocketEvents``.
+
+::
+
+    client = AsyncSocketClient('FooBar')
+    await client.connect('http://localhost:5000')
+    async for msg in client.stream(DataType.GYRO):
+        print(msg.alpha)
+
+Incoming ``new_data`` messages are decoded with ``api_codec`` (only when a
+subscriber for their type exists) and fanned out to bounded per type queues.
+A slow subscriber drops its oldest messages instead of delaying everybody
+else. A subscriber with a ``downsampler.Downsampler`` receives its aggregates
+of the sensor messages instead. Outgoing messages go through a bounded send
+queue, ``send`` waits when it is full.
+
+The socket.io connection itself is made by a transport, by default
+:class:`SocketIoTransport` (needs ``python-socketio[asyncio_client]``, use a
+version speaking the socket.io 2 protocol of the server). The
+``local_server.LocalTransport`` connects to an in-process stand-in server.
+"""
+import asyncio
+import inspect
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Union
+
+import api_codec
+from api_types import AllDataMsg, DataType, Device, DevicesPkg, InputResponseMsg, SocketEvents
+from asset_store import ASSETS, GET_ASSETS, AssetStore
+from downsampler import Downsampler
+
+QUEUE_SIZE = 256
+SEND_QUEUE_SIZE = 1024
+# seconds ``close`` waits for the queued messages to be sent
+CLOSE_TIMEOUT = 5
+# the room receiving the ``new_data`` of all devices, not (yet) part of api_types
+GLOBAL_LISTENER_ROOM = 'GLOBAL_LISTENER'
+
+# events the client registers its own transport handlers for
+_HANDLED_EVENTS = frozenset(
+    [
+        'connect',
+        SocketEvents.DEVICE.value,
+        SocketEvents.DEVICES.value,
+        SocketEvents.NEW_DATA.value,
+        SocketEvents.ALL_DATA.value,
+        ASSETS,
+    ]
+)
+
+
+def time_stamp() -> float:
+    return time.time()
+
+
+def _decode(data: dict) -> Any:
+    try:
+        return api_codec.decode(data)
+    except api_codec.DecodeError:
+        return data
+
+
+class SocketIoTransport:
+    """Transport backed by ``socketio.AsyncClient``."""
+
+    def __init__(self, **client_options):
+        try:
+            import socketio
+        except ImportError as err:
+            raise ImportError(
+                'SocketIoTransport requires python-socketio, install it with '
+                "'pip install \"python-socketio[asyncio_client]<5\"'"
+            ) from err
+        self.client = socketio.AsyncClient(**client_options)
+
+    @property
+    def sid(self) -> Optional[str]:
+        return self.client.sid
+
+    @property
+    def connected(self) -> bool:
+        return self.client.connected
+
+    def on(self, event: str, handler: Callable[[Any], Any]):
+        async def call(*args):
+            result = handler(args[0] if args else None)
+            if inspect.isawaitable(result):
+                await result
+
+        self.client.on(event, call)
+
+    async def connect(self, url: str):
+        await self.client.connect(url, transports=['websocket'])
+
+    async def disconnect(self):
+        await self.client.disconnect()
+
+    async def emit(self, event: str, data: Any = None):
+        await self.client.emit(event, data)
+
+
+class Subscription:
+    """Bounded queue of the messages of one type, iterate it with ``async for``."""
+
+    def __init__(self, client: 'AsyncSocketClient', msg_type: str, maxsize: int, downsampler: Optional[Downsampler] = None):
+        self.client = client
+        self.type = msg_type
+        self.downsampler = downsampler
+        self.queue: 'asyncio.Queue[Any]' = asyncio.Queue(maxsize)
+        self.dropped = 0
+
+    def put(self, msg: Any):
+        if self.queue.full():
+            # keep latency bounded: the oldest message is the least interesting one
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(msg)
+
+    async def get(self) -> Any:
+        return await self.queue.get()
+
+    def close(self):
+        self.client._unsubscribe(self)
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self
+
+    async def __anext__(self) -> Any:
+        return await self.queue.get()
+
+
+class AsyncSocketClient:
+    def __init__(
+        self,
+        device_id: str,
+        transport=None,
+        is_client: bool = False,
+        queue_size: int = QUEUE_SIZE,
+        send_queue_size: int = SEND_QUEUE_SIZE,
+        assets: Optional[AssetStore] = None,
+    ):
+        self.device_id = device_id
+        self.is_client = is_client
+        self.transport = transport if transport is not None else SocketIoTransport()
+        self.device: Optional[Device] = None
+        self.devices: Optional[DevicesPkg] = None
+        self.queue_size = queue_size
+        # the playground config assets fetched so far, kept across reconnects
+        self.assets = assets if assets is not None else AssetStore()
+        self.subscriptions: Dict[str, Set[Subscription]] = {}
+        self.handlers: Dict[str, List[Callable[[Any], Any]]] = {}
+        self._device_ready: Optional[asyncio.Future] = None
+        # keyed by the ``time_stamp`` of the prompt, which the ``input_response`` repeats: the
+        # ``response_id`` index.ts adds is the socket id of the prompting client, the same for all its prompts
+        self._pending_responses: Dict[float, asyncio.Future] = {}
+        self._pending_all_data: Dict[str, List[asyncio.Future]] = {}
+        self._pending_assets: Dict[float, asyncio.Future] = {}
+        self._send_queue: 'asyncio.Queue[tuple]' = asyncio.Queue(send_queue_size)
+        self._sender: Optional[asyncio.Task] = None
+        for event, handler in [
+            ('connect', self._on_connect),
+            (SocketEvents.DEVICE.value, self._on_device),
+            (SocketEvents.DEVICES.value, self._on_devices),
+            (SocketEvents.NEW_DATA.value, self._on_new_data),
+            (SocketEvents.ALL_DATA.value, self._on_all_data),
+            (ASSETS, self._on_assets),
+        ]:
+            self.transport.on(event, handler)
+
+    @property
+    def device_nr(self) -> Optional[float]:
+        return self.device.device_nr if self.device is not None else None
+
+    async def connect(self, url: Optional[str] = None, timeout: Optional[float] = 10) -> Device:
+        """Connect and register as ``device_id``, returns the assigned ``Device``."""
+        self._device_ready = asyncio.get_event_loop().create_future()
+        await self.transport.connect(url)
+        if self._sender is None:
+            self._sender = asyncio.ensure_future(self._send_loop())
+        return await asyncio.wait_for(asyncio.shield(self._device_ready), timeout)
+
+    async def close(self, timeout: Optional[float] = CLOSE_TIMEOUT):
+        """Send the queued messages (for up to ``timeout`` seconds) and disconnect,
+        messages still queued then or queued while disconnected are dropped."""
+        if self._sender is not None and not self._sender.done() and self.transport.connected:
+            try:
+                await asyncio.wait_for(self._send_queue.join(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        if self._sender is not None:
+            self._sender.cancel()
+            self._sender = None
+        while not self._send_queue.empty():
+            self._send_queue.get_nowait()
+            self._send_queue.task_done()
+        await self.transport.disconnect()
+
+    # receiving
+
+    def on(self, event: Union[SocketEvents, str], handler: Callable[[Any], Any]):
+        """register a handler for the raw payloads of any event"""
+        event = getattr(event, 'value', event)
+        if event not in self.handlers and event not in _HANDLED_EVENTS:
+            self.transport.on(event, lambda data: self._call_handlers(event, data))
+        self.handlers.setdefault(event, []).append(handler)
+
+    def subscribe(
+        self, msg_type: Union[DataType, str], maxsize: Optional[int] = None, downsampler: Optional[Downsampler] = None
+    ) -> Subscription:
+        msg_type = getattr(msg_type, 'value', msg_type)
+        subscription = Subscription(self, msg_type, maxsize or self.queue_size, downsampler)
+        self.subscriptions.setdefault(msg_type, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription):
+        self.subscriptions.get(subscription.type, set()).discard(subscription)
+
+    async def stream(
+        self, msg_type: Union[DataType, str], maxsize: Optional[int] = None, downsampler: Optional[Downsampler] = None
+    ) -> AsyncIterator[Any]:
+        """async iterator over the decoded messages of ``msg_type`` (or their aggregates by ``downsampler``)"""
+        subscription = self.subscribe(msg_type, maxsize, downsampler)
+        try:
+            async for msg in subscription:
+                yield msg
+        finally:
+            subscription.close()
+
+    async def _call_handlers(self, event: str, data: Any):
+        for handler in self.handlers.get(event, ()):
+            result = handler(data)
+            if inspect.isawaitable(result):
+                await result
+
+    async def _on_connect(self, _data):
+        # (re)register after every (re)connect
+        await self.transport.emit(
+            SocketEvents.NEW_DEVICE.value,
+            {'device_id': self.device_id, 'is_client': self.is_client, 'time_stamp': time_stamp()},
+        )
+
+    async def _on_device(self, data: dict):
+        self.device = api_codec.decode_as(Device, data)
+        if self._device_ready is not None and not self._device_ready.done():
+            self._device_ready.set_result(self.device)
+        await self._call_handlers(SocketEvents.DEVICE.value, data)
+
+    async def _on_devices(self, data: dict):
+        self.devices = api_codec.decode_as(DevicesPkg, data)
+        await self._call_handlers(SocketEvents.DEVICES.value, data)
+
+    async def _on_all_data(self, data: dict):
+        for future in self._pending_all_data.pop(data.get('device_id'), ()):
+            if not future.done():
+                future.set_result(api_codec.decode_as(AllDataMsg, data))
+        await self._call_handlers(SocketEvents.ALL_DATA.value, data)
+
+    async def _on_assets(self, data: dict):
+        future = self._pending_assets.pop(data.get('time_stamp'), None)
+        if future is not None and not future.done():
+            future.set_result(data.get('assets') or {})
+        await self._call_handlers(ASSETS, data)
+
+    async def _on_new_data(self, data: dict):
+        msg_type = data.get('type')
+        if msg_type == DataType.INPUT_RESPONSE.value:
+            future = self._pending_responses.pop(data.get('time_stamp'), None)
+            if future is not None and not future.done():
+                future.set_result(api_codec.decode_as(InputResponseMsg, data))
+        subscriptions = self.subscriptions.get(msg_type)
+        if subscriptions:
+            msg = None
+            for subscription in subscriptions:
+                if subscription.downsampler is not None:
+                    for aggregate in subscription.downsampler.push(data):
+                        subscription.put(_decode(aggregate))
+                    continue
+                if msg is None:
+                    msg = _decode(data)
+                subscription.put(msg)
+        await self._call_handlers(SocketEvents.NEW_DATA.value, data)
+
+    # sending
+
+    def _payload(self, data: Any) -> dict:
+        if data.__class__ is not dict:
+            data = api_codec.to_dict(data)
+        payload = {'device_id': self.device_id, 'device_nr': self.device_nr, 'time_stamp': time_stamp()}
+        payload.update((key, value) for key, value in data.items() if value is not None)
+        return payload
+
+    async def send(self, data: Any, event: Union[SocketEvents, str] = SocketEvents.NEW_DATA):
+        """Queue a message, waits while the send queue is full. Missing ``device_id``,
+        ``device_nr`` and ``time_stamp`` fields are filled in."""
+        await self._send_queue.put((getattr(event, 'value', event), self._payload(data)))
+
+    def send_nowait(self, data: Any, event: Union[SocketEvents, str] = SocketEvents.NEW_DATA):
+        """Queue a message, raises ``asyncio.QueueFull`` when the send queue is full."""
+        self._send_queue.put_nowait((getattr(event, 'value', event), self._payload(data)))
+
+    async def _send_loop(self):
+        while True:
+            event, payload = await self._send_queue.get()
+            try:
+                await self.transport.emit(event, payload)
+            finally:
+                self._send_queue.task_done()
+
+    # requests
+
+    async def input_prompt(
+        self,
+        question: str,
+        input_type: Optional[str] = None,
+        options: Optional[List[str]] = None,
+        unicast_to: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> InputResponseMsg:
+        """Ask ``question`` and wait for the ``input_response``."""
+        ts = time_stamp()
+        while ts in self._pending_responses:
+            # the time stamp identifies the response
+            ts += 1e-6
+        future = asyncio.get_event_loop().create_future()
+        self._pending_responses[ts] = future
+        msg = {'type': DataType.INPUT_PROMPT.value, 'question': question, 'time_stamp': ts}
+        for key, value in (('input_type', input_type), ('options', options), ('unicast_to', unicast_to)):
+            if value is not None:
+                msg[key] = value
+        try:
+            await self.send(msg)
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending_responses.pop(ts, None)
+
+    async def get_all_data(self, device_id: Optional[str] = None, timeout: Optional[float] = 10) -> AllDataMsg:
+        device_id = device_id or self.device_id
+        future = asyncio.get_event_loop().create_future()
+        self._pending_all_data.setdefault(device_id, []).append(future)
+        await self.send({'device_id': device_id}, SocketEvents.GET_ALL_DATA)
+        return await asyncio.wait_for(future, timeout)
+
+    async def fetch_assets(self, msg: dict, timeout: Optional[float] = 10) -> dict:
+        """A stored ``playground_config`` message (as in ``all_data`` of a server with an
+        asset store) with its asset bodies, only the bodies not in ``assets`` are requested."""
+        missing = self.assets.missing(msg)
+        if missing:
+            ts = time_stamp()
+            while ts in self._pending_assets:
+                ts += 1e-6
+            future = asyncio.get_event_loop().create_future()
+            self._pending_assets[ts] = future
+            try:
+                await self.send({'digests': missing, 'time_stamp': ts}, GET_ASSETS)
+                self.assets.update(await asyncio.wait_for(future, timeout))
+            finally:
+                self._pending_assets.pop(ts, None)
+        return self.assets.resolve(msg)
@@ -0,0 +1,127 @@
+"""Batching of outgoing sprite updates.
+
+Instead of one ``sprite`` message per sprite and tick, the updates of a frame
+window are collected, repeated updates of the same ``Sprite.id`` are merged
+(the last writer of each field wins) and the window is sent as a single
+``sprites`` message::
+
+    batcher = SpriteBatcher(client, window=1 / 30)
+    batcher.update(Sprite(id='ball', pos_x=10, pos_y=20))
+    batcher.update({'id': 'ball', 'pos_x': 11})
+    # -> one sprites message with {'id': 'ball', 'pos_x': 11, 'pos_y': 20}
+"""
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+import api_codec
+from api_types import DataType, Sprite
+
+FRAME_WINDOW = 1 / 60
+
+
+@dataclass
+class BatchStats:
+    # sprite updates passed to the batcher
+    updates: int = 0
+    # sprites sent after coalescing
+    sprites_sent: int = 0
+    # ``sprites`` messages sent
+    messages_sent: int = 0
+    latency_total: float = 0
+    latency_max: float = 0
+
+    @property
+    def messages_saved(self) -> int:
+        """messages saved compared to one ``sprite`` message per update"""
+        return self.updates - self.messages_sent
+
+    @property
+    def coalesced(self) -> int:
+        """updates merged into a pending update of the same sprite"""
+        return self.updates - self.sprites_sent
+
+    @property
+    def latency_mean(self) -> float:
+        """mean time in seconds from the first update of a frame until its message was sent"""
+        return self.latency_total / self.messages_sent if self.messages_sent else 0
+
+
+class SpriteBatcher:
+    def __init__(self, client, window: float = FRAME_WINDOW, max_sprites: Optional[int] = None):
+        """
+        :param client: anything with an ``async send(data)`` method, e.g. ``AsyncSocketClient``
+        :param window: seconds to collect updates before they are flushed
+        :param max_sprites: flush early when this many distinct sprites are pending
+        """
+        self.client = client
+        self.window = window
+        self.max_sprites = max_sprites
+        self.stats = BatchStats()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._frame_start: Optional[float] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # the background flush in flight and whether it has to flush once more
+        self._flushing: Optional[asyncio.Future] = None
+        self._flush_requested = False
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def update(self, sprite: Union[Sprite, Dict[str, Any]]):
+        """Queue a sprite upsert, fields which are ``None`` are not sent."""
+        if sprite.__class__ is not dict:
+            sprite = api_codec.to_dict(sprite)
+        self.stats.updates += 1
+        prev = self._pending.get(sprite['id'])
+        if prev is None:
+            self._pending[sprite['id']] = dict(sprite)
+        else:
+            prev.update(sprite)
+        if self._timer is None:
+            loop = asyncio.get_event_loop()
+            self._frame_start = loop.time()
+            self._timer = loop.call_later(self.window, self._schedule_flush)
+        if self.max_sprites is not None and len(self._pending) >= self.max_sprites:
+            self._schedule_flush()
+
+    async def remove(self, sprite_id: str):
+        """Drop pending updates of ``sprite_id`` and send a ``remove_sprite`` message."""
+        self._pending.pop(sprite_id, None)
+        await self.client.send({'type': DataType.REMOVE_SPRITE.value, 'id': sprite_id})
+
+    def _schedule_flush(self):
+        self._flush_requested = True
+        if self._flushing is None or self._flushing.done():
+            self._flushing = asyncio.ensure_future(self._flush_requests())
+
+    async def _flush_requests(self):
+        """flush until no flush was requested while sending, at most one runs at a time"""
+        while self._flush_requested:
+            self._flush_requested = False
+            await self._send()
+
+    async def flush(self):
+        """Send the pending updates as one ``sprites`` message, after the flush in flight."""
+        self._schedule_flush()
+        await self._flushing
+
+    async def _send(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        sprites = list(self._pending.values())
+        frame_start = self._frame_start
+        self._pending = {}
+        await self.client.send({'type': DataType.SPRITES.value, 'sprites': sprites})
+        latency = asyncio.get_event_loop().time() - frame_start
+        self.stats.messages_sent += 1
+        self.stats.sprites_sent += len(sprites)
+        self.stats.latency_total += latency
+        self.stats.latency_max = max(self.stats.latency_max, latency)
+
+    async def close(self):
+        """wait for the flush in flight, then send what is still pending"""
+        await self.flush()
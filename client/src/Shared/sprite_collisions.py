@@ -0,0 +1,325 @@
+"""Collision detection of sprites on a uniform grid.
+
+The browser (``Playground.update``) compares every sprite with
+``collision_detection`` against all other sprites on every tick. Here the
+sprites are hashed into grid cells of ``cell_size`` playground units and only
+sprites which moved since the last :meth:`CollisionGrid.detect` are compared,
+and only with the sprites sharing a cell. The reported ``sprite_collision``
+messages follow ``Sprite.reportCollisions``: one ``in`` when two sprites start
+to overlap and one ``out`` when they stop (or one of them was removed), for
+every pair with at least one ``collision_detection`` sprite::
+
+    grid = CollisionGrid()
+    grid.apply(msg)  # sprite, sprites, remove_sprite, ...
+    grid.move_many(physics.ids, physics.column('x'), physics.column('y'))
+    for event in grid.detect(time_stamp):
+        client.send_nowait(event)
+
+Like the browser, overlaps are tested on the bounding boxes, ``form`` only
+changes the default anchor. Sprites covering more than ``max_cells`` cells
+are not hashed but compared with all sprites, sprites with a non-finite
+position or size overlap nothing.
+"""
+import math
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import api_codec
+from api_types import DataType, Overlap, SpriteForm
+
+CELL_SIZE = 10
+MAX_CELLS = 64
+
+SPRITE = DataType.SPRITE.value
+SPRITES = DataType.SPRITES.value
+REMOVE_SPRITE = DataType.REMOVE_SPRITE.value
+SPRITE_COLLISION = DataType.SPRITE_COLLISION.value
+# not (yet) part of api_types.DataType
+CLEAN_PLAYGROUND = 'clean_playground'
+
+_Cells = Tuple[int, int, int, int]
+# the empty cell range of the sprites in ``CollisionGrid.large``
+_LARGE: _Cells = (0, 0, -1, -1)
+
+
+class _Body:
+    __slots__ = ('id', 'seq', 'x', 'y', 'width', 'height', 'anchor_x', 'anchor_y', 'collision_detection', 'cells')
+
+    def __init__(self, sprite_id: str, seq: int):
+        self.id = sprite_id
+        self.seq = seq
+        self.x = 0.0
+        self.y = 0.0
+        self.width = 5.0
+        self.height = 5.0
+        self.anchor_x = 0.0
+        self.anchor_y = 0.0
+        self.collision_detection = False
+        self.cells: Optional[_Cells] = None
+
+    @property
+    def left(self) -> float:
+        return self.x - self.anchor_x * self.width
+
+    @property
+    def right(self) -> float:
+        return self.x + (1 - self.anchor_x) * self.width
+
+    @property
+    def bottom(self) -> float:
+        return self.y - self.anchor_y * self.height
+
+    @property
+    def top(self) -> float:
+        return self.y + (1 - self.anchor_y) * self.height
+
+    def overlaps(self, other: '_Body') -> bool:
+        """``BoundingBox.hasOverlap``, touching edges do not overlap"""
+        return self.right > other.left and self.left < other.right and self.top > other.bottom and self.bottom < other.top
+
+    def position(self) -> Dict[str, Any]:
+        return {'id': self.id, 'collision_detection': self.collision_detection, 'pos_x': self.x, 'pos_y': self.y}
+
+
+class CollisionGrid:
+    def __init__(self, cell_size: float = CELL_SIZE, max_cells: int = MAX_CELLS):
+        """
+        :param cell_size: edge length of a grid cell, about the size of a typical sprite
+        :param max_cells: sprites covering more cells are compared with all sprites instead
+        """
+        self.cell_size = cell_size
+        self.max_cells = max_cells
+        self.bodies: Dict[str, _Body] = {}
+        self.cells: Dict[Tuple[int, int], Set[str]] = {}
+        self.large: Set[str] = set()
+        # the current overlaps of each sprite (symmetric) with the number of
+        # their ``in`` message, ``out`` messages follow the same order
+        self.overlaps: Dict[str, Dict[str, int]] = {}
+        self._dirty: Set[str] = set()
+        # (first, second, number) of pairs ended by a removal, with a body snapshot
+        self._removed: List[Tuple[_Body, _Body, int]] = []
+        self._next_seq = 0
+        self._next_in = 0
+
+    def __len__(self) -> int:
+        return len(self.bodies)
+
+    def __contains__(self, sprite_id: str) -> bool:
+        return sprite_id in self.bodies
+
+    # messages
+
+    def apply(self, msg: Union[dict, object]):
+        """apply a message received by the playground, other types are ignored"""
+        if msg.__class__ is not dict:
+            msg = api_codec.to_dict(msg)
+        msg_type = msg.get('type')
+        if msg_type == SPRITE:
+            self.upsert(msg['sprite'])
+        elif msg_type == SPRITES:
+            for sprite in msg['sprites']:
+                self.upsert(sprite)
+        elif msg_type == REMOVE_SPRITE:
+            self.remove(msg['id'])
+        elif msg_type in (CLEAN_PLAYGROUND, DataType.CLEAR_PLAYGROUND.value):
+            self.clear()
+
+    def upsert(self, sprite: Union[Dict[str, Any], object]):
+        """add a sprite or merge the geometry fields of an update"""
+        if sprite.__class__ is not dict:
+            sprite = api_codec.to_dict(sprite)
+        body = self.bodies.get(sprite['id'])
+        if body is None:
+            body = _Body(sprite['id'], self._next_seq)
+            self._next_seq += 1
+            self.bodies[body.id] = body
+            if sprite.get('anchor') is None and sprite.get('form') == SpriteForm.ROUND.value:
+                body.anchor_x = body.anchor_y = 0.5
+        for key, attr in (('pos_x', 'x'), ('pos_y', 'y'), ('width', 'width'), ('height', 'height')):
+            if sprite.get(key) is not None:
+                setattr(body, attr, sprite[key])
+        anchor = sprite.get('anchor')
+        if anchor is not None and len(anchor) == 2:
+            body.anchor_x, body.anchor_y = anchor
+        if sprite.get('collision_detection') is not None and sprite['collision_detection'] != body.collision_detection:
+            body.collision_detection = sprite['collision_detection']
+            if not body.collision_detection:
+                self._drop_undetected(body)
+        self._rehash(body)
+
+    def move(self, sprite_id: str, x: float, y: float):
+        body = self.bodies.get(sprite_id)
+        if body is not None and (body.x != x or body.y != y):
+            body.x = x
+            body.y = y
+            self._rehash(body)
+
+    def move_many(self, sprite_ids: Iterable[str], xs: Iterable[float], ys: Iterable[float]):
+        """move many sprites, e.g. with the ``ids`` and position columns of ``SpritePhysics``"""
+        bodies = self.bodies
+        for sprite_id, x, y in zip(sprite_ids, xs, ys):
+            body = bodies.get(sprite_id)
+            if body is not None and (body.x != x or body.y != y):
+                body.x = float(x)
+                body.y = float(y)
+                self._rehash(body)
+
+    def remove(self, sprite_id: str) -> bool:
+        body = self.bodies.pop(sprite_id, None)
+        if body is None:
+            return False
+        self._unhash(body)
+        self._dirty.discard(sprite_id)
+        for other_id, number in self.overlaps.pop(sprite_id, {}).items():
+            other = self.bodies[other_id]
+            del self.overlaps[other_id][sprite_id]
+            # only a remaining collision detected sprite notices the removal
+            if other.collision_detection:
+                self._removed.append((other, _snapshot(body), number))
+        return True
+
+    def clear(self):
+        """remove all sprites, no ``out`` messages are reported"""
+        self.bodies = {}
+        self.cells = {}
+        self.large = set()
+        self.overlaps = {}
+        self._dirty = set()
+        self._removed = []
+
+    # hashing
+
+    def _cell_range(self, body: _Body) -> Optional[_Cells]:
+        """the cells covered by ``body``, ``_LARGE`` for more than ``max_cells`` and ``None`` when it is not finite"""
+        left, bottom, right, top = body.left, body.bottom, body.right, body.top
+        if not (math.isfinite(left) and math.isfinite(bottom) and math.isfinite(right) and math.isfinite(top)):
+            return None
+        size = self.cell_size
+        x0, y0 = math.floor(left / size), math.floor(bottom / size)
+        x1, y1 = math.floor(right / size), math.floor(top / size)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > self.max_cells:
+            return _LARGE
+        return x0, y0, x1, y1
+
+    def _rehash(self, body: _Body):
+        self._dirty.add(body.id)
+        cells = self._cell_range(body)
+        if cells == body.cells:
+            return
+        self._unhash(body)
+        body.cells = cells
+        if cells is None:
+            return
+        if cells is _LARGE:
+            self.large.add(body.id)
+            return
+        x0, y0, x1, y1 = cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                members = self.cells.get((cx, cy))
+                if members is None:
+                    self.cells[(cx, cy)] = {body.id}
+                else:
+                    members.add(body.id)
+
+    def _unhash(self, body: _Body):
+        if body.cells is None:
+            return
+        self.large.discard(body.id)
+        x0, y0, x1, y1 = body.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                members = self.cells[(cx, cy)]
+                members.discard(body.id)
+                if not members:
+                    del self.cells[(cx, cy)]
+        body.cells = None
+
+    def _neighbours(self, body: _Body) -> Set[str]:
+        if body.cells is None:
+            return set()
+        if body.cells is _LARGE:
+            found = set(self.bodies)
+            found.discard(body.id)
+            return found
+        found = set(self.large)
+        x0, y0, x1, y1 = body.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                found |= self.cells[(cx, cy)]
+        found.discard(body.id)
+        return found
+
+    def _drop_undetected(self, body: _Body):
+        # pairs of two sprites without collision detection are not tracked
+        for other_id in list(self.overlaps.get(body.id, ())):
+            if not self.bodies[other_id].collision_detection:
+                del self.overlaps[body.id][other_id]
+                del self.overlaps[other_id][body.id]
+
+    # detection
+
+    def detect(self, time_stamp: float) -> List[Dict[str, Any]]:
+        """Compare the moved sprites with their neighbours, returns the
+        ``sprite_collision`` messages in the order the browser sends them."""
+        bodies = self.bodies
+        started: Set[Tuple[str, str]] = set()
+        ended: Set[Tuple[str, str]] = set()
+        for sprite_id in self._dirty:
+            body = bodies[sprite_id]
+            current = self.overlaps.get(sprite_id, {})
+            for other_id in self._neighbours(body).union(current):
+                other = bodies[other_id]
+                if not (body.collision_detection or other.collision_detection):
+                    continue
+                pair = _pair(body, other)
+                if body.cells is not None and other.cells is not None and body.overlaps(other):
+                    if other_id not in current:
+                        started.add(pair)
+                elif other_id in current:
+                    ended.add(pair)
+        self._dirty = set()
+
+        # (first, in before out, second or number of the in message, message)
+        events: List[Tuple[int, int, int, Dict[str, Any]]] = []
+        for first, second, number in self._removed:
+            events.append((first.seq, 1, number, _message(first, second, Overlap.OUT, time_stamp)))
+        self._removed = []
+        for first_id, second_id in ended:
+            first, second = bodies[first_id], bodies[second_id]
+            number = self.overlaps[first_id].pop(second_id)
+            del self.overlaps[second_id][first_id]
+            events.append((first.seq, 1, number, _message(first, second, Overlap.OUT, time_stamp)))
+        for first_id, second_id in started:
+            first, second = bodies[first_id], bodies[second_id]
+            events.append((first.seq, 0, second.seq, _message(first, second, Overlap.IN, time_stamp)))
+        events.sort(key=lambda event: event[:3])
+        for _, out, _, msg in events:
+            if not out:
+                first_id, second_id = msg['sprites'][0]['id'], msg['sprites'][1]['id']
+                self.overlaps.setdefault(first_id, {})[second_id] = self._next_in
+                self.overlaps.setdefault(second_id, {})[first_id] = self._next_in
+                self._next_in += 1
+        return [event[3] for event in events]
+
+
+def _pair(a: _Body, b: _Body) -> Tuple[str, str]:
+    """the pair ordered like the browser reports it: the first collision detected sprite in list order leads"""
+    if a.collision_detection and (a.seq < b.seq or not b.collision_detection):
+        return a.id, b.id
+    return b.id, a.id
+
+
+def _snapshot(body: _Body) -> _Body:
+    copy = _Body(body.id, body.seq)
+    for attr in _Body.__slots__:
+        setattr(copy, attr, getattr(body, attr))
+    return copy
+
+
+def _message(first: _Body, second: _Body, overlap: Overlap, time_stamp: float) -> Dict[str, Any]:
+    return {
+        'type': SPRITE_COLLISION,
+        'sprites': [first.position(), second.position()],
+        'time_stamp': time_stamp,
+        'overlap': overlap.value,
+    }
@@ -0,0 +1,121 @@
+"""Delta encoding of sprite updates.
+
+The server merges sprite updates into the stored sprite (``{...prev, ...new}``
+in ``addDataToStore``), so a sprite update only needs the fields which
+changed since the last sent state - like ``UpdateSprite``, but for every
+``Sprite`` field. :class:`SpriteDeltaTracker` keeps the last sent state per
+sprite and produces these partial updates, with a full keyframe every
+``keyframe_interval`` seconds so clients which missed an update (or joined
+late) converge again. A field set to ``None`` (or left out of a ``Sprite``)
+after it was sent is reset with an explicit ``None``::
+
+    tracker = SpriteDeltaTracker()
+    for sprite in sprites:
+        update = tracker.diff(sprite)
+        if update is not None:
+            batcher.update(update)
+"""
+import copy
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Union
+
+import api_codec
+from api_types import Sprite
+
+KEYFRAME_INTERVAL = 2.0
+
+
+@dataclass
+class DeltaStats:
+    updates: int = 0
+    keyframes: int = 0
+    # fields of all updates passed to ``diff`` and fields actually sent
+    fields_total: int = 0
+    fields_sent: int = 0
+
+
+class _SpriteState:
+    __slots__ = ('fields', 'keyframe_at')
+
+    def __init__(self, fields: Dict[str, Any], keyframe_at: float):
+        self.fields = fields
+        self.keyframe_at = keyframe_at
+
+
+class SpriteDeltaTracker:
+    def __init__(
+        self,
+        keyframe_interval: Optional[float] = KEYFRAME_INTERVAL,
+        epsilon: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param keyframe_interval: seconds between full updates of a sprite, ``None`` disables keyframes
+        :param epsilon: numeric changes up to ``epsilon`` are not sent
+        """
+        self.keyframe_interval = keyframe_interval
+        self.epsilon = epsilon
+        self.clock = clock
+        self.stats = DeltaStats()
+        self._states: Dict[str, _SpriteState] = {}
+
+    def diff(self, sprite: Union[Sprite, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """The fields of ``sprite`` changed since the last sent state (with ``id``),
+        the full sprite on keyframes or ``None`` when nothing changed."""
+        if sprite.__class__ is not dict:
+            sprite = api_codec.to_dict(sprite)
+            state = self._states.get(sprite['id'])
+            if state is not None:
+                # ``to_dict`` drops ``None`` fields, the ones sent before are reset
+                sprite.update(dict.fromkeys(state.fields.keys() - sprite.keys()))
+        sprite_id = sprite['id']
+        now = self.clock()
+        self.stats.updates += 1
+        self.stats.fields_total += len(sprite)
+        state = self._states.get(sprite_id)
+        if state is None or (self.keyframe_interval is not None and now - state.keyframe_at >= self.keyframe_interval):
+            fields = dict(state.fields) if state is not None else {}
+            fields.update(sprite)
+            stored = {key: _copy(value) for key, value in fields.items() if value is not None}
+            self._states[sprite_id] = _SpriteState(stored, now)
+            self.stats.keyframes += 1
+            self.stats.fields_sent += len(fields)
+            return fields
+        last = state.fields
+        changed = {}
+        for key, value in sprite.items():
+            prev = last.get(key)
+            if value == prev or (self.epsilon and _close(value, prev, self.epsilon)):
+                continue
+            changed[key] = value
+        if not changed:
+            return None
+        for key, value in changed.items():
+            if value is None:
+                del last[key]
+            else:
+                last[key] = _copy(value)
+        changed['id'] = sprite_id
+        self.stats.fields_sent += len(changed)
+        return changed
+
+    def forget(self, sprite_id: str):
+        """the sprite was removed, its next update is a keyframe"""
+        self._states.pop(sprite_id, None)
+
+    def reset(self):
+        """the playground was cleared"""
+        self._states.clear()
+
+
+def _copy(value):
+    """the stored state must not change with the caller's lists and dicts"""
+    return copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+
+
+def _close(value, prev, epsilon: float) -> bool:
+    number = (int, float)
+    if isinstance(value, number) and isinstance(prev, number) and not isinstance(value, bool):
+        return abs(value - prev) <= epsilon
+    return False
@@ -0,0 +1,345 @@
+"""Vectorized port of the sprite motion model of the browser client.
+
+The browser animates ``direction``, ``speed``, ``distance`` and ``time_span``
+of a sprite (``models/AutoMovement.ts``) and checks every sprite against the
+playground on each tick (``Playground.update``), reporting ``border_overlap``,
+``sprite_out`` and ``sprite_removed``. :class:`SpritePhysics` implements the
+same model with all sprites of a playground in numpy columns, so one
+:meth:`SpritePhysics.step` moves thousands of sprites::
+
+    physics = SpritePhysics()
+    physics.apply({'type': 'sprite', 'sprite': {'id': 'ball', 'direction': [1, 0], 'speed': 2}}, time_stamp=0)
+    for ts in np.arange(0.005, 10, 0.005):
+        for event in physics.step(ts):
+            client.send_nowait(event)
+
+Positions are a closed form of the time since the movement started (like in
+the browser), the engine never reads a clock: messages and steps carry the
+time stamps, so replaying a recorded client trace gives the same events.
+"""
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+import api_codec
+from api_types import BorderSide, DataType, SpriteForm
+
+# seconds a sprite may stay outside of the playground before it is removed
+OUT_TIMEOUT = 2
+# ``speed`` is in playground units per 100 ms
+SPEED_SCALE = 10
+
+WIDTH = 100
+HEIGHT = 100
+SHIFT_X = -50
+SHIFT_Y = -50
+
+# index of the ``border`` column, -1 is no border
+BORDER_SIDES = (BorderSide.LEFT.value, BorderSide.RIGHT.value, BorderSide.TOP.value, BorderSide.BOTTOM.value)
+
+SPRITE = DataType.SPRITE.value
+SPRITES = DataType.SPRITES.value
+REMOVE_SPRITE = DataType.REMOVE_SPRITE.value
+PLAYGROUND_CONFIG = DataType.PLAYGROUND_CONFIG.value
+BORDER_OVERLAP = DataType.BORDER_OVERLAP.value
+SPRITE_OUT = DataType.SPRITE_OUT.value
+# not (yet) part of api_types.DataType
+SPRITE_REMOVED = 'sprite_removed'
+CLEAN_PLAYGROUND = 'clean_playground'
+
+_FLOAT_COLUMNS = (
+    'x',
+    'y',
+    'init_x',
+    'init_y',
+    'dir_x',
+    'dir_y',
+    'speed',
+    'distance',
+    'time_span',
+    'start',
+    'width',
+    'height',
+    'anchor_x',
+    'anchor_y',
+    'inactive_since',
+)
+
+
+class SpritePhysics:
+    def __init__(self, capacity: int = 64):
+        """
+        :param capacity: initial number of sprite slots, grows on demand
+        """
+        self.width: float = WIDTH
+        self.height: float = HEIGHT
+        self.shift_x: float = SHIFT_X
+        self.shift_y: float = SHIFT_Y
+        # time stamp of the last step, default for messages without one
+        self.time_stamp: float = 0
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self._next_seq = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        self.columns: Dict[str, np.ndarray] = {name: np.full(capacity, np.nan) for name in _FLOAT_COLUMNS}
+        self.collision_detection = np.zeros(capacity, dtype=bool)
+        self.border = np.full(capacity, -1, dtype=np.int8)
+        # insertion order, events are reported in the order of the browser's sprite list
+        self.seq = np.zeros(capacity, dtype=np.int64)
+
+    def _grow(self):
+        size = len(self.ids)
+        columns, collision_detection, border, seq = self.columns, self.collision_detection, self.border, self.seq
+        self._allocate(self.capacity * 2)
+        for name, column in columns.items():
+            self.columns[name][:size] = column[:size]
+        self.collision_detection[:size] = collision_detection[:size]
+        self.border[:size] = border[:size]
+        self.seq[:size] = seq[:size]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, sprite_id: str) -> bool:
+        return sprite_id in self.index
+
+    def column(self, name: str) -> np.ndarray:
+        """view of a column of all sprites, in slot order (see ``ids``)"""
+        if name in self.columns:
+            return self.columns[name][: len(self.ids)]
+        return getattr(self, name)[: len(self.ids)]
+
+    def position(self, sprite_id: str) -> Tuple[float, float]:
+        idx = self.index[sprite_id]
+        return float(self.columns['x'][idx]), float(self.columns['y'][idx])
+
+    # messages
+
+    def apply(self, msg: Union[dict, object], time_stamp: Optional[float] = None):
+        """Apply a message received by the playground at ``time_stamp``, other types are ignored."""
+        if msg.__class__ is not dict:
+            msg = api_codec.to_dict(msg)
+        if time_stamp is None:
+            time_stamp = self.time_stamp
+        msg_type = msg.get('type')
+        if msg_type == SPRITE:
+            self.upsert(msg['sprite'], time_stamp)
+        elif msg_type == SPRITES:
+            for sprite in msg['sprites']:
+                self.upsert(sprite, time_stamp)
+        elif msg_type == REMOVE_SPRITE:
+            self.remove(msg['id'])
+        elif msg_type == CLEAN_PLAYGROUND:
+            self.clear()
+        elif msg_type == DataType.CLEAR_PLAYGROUND.value:
+            self.clear()
+            self.width, self.height, self.shift_x, self.shift_y = WIDTH, HEIGHT, SHIFT_X, SHIFT_Y
+        elif msg_type == PLAYGROUND_CONFIG:
+            self.configure(msg.get('config') or {})
+
+    def configure(self, config: Dict[str, Any]):
+        """apply a ``PlaygroundConfig``, missing fields are kept"""
+        for key, attr in (('width', 'width'), ('height', 'height'), ('shift_x', 'shift_x'), ('shift_y', 'shift_y')):
+            if config.get(key) is not None:
+                setattr(self, attr, config[key])
+
+    def upsert(self, sprite: Union[Dict[str, Any], object], time_stamp: Optional[float] = None):
+        """Add a sprite or update it like ``Sprite.update`` of the browser client."""
+        if sprite.__class__ is not dict:
+            sprite = api_codec.to_dict(sprite)
+        if time_stamp is None:
+            time_stamp = self.time_stamp
+        idx = self.index.get(sprite['id'])
+        if idx is None:
+            self._add(sprite, time_stamp)
+        else:
+            self._update(idx, sprite, time_stamp)
+
+    def _add(self, sprite: Dict[str, Any], time_stamp: float):
+        if len(self.ids) == self.capacity:
+            self._grow()
+        idx = len(self.ids)
+        self.ids.append(sprite['id'])
+        self.index[sprite['id']] = idx
+        self.seq[idx] = self._next_seq
+        self._next_seq += 1
+        anchor = sprite.get('anchor')
+        if anchor is None:
+            anchor = (0.5, 0.5) if sprite.get('form') == SpriteForm.ROUND.value else (0, 0)
+        direction = sprite.get('direction') or (0, 0)
+        x = _default(sprite.get('pos_x'), 0)
+        y = _default(sprite.get('pos_y'), 0)
+        values = {
+            'x': x,
+            'y': y,
+            'init_x': x,
+            'init_y': y,
+            'dir_x': direction[0],
+            'dir_y': direction[1],
+            'speed': _default(sprite.get('speed'), 0),
+            'distance': _default(sprite.get('distance'), np.nan),
+            'time_span': _default(sprite.get('time_span'), np.nan),
+            'start': time_stamp,
+            'width': _default(sprite.get('width'), 5),
+            'height': _default(sprite.get('height'), 5),
+            'anchor_x': anchor[0],
+            'anchor_y': anchor[1],
+            'inactive_since': np.nan,
+        }
+        for name, value in values.items():
+            self.columns[name][idx] = value
+        self.collision_detection[idx] = bool(sprite.get('collision_detection'))
+        self.border[idx] = -1
+
+    def _update(self, idx: int, sprite: Dict[str, Any], time_stamp: float):
+        c = self.columns
+        keeps_offset = not np.isnan(c['distance'][idx])
+        for pos, init, key in (('x', 'init_x', 'pos_x'), ('y', 'init_y', 'pos_y')):
+            value = sprite.get(key)
+            if value is None:
+                continue
+            # a distance limited movement continues relative to the new position
+            offset = c[pos][idx] - c[init][idx] if keeps_offset else 0
+            c[init][idx] = value
+            c[pos][idx] = value + offset
+        if sprite.get('reset_time'):
+            c['start'][idx] = time_stamp
+        direction = sprite.get('direction')
+        changes = [sprite.get(key) is not None for key in ('distance', 'speed', 'time_span')]
+        if direction or any(changes):
+            # a new init movement starting at the current position, like in the
+            # browser an updated ``time_span`` does not replace the running one
+            if direction:
+                c['dir_x'][idx], c['dir_y'][idx] = direction[0], direction[1]
+            if changes[0]:
+                c['distance'][idx] = sprite['distance']
+            if changes[1]:
+                c['speed'][idx] = sprite['speed']
+            c['init_x'][idx] = c['x'][idx]
+            c['init_y'][idx] = c['y'][idx]
+            c['start'][idx] = time_stamp
+        for key in ('width', 'height'):
+            if sprite.get(key) is not None:
+                c[key][idx] = sprite[key]
+        anchor = sprite.get('anchor')
+        if anchor is not None and len(anchor) == 2:
+            c['anchor_x'][idx], c['anchor_y'][idx] = anchor
+        if sprite.get('collision_detection') is not None:
+            self.collision_detection[idx] = sprite['collision_detection']
+
+    def remove(self, sprite_id: str) -> bool:
+        idx = self.index.pop(sprite_id, None)
+        if idx is None:
+            return False
+        last = len(self.ids) - 1
+        if idx != last:
+            # move the last sprite into the free slot
+            moved = self.ids[last]
+            self.ids[idx] = moved
+            self.index[moved] = idx
+            for column in self.columns.values():
+                column[idx] = column[last]
+            self.collision_detection[idx] = self.collision_detection[last]
+            self.border[idx] = self.border[last]
+            self.seq[idx] = self.seq[last]
+        self.ids.pop()
+        return True
+
+    def clear(self):
+        self.ids = []
+        self.index = {}
+
+    # stepping
+
+    def step(self, time_stamp: float) -> List[Dict[str, Any]]:
+        """Move all sprites to their position at ``time_stamp`` and check them
+        against the playground, returns the ``border_overlap``, ``sprite_out``
+        and ``sprite_removed`` messages the browser would send."""
+        self.time_stamp = time_stamp
+        size = len(self.ids)
+        if size == 0:
+            return []
+        c = {name: column[:size] for name, column in self.columns.items()}
+        x, y, init_x, init_y = c['x'], c['y'], c['init_x'], c['init_y']
+        dir_x, dir_y, speed = c['dir_x'], c['dir_y'], c['speed']
+        distance, time_span = c['distance'], c['time_span']
+        dt = time_stamp - c['start']
+
+        with np.errstate(invalid='ignore'):
+            # AutoMovement.isProcessing of the init movement
+            has_time_span = time_span > 0
+            moving = (((dir_x != 0) | (dir_y != 0)) & (speed != 0)) | has_time_span
+            # same operand order as updatePosition, for identical floats
+            x[moving] = init_x[moving] + dir_x[moving] * speed[moving] * dt[moving] * SPEED_SCALE
+            y[moving] = init_y[moving] + dir_y[moving] * speed[moving] * dt[moving] * SPEED_SCALE
+
+            has_distance = (distance != 0) & ~np.isnan(distance)
+            dx = init_x - x
+            dy = init_y - y
+            finished = moving & np.where(
+                has_distance, np.sqrt(dx * dx + dy * dy) >= distance, has_time_span & (dt > time_span)
+            )
+
+        width, height, anchor_x, anchor_y = c['width'], c['height'], c['anchor_x'], c['anchor_y']
+        left = x - anchor_x * width
+        right = x + (1 - anchor_x) * width
+        bottom = y - anchor_y * height
+        top = y + (1 - anchor_y) * height
+        pg_left = self.shift_x
+        pg_right = self.width + self.shift_x
+        pg_bottom = self.shift_y
+        pg_top = self.height + self.shift_y
+        # sprite.hasOverlap(playground) of Playground.update, the strict test of BoundingBox.hasOverlap
+        inside = (right > pg_left) & (left < pg_right) & (top > pg_bottom) & (bottom < pg_top)
+        side = np.select(
+            [left < pg_left, pg_right < right, pg_top < top, bottom < pg_bottom], [0, 1, 2, 3], default=-1
+        ).astype(np.int8)
+
+        border = self.border[:size]
+        inactive_since = c['inactive_since']
+        inactive = ~np.isnan(inactive_since)
+        with np.errstate(invalid='ignore'):
+            expired = ~inside & inactive & (time_stamp - inactive_since > OUT_TIMEOUT)
+        removed = finished | expired
+        overlap = ~removed & inside & (side >= 0) & (side != border)
+        went_out = ~removed & ~inside & ~inactive
+
+        border[inside & (side < 0)] = -1
+        border[overlap] = side[overlap]
+        inactive_since[~removed & inside] = np.nan
+        inactive_since[went_out] = time_stamp
+
+        flagged = np.flatnonzero(removed | overlap | went_out)
+        if len(flagged) == 0:
+            return []
+        flagged = flagged[np.argsort(self.seq[flagged], kind='stable')]
+        events = []
+        gone = []
+        for idx in flagged.tolist():
+            sprite_id = self.ids[idx]
+            if removed[idx]:
+                events.append({'type': SPRITE_REMOVED, 'id': sprite_id})
+                gone.append(sprite_id)
+            elif overlap[idx]:
+                events.append(
+                    {
+                        'type': BORDER_OVERLAP,
+                        'id': sprite_id,
+                        'collision_detection': bool(self.collision_detection[idx]),
+                        'border': BORDER_SIDES[side[idx]],
+                        'x': float(x[idx]),
+                        'y': float(y[idx]),
+                    }
+                )
+            else:
+                events.append({'type': SPRITE_OUT, 'id': sprite_id})
+        for sprite_id in gone:
+            self.remove(sprite_id)
+        return events
+
+
+def _default(value, default):
+    return default if value is None else value
@@ -0,0 +1,309 @@
+"""Incremental parsing of ``data_store`` and ``all_data`` payloads.
+
+The ``data_store`` event of index.ts sends the stores of all devices
+(``{device_id: {type: [msg, ...]}}``), an ``all_data`` message the store of
+one device in its ``all_data`` field. :class:`StoreParser` is fed the json
+text in chunks and yields every stored message as soon as it is complete,
+without building the whole payload first::
+
+    parser = StoreParser()
+    for chunk in chunks:
+        for device_id, data_type, msg in parser.feed(chunk):
+            ...
+    parser.close()
+
+    for device_id, data_type, msg in iter_store(open('store.json', 'rb')):
+        ...
+
+Values of the ``skip`` fields (image and audio bodies by default) are passed
+over without being parsed or kept and read as ``None``, so the memory in use
+is bounded by the largest message without them.
+"""
+import json
+import re
+from functools import partial
+from typing import Any, BinaryIO, Callable, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
+
+import api_codec
+from api_types import ClientDataMsg, DataType
+
+SKIP_FIELDS = frozenset(['image', 'audio'])
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(rb'[ \t\n\r]*')
+_STRUCTURE = re.compile(rb'["{}\[\]]')
+# the body of a string up to (not including) its closing quote
+_STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_SCALAR = re.compile(rb'[^,:\]}\s]+')
+
+Item = Tuple[Optional[str], Union[DataType, str], Any]
+
+
+class StoreParseError(ValueError):
+    pass
+
+
+class StoreParser:
+    def __init__(
+        self,
+        skip: Iterable[str] = SKIP_FIELDS,
+        decode: Optional[Callable[[dict], Any]] = partial(api_codec.decode_as, ClientDataMsg),
+    ):
+        """
+        :param skip: fields (at any depth of a message) whose values are not parsed
+        :param decode: converts the message dicts, ``None`` to keep the dicts
+        """
+        self.skip: FrozenSet[bytes] = frozenset(json.dumps(name).encode() for name in skip)
+        names = b'|'.join(re.escape(name) for name in self.skip) or b'(?!)'
+        # text up to the next bracket, an incomplete string or a skip field name
+        self._content = re.compile(rb'(?:[^"{}\[\]]+|(?!%s)"[^"\\]*(?:\\.[^"\\]*)*")*' % names, re.DOTALL)
+        self._skip_key = re.compile(rb'(?:%s)[ \t\n\r]*:' % names)
+        self.decode = decode
+        self.count = 0
+        self._buf = bytearray()
+        self._pos = 0
+        # ``[kind, key]`` of the open containers outside of a message, the key
+        # of an array is its index, the key of an object stays set until the next ``,``
+        self._stack: List[list] = []
+        self._device_id: Optional[str] = None
+        self._done = False
+        # the current message: nesting depth, text of the completed parts and start of the current one
+        self._depth = 0
+        self._parts: List[bytes] = []
+        self._start: Optional[int] = None
+        self._path: Tuple[Optional[str], Union[DataType, str]] = (None, '')
+        # nesting depth of a skipped container value, -1 while skipping a string
+        self._skipping: Optional[int] = None
+        # start of an incomplete string and how far its body was scanned
+        self._string = (-1, -1)
+
+    def feed(self, chunk: bytes) -> List[Item]:
+        """the messages completed by ``chunk``"""
+        self._buf += chunk
+        # the text of the completed messages, parsed at once
+        texts: List[Tuple[Tuple[Optional[str], Union[DataType, str]], bytes]] = []
+        self._parse(texts)
+        # drop the parsed text, keep the unfinished part of the current message
+        keep = self._pos if self._start is None else min(self._start, self._pos)
+        if keep:
+            del self._buf[:keep]
+            self._pos -= keep
+            if self._start is not None:
+                self._start -= keep
+            self._string = (self._string[0] - keep, self._string[1] - keep)
+        if not texts:
+            return []
+        messages = json.loads(b'[' + b','.join(text for _, text in texts) + b']')
+        items: List[Item] = []
+        decode = self.decode
+        for ((device_id, data_type), _), data in zip(texts, messages):
+            if device_id is None:
+                device_id = data.get('device_id')
+            items.append((device_id, data_type, data if decode is None else decode(data)))
+        self.count += len(items)
+        return items
+
+    def close(self):
+        """raises ``StoreParseError`` when the payload is incomplete"""
+        if not self._done or self._buf[self._pos :].strip():
+            raise StoreParseError('incomplete or trailing data store payload')
+
+    # parsing
+
+    def _parse(self, texts: list):
+        while True:
+            if self._skipping is not None:
+                if not self._skip_value():
+                    return
+            elif self._start is not None:
+                if not self._message(texts):
+                    return
+            elif not self._outer():
+                return
+
+    def _outer(self) -> bool:
+        """one token outside of the messages, ``False`` when more text is needed"""
+        buf = self._buf
+        pos = _WHITESPACE.match(buf, self._pos).end()
+        self._pos = pos
+        if pos >= len(buf) or self._done:
+            return False
+        c = buf[pos]
+        stack = self._stack
+        if c == 0x7B:  # {
+            if self._is_message():
+                frame = stack[0]
+                device_id = self._device_id if frame[1] == 'all_data' else frame[1]
+                data_type = stack[1][1]
+                self._path = (device_id, api_codec.DATA_TYPES.get(data_type, data_type))
+                self._start = pos
+                self._depth = 0
+                return True
+            stack.append(['{', None])
+            self._pos = pos + 1
+        elif c == 0x5B:  # [
+            stack.append(['[', 0])
+            self._pos = pos + 1
+        elif c == 0x7D or c == 0x5D:  # } ]
+            if not stack:
+                raise StoreParseError(f'unexpected {chr(c)} at {pos}')
+            stack.pop()
+            self._pos = pos + 1
+            if not stack:
+                self._done = True
+        elif c == 0x2C:  # ,
+            frame = stack[-1]
+            if frame[0] == '[':
+                frame[1] += 1
+            else:
+                frame[1] = None
+            self._pos = pos + 1
+        elif c == 0x3A:  # :
+            self._pos = pos + 1
+        elif c == 0x22:  # "
+            end = self._string_end(pos)
+            if end is None:
+                return False
+            frame = stack[-1] if stack else None
+            if frame is not None and frame[0] == '{' and frame[1] is None:
+                frame[1] = json.loads(buf[pos:end])
+            elif len(stack) == 1 and frame[1] == 'device_id':
+                self._device_id = json.loads(buf[pos:end])
+            self._pos = end
+        else:
+            match = _SCALAR.match(buf, pos)
+            if match is None or match.end() == len(buf):
+                return False
+            self._pos = match.end()
+        return True
+
+    def _is_message(self) -> bool:
+        """whether an object at the current position is a stored message, at ``device_id/type/index``
+        of a ``data_store`` or ``all_data/type/index`` of an ``all_data`` message"""
+        stack = self._stack
+        return (
+            len(stack) == 3
+            and stack[0][0] == '{'
+            and stack[1][0] == '{'
+            and stack[2][0] == '['
+            and isinstance(stack[0][1], str)
+            and isinstance(stack[1][1], str)
+        )
+
+    def _string_end(self, pos: int) -> Optional[int]:
+        """the end of the string starting at ``pos``, ``None`` when it is incomplete"""
+        start, scanned = self._string
+        end = _STRING_BODY.match(self._buf, scanned if start == pos else pos + 1).end()
+        # the body ends at the closing quote or a trailing backslash
+        if end >= len(self._buf) or self._buf[end] != 0x22:
+            self._string = (pos, end)
+            return None
+        return end + 1
+
+    def _message(self, texts: list) -> bool:
+        """scan the current message, ``False`` when more text is needed"""
+        buf = self._buf
+        pos = self._pos
+        size = len(buf)
+        while True:
+            # an incomplete string is not scanned again from its start
+            if pos != self._string[0]:
+                pos = self._content.match(buf, pos).end()
+            if pos >= size:
+                self._pos = pos
+                return False
+            c = buf[pos]
+            if c == 0x22:  # an incomplete string or a skip field name
+                key = self._skip_key.match(buf, pos) if self.skip else None
+                if key is not None:
+                    value = _WHITESPACE.match(buf, key.end()).end()
+                    if value >= size:
+                        self._pos = pos
+                        return False
+                    # skip string and container values, scalars are short
+                    if buf[value] in b'"{[':
+                        self._parts.append(bytes(buf[self._start : value]) + b'null')
+                        self._start = None
+                        self._skipping = -1 if buf[value] == 0x22 else 1
+                        self._pos = value + 1
+                        return True
+                    pos = value
+                    continue
+                end = self._string_end(pos)
+                # the colon of a skip field name may follow in the next chunk
+                if end is None or _WHITESPACE.match(buf, end).end() >= size:
+                    self._pos = pos
+                    return False
+                pos = end
+            elif c == 0x7B or c == 0x5B:  # { [
+                self._depth += 1
+                pos += 1
+            else:
+                self._depth -= 1
+                pos += 1
+                if self._depth == 0:
+                    self._emit(texts, pos)
+                    return True
+
+    def _skip_value(self) -> bool:
+        """pass over a skipped value without keeping it, ``False`` when more text is needed"""
+        buf = self._buf
+        pos = self._pos
+        if self._skipping == -1:
+            end = _STRING_BODY.match(buf, pos).end()
+            if end >= len(buf) or buf[end] != 0x22:
+                # a trailing backslash is kept, it escapes the next character
+                self._pos = end
+                return False
+            self._resume(end + 1)
+            return True
+        while True:
+            match = _STRUCTURE.search(buf, pos)
+            if match is None:
+                self._pos = len(buf)
+                return False
+            pos = match.start()
+            c = buf[pos]
+            if c == 0x22:
+                end = self._string_end(pos)
+                if end is None:
+                    self._pos = pos
+                    return False
+                pos = end
+            elif c == 0x7B or c == 0x5B:
+                self._skipping += 1
+                pos += 1
+            else:
+                self._skipping -= 1
+                pos += 1
+                if self._skipping == 0:
+                    self._resume(pos)
+                    return True
+
+    def _resume(self, pos: int):
+        self._skipping = None
+        self._start = pos
+        self._pos = pos
+
+    def _emit(self, texts: list, end: int):
+        self._parts.append(bytes(self._buf[self._start : end]))
+        texts.append((self._path, b''.join(self._parts)))
+        self._parts = []
+        self._start = None
+        self._pos = end
+
+
+def iter_store(
+    stream: BinaryIO,
+    chunk_size: int = CHUNK_SIZE,
+    skip: Iterable[str] = SKIP_FIELDS,
+    decode: Optional[Callable[[dict], Any]] = partial(api_codec.decode_as, ClientDataMsg),
+) -> Iterator[Item]:
+    """``(device_id, data type, message)`` of all messages of a ``data_store`` or ``all_data`` payload read from ``stream``"""
+    parser = StoreParser(skip, decode)
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        yield from parser.feed(chunk)
+    parser.close()
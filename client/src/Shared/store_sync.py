@@ -0,0 +1,181 @@
+"""Incremental synchronisation of device stores.
+
+A :class:`VersionedDataStoreEngine` counts a monotonic revision per device
+store and keeps a compacted change log (the last change per entry). A replica
+at revision ``N`` asks for :meth:`VersionedDataStoreEngine.delta` and receives
+only the entries changed since ``N`` instead of the whole ``all_data``
+package; a full snapshot (``reset=True``) is only sent when the replica is
+older than the compacted log or the store was cleared.
+
+:class:`StoreReplica` merges these deltas into a local copy of the store.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+import api_codec
+from api_types import DataStore
+from data_store import (
+    INPUT_PROMPT,
+    LINE,
+    NOTIFICATION,
+    PLAYGROUND_CONFIG,
+    SPRITE,
+    THRESHOLD,
+    DataStoreEngine,
+    DeviceStore,
+)
+
+# kinds whose removals are part of the delta, all other kinds are bounded
+# deques where every replica drops the oldest entries by the same cap
+KEYED_KINDS = frozenset([SPRITE, LINE, PLAYGROUND_CONFIG, NOTIFICATION, INPUT_PROMPT])
+
+MAX_LOG = 2048
+
+
+@dataclass
+class StoreChange:
+    kind: str
+    key: Any
+    msg: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class StoreDelta:
+    base_revision: int
+    device_id: str
+    revision: int
+    changes: List[StoreChange] = field(default_factory=list)
+    reset: Optional[bool] = None
+
+    def to_dict(self) -> dict:
+        data = {
+            'base_revision': self.base_revision,
+            'device_id': self.device_id,
+            'revision': self.revision,
+            'changes': [[c.kind, c.key, c.msg] for c in self.changes],
+        }
+        if self.reset:
+            data['reset'] = True
+        return data
+
+    @staticmethod
+    def from_dict(data: dict) -> 'StoreDelta':
+        return StoreDelta(
+            base_revision=data['base_revision'],
+            device_id=data['device_id'],
+            revision=data['revision'],
+            changes=[StoreChange(kind, key, msg) for kind, key, msg in data.get('changes', [])],
+            reset=data.get('reset'),
+        )
+
+
+class VersionedDeviceStore(DeviceStore):
+    def __init__(self, revision: int = 0, max_log: int = MAX_LOG):
+        super().__init__()
+        self.revision = revision
+        # deltas from revisions older than the horizon are incomplete
+        self.horizon = revision
+        self.max_log = max_log
+        # (kind, key) -> (revision, msg), ordered by revision
+        self.log: 'OrderedDict[Tuple[str, Hashable], Tuple[int, Optional[dict]]]' = OrderedDict()
+
+    def changed(self, kind: str, key: Hashable, msg: Optional[dict]):
+        self.revision += 1
+        entry = (kind, key)
+        if entry in self.log:
+            del self.log[entry]
+        self.log[entry] = (self.revision, msg)
+        if len(self.log) > self.max_log:
+            _, (revision, _) = self.log.popitem(last=False)
+            self.horizon = revision
+
+    def dropped(self, kind: str, key: Hashable):
+        # replicas evict it on their own by the same cap
+        self.log.pop((kind, key), None)
+
+    def entries(self) -> Iterator[StoreChange]:
+        """all stored entries, in store order"""
+        for sprite_id, msg in self.sprites.items():
+            yield StoreChange(SPRITE, sprite_id, msg)
+        for line_id, msg in self.lines.items():
+            yield StoreChange(LINE, line_id, msg)
+        if self.config is not None:
+            yield StoreChange(PLAYGROUND_CONFIG, PLAYGROUND_CONFIG, self.config)
+        for kind, store in self.keyed.items():
+            for key, msg in store.items.items():
+                yield StoreChange(kind, key, msg)
+        for kind, store in self.messages.items():
+            for seq, msg in store:
+                yield StoreChange(kind, seq, msg)
+
+    def changes_since(self, revision: int) -> List[StoreChange]:
+        changes = []
+        for (kind, key), (rev, msg) in reversed(self.log.items()):
+            if rev <= revision:
+                break
+            changes.append(StoreChange(kind, key, msg))
+        changes.reverse()
+        return changes
+
+
+class VersionedDataStoreEngine(DataStoreEngine):
+    DEVICE_STORE = VersionedDeviceStore
+
+    def clear(self, device_id: str):
+        prev = self.devices.get(device_id)
+        self.release_assets(prev)
+        revision = prev.revision + 1 if prev is not None else 0
+        self.devices[device_id] = VersionedDeviceStore(revision)
+
+    def revision(self, device_id: str) -> int:
+        return self.device(device_id).revision
+
+    def delta(self, device_id: str, since: Optional[int] = None) -> StoreDelta:
+        """The changes of ``device_id`` since the revision ``since``, a full snapshot when ``since`` is ``None``."""
+        store = self.device(device_id)
+        if since is None or since < store.horizon or since > store.revision:
+            return StoreDelta(
+                base_revision=since or 0,
+                device_id=device_id,
+                revision=store.revision,
+                changes=list(store.entries()),
+                reset=True,
+            )
+        return StoreDelta(
+            base_revision=since, device_id=device_id, revision=store.revision, changes=store.changes_since(since)
+        )
+
+
+class StoreReplica:
+    """Local copy of one device store, kept up to date with :class:`StoreDelta` packages."""
+
+    def __init__(self, device_id: str):
+        self.device_id = device_id
+        self.revision: Optional[int] = None
+        self.entries: Dict[str, 'OrderedDict[Hashable, dict]'] = {}
+
+    def apply(self, delta: StoreDelta) -> bool:
+        """Merge ``delta``, returns ``False`` when it does not fit the current revision (request a new one)."""
+        if not delta.reset and delta.base_revision != self.revision:
+            return False
+        if delta.reset:
+            self.entries = {}
+        for change in delta.changes:
+            entries = self.entries.get(change.kind)
+            if entries is None:
+                entries = OrderedDict()
+                self.entries[change.kind] = entries
+            entries.pop(change.key, None)
+            if change.msg is not None:
+                entries[change.key] = change.msg
+                if change.kind not in KEYED_KINDS and len(entries) > THRESHOLD:
+                    entries.popitem(last=False)
+        self.revision = delta.revision
+        return True
+
+    def to_dict(self) -> Dict[str, List[dict]]:
+        return {kind: list(entries.values()) for kind, entries in self.entries.items() if entries}
+
+    def data_store(self) -> DataStore:
+        return api_codec.decode_as(DataStore, self.to_dict())
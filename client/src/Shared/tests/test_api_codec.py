@@ -0,0 +1,56 @@
+import json
+import math
+
+import pytest
+
+import api_codec
+import api_models
+from api_types import AccMsg, ClientDataMsg, DataType, Key, SpritesMsg
+
+MESSAGES = [
+    {'type': 'acceleration', 'device_id': 'a', 'device_nr': 0, 'time_stamp': 1.5, 'x': 0.1, 'y': -9.81, 'z': 3, 'interval': 16},
+    {'type': 'key', 'key': 'up', 'time_stamp': 2, 'unicast_to': 1},
+    {'type': 'sprites', 'sprites': [{'id': 'a', 'pos_x': 1, 'color': 'red'}, {'id': 'b', 'direction': [1, 0.5]}]},
+    {'type': 'pointer', 'context': 'color', 'color': 'blue', 'x': 1, 'y': 2},
+    {'type': 'line', 'line': {'id': 'l', 'x1': 0, 'y1': 0, 'x2': 3, 'y2': 4}, 'deliver_to': 'b'},
+]
+
+
+@pytest.mark.parametrize('data', MESSAGES, ids=[m['type'] for m in MESSAGES])
+def test_round_trip(data):
+    msg = api_codec.decode(data)
+    assert api_codec.to_dict(msg) == data
+    assert json.loads(api_codec.encode(msg)) == data
+    assert api_codec.decode(json.loads(api_codec.encode(msg))) == msg
+
+
+def test_decode_classes():
+    assert api_codec.decode(MESSAGES[0]).__class__ is AccMsg
+    assert api_codec.decode(MESSAGES[1]).key is Key.UP
+    assert api_codec.decode(MESSAGES[4]).__class__ is api_models.LineMsg
+    model = api_codec.decode_model({**MESSAGES[1], 'deliver_to': 'b'})
+    assert model.__class__ is api_models.KeyMsg and model.deliver_to == 'b'
+
+
+@pytest.mark.parametrize('value', [math.nan, math.inf, -math.inf])
+def test_non_finite_floats_are_rejected(value):
+    msg = api_codec.decode({**MESSAGES[0], 'x': value})
+    assert math.isnan(msg.x) if value != value else msg.x == value
+    with pytest.raises(ValueError):
+        api_codec.encode(msg)
+    sprites = api_codec.decode({'type': 'sprites', 'sprites': [{'id': 'a', 'direction': [value, 0]}]})
+    with pytest.raises(ValueError):
+        api_codec.encode(sprites)
+
+
+def test_unknown_values_raise_decode_error():
+    with pytest.raises(api_codec.DecodeError, match="unknown message type 'nope'"):
+        api_codec.decode({'type': 'nope'})
+    with pytest.raises(api_codec.DecodeError, match="unknown Key 'nokey'"):
+        api_codec.decode({'type': 'key', 'key': 'nokey'})
+    with pytest.raises(api_codec.DecodeError):
+        api_codec.decode_as(ClientDataMsg, {'type': 'nope'})
+    with pytest.raises(api_codec.DecodeError):
+        api_codec.decode({'type': 'pointer', 'context': 'nope'})
+    assert api_codec.enum_member(DataType, 'sprites') is DataType.SPRITES
+    assert api_codec.decode(MESSAGES[2]).__class__ is SpritesMsg
@@ -0,0 +1,57 @@
+import dataclasses
+import json
+
+import pytest
+
+import api_codec
+import api_lazy
+from api_types import ClientDataMsg, Key, SpritesMsg
+
+MESSAGES = [
+    {'type': 'acceleration', 'device_id': 'a', 'device_nr': 0, 'time_stamp': 1.5, 'x': 0.1, 'y': -9.81, 'z': 3, 'interval': 16},
+    {'type': 'key', 'key': 'up', 'time_stamp': 2, 'unicast_to': 1},
+    {'type': 'sprites', 'sprites': [{'id': 'a', 'pos_x': 1, 'color': 'red'}, {'id': 'b', 'direction': [1, 0.5]}]},
+    {'type': 'pointer', 'context': 'color', 'color': 'blue', 'x': 1, 'y': 2},
+]
+
+
+def fields(msg) -> dict:
+    """all fields, nested views and dataclasses as dicts"""
+    values = {}
+    for field in dataclasses.fields(getattr(msg, 'DATACLASS', msg.__class__)):
+        value = getattr(msg, field.name)
+        if isinstance(value, list):
+            value = [fields(v) if hasattr(v, 'FIELDS') or dataclasses.is_dataclass(v) else v for v in value]
+        values[field.name] = value
+    return values
+
+
+@pytest.mark.parametrize('data', MESSAGES, ids=[m['type'] for m in MESSAGES])
+def test_view_reads_like_decode(data):
+    msg = api_lazy.view(data)
+    decoded = api_codec.decode(data)
+    assert msg.DATACLASS is decoded.__class__
+    assert fields(msg) == fields(decoded)
+    assert msg == decoded and msg.to_dataclass() == decoded
+
+
+@pytest.mark.parametrize('data', MESSAGES, ids=[m['type'] for m in MESSAGES])
+def test_encode_of_a_view(data):
+    msg = api_lazy.view(json.dumps(data).encode(), api_lazy.view(data).DATACLASS)
+    decoded = msg.to_dataclass()
+    assert api_codec.encode(msg) == api_codec.encode(decoded)
+    assert api_codec.to_dict(msg) == api_codec.to_dict(decoded)
+
+
+def test_fields_are_decoded_on_access():
+    msg = api_lazy.view(json.dumps(MESSAGES[2]), SpritesMsg)
+    assert msg._data.__class__ is str
+    sprites = msg.sprites
+    assert msg._data.__class__ is dict
+    # converted once and cached, nested dataclasses are views
+    assert msg.sprites is sprites and isinstance(sprites[0], api_lazy.LazyView)
+    assert sprites[1].direction == [1, 0.5]
+    assert api_lazy.view(MESSAGES[1]).key is Key.UP
+    # fields other than ``type`` of unknown messages can be read
+    unknown = api_lazy.view({'type': 'nope', 'device_id': 'a'})
+    assert unknown.DATACLASS is ClientDataMsg and unknown.device_id == 'a'
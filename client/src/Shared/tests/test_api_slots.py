@@ -0,0 +1,30 @@
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+import api_codec
+import api_slots
+
+SPRITES = {'type': 'sprites', 'time_stamp': 1.5, 'sprites': [{'id': 'a', 'pos_x': 1, 'color': 'red'}, {'id': 'b'}]}
+
+
+@pytest.mark.parametrize('decode', [api_slots.decode, api_slots.decode_frozen])
+def test_pickle_and_copy(decode):
+    msg = decode(SPRITES)
+    assert pickle.loads(pickle.dumps(msg)) == msg
+    assert copy.copy(msg) == msg
+    clone = copy.deepcopy(msg)
+    assert clone == msg and clone.sprites[0] is not msg.sprites[0]
+    assert api_codec.to_dict(clone) == api_codec.to_dict(api_codec.decode(SPRITES))
+
+
+def test_frozen_variants_have_their_own_name():
+    msg = api_slots.decode_frozen(SPRITES)
+    assert msg.__class__ is api_slots.FrozenSpritesMsg
+    assert msg.sprites[0].__class__ is api_slots.FrozenSprite
+    assert api_slots.decode(SPRITES).__class__ is api_slots.SpritesMsg
+    assert 'FrozenSpritesMsg' in api_slots.__all__
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        msg.time_stamp = 2
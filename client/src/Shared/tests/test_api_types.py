@@ -0,0 +1,16 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+SHARED = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize('name', ['DataStore', 'ClientDataMsg', 'SpritesMsg'])
+def test_type_hints_of_lazy_definitions(name):
+    # a fresh interpreter, other tests build every definition
+    code = f'import typing; from api_types import {name}; print(len(typing.get_type_hints({name})))'
+    out = subprocess.run([sys.executable, '-c', code], cwd=SHARED, capture_output=True, text=True)
+    assert out.returncode == 0, out.stderr
+    assert int(out.stdout) > 0
@@ -0,0 +1,63 @@
+import pytest
+
+from asset_store import AssetStore, MissingAssets, digest
+
+SVG = '<svg>ä</svg>'
+PNG = b'\x89PNG' + bytes(60)
+
+
+def config(*images, audio=()) -> dict:
+    return {
+        'type': 'playground_config',
+        'config': {
+            'width': 10,
+            'images': [{'name': f'i{idx}', 'image': body} for idx, body in enumerate(images)],
+            'audio_tracks': [{'name': f'a{idx}', 'audio': body} for idx, body in enumerate(audio)],
+        },
+    }
+
+
+def test_intern_resolve_round_trip():
+    assets = AssetStore()
+    msg = config(SVG, PNG, SVG, audio=[PNG])
+    stored = assets.intern(msg)
+    assert all(entry['image'] is None for entry in stored['config']['images'])
+    assert assets.digests(stored) == [digest(SVG), digest(PNG)]
+    assert len(assets) == 2 and assets.size == len(SVG.encode()) + len(PNG)
+    assert assets.resolve(stored) == msg
+    # interning an interned message only references its digests
+    assert assets.intern(stored) == stored
+    assert assets.refs[digest(SVG)] == 4
+    plain = {'type': 'playground_config', 'config': {'width': 10}}
+    assert assets.intern(plain) is plain and assets.resolve(plain) is plain
+
+
+def test_referenced_assets_are_not_evicted():
+    assets = AssetStore(max_bytes=len(PNG))
+    first = assets.intern(config(PNG))
+    second = assets.intern(config(SVG))
+    assert digest(PNG) in assets and digest(SVG) in assets
+    assets.release(first)
+    assert digest(PNG) not in assets and assets.size == len(SVG.encode())
+    assets.put(b'x' * 30)
+    assets.put(b'y' * 30)
+    # the least recently used unreferenced body goes first
+    assert digest(b'x' * 30) not in assets and digest(b'y' * 30) in assets
+    assets.release(second)
+    assert digest(SVG) in assets
+
+
+def test_missing_assets():
+    server = AssetStore()
+    stored = server.intern(config(SVG, PNG))
+    client = AssetStore()
+    client.put(SVG)
+    assert client.missing(stored) == [digest(PNG)]
+    with pytest.raises(MissingAssets) as error:
+        client.resolve(stored)
+    assert error.value.digests == [digest(PNG)]
+    client.update(server.select(client.missing(stored) + ['unknown']))
+    # bodies not matching their digest are ignored
+    client.update({digest(b'other'): b'tampered'})
+    assert client.missing(stored) == [] and len(client) == 2
+    assert client.resolve(stored) == server.resolve(stored)
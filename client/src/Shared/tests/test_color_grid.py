@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from color_grid import WHITE, ColorGrid, cell_rgba
+from colors import pack, resolve, unpack
+
+GRIDS = [
+    ['0123', '9x5'],
+    '\n 11 \n 90 \n',
+    [[0, 3, 9], [9, 9, 9]],
+    [[[255, 128, 0], [0, 0, 255, 0.5]]],
+    [['red', 3, None], ['#0f0', [1, 2, 3], '7', 'nope']],
+    [1, 'blue', 0],
+]
+
+
+@pytest.mark.parametrize('grid', GRIDS[2:5])
+def test_cells_are_resolved_like_colors(grid):
+    base = (0, 0, 255)
+    frame = ColorGrid.from_wire(grid, base_color='blue')
+    for row, cells in enumerate(grid):
+        for column, color in enumerate(cells):
+            assert tuple(frame.rgba[row, column]) == cell_rgba(color, base)
+            packed = resolve(color, pack(*base))
+            assert frame._packed()[row, column] == (pack(*WHITE) if packed is None else packed)
+
+
+@pytest.mark.parametrize('grid', GRIDS)
+def test_wire_round_trip(grid):
+    frame = ColorGrid.from_wire(grid, base_color=[0, 128, 0])
+    assert ColorGrid.from_wire(frame.to_wire(), frame.base_color) == frame
+    assert ColorGrid.from_msg(frame.to_msg()) == frame
+
+
+def test_digit_lines():
+    frame = ColorGrid.from_wire(['0123', '9x5'])
+    # level 0 and non digits are transparent red, the padding is white
+    assert tuple(frame.rgba[0, 0]) == (255, 0, 0, 0)
+    assert tuple(frame.rgba[1, 1]) == (255, 0, 0, 0)
+    assert tuple(frame.rgba[1, 3]) == WHITE
+    assert frame.to_wire()[0] == ['0', 1, 2, 3]
+    frame.set_base_color('blue')
+    assert tuple(frame.rgba[0, 3]) == unpack(resolve(3, pack(0, 0, 255)))
+    assert tuple(frame.rgba[1, 3]) == WHITE
+
+
+def test_packed_cells_match_colors_pack():
+    frame = ColorGrid.from_wire([['green', [1, 2, 3, 0.5]]])
+    assert frame._packed().tolist() == [[0x008000FF, pack(1, 2, 3, 128)]]
+    assert frame.to_wire() == [['green', [1, 2, 3, 0.502]]]
+
+
+def test_diff():
+    prev = ColorGrid.from_wire(['0' * 64] * 64, base_color='blue')
+    frame = prev.copy()
+    assert frame.diff(prev) == []
+    frame.update({'row': 1, 'column': 3, 'color': 9})
+    frame.update({'number': 3, 'color': 'green'})
+    updates = frame.diff(prev)
+    assert updates == [
+        {'type': 'grid_update', 'row': 0, 'column': 2, 'color': 'green'},
+        {'type': 'grid_update', 'row': 1, 'column': 3, 'color': 9},
+    ]
+    for msg in updates:
+        prev.apply(msg)
+    assert prev == frame
+    frame.rgba[...] = 128
+    assert [msg['type'] for msg in frame.diff(prev)] == ['grid']
+    frame.set_base_color('red')
+    assert [msg['type'] for msg in frame.diff(prev)] == ['grid']
+    assert frame.diff(None) == [frame.to_msg()]
+
+
+def test_update_grows_the_grid():
+    frame = ColorGrid.from_wire([[1]])
+    frame.update({'row': 2, 'column': 1, 'color': 'blue'})
+    assert frame.shape == (3, 2)
+    assert tuple(frame.rgba[2, 1]) == (0, 0, 255, 255)
+    assert np.all(frame.rgba[1] == WHITE)
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from colors import BASE_COLOR, WHITE, base_color, level_color, pack, parse_css, resolve, resolve_many, to_rgba_array, unpack
+
+
+def test_parse_css():
+    assert parse_css('#ff8000') == 0xFF8000FF
+    assert parse_css('#0f08') == 0x00FF0088
+    assert parse_css(' Blue ') == 0x0000FFFF
+    assert parse_css('rgba(255, 0, 0, 0.5)') == 0xFF000080
+    assert parse_css('hsl(120, 100%, 50%)') == 0x00FF00FF
+    assert parse_css('nope') is None
+    assert unpack(pack(1, 2, 3, 4)) == (1, 2, 3, 4)
+
+
+@pytest.mark.parametrize(
+    'color, expected',
+    [
+        (None, None),
+        (0, None),
+        ('', None),
+        ('#zzzzzz', None),
+        (3, 0xFF000055),
+        ('9', 0xFF0000FF),
+        (12, 0xFF0000FF),
+        ('x', 0xFF000000),
+        # no ascii digit, ``parseInt`` of Color.ts reads level 0
+        ('²', 0xFF000000),
+        ('٣', 0xFF000000),
+        ([0, 128, 255], 0x0080FFFF),
+        ([0, 128, 255, 0.5], 0x0080FF80),
+        ('red', 0xFF0000FF),
+    ],
+)
+def test_resolve(color, expected):
+    assert resolve(color) == expected
+
+
+def test_base_and_level_colors():
+    blue = base_color('blue')
+    assert base_color('nope') == base_color(None) == BASE_COLOR
+    assert base_color([0, 0, 300]) == blue
+    assert level_color(3, blue) == resolve(3, blue) == 0x0000FF55
+    assert level_color(float('nan'), blue) == 0x0000FF00
+
+
+def test_numeric_arrays_are_levels_unless_rgb():
+    # 3 and 4 column level grids are levels, not rgb(a) rows
+    levels = np.array([[0, 3, 9], [9, 9, 9]])
+    expected = [[WHITE, level_color(3), level_color(9)], [level_color(9)] * 3]
+    assert resolve_many(levels).tolist() == expected
+    assert resolve_many(levels.astype(float)).tolist() == expected
+    assert resolve_many(np.array([[0, 0, 0, np.nan]]), default=0).tolist() == [[0] * 4]
+    assert resolve_many(np.array([[255, 128, 0], [0, 0, 300]]), rgb=True).tolist() == [0xFF8000FF, 0x0000FFFF]
+    assert resolve_many([[255, 128, 0, 0.5]], rgb=True).tolist() == [0xFF800080]
+    with pytest.raises(ValueError):
+        resolve_many(np.array([[1, 2]]), rgb=True)
+
+
+def test_resolve_many_matches_resolve():
+    cells = ['red', '#00f', [0, 255, 0], 5, None, 'nope', '7', [0, 255, 0]]
+    base = base_color('green')
+    expected = [WHITE if resolve(c, base) is None else resolve(c, base) for c in cells]
+    assert resolve_many(cells, base).tolist() == expected
+    rgba = to_rgba_array(resolve_many(cells, base))
+    assert [tuple(c) for c in rgba.tolist()] == [unpack(c) for c in expected]
@@ -0,0 +1,76 @@
+from data_store import THRESHOLD, DataStoreEngine
+
+
+def sprite(sprite_id: str, **fields) -> dict:
+    return {'type': 'sprite', 'sprite': {'id': sprite_id, **fields}, 'time_stamp': 1}
+
+
+def test_threshold_trimming():
+    engine = DataStoreEngine()
+    for idx in range(THRESHOLD + 5):
+        engine.apply('a', {'type': 'key', 'key': 'up', 'time_stamp': idx})
+        engine.apply('a', {'type': 'line', 'line': {'id': f'l{idx}', 'x1': idx}})
+    data = engine.to_dict()['a']
+    assert [msg['time_stamp'] for msg in data['key']] == list(range(5, THRESHOLD + 5))
+    assert [msg['line']['id'] for msg in data['line']] == [f'l{idx}' for idx in range(5, THRESHOLD + 5)]
+
+
+def test_sprite_updates_merge_and_move_to_the_end():
+    engine = DataStoreEngine()
+    engine.apply('a', sprite('s1', pos_x=1, color='red'))
+    engine.apply('a', sprite('s2'))
+    engine.apply('a', {'type': 'sprites', 'sprites': [{'id': 's1', 'pos_x': 2}], 'time_stamp': 2})
+    sprites = engine.to_dict()['a']['sprite']
+    assert [msg['sprite'] for msg in sprites] == [{'id': 's2'}, {'id': 's1', 'pos_x': 2, 'color': 'red'}]
+    assert sprites[1]['time_stamp'] == 2
+
+
+def test_sprite_eviction_prefers_sprites_without_collision_detection():
+    engine = DataStoreEngine()
+    engine.apply('a', sprite('detected', collision_detection=True))
+    engine.apply('a', sprite('plain'))
+    for idx in range(THRESHOLD - 2):
+        engine.apply('a', sprite(f's{idx}', collision_detection=True))
+    engine.apply('a', sprite('new'))
+    ids = [msg['sprite']['id'] for msg in engine.to_dict()['a']['sprite']]
+    assert len(ids) == THRESHOLD and 'plain' not in ids and ids[0] == 'detected'
+    # only collision detected sprites left but the newest: the oldest goes
+    engine.apply('a', sprite('new', collision_detection=True))
+    engine.apply('a', sprite('newer', collision_detection=True))
+    ids = [msg['sprite']['id'] for msg in engine.to_dict()['a']['sprite']]
+    assert 'detected' not in ids and ids[-1] == 'newer'
+
+
+def test_notifications_are_never_stored():
+    engine = DataStoreEngine()
+    engine.apply('a', {'type': 'notification', 'message': 'hi', 'time_stamp': 1})
+    engine.apply('a', {'type': 'alert_confirm', 'time_stamp': 1})
+    assert engine.to_dict()['a'] == {}
+
+
+def test_input_prompts_are_keyed_by_time_stamp():
+    engine = DataStoreEngine()
+    engine.apply('a', {'type': 'input_prompt', 'question': 'first?', 'time_stamp': 1})
+    engine.apply('a', {'type': 'input_prompt', 'question': 'second?', 'time_stamp': 2})
+    engine.apply('a', {'type': 'input_prompt', 'question': 'again?', 'time_stamp': 1})
+    assert [msg['question'] for msg in engine.to_dict()['a']['input_prompt']] == ['second?', 'again?']
+    engine.apply('a', {'type': 'input_response', 'response': 'yes', 'time_stamp': 1})
+    engine.apply('a', {'type': 'input_response', 'response': 'no', 'time_stamp': 3})
+    assert [msg['question'] for msg in engine.to_dict()['a']['input_prompt']] == ['second?']
+    assert engine.data_store('a').input_prompt[0].question == 'second?'
+
+
+def test_clear_and_clean_playground():
+    engine = DataStoreEngine()
+    for device_id in ('a', 'b'):
+        engine.apply(device_id, sprite('s1'))
+        engine.apply(device_id, {'type': 'line', 'line': {'id': 'l1'}})
+        engine.apply(device_id, {'type': 'playground_config', 'config': {'width': 10}})
+        engine.apply(device_id, {'type': 'key', 'key': 'up'})
+    engine.apply('a', {'type': 'clean_playground'})
+    assert sorted(engine.to_dict()['a']) == ['key', 'playground_config']
+    engine.apply('a', {'type': 'clear_playground'})
+    assert sorted(engine.to_dict()['a']) == ['key']
+    engine.clear('b')
+    assert engine.to_dict()['b'] == {}
+    assert sorted(engine.to_dict()['a']) == ['key']
@@ -0,0 +1,81 @@
+import random
+
+from device_registry import DeviceRegistry
+
+
+class Reference:
+    """the device numbering of index.ts, scanning the device list"""
+
+    def __init__(self):
+        self.devices = {}
+
+    def next_device_nr(self, is_client: bool) -> int:
+        numbers = [device['device_nr'] for device in self.devices.values()]
+        nr = 0 if is_client else -1
+        while nr in numbers:
+            nr += 1 if is_client else -1
+        return nr
+
+    def add(self, sid: str, device_id: str, is_client: bool):
+        nr = self.next_device_nr(is_client)
+        self.devices[sid] = {'device_id': device_id, 'is_client': is_client, 'device_nr': nr, 'socket_id': sid}
+
+    def remove(self, sid: str):
+        self.devices.pop(sid, None)
+
+    def reassign(self, sid: str, new_device_nr: int):
+        device = self.devices[sid]
+        other = next((d for d in self.devices.values() if d['device_nr'] == new_device_nr), None)
+        device['device_nr'] = new_device_nr
+        if other is not None:
+            other['device_nr'] = self.next_device_nr(other['is_client'])
+
+    def ordered(self) -> list:
+        clients = sorted((d for d in self.devices.values() if d['is_client']), key=lambda d: d['device_nr'])
+        scripts = sorted((d for d in self.devices.values() if not d['is_client']), key=lambda d: -d['device_nr'])
+        return [d['socket_id'] for d in clients + scripts]
+
+
+def test_numbering_matches_index_ts():
+    rnd = random.Random(7)
+    registry = DeviceRegistry()
+    reference = Reference()
+    for step in range(5000):
+        sids = list(reference.devices)
+        pick = rnd.random()
+        if pick < 0.45 or not sids:
+            # new sockets and sockets announcing a new device
+            sid = rnd.choice(sids) if sids and rnd.random() < 0.2 else f'sid-{step}'
+            is_client = rnd.random() < 0.7
+            registry.add(sid, f'dev-{rnd.randrange(5)}', is_client)
+            reference.add(sid, f'dev-{rnd.randrange(5)}', is_client)
+        elif pick < 0.85:
+            sid = rnd.choice(sids)
+            registry.remove(sid)
+            reference.remove(sid)
+        else:
+            sid = rnd.choice(sids)
+            new_device_nr = rnd.randrange(-8, 12)
+            if reference.devices[sid]['device_nr'] == new_device_nr:
+                continue
+            registry.reassign(registry.by_socket(sid), new_device_nr)
+            reference.reassign(sid, new_device_nr)
+        numbers = {sid: device['device_nr'] for sid, device in reference.devices.items()}
+        assert {sid: device['device_nr'] for sid, device in registry.sockets.items()} == numbers
+        assert [device['socket_id'] for device in registry.ordered()] == reference.ordered()
+        assert all(registry.by_nr(nr)['socket_id'] == sid for sid, nr in numbers.items())
+
+
+def test_lookups():
+    registry = DeviceRegistry()
+    a = registry.add('s1', 'FooBar', True)
+    b = registry.add('s2', 'FooBar', False)
+    c = registry.add('s3', 'FooBar', True)
+    assert (a['device_nr'], b['device_nr'], c['device_nr']) == (0, -1, 1)
+    assert registry.by_id('FooBar') == [a, c, b]
+    assert registry.by_nr(True) is None and registry.by_nr([0]) is None and registry.by_nr(0.0) is a
+    pkg = registry.changed_pkg()
+    assert pkg['devices'] == [a, c, b] and registry.changed_pkg() is None
+    registry.remove('s1')
+    assert registry.add('s4', 'Other', True)['device_nr'] == 0
+    assert registry.changed_pkg()['time_stamp'] > pkg['time_stamp']
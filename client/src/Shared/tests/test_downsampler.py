@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from api_types import AccMsg, DataType
+from downsampler import LAST, MAX_MAGNITUDE, MEAN, NUMPY_MIN, Downsampler, aggregate
+from local_server import LocalServer
+from socket_client import AsyncSocketClient
+
+
+def gyro(ts: float, alpha: float = 0, device_id: str = 'a') -> dict:
+    return {'type': 'gyro', 'device_id': device_id, 'device_nr': 0, 'time_stamp': ts, 'alpha': alpha, 'beta': 0, 'gamma': 0}
+
+
+def acc(ts: float, x: float = 0, interval: float = 125, device_id: str = 'a') -> dict:
+    msg = {'type': 'acceleration', 'device_id': device_id, 'device_nr': 0, 'time_stamp': ts, 'x': x, 'y': 0, 'z': 0}
+    return {**msg, 'interval': interval}
+
+
+def test_window_alignment():
+    downsampler = Downsampler({DataType.GYRO: 4}, aggregation=LAST)
+    emitted = []
+    # windows of 0.25 s: [0, 0.25), [0.25, 0.5), a gap starts a new grid at 1.0625
+    for ts in (0, 0.125, 0.25, 0.375, 1.0625, 1.125, 1.3125, 1.5):
+        emitted.extend((ts, msg['time_stamp']) for msg in downsampler.push(gyro(ts)))
+    # an aggregate is emitted by the first sample after its window and has the time stamp of its last sample
+    assert emitted == [(0.25, 0.125), (1.0625, 0.375), (1.3125, 1.125)]
+    assert downsampler.sensors['gyro'].windows['a'].start == 1.3125
+    assert [msg['time_stamp'] for msg in downsampler.flush()] == [1.5]
+
+
+@pytest.mark.parametrize('size', [3, NUMPY_MIN])
+def test_aggregations(size):
+    values = [(1.0, 0.0, 0.0), (0.0, 3.0, 0.0), (0.0, 0.0, 2.0)] * (size // 3) + [(0.0, 0.0, 2.0)] * (size % 3)
+    assert aggregate(values, LAST) == [0, 0, 2]
+    assert aggregate(values, MAX_MAGNITUDE) == [0, 3, 0]
+    mean = aggregate(values, MEAN)
+    assert mean == pytest.approx([sum(column) / size for column in zip(*values)])
+
+
+def test_aggregation_per_sensor_type():
+    downsampler = Downsampler({DataType.GYRO: 4, 'acceleration': 4}, aggregation={DataType.GYRO: MAX_MAGNITUDE})
+    for ts, value in ((0, 1), (0.0625, -5), (0.125, 2)):
+        downsampler.push(gyro(ts, value))
+        downsampler.push(acc(ts, value, interval=0))
+    aggregates = {msg['type']: msg for msg in downsampler.flush()}
+    assert aggregates['gyro']['alpha'] == -5
+    assert aggregates['acceleration']['x'] == pytest.approx(-2 / 3)
+    assert aggregates['acceleration']['interval'] == 250
+    with pytest.raises(ValueError):
+        Downsampler({DataType.KEY: 4})
+
+
+def test_interval_hint_emits_early():
+    downsampler = Downsampler({DataType.ACCELERATION: 4})
+    assert downsampler.push(acc(0, 1)) == []
+    # the next sample (at 0.25) falls into the next window
+    assert [msg['x'] for msg in downsampler.push(acc(0.125, 3))] == [2]
+    assert downsampler.push(acc(0.25)) == []
+    # a wrong hint never delays an aggregate past the observed rate
+    downsampler.push(acc(0.5, interval=1000))
+    assert len(downsampler.push(acc(0.625, interval=1000))) == 1
+
+
+def test_interval_hints_are_per_sensor_type():
+    downsampler = Downsampler({DataType.ACCELERATION: 4, DataType.GYRO: 4})
+    downsampler.push(acc(0))
+    assert downsampler.push(gyro(0)) == []
+    # the acceleration interval is no hint for the gyro samples of the device
+    assert downsampler.push(gyro(0.125)) == []
+    assert [msg['type'] for msg in downsampler.push(acc(0.125))] == ['acceleration']
+
+
+def test_flush_up_to_time_stamp():
+    downsampler = Downsampler({DataType.GYRO: 4}, key='device_nr')
+    downsampler.push({**gyro(0, device_id='a'), 'device_nr': 1})
+    downsampler.push({**gyro(0.375, device_id='b'), 'device_nr': 2})
+    assert [msg['device_nr'] for msg in downsampler.flush(0.25)] == [1]
+    assert downsampler.flush(0.5) == []
+    assert [msg['device_nr'] for msg in downsampler.flush(0.625)] == [2]
+    key = {'type': 'key', 'key': 'up'}
+    assert downsampler.push(key) == [key]
+    assert (downsampler.received, downsampler.emitted) == (2, 2)
+
+
+def test_stream_with_downsampler():
+    async def main():
+        server = LocalServer()
+        script = AsyncSocketClient('FooBar', transport=server.transport())
+        phone = AsyncSocketClient('FooBar', transport=server.transport(), is_client=True)
+        await script.connect()
+        await phone.connect()
+        raw = script.subscribe(DataType.ACCELERATION)
+        downsampled = script.stream(DataType.ACCELERATION, downsampler=Downsampler({DataType.ACCELERATION: 4}))
+        first = asyncio.ensure_future(downsampled.__anext__())
+        await asyncio.sleep(0)
+        for ts, x in ((0, 1), (0.125, 3), (0.25, 5)):
+            await phone.send({key: value for key, value in acc(ts, x).items() if key != 'device_id'})
+        msg = await first
+        assert msg.__class__ is AccMsg and (msg.x, msg.time_stamp, msg.interval) == (2, 0.125, 250)
+        assert [(await raw.get()).x for _ in range(3)] == [1, 3, 5]
+        await downsampled.aclose()
+        await phone.close()
+        await script.close()
+
+    asyncio.run(asyncio.wait_for(main(), 5))
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from latency_monitor import BUCKETS, MAX_VALUE, ClockOffsets, Histogram, LatencyMonitor
+
+
+def test_quantile_error_bound():
+    rng = np.random.default_rng(1)
+    values = np.exp(rng.uniform(np.log(1e-5), np.log(10), 20000))
+    hist = Histogram()
+    hist.record_many(values)
+    quantiles = [0.01, 0.1, 0.5, 0.9, 0.99, 0.999]
+    exact = np.quantile(values, quantiles, method='inverted_cdf')
+    # about 3% relative error, at most a microsecond below 64 us
+    assert np.all(np.abs(np.array(hist.quantiles(quantiles)) - exact) <= np.maximum(exact * 0.03, 1e-6))
+    assert hist.mean == pytest.approx(values.mean())
+    assert np.isnan(Histogram().quantile(0.5))
+
+
+def test_record_and_record_many_fill_the_same_buckets():
+    rng = np.random.default_rng(2)
+    values = np.concatenate(
+        [[-1.0, 0.0, 63e-6, 64e-6, 65e-6, 127e-6, 128e-6, MAX_VALUE * 1e-6, 1000.0], rng.exponential(0.05, 5000)]
+    )
+    one, many = Histogram(), Histogram()
+    for value in values.tolist():
+        one.record(value)
+    many.record_many(values)
+    assert list(one.counts) == list(many.counts)
+    assert (one.count, one.negative, one.overflow, one.max) == (many.count, many.negative, many.overflow, many.max)
+    assert (one.negative, one.overflow) == (1, 1)
+    assert len(one.counts) == BUCKETS and sum(one.counts) == len(values)
+    merged = Histogram()
+    merged.merge(one)
+    merged.merge(many)
+    assert merged.count == 2 * len(values) and merged.quantile(0.5) == one.quantile(0.5)
+
+
+def test_clock_offsets_are_the_window_minimum():
+    rng = np.random.default_rng(3)
+    offsets = ClockOffsets(window=5)
+    samples = []
+    for delay in rng.exponential(0.01, 200).tolist():
+        samples.append(2.0 + delay)
+        offsets.observe(7, server_time=100.0, local_time=102.0 + delay)
+        assert offsets.get(7) == pytest.approx(min(samples[-5:]))
+    assert offsets.get('unknown') == 0
+
+
+def test_hops_and_prometheus_output(tmp_path):
+    monitor = LatencyMonitor()
+    # the clock of device 1 is 2 s ahead of the server, the observer (0) is synchronized
+    monitor.observe_timer(1, {'time': 10.0}, received_at=12.0)
+    monitor.observe({'type': 'key', 'device_nr': 1, 'time_stamp': 12.0}, received_at=10.25, observer=0)
+    monitor.observe(
+        {'type': 'input_response', 'device_nr': 1, 'time_stamp': 10.0, 'displayed_at': 12.5}, received_at=11.0, observer=0
+    )
+    monitor.observe({'type': 'pointer', 'device_nr': '"x"', 'time_stamp': 5.0, 'displayed_at': 4.0}, received_at=5.5)
+    send = monitor.by_type[('send', 'key')]
+    assert send.quantile(0.5) == pytest.approx(0.25, rel=0.03)
+    assert monitor.by_type[('display', 'input_response')].quantile(0.5) == pytest.approx(0.5, rel=0.03)
+    assert monitor.by_type[('round_trip', 'input_response')].sum == 1.0
+    assert monitor.lagging('send', top=1) == [('"x"', pytest.approx(0.5, rel=0.03))]
+
+    text = monitor.prometheus(quantiles=(0.5,))
+    lines = text.splitlines()
+    assert '# TYPE sockets_latency_seconds summary' in lines
+    assert 'sockets_latency_seconds_count{hop="send",type="key"} 1' in lines
+    assert 'sockets_device_latency_seconds_count{hop="send",device_nr="\\"x\\""} 1' in lines
+    assert 'sockets_clock_offset_seconds{device_nr="1"} 2.0' in lines
+    assert any(line.startswith('sockets_latency_seconds{hop="send",type="key",quantile="0.5"} 0.25') for line in lines)
+    path = tmp_path / 'sockets.prom'
+    monitor.write_prometheus(str(path), quantiles=(0.5,))
+    assert path.read_text() == text
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,35 @@
+import asyncio
+
+import numpy as np
+
+from api_types import DataType
+from load_generator import LoadGenerator, format_stats
+from local_server import LocalServer
+
+RATES = {DataType.ACCELERATION: 20, DataType.GYRO: 20, DataType.KEY: 5, DataType.POINTER: 5}
+
+
+def test_short_run_against_local_server():
+    server = LocalServer()
+    generator = LoadGenerator(4, rates=RATES, transport=server.transport, seed=1)
+    stats = asyncio.run(asyncio.wait_for(generator.run(duration=0.5, drain=0.2), 10))
+    assert sorted(stats) == sorted(dt.value for dt in RATES)
+    for data_type, rate in RATES.items():
+        s = stats[data_type.value]
+        # everything due within the duration is sent and received back by the listener
+        assert s.sent == int(0.5 * rate * 4)
+        assert s.received == s.sent
+        assert 0 <= s.p50 <= s.p99 <= s.max < 1
+    assert generator.device_nrs == [0, 1, 2, 3]
+    assert len(server.devices) == 0
+    assert 'acceleration' in format_stats(stats)
+
+
+def test_build_spreads_the_samples_over_the_devices():
+    generator = LoadGenerator(3, seed=1)
+    generator.device_nrs = [0, 1, 2]
+    payloads = generator.build(DataType.GYRO, 0, 2)
+    assert [p['device_id'] for p in payloads] == ['load-0', 'load-1', 'load-2'] * 2
+    assert np.allclose([p['gamma'] for p in payloads], 0)
+    pointers = generator.build(DataType.POINTER, 0, 20)
+    assert all(0 <= p['row'] < 10 and 0 <= p['column'] < 10 and p['context'] == 'grid' for p in pointers)
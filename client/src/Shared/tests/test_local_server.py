@@ -0,0 +1,51 @@
+import asyncio
+from collections import Counter
+
+from local_server import LocalServer
+
+
+async def connect(server: LocalServer, device_id: str, events: list):
+    transport = server.transport()
+    for event in ('room_joined', 'room_left'):
+        transport.on(event, lambda data, event=event: events.append((event, device_id, data['room'])))
+    await transport.connect()
+    await transport.emit('new_device', {'device_id': device_id, 'is_client': True})
+    return transport
+
+
+async def settle(*transports):
+    for transport in transports:
+        await transport._inbox.join()
+
+
+def test_leave_room_is_reported_once_to_each_member():
+    async def run():
+        server = LocalServer()
+        events = []
+        a = await connect(server, 'a', events)
+        b = await connect(server, 'b', events)
+        await b.emit('join_room', {'room': 'a'})
+        await settle(a, b)
+        events.clear()
+        await b.emit('leave_room', {'room': 'a'})
+        await settle(a, b)
+        assert Counter(events) == {('room_left', 'a', 'a'): 1, ('room_left', 'b', 'a'): 1}
+        assert server.rooms['a'] == {a.sid}
+
+    asyncio.run(run())
+
+
+def test_disconnect_reports_to_the_remaining_members():
+    async def run():
+        server = LocalServer()
+        events = []
+        a = await connect(server, 'a', events)
+        b = await connect(server, 'b', events)
+        await b.emit('join_room', {'room': 'a'})
+        await settle(a, b)
+        events.clear()
+        await b.disconnect()
+        await settle(a)
+        assert events == [('room_left', 'a', 'a')]
+
+    asyncio.run(run())
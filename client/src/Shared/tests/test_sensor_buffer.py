@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from api_codec import decode
+from sensor_buffer import ACC_FIELDS, AccelerationBuffer, GyroBuffer, SensorRing
+
+
+def rows(start: int, count: int) -> np.ndarray:
+    return np.arange(start, start + count, dtype=np.float64)[:, None] * [1, 10, 100]
+
+
+def test_ring_wraparound():
+    ring = SensorRing(('a', 'b', 'c'), capacity=4)
+    for row in rows(0, 10):
+        ring.append(tuple(row))
+    assert len(ring) == 4 and ring.count == 10
+    assert ring.column('a').tolist() == [6, 7, 8, 9]
+    assert ring.column('b', 2).tolist() == [80, 90]
+    assert ring.last().T.tolist() == rows(6, 4).tolist()
+    # the last samples are a view, not a copy
+    assert ring.last().base is ring._data
+
+
+@pytest.mark.parametrize('chunks', [[10], [3, 3, 4], [1, 5, 1, 3], [7, 3], [2, 8]])
+def test_extend_equals_append(chunks):
+    appended = SensorRing(('a', 'b', 'c'), capacity=4)
+    extended = SensorRing(('a', 'b', 'c'), capacity=4)
+    start = 0
+    for size in chunks:
+        block = rows(start, size)
+        for row in block:
+            appended.append(tuple(row))
+        extended.extend(block)
+        start += size
+        assert extended.count == appended.count
+        assert np.array_equal(extended.last(), appended.last())
+        assert np.array_equal(extended._data, appended._data)
+
+
+def test_rolling_mean_and_resample():
+    ring = SensorRing(('time_stamp', 'x'), capacity=8)
+    ring.extend([[0, 0], [1, 2], [2, 4], [3, 6]])
+    assert ring.rolling_mean('x', 2).tolist() == [1, 3, 5]
+    assert len(ring.rolling_mean('x', 5)) == 0
+    time_stamps, values = ring.resample('x', 2)
+    assert time_stamps.tolist() == [0, 0.5, 1, 1.5, 2, 2.5, 3]
+    assert values.tolist() == [0, 1, 2, 3, 4, 5, 6]
+
+
+def test_ingest():
+    acc = AccelerationBuffer(capacity=4, key='device_nr')
+    gyro = GyroBuffer(capacity=4)
+    msg = {'type': 'acceleration', 'device_id': 'a', 'device_nr': 1, 'time_stamp': 1, 'x': 3, 'y': 4, 'z': 0, 'interval': 16}
+    assert acc.ingest(msg) and acc.ingest(decode(msg))
+    assert not gyro.ingest(msg)
+    assert acc.ingest_many([msg, {'type': 'key', 'key': 'up'}]) == 1
+    assert list(acc) == [1] and len(acc[1]) == 3
+    assert acc[1].magnitude().tolist() == [5, 5, 5]
+    assert acc[1].last(1)[:, 0].tolist() == [msg[name] for name in ACC_FIELDS]
+    with pytest.raises(ValueError):
+        AccelerationBuffer(key='time_stamp')
@@ -0,0 +1,37 @@
+import json
+
+import numpy as np
+import pytest
+
+import sensor_fanout
+from api_types import DataType
+from sensor_fanout import SensorFanOut, WorkerError
+
+
+def acc(device_id: str, ts: float) -> dict:
+    return {'type': 'acceleration', 'device_id': device_id, 'device_nr': 0, 'time_stamp': ts, 'x': ts, 'y': 0, 'z': 0, 'interval': 16}
+
+
+def test_malformed_payloads_are_skipped():
+    blocks = []
+    with SensorFanOut(workers=2, block_rows=8) as fanout:
+        for i in range(20):
+            fanout.put(acc(f'd{i % 3}', i))
+            fanout.put(json.dumps(acc(f'd{i % 3}', i))[:-5])
+            fanout.put({'type': 'gyro', 'device_id': 'd0', 'alpha': 'up'})
+        fanout.close(lambda block: blocks.append(block.copy()))
+    time_stamps = np.concatenate([block.sensor(DataType.ACCELERATION)['time_stamp'] for block in blocks])
+    assert sorted(time_stamps) == list(range(20))
+    assert fanout.skipped == 40
+
+
+def test_worker_failure_is_raised(monkeypatch):
+    def fail(self, capacity):
+        raise MemoryError('no rings')
+
+    monkeypatch.setattr(sensor_fanout._Worker, '__init__', fail)
+    fanout = SensorFanOut(workers=2)
+    fanout.put(acc('d0', 0))
+    with pytest.raises(WorkerError, match='no rings'):
+        fanout.close()
+    assert not fanout._processes
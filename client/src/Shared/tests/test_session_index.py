@@ -0,0 +1,62 @@
+import numpy as np
+
+from api_types import AccMsg, DataType, GyroMsg
+from session_index import SessionIndex
+from session_log import Recorder, Schema, SessionLog
+
+
+def acc(nr: int, ts: float, x: float) -> dict:
+    return {'device_id': f'd{nr}', 'device_nr': nr, 'time_stamp': ts, 'type': 'acceleration', 'x': x, 'y': 0.0, 'z': 9.81, 'interval': 16}
+
+
+def gyro(nr: int, ts: float, alpha: float) -> dict:
+    return {'device_id': f'd{nr}', 'device_nr': nr, 'time_stamp': ts, 'type': 'gyro', 'alpha': alpha, 'beta': 0.0, 'gamma': 0.0, 'absolute': False}
+
+
+def test_block_layout_of_several_logs(tmp_path):
+    # the schema ids of acceleration and gyro swap between the logs
+    for cycle in range(30):
+        path = tmp_path / f'{cycle}.log'
+        first, second = (acc(0, 1.0, 1.5), gyro(1, 2.0, 90.0)) if cycle % 2 else (gyro(1, 2.0, 90.0), acc(0, 1.0, 1.5))
+        with Recorder(path) as recorder:
+            recorder.write(first)
+            recorder.write(second)
+        with SessionLog(path) as log:
+            index = SessionIndex.build(log)
+            acc_block = index.block(['x', 'alpha'], type=DataType.ACCELERATION)
+            gyro_block = index.block(['x', 'alpha'], type=DataType.GYRO)
+            assert acc_block['x'].tolist() == [1.5]
+            assert np.isnan(acc_block['alpha']).all()
+            assert gyro_block['alpha'].tolist() == [90.0]
+            assert np.isnan(gyro_block['x']).all()
+
+
+def test_layout_of_freed_schemas():
+    # freed schemas hand their ids to new ones, the layout must not come along
+    for i in range(500):
+        cls = AccMsg if i % 2 else GyroMsg
+        schema = Schema.of(1, cls)
+        fields = schema.layout
+        assert ('x' if cls is AccMsg else 'alpha') in fields
+        del schema, fields
+
+
+def test_reader_reads_the_indexed_fields(tmp_path):
+    path = tmp_path / 'session.log'
+    messages = [
+        acc(0, 1.0, 1.5),
+        {'type': 'sprite', 'device_id': 'd0', 'sprite': {'id': 'ball', 'pos_x': 1}, 'time_stamp': 2.0},
+        {'type': 'remove_sprite', 'id': 'ball', 'device_nr': 1},
+        {'type': 'sprites', 'sprites': [{'id': 'a'}], 'time_stamp': 3.0},
+    ]
+    with Recorder(path) as recorder:
+        for msg in messages:
+            recorder.write(msg)
+    with SessionLog(path) as log:
+        for _, schema, start, end in log.records():
+            data = schema.unpack(log.buffer, start, end)
+            fields = schema.reader(SessionIndex.FIELDS)(log.buffer, start, end)
+            assert fields == {name: value for name, value in data.items() if name in SessionIndex.FIELDS}
+        index = SessionIndex.build(log)
+        assert [m['type'] for m in index.messages(sprite_id='ball', decode=False)] == ['sprite', 'remove_sprite']
+        assert len(index.select(device_id='d0')) == 2
@@ -0,0 +1,71 @@
+import json
+
+import api_codec
+import api_lazy
+import api_models
+import api_slots
+import api_types
+from session_log import Recorder, Schema, SessionLog
+
+KEY = {'type': 'key', 'key': 'up', 'device_id': 'a', 'device_nr': 0, 'time_stamp': 1.5}
+LINE = {
+    'type': 'line',
+    'device_id': 'a',
+    'time_stamp': 2.0,
+    'line': {'id': 'l1', 'x1': 0, 'y1': 0, 'x2': 10, 'y2': 5, 'color': 'red'},
+    'deliver_to': 'b',
+}
+
+
+def record(path, messages):
+    with Recorder(path) as recorder:
+        for msg in messages:
+            recorder.write(msg)
+
+
+def test_round_trip_of_api_models_messages(tmp_path):
+    path = tmp_path / 'session.log'
+    messages = [
+        api_codec.decode_model({**KEY, 'deliver_to': 'b', 'stop_propagation': True, 'cross_origin': False}),
+        api_codec.decode(KEY),
+        api_codec.decode(LINE),
+    ]
+    record(path, messages)
+    with SessionLog(path) as log:
+        replayed = list(log)
+        assert [m.__class__ for m in replayed] == [api_models.KeyMsg, api_types.KeyMsg, api_models.LineMsg]
+        assert replayed == messages
+        assert replayed[0].deliver_to == 'b' and replayed[0].stop_propagation is True
+        assert list(log.messages(decode=False))[2] == LINE
+
+
+def test_variants_share_the_schema_of_their_dataclass(tmp_path):
+    path = tmp_path / 'session.log'
+    record(path, [api_codec.decode(KEY), api_slots.decode(KEY), api_slots.decode_frozen(KEY), api_lazy.view(KEY)])
+    with SessionLog(path) as log:
+        assert list(log) == [api_codec.decode(KEY)] * 4
+        assert [schema.cls for schema in log.schemas.values()] == [api_types.KeyMsg]
+
+
+def test_continued_log(tmp_path):
+    path = tmp_path / 'session.log'
+    record(path, [api_codec.decode(KEY), api_codec.decode(LINE)])
+    record(path, [api_codec.decode(LINE), api_codec.decode_model(KEY), api_codec.decode(KEY)])
+    with SessionLog(path) as log:
+        assert [m.__class__ for m in log] == [
+            api_types.KeyMsg,
+            api_models.LineMsg,
+            api_models.LineMsg,
+            api_models.KeyMsg,
+            api_types.KeyMsg,
+        ]
+        assert sorted(schema.id for schema in log.schemas.values()) == [1, 2, 3]
+
+
+def test_schema_without_module():
+    # logs of earlier versions name the api_types class only
+    schema = json.loads(Schema.of(1, api_types.KeyMsg).to_json())
+    assert schema['class'] == 'api_types.KeyMsg'
+    schema['class'] = 'KeyMsg'
+    assert Schema.from_json(json.dumps(schema).encode()).cls is api_types.KeyMsg
+    assert Schema.from_json(Schema.of(1, api_models.KeyMsg).to_json()).cls is api_models.KeyMsg
@@ -0,0 +1,127 @@
+import asyncio
+
+from api_types import AllDataMsg, DataType, KeyMsg
+from local_server import LocalServer
+from socket_client import AsyncSocketClient
+
+KEY = {'type': 'key', 'key': 'up'}
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, 5))
+
+
+async def connected(server: LocalServer, device_id: str = 'FooBar', is_client: bool = False) -> AsyncSocketClient:
+    client = AsyncSocketClient(device_id, transport=server.transport(), is_client=is_client)
+    await client.connect()
+    return client
+
+
+def test_handshake():
+    async def main():
+        server = LocalServer()
+        script = await connected(server)
+        phone = await connected(server, is_client=True)
+        assert (script.device.device_id, script.device_nr) == ('FooBar', -1)
+        assert phone.device_nr == 0
+        await asyncio.sleep(0.01)
+        assert [d.device_nr for d in script.devices.devices] == [0, -1]
+        await phone.close()
+        await script.close()
+
+    run(main())
+
+
+def test_stream_and_subscribe():
+    async def main():
+        server = LocalServer()
+        script = await connected(server)
+        phone = await connected(server, is_client=True)
+        keys = script.stream(DataType.KEY)
+        gyro = script.subscribe('gyro')
+        # started before the messages arrive
+        first = asyncio.ensure_future(keys.__anext__())
+        await asyncio.sleep(0)
+        await phone.send(KEY)
+        await phone.send({'type': 'gyro', 'alpha': 1, 'beta': 2, 'gamma': 3})
+        msg = await first
+        assert msg.__class__ is KeyMsg and msg.device_nr == 0
+        assert (await gyro.get()).alpha == 1
+        await keys.aclose()
+        assert not script.subscriptions['key']
+        await phone.close()
+        await script.close()
+
+    run(main())
+
+
+def test_input_prompt_awaits_its_response():
+    async def main():
+        server = LocalServer()
+        script = await connected(server)
+        phone = await connected(server, is_client=True)
+
+        async def answer(data: dict):
+            if data['type'] == DataType.INPUT_PROMPT.value:
+                await phone.send(
+                    {
+                        'type': 'input_response',
+                        'response': data['question'].upper(),
+                        'time_stamp': data['time_stamp'],
+                        'caller_id': data['response_id'],
+                        'displayed_at': data['time_stamp'],
+                    }
+                )
+
+        phone.on('new_data', answer)
+        first, second = await asyncio.gather(script.input_prompt('first?'), script.input_prompt('second?'))
+        assert (first.response, second.response) == ('FIRST?', 'SECOND?')
+        assert not script._pending_responses
+        await phone.close()
+        await script.close()
+
+    run(main())
+
+
+def test_get_all_data():
+    async def main():
+        server = LocalServer()
+        script = await connected(server)
+        await script.send({'type': 'sprite', 'sprite': {'id': 'ball', 'pos_x': 3}})
+        await script.send(KEY)
+        all_data = await script.get_all_data()
+        assert all_data.__class__ is AllDataMsg
+        assert [m.sprite.id for m in all_data.all_data.sprite] == ['ball']
+        assert len(all_data.all_data.key) == 1
+        await script.close()
+
+    run(main())
+
+
+def test_reconnect():
+    async def main():
+        server = LocalServer()
+        script = await connected(server)
+        await script.transport.disconnect()
+        assert len(server.devices) == 0
+        device = await script.connect()
+        assert device.device_id == 'FooBar' and len(server.devices) == 1
+        await script.send(KEY)
+        all_data = await script.get_all_data()
+        assert len(all_data.all_data.key) == 1
+        await script.close()
+
+    run(main())
+
+
+def test_close_when_disconnected():
+    async def main():
+        server = LocalServer()
+        script = await connected(server)
+        await script.transport.disconnect()
+        for _ in range(3):
+            script.send_nowait(KEY)
+        await script.close()
+        assert script._send_queue.empty()
+
+    run(main())
@@ -0,0 +1,56 @@
+import asyncio
+
+from sprite_batcher import SpriteBatcher
+
+
+class SlowClient:
+    def __init__(self):
+        self.sent = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send(self, data):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.sent.append(data)
+        self.in_flight -= 1
+
+
+def test_one_flush_in_flight():
+    async def run():
+        client = SlowClient()
+        batcher = SpriteBatcher(client, window=0.001, max_sprites=2)
+        for i in range(20):
+            batcher.update({'id': f's{i % 5}', 'pos_x': i})
+            await asyncio.sleep(0.002)
+        batcher.update({'id': 'last', 'pos_x': 0})
+        await batcher.close()
+        return client, batcher
+
+    client, batcher = asyncio.run(run())
+    assert client.max_in_flight == 1
+    sent = [sprite for msg in client.sent for sprite in msg['sprites']]
+    assert sent[-1] == {'id': 'last', 'pos_x': 0}
+    # the last update of every sprite is sent
+    assert {s['id']: s['pos_x'] for s in sent} == {'s0': 15, 's1': 16, 's2': 17, 's3': 18, 's4': 19, 'last': 0}
+    assert len(batcher) == 0 and batcher.stats.messages_sent == len(client.sent)
+
+
+def test_public_flush_waits_for_the_flush_in_flight():
+    async def run():
+        client = SlowClient()
+        batcher = SpriteBatcher(client, window=0.001)
+        batcher.update({'id': 'a', 'pos_x': 1})
+        await asyncio.sleep(0.005)
+        # the background flush of the first frame is sending now
+        assert client.in_flight == 1
+        batcher.update({'id': 'a', 'pos_x': 2})
+        await batcher.flush()
+        assert client.in_flight == 0 and len(batcher) == 0
+        await batcher.flush()
+        return client
+
+    client = asyncio.run(run())
+    assert client.max_in_flight == 1
+    assert [msg['sprites'] for msg in client.sent] == [[{'id': 'a', 'pos_x': 1}], [{'id': 'a', 'pos_x': 2}]]
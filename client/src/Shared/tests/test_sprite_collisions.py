@@ -0,0 +1,86 @@
+import math
+import random
+
+import pytest
+
+from sprite_collisions import CollisionGrid
+
+
+def has_overlap(a: dict, b: dict) -> bool:
+    """``BoundingBox.hasOverlap`` of two sprites anchored at their lower left corner"""
+    return (
+        a['pos_x'] + a['width'] > b['pos_x']
+        and a['pos_x'] < b['pos_x'] + b['width']
+        and a['pos_y'] + a['height'] > b['pos_y']
+        and a['pos_y'] < b['pos_y'] + b['height']
+    )
+
+
+def brute_force(sprites: dict) -> set:
+    finite = [s for s in sprites.values() if all(math.isfinite(s[k]) for k in ('pos_x', 'pos_y', 'width', 'height'))]
+    return {
+        frozenset((a['id'], b['id']))
+        for i, a in enumerate(finite)
+        for b in finite[i + 1 :]
+        if (a['collision_detection'] or b['collision_detection']) and has_overlap(a, b)
+    }
+
+
+def tracked(grid: CollisionGrid) -> set:
+    return {frozenset((a, b)) for a, others in grid.overlaps.items() for b in others}
+
+
+def random_sprite(rng: random.Random, sprite_id: str) -> dict:
+    size = rng.choice([1, 5, 12, 400])
+    return {
+        'id': sprite_id,
+        'pos_x': rng.choice([rng.uniform(-60, 60), math.nan, math.inf]) if rng.random() < 0.1 else rng.uniform(-60, 60),
+        'pos_y': rng.uniform(-60, 60),
+        'width': size,
+        'height': rng.choice([size, math.inf]) if rng.random() < 0.05 else size,
+        'collision_detection': rng.random() < 0.5,
+    }
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_matches_brute_force(seed):
+    rng = random.Random(seed)
+    grid = CollisionGrid(cell_size=10, max_cells=16)
+    sprites = {}
+    for tick in range(30):
+        for _ in range(rng.randint(1, 10)):
+            sprite = random_sprite(rng, f's{rng.randint(0, 40)}')
+            sprites[sprite['id']] = sprite
+            grid.apply({'type': 'sprite', 'sprite': sprite})
+        if sprites and rng.random() < 0.3:
+            sprite_id = rng.choice(sorted(sprites))
+            del sprites[sprite_id]
+            grid.apply({'type': 'remove_sprite', 'id': sprite_id})
+        events = grid.detect(tick)
+        assert tracked(grid) == brute_force(sprites)
+        assert all(e['sprites'][0]['collision_detection'] for e in events)
+    assert grid.large <= set(sprites)
+
+
+def test_non_finite_sprites_overlap_nothing():
+    grid = CollisionGrid()
+    grid.upsert({'id': 'a', 'pos_x': 0, 'pos_y': 0, 'collision_detection': True})
+    grid.upsert({'id': 'b', 'pos_x': 1, 'pos_y': 1})
+    assert [e['overlap'] for e in grid.detect(1)] == ['in']
+    grid.move('b', math.nan, 1)
+    assert [e['overlap'] for e in grid.detect(2)] == ['out']
+    grid.upsert({'id': 'c', 'pos_x': 0, 'pos_y': 0, 'width': math.inf})
+    assert grid.detect(3) == []
+    grid.move('b', 2, 2)
+    assert [e['overlap'] for e in grid.detect(4)] == ['in']
+
+
+def test_large_sprites_are_not_hashed():
+    grid = CollisionGrid(cell_size=1, max_cells=4)
+    grid.upsert({'id': 'floor', 'pos_x': -1000, 'pos_y': 0, 'width': 2000, 'height': 1})
+    grid.upsert({'id': 'ball', 'pos_x': 500, 'pos_y': 0.5, 'width': 1, 'height': 1, 'collision_detection': True})
+    assert grid.large == {'floor'} and len(grid.cells) == 4
+    assert [e['sprites'][1]['id'] for e in grid.detect(1)] == ['floor']
+    grid.upsert({'id': 'floor', 'width': 1})
+    assert grid.large == set()
+    assert [e['overlap'] for e in grid.detect(2)] == ['out']
@@ -0,0 +1,64 @@
+from api_types import Sprite
+from sprite_delta import SpriteDeltaTracker
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_deltas_and_keyframes():
+    clock = Clock()
+    tracker = SpriteDeltaTracker(keyframe_interval=2, clock=clock)
+    assert tracker.diff({'id': 'a', 'pos_x': 1, 'pos_y': 2}) == {'id': 'a', 'pos_x': 1, 'pos_y': 2}
+    assert tracker.diff({'id': 'a', 'pos_x': 1, 'pos_y': 2}) is None
+    assert tracker.diff({'id': 'a', 'pos_x': 3, 'pos_y': 2}) == {'pos_x': 3, 'id': 'a'}
+    clock.now = 2
+    # the keyframe has all fields sent so far
+    assert tracker.diff({'id': 'a', 'text': 'hi'}) == {'id': 'a', 'pos_x': 3, 'pos_y': 2, 'text': 'hi'}
+    assert tracker.stats.keyframes == 2 and tracker.stats.updates == 4
+    assert SpriteDeltaTracker(keyframe_interval=None, clock=clock).diff({'id': 'b'}) == {'id': 'b'}
+
+
+def test_epsilon():
+    tracker = SpriteDeltaTracker(epsilon=0.5)
+    tracker.diff({'id': 'a', 'pos_x': 1.0, 'clickable': True})
+    assert tracker.diff({'id': 'a', 'pos_x': 1.4, 'clickable': True}) is None
+    assert tracker.diff({'id': 'a', 'pos_x': 1.6}) == {'pos_x': 1.6, 'id': 'a'}
+    # booleans are no numbers
+    assert tracker.diff({'id': 'a', 'clickable': False}) == {'clickable': False, 'id': 'a'}
+
+
+def test_forget_and_reset():
+    tracker = SpriteDeltaTracker()
+    tracker.diff({'id': 'a', 'pos_x': 1})
+    tracker.diff({'id': 'b', 'pos_x': 1})
+    tracker.forget('a')
+    assert tracker.diff({'id': 'a', 'pos_x': 1}) == {'id': 'a', 'pos_x': 1}
+    assert tracker.diff({'id': 'b', 'pos_x': 1}) is None
+    tracker.reset()
+    assert tracker.diff({'id': 'b', 'pos_x': 1}) == {'id': 'b', 'pos_x': 1}
+
+
+def test_mutated_values_are_sent():
+    tracker = SpriteDeltaTracker()
+    direction = [1, 0]
+    sprite = {'id': 'a', 'direction': direction}
+    tracker.diff(sprite)
+    direction[1] = 1
+    assert tracker.diff(sprite) == {'direction': [1, 1], 'id': 'a'}
+    direction[0] = 0
+    assert tracker.diff(Sprite(id='a', direction=direction)) == {'direction': [0, 1], 'id': 'a'}
+
+
+def test_none_resets_the_field():
+    tracker = SpriteDeltaTracker()
+    tracker.diff(Sprite(id='a', pos_x=1, text='hi'))
+    assert tracker.diff(Sprite(id='a', pos_x=1)) == {'text': None, 'id': 'a'}
+    assert tracker.diff(Sprite(id='a', pos_x=1)) is None
+    assert tracker.diff({'id': 'a', 'pos_x': None}) == {'pos_x': None, 'id': 'a'}
+    assert tracker.diff({'id': 'a', 'pos_x': None}) is None
+    assert tracker.diff({'id': 'a', 'pos_x': 2}) == {'pos_x': 2, 'id': 'a'}
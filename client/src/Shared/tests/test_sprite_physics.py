@@ -0,0 +1,41 @@
+from sprite_physics import OUT_TIMEOUT, SpritePhysics
+
+
+def moving_right() -> SpritePhysics:
+    physics = SpritePhysics()
+    physics.upsert({'id': 'ball', 'pos_x': 40, 'pos_y': 0, 'width': 5, 'height': 5, 'direction': [1, 0], 'speed': 1}, 0)
+    return physics
+
+
+def events(physics: SpritePhysics, start: float, end: float, tick: float = 0.05) -> list:
+    found = []
+    steps = round((end - start) / tick)
+    for i in range(1, steps + 1):
+        found.extend(physics.step(start + i * tick))
+    return found
+
+
+def test_sprite_leaving_the_playground():
+    physics = moving_right()
+    leaving = events(physics, 0, 10)
+    assert [(e['type'], e.get('border')) for e in leaving[:2]] == [('border_overlap', 'right'), ('sprite_out', None)]
+    out = next(i for i, e in enumerate(leaving) if e['type'] == 'sprite_out')
+    assert leaving[out + 1:] == [{'type': 'sprite_removed', 'id': 'ball'}]
+    assert 'ball' not in physics.index
+
+
+def test_sprite_out_is_removed_after_the_timeout():
+    physics = moving_right()
+    found = []
+    time_stamp = 0.0
+    while not found or found[-1]['type'] != 'sprite_out':
+        time_stamp += 0.05
+        found.extend(physics.step(time_stamp))
+    assert physics.step(time_stamp + OUT_TIMEOUT / 2) == []
+    assert physics.step(time_stamp + OUT_TIMEOUT + 0.1) == [{'type': 'sprite_removed', 'id': 'ball'}]
+
+
+def test_sprite_inside_reports_nothing():
+    physics = SpritePhysics()
+    physics.upsert({'id': 'still', 'pos_x': 0, 'pos_y': 0, 'width': 5, 'height': 5}, 0)
+    assert events(physics, 0, 1) == []
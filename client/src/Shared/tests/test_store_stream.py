@@ -0,0 +1,71 @@
+import io
+import json
+
+import pytest
+
+from store_stream import StoreParseError, StoreParser, iter_store
+
+STORE = {
+    'FooBar': {
+        'key': [{'type': 'key', 'key': 'up', 'device_id': 'FooBar', 'time_stamp': 1}],
+        'sprite': [
+            {'type': 'sprite', 'sprite': {'id': 'a"{[', 'text': 'ä \\"} ]\n', 'image': 'data:x' * 50}, 'time_stamp': 2},
+        ],
+        'playground_config': [
+            {
+                'type': 'playground_config',
+                'config': {'images': {'ball': {'image': ['{', {'nested': '"]'}], 'width': 3}}, 'audio_tracks': {}},
+            }
+        ],
+    },
+    'other': {'gyro': [{'type': 'gyro', 'alpha': -1.5e-3, 'beta': None, 'absolute': True}], 'key': []},
+}
+
+
+def nulled(value, skip=('image', 'audio')):
+    """the expected message: values of the skip fields are ``None``"""
+    if isinstance(value, dict):
+        return {key: None if key in skip else nulled(item, skip) for key, item in value.items()}
+    if isinstance(value, list):
+        return [nulled(item, skip) for item in value]
+    return value
+
+
+def expected(store: dict) -> list:
+    return [
+        (device_id, data_type, nulled(msg))
+        for device_id, types in store.items()
+        for data_type, messages in types.items()
+        for msg in messages
+    ]
+
+
+def parsed(text: bytes, chunk_size: int) -> list:
+    parser = StoreParser(decode=None)
+    items = []
+    for pos in range(0, len(text), chunk_size):
+        items.extend(parser.feed(text[pos : pos + chunk_size]))
+    parser.close()
+    return [(device_id, getattr(data_type, 'value', data_type), msg) for device_id, data_type, msg in items]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, 64, 1 << 16])
+@pytest.mark.parametrize('indent', [None, 2])
+def test_chunked_parse_equals_json_loads(chunk_size, indent):
+    text = json.dumps(STORE, indent=indent, ensure_ascii=False).encode()
+    assert parsed(text, chunk_size) == expected(json.loads(text))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 1 << 16])
+def test_all_data_message(chunk_size):
+    text = json.dumps({'type': 'all_data', 'device_id': 'FooBar', 'all_data': STORE['FooBar']}).encode()
+    assert parsed(text, chunk_size) == [('FooBar', data_type, msg) for _, data_type, msg in expected({'FooBar': STORE['FooBar']})]
+
+
+def test_decoded_messages_and_errors():
+    items = list(iter_store(io.BytesIO(json.dumps(STORE).encode()), chunk_size=3))
+    assert items[0][2].key.value == 'up' and items[1][2].sprite.text == 'ä \\"} ]\n'
+    parser = StoreParser()
+    parser.feed(json.dumps(STORE).encode()[:-1])
+    with pytest.raises(StoreParseError):
+        parser.close()
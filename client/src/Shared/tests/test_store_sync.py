@@ -0,0 +1,87 @@
+import json
+import random
+
+from data_store import THRESHOLD, DataStoreEngine
+from store_sync import StoreDelta, StoreReplica, VersionedDataStoreEngine
+
+
+def stream(count: int, seed: int = 1) -> list:
+    rnd = random.Random(seed)
+    messages = []
+    for i in range(count):
+        ts = i / 10
+        pick = rnd.random()
+        if pick < 0.35:
+            msg = {'type': 'sprite', 'sprite': {'id': f's{rnd.randrange(40)}', 'pos_x': i, 'collision_detection': rnd.random() < 0.2}}
+        elif pick < 0.45:
+            msg = {'type': 'sprites', 'sprites': [{'id': f's{rnd.randrange(40)}', 'pos_y': i} for _ in range(3)]}
+        elif pick < 0.5:
+            msg = {'type': 'remove_sprite', 'id': f's{rnd.randrange(40)}'}
+        elif pick < 0.6:
+            msg = {'type': 'line', 'line': {'id': f'l{rnd.randrange(10)}', 'x1': 0, 'y1': 0, 'x2': i, 'y2': 1}}
+        elif pick < 0.63:
+            msg = {'type': 'remove_line', 'id': f'l{rnd.randrange(10)}'}
+        elif pick < 0.8:
+            msg = {'type': rnd.choice(['key', 'acceleration', 'color']), 'key': 'up', 'x': i}
+        elif pick < 0.85:
+            msg = {'type': 'input_prompt', 'question': 'name?'}
+        elif pick < 0.88:
+            msg = {'type': 'input_response', 'time_stamp': round(rnd.randrange(i + 1) / 10, 1)}
+        elif pick < 0.9:
+            msg = {'type': 'playground_config', 'config': {'width': rnd.randrange(10, 100)}}
+        elif pick < 0.91:
+            msg = {'type': 'clear_playground'}
+        else:
+            msg = {'type': 'clean_playground'}
+        messages.append({'device_id': 'a', 'time_stamp': ts, **msg})
+    return messages
+
+
+def wire(delta: StoreDelta) -> StoreDelta:
+    return StoreDelta.from_dict(json.loads(json.dumps(delta.to_dict())))
+
+
+def test_versioned_store_matches_the_data_store():
+    plain = DataStoreEngine()
+    versioned = VersionedDataStoreEngine()
+    for msg in stream(3000):
+        plain.apply('a', json.loads(json.dumps(msg)))
+        versioned.apply('a', json.loads(json.dumps(msg)))
+    assert versioned.to_dict() == plain.to_dict()
+    assert len(plain['a'].to_dict()['key']) <= THRESHOLD
+
+
+def test_replica_follows_the_deltas():
+    engine = VersionedDataStoreEngine()
+    replica = StoreReplica('a')
+    assert replica.apply(wire(engine.delta('a')))
+    rnd = random.Random(2)
+    sizes = []
+    for msg in stream(3000):
+        engine.apply('a', msg)
+        if rnd.random() < 0.05:
+            delta = wire(engine.delta('a', replica.revision))
+            sizes.append(len(delta.changes))
+            assert not delta.reset
+            assert replica.apply(delta)
+            assert replica.to_dict() == engine['a'].to_dict()
+    assert replica.apply(wire(engine.delta('a', replica.revision)))
+    assert replica.data_store() == engine.data_store('a')
+    # deltas carry the changed entries only
+    assert max(sizes) < 3000 / 10
+
+
+def test_stale_replica_gets_a_snapshot():
+    engine = VersionedDataStoreEngine()
+    replica = StoreReplica('a')
+    replica.apply(engine.delta('a'))
+    stale = StoreDelta(base_revision=replica.revision + 1, device_id='a', revision=replica.revision + 2)
+    assert not replica.apply(stale)
+    for msg in stream(200):
+        engine.apply('a', msg)
+    engine.clear('a')
+    for msg in stream(50, seed=3):
+        engine.apply('a', msg)
+    delta = engine.delta('a', None)
+    assert delta.reset and replica.apply(wire(delta))
+    assert replica.to_dict() == engine['a'].to_dict()